@@ -15,10 +15,13 @@
 # limitations under the License.
 #
 
+import pytest
 import torch
 
 from kornia.augmentation import (
+    AugmentationSequential,
     CenterCrop,
+    ColorJitter,
     PadTo,
     RandomAffine,
     RandomCrop,
@@ -26,6 +29,7 @@ from kornia.augmentation import (
     RandomErasing,
     RandomFisheye,
     RandomHorizontalFlip,
+    RandomMosaic,
     RandomPerspective,
     RandomResizedCrop,
     RandomRotation,
@@ -202,3 +206,52 @@ def test_aug_2d_resize(benchmark, device, dtype, torch_optimizer, shape):
     actual = benchmark(op, input=data)
 
     assert actual.shape == (*shape[:-2], h_target, w_target)
+
+
+@pytest.mark.parametrize("fuse_geometric", [False, True])
+def test_aug_2d_sequential_geometric(benchmark, device, dtype, torch_optimizer, shape, fuse_geometric):
+    w_target = h_target = 64
+    data = torch.rand(*shape, device=device, dtype=dtype)
+    aug = AugmentationSequential(
+        RandomAffine(degrees=45, translate=0.25, scale=(0.9, 1.1), p=1.0, align_corners=True),
+        RandomHorizontalFlip(p=0.5),
+        RandomRotation(degrees=30, p=1.0),
+        RandomPerspective(0.25, p=1.0, align_corners=True),
+        CenterCrop((h_target, w_target), cropping_mode="resample"),
+        fuse_geometric=fuse_geometric,
+    )
+    op = torch_optimizer(aug)
+
+    actual = benchmark(op, data)
+
+    assert actual.shape == (*shape[:-2], h_target, w_target)
+
+
+def test_aug_2d_mosaic(benchmark, device, dtype, torch_optimizer, shape):
+    w_target = h_target = 64
+    data = torch.rand(*shape, device=device, dtype=dtype)
+    boxes = torch.tensor([[[10.0, 10.0, 40.0, 50.0], [20.0, 5.0, 30.0, 15.0]]], device=device, dtype=dtype)
+    boxes = boxes.repeat(shape[0], 1, 1)
+    aug = RandomMosaic((h_target, w_target), p=1.0, data_keys=["input", "bbox_xyxy"])
+    op = torch_optimizer(aug)
+
+    actual, actual_boxes = benchmark(op, data, boxes)
+
+    assert actual.shape == (*shape[:-2], h_target, w_target)
+    assert actual_boxes.shape == (shape[0], 8, 4)
+
+
+@pytest.mark.parametrize("static", [False, True])
+def test_aug_2d_sequential_static(benchmark, device, dtype, torch_optimizer, shape, static):
+    data = torch.rand(*shape, device=device, dtype=dtype)
+    aug = AugmentationSequential(
+        RandomAffine(degrees=45, translate=0.25, p=0.5),
+        ColorJitter(0.2, 0.2, p=0.5),
+        RandomHorizontalFlip(p=0.5),
+    )
+    aug.set_static_mode(static)
+    op = torch_optimizer(aug)
+
+    actual = benchmark(op, data)
+
+    assert actual.shape == shape
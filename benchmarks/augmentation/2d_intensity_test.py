@@ -19,6 +19,7 @@ import pytest
 import torch
 
 from kornia.augmentation import (
+    AugmentationSequential,
     ColorJiggle,
     ColorJitter,
     Denormalize,
@@ -433,3 +434,23 @@ def test_aug_2d_solarize(benchmark, device, dtype, torch_optimizer, shape):
     actual = benchmark(op, input=data)
 
     assert actual.shape == shape
+
+
+@pytest.mark.parametrize("uint8", [False, True])
+def test_aug_2d_lut_chain(benchmark, device, dtype, torch_optimizer, shape, uint8):
+    data = torch.randint(0, 256, shape, device=device, dtype=torch.uint8)
+    if not uint8:
+        data = data.to(dtype) / 255
+    aug = AugmentationSequential(
+        RandomBrightness((0.8, 1.2), p=1.0),
+        RandomContrast((0.8, 1.2), p=1.0),
+        RandomGamma((0.8, 1.2), p=1.0),
+        RandomSolarize(p=1.0),
+        RandomInvert(p=1.0),
+    )
+    op = torch_optimizer(aug)
+
+    actual = benchmark(op, data)
+
+    assert actual.shape == shape
+    assert actual.dtype == data.dtype
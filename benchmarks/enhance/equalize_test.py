@@ -0,0 +1,64 @@
+# LICENSE HEADER MANAGED BY add-license-header
+#
+# Copyright 2018 Kornia Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+import torch
+
+from kornia.enhance import equalize, equalize3d
+from kornia.utils.helpers import _torch_histc_cast
+
+
+def _scale_channel_loop(im: torch.Tensor) -> torch.Tensor:
+    # the previous implementation, one histogram and lookup table per channel
+    im = im * 255.0
+    histo = _torch_histc_cast(im, bins=256, min=0, max=255)
+    nonzero_histo = torch.reshape(histo[histo != 0], [-1])
+    step = torch.div(torch.sum(nonzero_histo) - nonzero_histo[-1], 255, rounding_mode="trunc")
+    if step == 0:
+        return im / 255.0
+    lut = torch.div(torch.cumsum(histo, 0) + torch.div(step, 2, rounding_mode="trunc"), step, rounding_mode="trunc")
+    lut = torch.cat([torch.zeros(1, device=lut.device, dtype=lut.dtype), lut[:-1]]).clamp(0, 255)
+    return torch.gather(lut, 0, im.flatten().long()).reshape_as(im) / 255.0
+
+
+def _equalize_loop(input: torch.Tensor) -> torch.Tensor:
+    return torch.stack([torch.stack([_scale_channel_loop(channel) for channel in image]) for image in input])
+
+
+@pytest.mark.parametrize("B", [1, 16, 256])
+@pytest.mark.parametrize("C", [3])
+@pytest.mark.parametrize("H, W", [(64, 64), (224, 224)])
+@pytest.mark.parametrize("impl", ["loop", "batched"])
+def test_equalize(benchmark, device, dtype, torch_optimizer, B, C, H, W, impl):
+    data = torch.rand(B, C, H, W, device=device, dtype=dtype)
+    op = _equalize_loop if impl == "loop" else torch_optimizer(equalize)
+
+    actual = benchmark(op, data)
+
+    assert actual.shape == (B, C, H, W)
+
+
+@pytest.mark.parametrize("B", [1, 8])
+@pytest.mark.parametrize("C", [3])
+@pytest.mark.parametrize("D, H, W", [(16, 64, 64)])
+@pytest.mark.parametrize("impl", ["loop", "batched"])
+def test_equalize3d(benchmark, device, dtype, torch_optimizer, B, C, D, H, W, impl):
+    data = torch.rand(B, C, D, H, W, device=device, dtype=dtype)
+    op = _equalize_loop if impl == "loop" else torch_optimizer(equalize3d)
+
+    actual = benchmark(op, data)
+
+    assert actual.shape == (B, C, D, H, W)
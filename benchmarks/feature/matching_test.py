@@ -0,0 +1,76 @@
+# LICENSE HEADER MANAGED BY add-license-header
+#
+# Copyright 2018 Kornia Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+import torch
+
+from kornia.feature import DescriptorIndex, DescriptorMatcher, LightGlue
+
+
+@pytest.mark.parametrize("num_desc", [2000, 8000])
+@pytest.mark.parametrize("max_memory", [None, 2**26])
+@pytest.mark.parametrize("match_mode", ["snn", "smnn"])
+def test_descriptor_matcher(benchmark, device, dtype, num_desc, max_memory, match_mode):
+    torch.manual_seed(0)
+    desc1 = torch.rand(num_desc, 128, device=device, dtype=dtype)
+    desc2 = torch.rand(num_desc, 128, device=device, dtype=dtype)
+    matcher = DescriptorMatcher(match_mode, 0.95, max_memory=max_memory)
+
+    dists, idxs = benchmark(matcher, desc1, desc2)
+
+    assert dists.shape[0] == idxs.shape[0]
+
+
+@pytest.mark.parametrize("num_desc", [2000, 8000])
+@pytest.mark.parametrize("num_probes", [4, 8, 16])
+def test_descriptor_matcher_index(benchmark, device, dtype, num_desc, num_probes):
+    torch.manual_seed(0)
+    desc2 = torch.nn.functional.normalize(torch.randn(num_desc, 128, device=device, dtype=dtype), dim=1)
+    desc1 = torch.nn.functional.normalize(desc2 + 0.1 * torch.randn_like(desc2), dim=1)
+    matcher = DescriptorMatcher("snn", 0.9, index=DescriptorIndex(num_probes=num_probes))
+    # the reference descriptors are indexed once, e.g. the target of a tracker
+    matcher.build_index(desc2)
+
+    dists, idxs = benchmark(matcher, desc1, desc2)
+
+    assert dists.shape[0] == idxs.shape[0]
+
+
+@pytest.mark.parametrize("num_candidates", [8, 32])
+@pytest.mark.parametrize("shortlist", [False, True])
+def test_lightglue_shortlist(benchmark, device, dtype, num_candidates, shortlist):
+    torch.manual_seed(0)
+    # the speed does not depend on the weights, which are random to avoid the download
+    lightglue = LightGlue(None, input_dim=128, depth_confidence=-1, width_confidence=-1).to(device, dtype).eval()
+
+    def image(num):
+        return {
+            "keypoints": torch.rand(1, num, 2, device=device, dtype=dtype) * 500,
+            "descriptors": torch.randn(1, num, 128, device=device, dtype=dtype),
+            "image_size": torch.tensor([[640, 512]], device=device),
+        }
+
+    query = image(1024)
+    candidates = [image(num) for num in torch.randint(512, 1024, (num_candidates,)).tolist()]
+
+    def match():
+        if shortlist:
+            return lightglue.match_shortlist(query, candidates)["pair_idxs"]
+        return [lightglue({"image0": query, "image1": candidate})["matches"][0] for candidate in candidates]
+
+    with torch.no_grad():
+        benchmark(match)
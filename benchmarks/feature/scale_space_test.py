@@ -0,0 +1,37 @@
+# LICENSE HEADER MANAGED BY add-license-header
+#
+# Copyright 2018 Kornia Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+import torch
+
+from kornia.feature import SIFTFeature, SIFTFeatureScaleSpace
+
+# about 1, 3, 6 and 12 megapixels
+_SIZES = [(768, 1024), (1536, 2048), (2048, 3072), (3000, 4000)]
+
+
+@pytest.mark.parametrize("hw", _SIZES)
+@pytest.mark.parametrize("feature", [SIFTFeature, SIFTFeatureScaleSpace])
+def test_sift_feature(benchmark, device, dtype, hw, feature):
+    torch.manual_seed(0)
+    img = torch.nn.functional.avg_pool2d(torch.rand(1, 1, *hw, device=device, dtype=dtype), 5, 1, 2)
+    sift = feature(2048, upright=True).to(device, dtype)
+
+    with torch.no_grad():
+        lafs, _, _ = benchmark(sift, img)
+
+    assert lafs.shape == (1, 2048, 2, 3)
@@ -0,0 +1,59 @@
+# LICENSE HEADER MANAGED BY add-license-header
+#
+# Copyright 2018 Kornia Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+import torch
+
+from kornia.geometry.bbox import batched_nms, nms, soft_nms
+
+
+def _boxes(batch_size, num_boxes, device, dtype):
+    torch.manual_seed(0)
+    xy = 500.0 * torch.rand(batch_size, num_boxes, 2, device=device, dtype=dtype)
+    wh = 1.0 + 60.0 * torch.rand(batch_size, num_boxes, 2, device=device, dtype=dtype)
+    scores = torch.rand(batch_size, num_boxes, device=device, dtype=dtype)
+    class_ids = torch.randint(0, 10, (batch_size, num_boxes), device=device)
+    return torch.cat([xy, xy + wh], -1), scores, class_ids
+
+
+@pytest.mark.parametrize("num_boxes", [1000, 5000])
+def test_nms(benchmark, device, dtype, num_boxes):
+    boxes, scores, _ = _boxes(1, num_boxes, device, dtype)
+
+    keep = benchmark(nms, boxes[0], scores[0], 0.5)
+
+    assert keep.dim() == 1
+
+
+@pytest.mark.parametrize("batch_size", [1, 8])
+@pytest.mark.parametrize("num_boxes", [1000, 5000])
+@pytest.mark.parametrize("method", ["iou", "diou"])
+def test_batched_nms(benchmark, device, dtype, batch_size, num_boxes, method):
+    boxes, scores, class_ids = _boxes(batch_size, num_boxes, device, dtype)
+
+    keep = benchmark(batched_nms, boxes, scores, 0.5, class_ids, method=method)
+
+    assert keep.shape == scores.shape
+
+
+@pytest.mark.parametrize("batch_size", [1, 8])
+@pytest.mark.parametrize("num_boxes", [1000, 5000])
+def test_soft_nms(benchmark, device, dtype, batch_size, num_boxes):
+    boxes, scores, class_ids = _boxes(batch_size, num_boxes, device, dtype)
+
+    out = benchmark(soft_nms, boxes, scores, 0.5, class_ids)
+
+    assert out.shape == scores.shape
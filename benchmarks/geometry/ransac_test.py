@@ -0,0 +1,74 @@
+# LICENSE HEADER MANAGED BY add-license-header
+#
+# Copyright 2018 Kornia Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+import torch
+
+from kornia.geometry import RANSAC, transform_points
+
+
+def _correspondences(num_points, outlier_ratio, device, dtype):
+    torch.manual_seed(0)
+    H = torch.eye(3, device=device, dtype=dtype)[None]
+    H[:, :2] = H[:, :2] + 0.1 * torch.rand_like(H[:, :2])
+    src = 1000.0 * torch.rand(1, num_points, 2, device=device, dtype=dtype)
+    dst = transform_points(H, src) + 0.3 * torch.randn_like(src)
+    num_outliers = int(num_points * outlier_ratio)
+    dst[:, :num_outliers] = 1000.0 * torch.rand(1, num_outliers, 2, device=device, dtype=dtype)
+    return src, dst
+
+
+@pytest.mark.parametrize("num_points", [5000, 50000])
+@pytest.mark.parametrize("sprt", [False, True])
+def test_ransac_verification(benchmark, device, dtype, num_points, sprt):
+    src, dst = _correspondences(num_points, 0.5, device, dtype)
+    mask = torch.ones(1, num_points, dtype=torch.bool, device=device)
+    ransac = RANSAC("homography", inl_th=2.0, batch_size=512)
+    models, models_ok = ransac.estimate_models_batch(src, dst, mask)
+    epsilon = torch.zeros(1, device=device, dtype=dtype)
+
+    if sprt:
+        _, _, score = benchmark(ransac.verify_sprt_batch, src, dst, mask, models, models_ok, 2.0, epsilon)
+    else:
+        _, _, score = benchmark(ransac.verify_batch, src, dst, mask, models, models_ok, 2.0)
+
+    assert score.shape == (1,)
+
+
+@pytest.mark.parametrize("num_points", [5000, 50000])
+@pytest.mark.parametrize("sprt", [False, True])
+def test_ransac_homography(benchmark, device, dtype, num_points, sprt):
+    src, dst = _correspondences(num_points, 0.5, device, dtype)
+    ransac = RANSAC("homography", inl_th=2.0, batch_size=512, sprt=sprt)
+
+    model, inliers = benchmark(ransac, src[0], dst[0])
+
+    assert model.shape == (3, 3)
+    assert inliers.shape == (num_points,)
+
+
+@pytest.mark.parametrize("sampling", ["uniform", "prosac", "weighted"])
+def test_ransac_guided_sampling(benchmark, device, dtype, sampling):
+    src, dst = _correspondences(5000, 0.9, device, dtype)
+    # noisy match confidences, higher for the inliers
+    weights = torch.rand(5000, device=device, dtype=dtype)
+    weights[4500:] += 0.5
+    ransac = RANSAC("homography", inl_th=2.0, batch_size=512, sampling=sampling)
+
+    model, _ = benchmark(ransac, src[0], dst[0], weights)
+
+    assert model.shape == (3, 3)
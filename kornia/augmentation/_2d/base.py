@@ -17,7 +17,8 @@
 
 from typing import Any, Dict, Optional
 
-from torch import float16, float32, float64
+import torch
+from torch import float16, float32, float64, uint8
 
 from kornia.augmentation.base import _AugmentationBase
 from kornia.augmentation.utils import _transform_input, _transform_input_by_shape, _validate_input_dtype
@@ -43,23 +44,56 @@ class AugmentationBase2D(_AugmentationBase):
         keepdim: whether to keep the output shape the same as input ``True`` or broadcast it to the batch
           form ``False``.
 
+    Images of ``torch.uint8`` are accepted as well. Unless the augmentation handles them natively, they are
+    converted to floats in :math:`[0, 1]` to be transformed and the output is rounded back to ``torch.uint8``.
+
     """
 
+    # whether ``apply_transform`` handles ``torch.uint8`` images and masks without a conversion to floats
+    _supports_uint8 = False
+
     def validate_tensor(self, input: Tensor) -> None:
         """Check if the input tensor is formatted as expected."""
-        _validate_input_dtype(input, accepted_dtypes=[float16, float32, float64])
+        _validate_input_dtype(input, accepted_dtypes=[float16, float32, float64, uint8])
         if len(input.shape) != 4:
             raise RuntimeError(f"Expect (B, C, H, W). Got {input.shape}.")
 
     def transform_tensor(self, input: Tensor, *, shape: Optional[Tensor] = None, match_channel: bool = True) -> Tensor:
         """Convert any incoming (H, W), (C, H, W) and (B, C, H, W) into (B, C, H, W)."""
-        _validate_input_dtype(input, accepted_dtypes=[float16, float32, float64])
+        _validate_input_dtype(input, accepted_dtypes=[float16, float32, float64, uint8])
 
         if shape is None:
             return _transform_input(input)
         else:
             return _transform_input_by_shape(input, reference_shape=shape, match_channel=match_channel)
 
+    def transform_inputs(
+        self,
+        input: Tensor,
+        params: Dict[str, Tensor],
+        flags: Dict[str, Any],
+        transform: Optional[Tensor] = None,
+        **kwargs: Any,
+    ) -> Tensor:
+        if input.dtype != uint8 or self._supports_uint8:
+            return super().transform_inputs(input, params, flags, transform, **kwargs)
+        output = super().transform_inputs(input.to(self.dtype) / 255.0, params, flags, transform, **kwargs)
+        return (output * 255.0).round().clamp(0, 255).to(uint8)
+
+    def transform_masks(
+        self,
+        input: Tensor,
+        params: Dict[str, Tensor],
+        flags: Dict[str, Any],
+        transform: Optional[Tensor] = None,
+        **kwargs: Any,
+    ) -> Tensor:
+        if input.dtype != uint8 or self._supports_uint8:
+            return super().transform_masks(input, params, flags, transform, **kwargs)
+        # the labels are not rescaled
+        output = super().transform_masks(input.to(self.dtype), params, flags, transform, **kwargs)
+        return output.round().clamp(0, 255).to(uint8)
+
 
 class RigidAffineAugmentationBase2D(AugmentationBase2D):
     r"""AugmentationBase2D base class for rigid/affine augmentation implementations.
@@ -97,19 +131,29 @@ class RigidAffineAugmentationBase2D(AugmentationBase2D):
         to_apply = batch_prob > 0.5  # NOTE: in case of Relaxed Distributions.
 
         in_tensor = self.transform_tensor(input)
-        if not to_apply.any():
+        if not in_tensor.is_floating_point():
+            # the matrices of integer images are computed from their shape only
+            in_tensor = in_tensor.new_zeros((), dtype=self.dtype).expand(in_tensor.shape)
+        full_batch = self.full_batch_params
+        if not full_batch and not to_apply.any():
             trans_matrix = self.identity_matrix(in_tensor)
-        elif to_apply.all():
+        elif not full_batch and to_apply.all():
             trans_matrix = self.compute_transformation(in_tensor, params=params, flags=flags)
         else:
             trans_matrix_A = self.identity_matrix(in_tensor)
-            trans_matrix_B = self.compute_transformation(in_tensor[to_apply], params=params, flags=flags)
+            if full_batch:
+                trans_matrix_B = self.compute_transformation(in_tensor, params=params, flags=flags)
+            else:
+                trans_matrix_B = self.compute_transformation(in_tensor[to_apply], params=params, flags=flags)
 
             if is_autocast_enabled():
                 trans_matrix_A = trans_matrix_A.type(input.dtype)
                 trans_matrix_B = trans_matrix_B.type(input.dtype)
 
-            trans_matrix = trans_matrix_A.index_put((to_apply,), trans_matrix_B)
+            if full_batch:
+                trans_matrix = torch.where(to_apply[:, None, None], trans_matrix_B, trans_matrix_A)
+            else:
+                trans_matrix = trans_matrix_A.index_put((to_apply,), trans_matrix_B)
 
         return trans_matrix
 
@@ -85,7 +85,7 @@ class GeometricAugmentationBase2D(RigidAffineAugmentationBase2D):
             Convert "resample" arguments to "nearest" by default.
 
         """
-        resample_method: Optional[Resample]
+        resample_method: Optional[Resample] = None
         if "resample" in flags:
             resample_method = flags["resample"]
             flags["resample"] = Resample.get("nearest")
@@ -71,8 +71,10 @@ class RandomHorizontalFlip(GeometricAugmentationBase2D):
 
     """
 
+    _supports_uint8 = True
+
     def compute_transformation(self, input: Tensor, params: Dict[str, Tensor], flags: Dict[str, Any]) -> Tensor:
-        w: int = int(params["forward_input_shape"][-1])
+        w: int = input.shape[-1]
         flip_mat: Tensor = tensor([[-1, 0, w - 1], [0, 1, 0], [0, 0, 1]], device=input.device, dtype=input.dtype)
 
         return flip_mat.expand(input.shape[0], 3, 3)
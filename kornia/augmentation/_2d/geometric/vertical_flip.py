@@ -63,8 +63,10 @@ class RandomVerticalFlip(GeometricAugmentationBase2D):
 
     """
 
+    _supports_uint8 = True
+
     def compute_transformation(self, input: Tensor, params: Dict[str, Tensor], flags: Dict[str, Any]) -> Tensor:
-        h: int = int(params["forward_input_shape"][-2])
+        h: int = input.shape[-2]
         flip_mat: Tensor = tensor([[1, 0, 0], [0, -1, h - 1], [0, 0, 1]], device=input.device, dtype=input.dtype)
 
         return flip_mat.expand(input.shape[0], 3, 3)
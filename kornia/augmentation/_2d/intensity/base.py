@@ -17,9 +17,12 @@
 
 from typing import Any, Dict, Optional
 
+import torch
 from torch import Tensor
 
 from kornia.augmentation._2d.base import RigidAffineAugmentationBase2D
+from kornia.augmentation.utils.helpers import _transform_output_shape
+from kornia.enhance.lut import apply_lut, identity_lut, lut_to_uint8
 from kornia.geometry.boxes import Boxes
 from kornia.geometry.keypoints import Keypoints
 
@@ -36,8 +39,76 @@ class IntensityAugmentationBase2D(RigidAffineAugmentationBase2D):
         keepdim: whether to keep the output shape the same as input ``True`` or broadcast it
           to the batch form ``False``.
 
+    Pointwise augmentations can set ``_supports_lut``, their ``torch.uint8`` images are then transformed by a lookup
+    table of the 256 levels per image and channel, computed by :meth:`apply_transform_lut`. Augmentations whose
+    output pixels only depend on the input pixels at the same location can set ``_supports_ragged``, the padded
+    buffer of a :class:`~kornia.augmentation.container.RaggedImages` batch is then transformed at once.
+
     """
 
+    # whether the augmentation is fully described by a lookup table of the levels of ``torch.uint8`` images
+    _supports_lut = False
+    # whether every output pixel only depends on the input pixel at the same location, regardless of the image size
+    _supports_ragged = False
+
+    def apply_transform_lut(
+        self, input: Tensor, lut: Tensor, params: Dict[str, Tensor], flags: Dict[str, Any]
+    ) -> Tensor:
+        """Compose the lookup tables of the augmentation after ``lut``.
+
+        By default, the augmentation is assumed to be pointwise and ``apply_transform`` is applied to the tables.
+
+        Args:
+            input: the ``torch.uint8`` images the tables are applied to, with shape :math:`(B, C, H, W)`.
+            lut: the values in :math:`[0, 1]` the levels of the images take so far, with shape :math:`(B, C, 256)`.
+            params: the parameters of the augmentation.
+            flags: the flags of the augmentation.
+
+        Returns:
+            the updated lookup tables with shape :math:`(B, C, 256)`.
+
+        """
+        return self.apply_transform(lut[..., None, :], params, flags)[..., 0, :]
+
+    def transform_lut(self, input: Tensor, lut: Tensor, params: Dict[str, Tensor], flags: Dict[str, Any]) -> Tensor:
+        """Compose the lookup tables of the augmentation after ``lut`` for the samples it is applied to.
+
+        Args:
+            input: the ``torch.uint8`` images the tables are applied to, with shape :math:`(B, C, H, W)`.
+            lut: the values in :math:`[0, 1]` the levels of the images take so far, with shape :math:`(B, C, 256)`.
+            params: the parameters of the augmentation.
+            flags: the flags of the augmentation.
+
+        """
+        to_apply = params["batch_prob"] > 0.5  # NOTE: in case of Relaxed Distributions.
+        if self.full_batch_params:
+            return torch.where(to_apply[:, None, None], self.apply_transform_lut(input, lut, params, flags), lut)
+        if to_apply.all():
+            return self.apply_transform_lut(input, lut, params, flags)
+        if not to_apply.any():
+            return lut
+        applied = self.apply_transform_lut(input[to_apply], lut[to_apply], params, flags)
+        return lut.index_put((to_apply,), applied)
+
+    def transform_inputs(
+        self,
+        input: Tensor,
+        params: Dict[str, Tensor],
+        flags: Dict[str, Any],
+        transform: Optional[Tensor] = None,
+        **kwargs: Any,
+    ) -> Tensor:
+        if input.dtype != torch.uint8 or not self._supports_lut:
+            return super().transform_inputs(input, params, flags, transform, **kwargs)
+        params, flags = self._process_kwargs_to_params_and_flags(
+            self._params if params is None else params, flags, **kwargs
+        )
+        in_tensor = self.transform_tensor(input)
+        self.validate_tensor(in_tensor)
+        lut = self.transform_lut(in_tensor, identity_lut(in_tensor, self.dtype), params, flags)
+        output = apply_lut(in_tensor, lut_to_uint8(lut))
+        return _transform_output_shape(output, input.shape) if self.keepdim else output
+
     def compute_transformation(self, input: Tensor, params: Dict[str, Tensor], flags: Dict[str, Any]) -> Tensor:
         return self.identity_matrix(input)
 
@@ -72,6 +72,9 @@ class RandomBrightness(IntensityAugmentationBase2D):
 
     """
 
+    _supports_lut = True
+    _supports_ragged = True
+
     def __init__(
         self,
         brightness: Tuple[float, float] = (1.0, 1.0),
@@ -52,6 +52,8 @@ class RandomChannelShuffle(IntensityAugmentationBase2D):
 
     """
 
+    _supports_ragged = True
+
     def __init__(self, same_on_batch: bool = False, p: float = 0.5, keepdim: bool = False) -> None:
         super().__init__(p=p, same_on_batch=same_on_batch, p_batch=1.0, keepdim=keepdim)
 
@@ -15,10 +15,11 @@
 # limitations under the License.
 #
 
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from kornia.augmentation import random_generator as rg
 from kornia.augmentation._2d.intensity.base import IntensityAugmentationBase2D
+from kornia.augmentation._2d.intensity.color_jitter import _apply_in_order, _is_identity_range
 from kornia.constants import pi
 from kornia.core import Tensor
 from kornia.enhance import adjust_brightness, adjust_contrast, adjust_hue, adjust_saturation
@@ -72,6 +73,8 @@ class ColorJiggle(IntensityAugmentationBase2D):
 
     """
 
+    _supports_ragged = True
+
     def __init__(
         self,
         brightness: Union[Tensor, float, Tuple[float, float], List[float]] = 0.0,
@@ -92,6 +95,20 @@ class ColorJiggle(IntensityAugmentationBase2D):
     def apply_transform(
         self, input: Tensor, params: Dict[str, Tensor], flags: Dict[str, Any], transform: Optional[Tensor] = None
     ) -> Tensor:
+        if self.static_mode:
+            # no shortcuts on the values, so that the traced graph does not depend on the parameters
+            # the factors which are constant by construction are still skipped, e.g. for grayscale images
+            static: List[Tuple[int, Callable[[Tensor], Tensor]]] = []
+            if not _is_identity_range(self.brightness, 1.0):
+                static.append((0, lambda img: adjust_brightness(img, params["brightness_factor"] - 1)))
+            if not _is_identity_range(self.contrast, 1.0):
+                static.append((1, lambda img: adjust_contrast(img, params["contrast_factor"])))
+            if not _is_identity_range(self.saturation, 1.0):
+                static.append((2, lambda img: adjust_saturation(img, params["saturation_factor"])))
+            if not _is_identity_range(self.hue, 0.0):
+                static.append((3, lambda img: adjust_hue(img, params["hue_factor"] * 2 * pi)))
+            return _apply_in_order(input, params["order"], static)
+
         transforms = [
             lambda img: adjust_brightness(img, params["brightness_factor"] - 1)
             if (params["brightness_factor"] - 1 != 0).any()
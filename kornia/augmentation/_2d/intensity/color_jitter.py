@@ -15,7 +15,7 @@
 # limitations under the License.
 #
 
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import torch
 
@@ -31,6 +31,30 @@ from kornia.enhance import (
 )
 
 
+def _is_identity_range(factor: Union[Tensor, float, Tuple[float, float], List[float]], center: float) -> bool:
+    # only the python values are checked, reading a tensor would synchronize with its device
+    if isinstance(factor, (int, float)):
+        return factor == 0
+    if isinstance(factor, (tuple, list)):
+        return all(isinstance(f, (int, float)) and f == center for f in factor)
+    return False
+
+
+def _apply_in_order(input: Tensor, order: Tensor, transforms: List[Tuple[int, Callable[[Tensor], Tensor]]]) -> Tensor:
+    # the order is followed on the device: in the round ``r`` only the transform ranked ``r`` among the given
+    # ones is kept, so that the graph does not depend on the order at the cost of ``len(transforms) ** 2`` calls
+    if not transforms:
+        return input
+    position = torch.argsort(order.to(input.device))
+    indices = torch.tensor([idx for idx, _ in transforms], device=input.device)
+    ranks = (position[indices][None] < position[indices][:, None]).sum(1)
+    output = input
+    for r in range(len(transforms)):
+        for rank, (_, fn) in zip(ranks, transforms):
+            output = torch.where(rank == r, fn(output), output)
+    return output
+
+
 class ColorJitter(IntensityAugmentationBase2D):
     r"""Apply a random transformation to the brightness, contrast, saturation and hue of a tensor image.
 
@@ -100,6 +124,8 @@ class ColorJitter(IntensityAugmentationBase2D):
 
         self.brightness = brightness
         self.contrast = contrast
+        # the contrast is adjusted around the mean of each image, which would include the padding of a ragged batch
+        self._supports_ragged = _is_identity_range(contrast, 1.0)
         self.saturation = saturation
         self.hue = hue
         self._param_generator = rg.ColorJitterGenerator(brightness, contrast, saturation, hue)
@@ -117,6 +143,20 @@ class ColorJitter(IntensityAugmentationBase2D):
         flags: Dict[str, Any],
         transform: Optional[Tensor] = None,
     ) -> Tensor:
+        if self.static_mode:
+            # no shortcuts on the values, so that the traced graph does not depend on the parameters
+            # the factors which are constant by construction are still skipped, e.g. for grayscale images
+            static: List[Tuple[int, Callable[[Tensor], Tensor]]] = []
+            if not _is_identity_range(self.brightness, 1.0):
+                static.append((0, lambda img: self._brightness_fn(img, params["brightness_factor"])))
+            if not _is_identity_range(self.contrast, 1.0):
+                static.append((1, lambda img: self._contrast_fn(img, params["contrast_factor"])))
+            if not _is_identity_range(self.saturation, 1.0):
+                static.append((2, lambda img: self._saturation_fn(img, params["saturation_factor"])))
+            if not _is_identity_range(self.hue, 0.0):
+                static.append((3, lambda img: self._hue_fn(img, params["hue_factor"] * 2 * pi)))
+            return _apply_in_order(input, params["order"], static)
+
         transforms = [
             lambda img: (
                 self._brightness_fn(img, params["brightness_factor"])
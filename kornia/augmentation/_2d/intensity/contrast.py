@@ -71,6 +71,9 @@ class RandomContrast(IntensityAugmentationBase2D):
 
     """
 
+    _supports_lut = True
+    _supports_ragged = True
+
     def __init__(
         self,
         contrast: Tuple[float, float] = (1.0, 1.0),
@@ -55,6 +55,8 @@ class Denormalize(IntensityAugmentationBase2D):
 
     """
 
+    _supports_ragged = True
+
     def __init__(
         self,
         mean: Union[Tensor, Tuple[float], List[float], float],
@@ -21,6 +21,8 @@ from torch import Tensor
 
 from kornia.augmentation._2d.intensity.base import IntensityAugmentationBase2D
 from kornia.enhance import equalize
+from kornia.enhance.adjust import _equalize_lut, _level_histogram
+from kornia.enhance.lut import lut_to_uint8
 
 
 class RandomEqualize(IntensityAugmentationBase2D):
@@ -39,7 +41,8 @@ class RandomEqualize(IntensityAugmentationBase2D):
         - Output: :math:`(B, C, H, W)`
 
     .. note::
-        This function internally uses :func:`kornia.enhance.equalize`.
+        This function internally uses :func:`kornia.enhance.equalize`. For ``torch.uint8`` images, the equalization
+        is computed from the histograms of the input and applied as a lookup table.
 
     Examples:
         >>> rng = torch.manual_seed(0)
@@ -60,6 +63,8 @@ class RandomEqualize(IntensityAugmentationBase2D):
 
     """
 
+    _supports_lut = True
+
     def __init__(self, same_on_batch: bool = False, p: float = 0.5, keepdim: bool = False) -> None:
         super().__init__(p=p, same_on_batch=same_on_batch, keepdim=keepdim)
 
@@ -67,3 +72,12 @@ class RandomEqualize(IntensityAugmentationBase2D):
         self, input: Tensor, params: Dict[str, Tensor], flags: Dict[str, Any], transform: Optional[Tensor] = None
     ) -> Tensor:
         return equalize(input)
+
+    def apply_transform_lut(
+        self, input: Tensor, lut: Tensor, params: Dict[str, Tensor], flags: Dict[str, Any]
+    ) -> Tensor:
+        # the levels so far are rounded as in a uint8 image, their histograms follow from the ones of the input
+        levels = lut_to_uint8(lut).long()
+        histo = _level_histogram(input.flatten(-2), dtype=lut.dtype)
+        histo = _level_histogram(levels, weights=histo)
+        return _equalize_lut(histo).gather(-1, levels) / 255.0
@@ -69,6 +69,9 @@ class RandomGamma(IntensityAugmentationBase2D):
 
     """
 
+    _supports_lut = True
+    _supports_ragged = True
+
     def __init__(
         self,
         gamma: Tuple[float, float] = (1.0, 1.0),
@@ -69,6 +69,8 @@ class RandomGrayscale(IntensityAugmentationBase2D):
 
     """
 
+    _supports_ragged = True
+
     def __init__(
         self, rgb_weights: Optional[Tensor] = None, same_on_batch: bool = False, p: float = 0.1, keepdim: bool = False
     ) -> None:
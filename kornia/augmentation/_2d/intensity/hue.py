@@ -71,6 +71,8 @@ class RandomHue(IntensityAugmentationBase2D):
 
     """
 
+    _supports_ragged = True
+
     def __init__(
         self, hue: Tuple[float, float] = (0.0, 0.0), same_on_batch: bool = False, p: float = 1.0, keepdim: bool = False
     ) -> None:
@@ -58,6 +58,9 @@ class RandomInvert(IntensityAugmentationBase2D):
 
     """
 
+    _supports_lut = True
+    _supports_ragged = True
+
     def __init__(
         self,
         max_val: Union[float, Tensor] = 1.0,
@@ -56,6 +56,8 @@ class Normalize(IntensityAugmentationBase2D):
 
     """
 
+    _supports_ragged = True
+
     def __init__(
         self,
         mean: Tensor | tuple[float, ...] | list[float] | float,
@@ -158,6 +158,8 @@ class RandomPlanckianJitter(IntensityAugmentationBase2D):
 
     """
 
+    _supports_ragged = True
+
     def __init__(
         self,
         mode: str = "blackbody",
@@ -63,6 +63,9 @@ class RandomPosterize(IntensityAugmentationBase2D):
 
     """
 
+    _supports_lut = True
+    _supports_ragged = True
+
     def __init__(
         self,
         bits: Union[float, Tuple[float, float], Tensor] = 3,
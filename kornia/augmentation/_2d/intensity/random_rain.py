@@ -81,29 +81,45 @@ class RandomRain(IntensityAugmentationBase2D):
             bool(torch.all(torch.abs(params["drop_width_factor"]) <= image.shape[3])),
             "Width of drop should be less than image width.",
         )
-        modeified_img = image.clone()
-        for i in range(image.shape[0]):
-            number_of_drops: int = int(params["number_of_drops_factor"][i])
-            # We generate tensor with maximum number of drops, and then remove unnecessary drops.
-
-            coordinates_of_drops: Tensor = params["coordinates_factor"][i][:number_of_drops]
-            height_of_drop: int = int(params["drop_height_factor"][i])
-            width_of_drop: int = int(params["drop_width_factor"][i])
-
-            # Generate start coordinates for each drop
-            random_y_coords = coordinates_of_drops[:, 0] * (image.shape[2] - height_of_drop - 1)
-            if width_of_drop > 0:
-                random_x_coords = coordinates_of_drops[:, 1] * (image.shape[3] - width_of_drop - 1)
-            else:
-                random_x_coords = coordinates_of_drops[:, 1] * (image.shape[3] + width_of_drop - 1) - width_of_drop
-
-            coords = torch.cat([random_y_coords[None], random_x_coords[None]], dim=0).to(image.device, dtype=torch.long)
-
-            # Generate how our drop will look like into the image
-            size_of_line: int = max(height_of_drop, abs(width_of_drop))
-            x = torch.linspace(start=0, end=height_of_drop, steps=size_of_line, dtype=torch.long).to(image.device)
-            y = torch.linspace(start=0, end=width_of_drop, steps=size_of_line, dtype=torch.long).to(image.device)
-            # Draw lines
-            for k in range(x.shape[0]):
-                modeified_img[i, :, coords[0] + x[k], coords[1] + y[k]] = 200 / 255
-        return modeified_img
+        batch_size, _, height, width = image.shape
+        height_of_drops = params["drop_height_factor"].to(image.device)
+        width_of_drops = params["drop_width_factor"].to(image.device)
+        number_of_drops = params["number_of_drops_factor"].to(image.device)
+        # We generate tensor with maximum number of drops, and then mask out the unnecessary drops.
+        coordinates_of_drops = params["coordinates_factor"].to(image.device)
+        is_drop = torch.arange(coordinates_of_drops.shape[1], device=image.device) < number_of_drops.view(-1, 1)
+
+        # Generate start coordinates for each drop
+        drop_height = height_of_drops.to(coordinates_of_drops.dtype).view(-1, 1)
+        drop_width = width_of_drops.to(coordinates_of_drops.dtype).view(-1, 1)
+        random_y_coords = coordinates_of_drops[..., 0] * (height - drop_height - 1)
+        random_x_coords = torch.where(
+            drop_width > 0,
+            coordinates_of_drops[..., 1] * (width - drop_width - 1),
+            coordinates_of_drops[..., 1] * (width + drop_width - 1) - drop_width,
+        )
+
+        # Generate how our drop will look like into the image, the lines of all the drops are drawn at once
+        size_of_line = torch.maximum(height_of_drops, width_of_drops.abs())
+        x = _linspace_long(height_of_drops, size_of_line, int(size_of_line.max()) if batch_size > 0 else 0)
+        y = _linspace_long(width_of_drops, size_of_line, x.shape[-1])
+        rows = random_y_coords.long()[..., None] + x[:, None]
+        cols = random_x_coords.long()[..., None] + y[:, None]
+        is_pixel = is_drop[..., None] & (torch.arange(x.shape[-1], device=image.device) < size_of_line.view(-1, 1, 1))
+        hits = torch.zeros(batch_size, height * width, device=image.device, dtype=torch.int32)
+        hits.scatter_add_(1, (rows * width + cols).flatten(1), is_pixel.flatten(1).to(torch.int32))
+        return image.masked_fill(hits.view(batch_size, 1, height, width) > 0, 200 / 255)
+
+
+def _linspace_long(end: Tensor, steps: Tensor, max_steps: int) -> Tensor:
+    r"""Compute ``torch.linspace(0, end[i], steps[i], dtype=torch.long)`` for every row at once.
+
+    The values are computed from both ends in double precision like :func:`torch.linspace`, and the rows are padded
+    with the last values up to ``max_steps``.
+    """
+    end = end.to(torch.float64).view(-1, 1)
+    steps = steps.view(-1, 1)
+    k = torch.minimum(torch.arange(max_steps, device=end.device), steps - 1).to(torch.float64)
+    step = end / (steps - 1).clamp(min=1)
+    values = torch.where(k < torch.div(steps, 2, rounding_mode="floor"), step * k, end - step * (steps - 1 - k))
+    return torch.where(steps == 1, torch.zeros_like(values), values).long()
@@ -91,6 +91,8 @@ class RandomRGBShift(IntensityAugmentationBase2D):
 
     """
 
+    _supports_ragged = True
+
     def __init__(
         self,
         r_shift_limit: float = 0.5,
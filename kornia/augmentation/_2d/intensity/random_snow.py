@@ -77,18 +77,14 @@ class RandomSnow(IntensityAugmentationBase2D):
             input = input[None, :, :, :]
         input_HLS = rgb_to_hls(input)
 
-        mask = torch.zeros_like(input_HLS)
         # Retrieve generated parameters
-        snow_coefficient = params["snow_coefficient"].to(input)
-        brightness = params["brightness"].to(input)
-        snow_coefficient = snow_coefficient[:, None, None, None]
-        brightness = brightness[:, None, None, None]
-
-        mask[:, 1, :, :] = torch.where(input_HLS[:, 1, :, :] < snow_coefficient[:, 0, :, :], 1, 0)
+        snow_coefficient = params["snow_coefficient"].to(input)[:, None, None]
+        brightness = params["brightness"].to(input)[:, None, None]
 
         # Increase Light channel of the image by given brightness for areas based on snow coefficient.
-        new_light = (input_HLS * mask * brightness).clamp(min=0.0, max=1.0)
-        input_HLS = input_HLS * (1 - mask) + new_light
+        light = input_HLS[:, 1]
+        new_light = torch.where(light < snow_coefficient, (light * brightness).clamp(min=0.0, max=1.0), light)
+        input_HLS = torch.stack([input_HLS[:, 0], new_light, input_HLS[:, 2]], 1)
 
         output = hls_to_rgb(input_HLS)
         return output
@@ -70,6 +70,8 @@ class RandomSaturation(IntensityAugmentationBase2D):
 
     """
 
+    _supports_ragged = True
+
     def __init__(
         self,
         saturation: Tuple[float, float] = (1.0, 1.0),
@@ -66,6 +66,9 @@ class RandomSolarize(IntensityAugmentationBase2D):
 
     """
 
+    _supports_lut = True
+    _supports_ragged = True
+
     def __init__(
         self,
         thresholds: Union[Tensor, float, Tuple[float, float], List[float]] = 0.1,
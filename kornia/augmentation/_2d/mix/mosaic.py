@@ -22,7 +22,7 @@ import torch
 from kornia.augmentation import random_generator as rg
 from kornia.augmentation._2d.mix.base import MixAugmentationBaseV2
 from kornia.constants import DataKey, Resample
-from kornia.core import Tensor, as_tensor, concatenate, pad, zeros
+from kornia.core import Tensor, as_tensor, pad, zeros
 from kornia.core.check import KORNIA_UNWRAP
 from kornia.geometry.boxes import Boxes
 from kornia.geometry.transform import crop_by_indices, crop_by_transform_mat, get_perspective_transform
@@ -116,30 +116,31 @@ class RandomMosaic(MixAugmentationBaseV2):
         dst_box = as_tensor(params["dst"], device=input.device, dtype=input.dtype)
         # Boxes is BxNx4x2 only.
         batch_shapes = as_tensor(params["batch_shapes"], device=input.device, dtype=input.dtype)
-        offset = zeros((len(to_apply), 2), device=input.device, dtype=input.dtype)  # Bx2
+        permutation = params["permutation"].to(input.device)
+        rows, cols = flags["mosaic_grid"]
+        # the tile (i, j) is placed at the i-th column and the j-th row of the super-image
+        grid_i, grid_j = torch.meshgrid(
+            torch.arange(rows, device=input.device, dtype=input.dtype),
+            torch.arange(cols, device=input.device, dtype=input.dtype),
+            indexing="ij",
+        )
+        offset = zeros((len(to_apply), rows * cols, 2), device=input.device, dtype=input.dtype)  # BxTx2
+        offset[to_apply, :, 0] = batch_shapes[:, -2, None] * grid_i.flatten() - src_box[:, :1, 0]
+        offset[to_apply, :, 1] = batch_shapes[:, -1, None] * grid_j.flatten() - src_box[:, :1, 1]
+
+        # the boxes of every tile, translated to the super-image at once
+        data = input.data[:, None].repeat(1, rows * cols, 1, 1, 1)  # BxTxNx4x2
+        data[: len(permutation)] = input.data[permutation]
+        data = data + offset[:, :, None, None]
+        # zero-out unrelated batch elements, keeping their boxes once.
+        data[~to_apply] = 0
+        data[~to_apply, 0] = input.data[~to_apply]
+
+        out_boxes = input.clone()
+        out_boxes._data = data.flatten(1, 2)
         # NOTE: not a pretty good line I think.
         offset_end = dst_box[0, 2].repeat(input.data.shape[0], 1)
-        idx = torch.arange(0, input.data.shape[0], device=input.device, dtype=torch.long)[to_apply]
-
-        maybe_out_boxes: Optional[Boxes] = None
-        for i in range(flags["mosaic_grid"][0]):
-            for j in range(flags["mosaic_grid"][1]):
-                _offset = offset.clone()
-                _offset[idx, 0] = batch_shapes[:, -2] * i - src_box[:, 0, 0]
-                _offset[idx, 1] = batch_shapes[:, -1] * j - src_box[:, 0, 1]
-                _box = input.clone()
-                _idx = i * flags["mosaic_grid"][1] + j
-                _box._data[params["permutation"][:, 0]] = _box._data[params["permutation"][:, _idx]]
-                _box.translate(_offset, inplace=True)
-                # zero-out unrelated batch elements.
-                _box._data[~to_apply] = 0
-                if maybe_out_boxes is None:
-                    _box._data[~to_apply] = input._data[~to_apply]
-                    maybe_out_boxes = _box
-                else:
-                    KORNIA_UNWRAP(maybe_out_boxes, Boxes).merge(_box, inplace=True)
-        out_boxes: Boxes = KORNIA_UNWRAP(maybe_out_boxes, Boxes)
-        out_boxes.clamp(offset, offset_end, inplace=True)
+        out_boxes.clamp(offset[:, 0].new_zeros(len(to_apply), 2), offset_end, inplace=True)
         out_boxes.filter_boxes_by_area(flags["min_bbox_size"], inplace=True)
         return out_boxes
 
@@ -151,15 +152,14 @@ class RandomMosaic(MixAugmentationBaseV2):
 
     @torch.no_grad()
     def _compose_images(self, input: Tensor, params: Dict[str, Tensor], flags: Dict[str, Any]) -> Tensor:
-        out = []
-        for i in range(flags["mosaic_grid"][0]):
-            out_row = []
-            for j in range(flags["mosaic_grid"][1]):
-                img_idx = flags["mosaic_grid"][1] * i + j
-                image = input[params["permutation"][:, img_idx]]
-                out_row.append(image)
-            out.append(concatenate(out_row, -2))
-        return concatenate(out, -1)
+        rows, cols = flags["mosaic_grid"]
+        permutation = params["permutation"]
+        batch_size = permutation.shape[0]
+        # the image (i, j) of the grid is placed at the i-th column and the j-th row of the super-image
+        tiles = input[permutation.flatten()].view(batch_size, rows, cols, *input.shape[1:])
+        output = input.new_empty(batch_size, input.shape[1], cols, input.shape[-2], rows, input.shape[-1])
+        output.copy_(tiles.permute(0, 3, 2, 4, 1, 5))
+        return output.view(batch_size, input.shape[1], cols * input.shape[-2], rows * input.shape[-1])
 
     def compute_transformation(self, input: Tensor, params: Dict[str, Tensor], flags: Dict[str, Any]) -> Tensor:
         if flags["cropping_mode"] == "resample":
@@ -17,6 +17,7 @@
 
 from typing import Any, Dict, Optional
 
+import torch
 from torch import float16, float32, float64
 
 import kornia
@@ -89,15 +90,20 @@ class RigidAffineAugmentationBase3D(AugmentationBase3D):
         batch_prob = params["batch_prob"]
         to_apply = batch_prob > 0.5  # NOTE: in case of Relaxed Distributions.
         in_tensor = self.transform_tensor(input)
-        if not to_apply.any():
+        full_batch = self.full_batch_params
+        if not full_batch and not to_apply.any():
             trans_matrix = self.identity_matrix(in_tensor)
-        elif to_apply.all():
+        elif not full_batch and to_apply.all():
             trans_matrix = self.compute_transformation(in_tensor, params=params, flags=flags)
         else:
             trans_matrix = self.identity_matrix(in_tensor)
-            trans_matrix = trans_matrix.index_put(
-                (to_apply,), self.compute_transformation(in_tensor[to_apply], params=params, flags=flags)
-            )
+            if full_batch:
+                applied = self.compute_transformation(in_tensor, params=params, flags=flags)
+                trans_matrix = torch.where(to_apply[:, None, None], applied, trans_matrix)
+            else:
+                trans_matrix = trans_matrix.index_put(
+                    (to_apply,), self.compute_transformation(in_tensor[to_apply], params=params, flags=flags)
+                )
         return trans_matrix
 
     def inverse_inputs(
@@ -101,17 +101,21 @@ from kornia.augmentation._3d.base import AugmentationBase3D, RigidAffineAugmenta
 from kornia.augmentation._3d.geometric.base import GeometricAugmentationBase3D
 from kornia.augmentation._3d.intensity.base import IntensityAugmentationBase3D
 from kornia.augmentation.container import (
+    AugmentationPool,
     AugmentationSequential,
     ImageSequential,
     ManyToManyAugmentationDispather,
     ManyToOneAugmentationDispather,
+    ParamBank,
     PatchSequential,
+    RaggedImages,
     VideoSequential,
 )
 
 __all__ = [
     "AugmentationBase2D",
     "AugmentationBase3D",
+    "AugmentationPool",
     "AugmentationSequential",
     "CenterCrop",
     "CenterCrop3D",
@@ -129,7 +133,9 @@ __all__ = [
     "MixAugmentationBaseV2",
     "Normalize",
     "PadTo",
+    "ParamBank",
     "PatchSequential",
+    "RaggedImages",
     "RandomAffine",
     "RandomAffine3D",
     "RandomAutoContrast",
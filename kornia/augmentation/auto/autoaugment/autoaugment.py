@@ -158,6 +158,8 @@ class AutoAugment(PolicyAugmentBase):
         return PolicySequential(*[getattr(ops, name)(prob, mag) for name, prob, mag in subpolicy])
 
     def get_forward_sequence(self, params: Optional[List[ParamItem]] = None) -> Iterator[Tuple[str, Module]]:
+        if params is None and self.static_mode:
+            return self.named_children()
         if params is None:
             idx = self.rand_selector.sample((1,))
             return self.get_children_by_indices(idx)
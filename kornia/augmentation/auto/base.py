@@ -21,7 +21,7 @@ import torch
 
 from kornia.augmentation.auto.operations.base import OperationBase
 from kornia.augmentation.auto.operations.policy import PolicySequential
-from kornia.augmentation.container.base import ImageSequentialBase, TransformMatrixMinIn
+from kornia.augmentation.container.base import ImageSequentialBase, TransformMatrixMinIn, _mask_batch_prob
 from kornia.augmentation.container.ops import InputSequentialOps
 from kornia.augmentation.container.params import ParamItem
 from kornia.core import Module, Tensor
@@ -98,6 +98,22 @@ class PolicyAugmentBase(ImageSequentialBase, TransformMatrixMinIn):
                 return False
         return True
 
+    def get_static_selection(self, batch_size: int) -> Tensor:
+        """Draw the policies applied to each sample in static mode, as a :math:`(B, N)` boolean mask.
+
+        By default, one policy is drawn uniformly for each sample.
+        """
+        idx = (self._rand(batch_size) * len(self)).long().clamp_max(len(self) - 1)
+        return torch.nn.functional.one_hot(idx, len(self)).bool()
+
+    def mask_static_selection(self, params: List[ParamItem], batch_size: int) -> List[ParamItem]:
+        """Mask the parameters of all the policies by the selection drawn for each sample, in static mode."""
+        if self.static_mode:
+            selection = self.get_static_selection(batch_size)
+            for idx, param in enumerate(params):
+                _mask_batch_prob(param.data, selection[:, idx])
+        return params
+
     def forward_parameters(self, batch_shape: torch.Size) -> List[ParamItem]:
         named_modules: Iterator[Tuple[str, Module]] = self.get_forward_sequence()
 
@@ -108,7 +124,7 @@ class PolicyAugmentBase(ImageSequentialBase, TransformMatrixMinIn):
             mod_param = module.forward_parameters(batch_shape)
             param = ParamItem(name, mod_param)
             params.append(param)
-        return params
+        return self.mask_static_selection(params, batch_shape[0])
 
     def transform_inputs(
         self, input: Tensor, params: List[ParamItem], extra_args: Optional[Dict[str, Any]] = None
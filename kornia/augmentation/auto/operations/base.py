@@ -59,6 +59,8 @@ class OperationBase(Module):
             raise ValueError(f"Only Kornia augmentations supported. Got {operation}.")
 
         self.op = operation
+        # the outputs of the wrapped operation are intermediate, no need to keep a host copy of them
+        self.op.disable_features = True
 
         self._init_magnitude(initial_magnitude)
 
@@ -138,6 +140,12 @@ class OperationBase(Module):
     def eval(self) -> Self:
         return self.train(False)
 
+    def set_rng_generator(self, generator: Optional[torch.Generator]) -> None:
+        self.op.set_rng_generator(generator)
+
+    def set_static_mode(self, enabled: bool = True) -> None:
+        self.op.set_static_mode(enabled)
+
     def forward_parameters(self, batch_shape: torch.Size, mag: Optional[Tensor] = None) -> Dict[str, Tensor]:
         if mag is None:
             mag = self.magnitude
@@ -130,6 +130,7 @@ class PolicySequential(TransformMatrixMinIn, ImageSequentialBase):
     def transform_inputs(
         self, input: Tensor, params: List[ParamItem], extra_args: Optional[Dict[str, Any]] = None
     ) -> Tensor:
+        self._reset_transform_matrix_state()
         for param in params:
             module = self.get_submodule(param.name)
             input = InputSequentialOps.transform(input, module=module, param=param, extra_args=extra_args)
@@ -22,6 +22,7 @@ import torch
 from kornia.augmentation.auto.base import SUBPOLICY_CONFIG, PolicyAugmentBase
 from kornia.augmentation.auto.operations import OperationBase
 from kornia.augmentation.auto.operations.policy import PolicySequential
+from kornia.augmentation.container.base import _select_per_sample
 from kornia.augmentation.container.params import ParamItem
 from kornia.core import Module, Tensor
 
@@ -101,7 +102,13 @@ class RandAugment(PolicyAugmentBase):
         name, low, high = subpolicy[0]
         return PolicySequential(*[getattr(ops, name)(low, high)])
 
+    def get_static_selection(self, batch_size: int) -> Tensor:
+        rand = self._rand(batch_size, len(self))
+        return _select_per_sample(torch.full_like(rand[:, 0], self.n), torch.ones(len(self)), rand)
+
     def get_forward_sequence(self, params: Optional[List[ParamItem]] = None) -> Iterator[Tuple[str, Module]]:
+        if params is None and self.static_mode:
+            return self.named_children()
         if params is None:
             idx = self.rand_selector(
                 self.n,
@@ -129,4 +136,4 @@ class RandAugment(PolicyAugmentBase):
             param = ParamItem(name, [ParamItem(next(iter(module.named_children()))[0], mod_param)])
             params.append(param)
 
-        return params
+        return self.mask_static_selection(params, batch_shape[0])
@@ -16,7 +16,7 @@
 #
 
 from enum import Enum
-from typing import Any, Callable, Dict, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, Union
 
 import torch
 from torch.distributions import Bernoulli, Distribution, RelaxedBernoulli
@@ -49,12 +49,28 @@ def _apply_transform_unimplemented(self: Module, *input: Any) -> Tensor:
     raise NotImplementedError(f'Module [{type(self).__name__}] is missing the required "apply_tranform" function')
 
 
+_Applied = TypeVar("_Applied", Tensor, Boxes, Keypoints)
+
+
+def _put_applied(output: _Applied, applied: _Applied, to_apply: Tensor, full_batch: bool) -> _Applied:
+    """Write the transformed samples into the output, ``applied`` holding either the whole batch or the selection."""
+    if isinstance(output, (Boxes, Keypoints)):
+        out = output.clone()
+        out._data = _put_applied(output.data, applied.data, to_apply, full_batch)
+        return out
+    if full_batch:
+        return torch.where(to_apply.view(-1, *([1] * (output.dim() - 1))), applied, output)
+    return output.index_put((to_apply,), applied)
+
+
 class _BasicAugmentationBase(Module):
     r"""_BasicAugmentationBase base class for customized augmentation implementations.
 
     Plain augmentation base class without the functionality of transformation matrix calculations.
     By default, the random computations will be happened on CPU with ``torch.get_default_dtype()``.
-    To change this behaviour, please use ``set_rng_device_and_dtype``.
+    To change this behaviour, please use ``set_rng_device_and_dtype``. With ``set_rng_generator``, the parameters
+    are sampled from a dedicated ``torch.Generator`` on its device, for the whole batch, without any host
+    synchronization.
 
     For automatically generating the corresponding ``__repr__`` with full customized parameters, you may need to
     implement ``_param_generator`` by inheriting ``RandomGeneratorBase`` for generating random parameters and
@@ -75,6 +91,9 @@ class _BasicAugmentationBase(Module):
     # Please contribute if anyone interested.
     ONNX_EXPORTABLE = False
 
+    # Whether the module consumes parameters generated for the whole batch, including the skipped samples.
+    _supports_full_batch_params = False
+
     def __init__(
         self,
         p: float = 0.5,
@@ -95,6 +114,8 @@ class _BasicAugmentationBase(Module):
         if p_batch != 0.0 or p_batch != 1.0:
             self._p_batch_gen = Bernoulli(self.p_batch)
         self._param_generator: Optional[RandomGeneratorBase] = None
+        self._generator: Optional[torch.Generator] = None
+        self._static = False
         self.flags: Dict[str, Any] = {}
         self.set_rng_device_and_dtype(torch.device("cpu"), torch.get_default_dtype())
 
@@ -155,6 +176,98 @@ class _BasicAugmentationBase(Module):
         if self._param_generator is not None:
             self._param_generator.set_rng_device_and_dtype(device, dtype)
 
+    def set_rng_generator(self, generator: Optional[torch.Generator]) -> None:
+        """Sample the parameters from a dedicated generator, on the device of the generator.
+
+        The parameters are generated for the whole batch and the samples skipped according to ``p`` are masked out
+        afterwards, so that their number is never read back on the host. The random stream of the module is
+        independent from the global one and reproducible by seeding ``generator``.
+
+        Args:
+            generator: the generator to sample from. ``None`` restores the global random stream and the sampling of
+                the parameters for the applied samples only.
+
+        Example:
+            >>> import kornia.augmentation as K
+            >>> aug = K.RandomAffine(30.0, p=0.5)
+            >>> aug.set_rng_generator(torch.Generator().manual_seed(0))
+            >>> params = aug.forward_parameters((4, 3, 8, 8))
+            >>> params["angle"].shape
+            torch.Size([4])
+
+        """
+        self._generator = generator
+        if generator is not None:
+            self.set_rng_device_and_dtype(generator.device, self.dtype)
+        if self._param_generator is not None:
+            self._param_generator.set_rng_generator(generator)
+
+    def set_static_mode(self, enabled: bool = True) -> None:
+        """Run the module with static shapes and without branching on the sampled values.
+
+        In static mode, the operation is computed on the whole batch and blended with the ``batch_prob`` mask, so that
+        the traced graph only depends on the configuration of the module. This lets ``torch.compile`` produce a
+        single graph and the forward be captured in CUDA graphs. Operations with a random batch-level probability
+        (``p_batch < 1``, e.g. crops with ``p < 1``) may change the output shape and still read it on the host.
+
+        Args:
+            enabled: whether to enable the static mode.
+
+        Example:
+            >>> import kornia.augmentation as K
+            >>> aug = K.RandomAffine(30.0, p=0.5)
+            >>> aug.set_static_mode()
+            >>> aug(torch.rand(4, 3, 8, 8)).shape
+            torch.Size([4, 3, 8, 8])
+
+        """
+        self._static = enabled
+
+    @property
+    def static_mode(self) -> bool:
+        """Whether the module runs in static mode."""
+        return self._static
+
+    @property
+    def full_batch_params(self) -> bool:
+        """Whether the parameters are generated for the whole batch, including the skipped samples."""
+        return (self._generator is not None or self._static) and self._supports_full_batch_params
+
+    def _applies_to_all(self, to_apply: Tensor) -> bool:
+        """Whether every sample of the batch is transformed."""
+        if self.full_batch_params:
+            # reading ``to_apply`` back on the host is avoided when the configuration decides. Every sample is
+            # transformed when ``p == p_batch == 1``, which covers the operations changing the output size (crops,
+            # resizes, pads). A random decision for the whole batch may also change it and has to be read.
+            if self.p_batch == 1.0:
+                return self.p == 1.0
+        return bool(to_apply.all())
+
+    def _applies_to_none(self, to_apply: Tensor) -> bool:
+        """Whether no sample of the batch is transformed."""
+        if self.full_batch_params and self.p_batch == 1.0:
+            return False
+        return not to_apply.any()
+
+    def _sample_prob(self, batch_size: int, p: float, dist: Distribution, same_on_batch: bool) -> Tensor:
+        if self._generator is None and not self._static:
+            if isinstance(dist, (RelaxedBernoulli,)):
+                # NOTE: there is no simple way to know if the sampler has `rsample` or not
+                return _adapted_rsampling((batch_size,), dist, same_on_batch)
+            return _adapted_sampling((batch_size,), dist, same_on_batch)
+        if p == 1:
+            return torch.ones(batch_size, device=self.device, dtype=self.dtype)
+        if p == 0:
+            return torch.zeros(batch_size, device=self.device, dtype=self.dtype)
+        if isinstance(dist, (RelaxedBernoulli,)):
+            rsample = _adapted_rsampling((batch_size,), dist, same_on_batch, self._generator)
+            return rsample.to(self.device).reshape(batch_size)
+        # a zero-dim host tensor is broadcast as a scalar without any copy
+        probs = dist.probs if isinstance(dist, Bernoulli) else p
+        num_samples = 1 if same_on_batch else batch_size
+        rand = torch.rand(num_samples, device=self.device, dtype=self.dtype, generator=self._generator)
+        return (rand < probs).to(self.dtype).expand(batch_size)
+
     def __batch_prob_generator__(
         self,
         batch_shape: Tuple[int, ...],
@@ -163,6 +276,11 @@ class _BasicAugmentationBase(Module):
         same_on_batch: bool,
     ) -> Tensor:
         batch_prob: Tensor
+        if self._generator is not None or self._static:
+            # no branching on the sampled values, which would read them back on the host
+            batch_prob = self._sample_prob(1, p_batch, self._p_batch_gen, same_on_batch)
+            sample_prob = self._sample_prob(batch_shape[0], p, self._p_gen, same_on_batch)
+            return batch_prob * sample_prob
         if p_batch == 1:
             batch_prob = zeros(1) + 1
         elif p_batch == 0:
@@ -214,8 +332,11 @@ class _BasicAugmentationBase(Module):
 
     def forward_parameters(self, batch_shape: Tuple[int, ...]) -> Dict[str, Tensor]:
         batch_prob = self.__batch_prob_generator__(batch_shape, self.p, self.p_batch, self.same_on_batch)
-        to_apply = batch_prob > 0.5
-        _params = self.generate_parameters(torch.Size((int(to_apply.sum().item()), *batch_shape[1:])))
+        if self.full_batch_params:
+            _params = self.generate_parameters(torch.Size(batch_shape))
+        else:
+            to_apply = batch_prob > 0.5
+            _params = self.generate_parameters(torch.Size((int(to_apply.sum().item()), *batch_shape[1:])))
         if _params is None:
             _params = {}
         _params["batch_prob"] = batch_prob
@@ -249,9 +370,11 @@ class _BasicAugmentationBase(Module):
         batch_shape = in_tensor.shape
         if params is None:
             params = self.forward_parameters(batch_shape)
-            for k,v in params.items():
-                if isinstance(v, torch.Tensor):
-                    params[k] = v.to(in_tensor.device)
+            # parameters sampled by a generator on the data device are already in place
+            if self._generator is None or self._generator.device != in_tensor.device:
+                for k, v in params.items():
+                    if isinstance(v, torch.Tensor):
+                        params[k] = v.to(in_tensor.device)
 
         if "batch_prob" not in params:
             params["batch_prob"] = tensor([True] * batch_shape[0])
@@ -278,6 +401,8 @@ class _AugmentationBase(_BasicAugmentationBase):
 
     """
 
+    _supports_full_batch_params = True
+
     def apply_transform(
         self,
         input: Tensor,
@@ -317,23 +442,28 @@ class _AugmentationBase(_BasicAugmentationBase):
         in_tensor = self.transform_tensor(input)
 
         self.validate_tensor(in_tensor)
-        if to_apply.all():
+        full_batch = self.full_batch_params
+        if self._applies_to_all(to_apply):
             output = self.apply_transform(in_tensor, params, flags, transform=transform)
-        elif not to_apply.any():
+        elif self._applies_to_none(to_apply):
             output = self.apply_non_transform(in_tensor, params, flags, transform=transform)
         else:  # If any tensor needs to be transformed.
             output = self.apply_non_transform(in_tensor, params, flags, transform=transform)
-            applied = self.apply_transform(
-                in_tensor[to_apply],
-                params,
-                flags,
-                transform=transform if transform is None else transform[to_apply],
-            )
+            if full_batch:
+                # the parameters cover the whole batch, the skipped samples are masked out afterwards
+                applied = self.apply_transform(in_tensor, params, flags, transform=transform)
+            else:
+                applied = self.apply_transform(
+                    in_tensor[to_apply],
+                    params,
+                    flags,
+                    transform=transform if transform is None else transform[to_apply],
+                )
 
             if is_autocast_enabled():
                 output = output.type(input.dtype)
                 applied = applied.type(input.dtype)
-            output = output.index_put((to_apply,), applied)
+            output = _put_applied(output, applied, to_apply, full_batch)
 
         output = _transform_output_shape(output, ori_shape) if self.keepdim else output
 
@@ -361,19 +491,23 @@ class _AugmentationBase(_BasicAugmentationBase):
         in_tensor = self.transform_tensor(input, shape=shape, match_channel=False)
 
         self.validate_tensor(in_tensor)
-        if to_apply.all():
+        full_batch = self.full_batch_params
+        if self._applies_to_all(to_apply):
             output = self.apply_transform_mask(in_tensor, params, flags, transform=transform)
-        elif not to_apply.any():
+        elif self._applies_to_none(to_apply):
             output = self.apply_non_transform_mask(in_tensor, params, flags, transform=transform)
         else:  # If any tensor needs to be transformed.
             output = self.apply_non_transform_mask(in_tensor, params, flags, transform=transform)
-            applied = self.apply_transform_mask(
-                in_tensor[to_apply],
-                params,
-                flags,
-                transform=transform if transform is None else transform[to_apply],
-            )
-            output = output.index_put((to_apply,), applied)
+            if full_batch:
+                applied = self.apply_transform_mask(in_tensor, params, flags, transform=transform)
+            else:
+                applied = self.apply_transform_mask(
+                    in_tensor[to_apply],
+                    params,
+                    flags,
+                    transform=transform if transform is None else transform[to_apply],
+                )
+            output = _put_applied(output, applied, to_apply, full_batch)
         output = _transform_output_shape(output, ori_shape, reference_shape=shape) if self.keepdim else output
         return output
 
@@ -395,23 +529,28 @@ class _AugmentationBase(_BasicAugmentationBase):
         batch_prob = params["batch_prob"]
         to_apply = batch_prob > 0.5  # NOTE: in case of Relaxed Distributions.
         output: Boxes
-        if to_apply.bool().all():
+        full_batch = self.full_batch_params
+        if self._applies_to_all(to_apply):
             output = self.apply_transform_box(input, params, flags, transform=transform)
-        elif not to_apply.any():
+        elif self._applies_to_none(to_apply):
             output = self.apply_non_transform_box(input, params, flags, transform=transform)
         else:  # If any tensor needs to be transformed.
             output = self.apply_non_transform_box(input, params, flags, transform=transform)
-            applied = self.apply_transform_box(
-                input[to_apply],
-                params,
-                flags,
-                transform=transform if transform is None else transform[to_apply],
-            )
+            if full_batch:
+                # the boxes are transformed in place
+                applied = self.apply_transform_box(input.clone(), params, flags, transform=transform)
+            else:
+                applied = self.apply_transform_box(
+                    input[to_apply],
+                    params,
+                    flags,
+                    transform=transform if transform is None else transform[to_apply],
+                )
             if is_autocast_enabled():
                 output = output.type(input.dtype)
                 applied = applied.type(input.dtype)
 
-            output = output.index_put((to_apply,), applied)
+            output = _put_applied(output, applied, to_apply, full_batch)
         return output
 
     def transform_keypoints(
@@ -431,22 +570,27 @@ class _AugmentationBase(_BasicAugmentationBase):
 
         batch_prob = params["batch_prob"]
         to_apply = batch_prob > 0.5  # NOTE: in case of Relaxed Distributions.
-        if to_apply.all():
+        full_batch = self.full_batch_params
+        if self._applies_to_all(to_apply):
             output = self.apply_transform_keypoint(input, params, flags, transform=transform)
-        elif not to_apply.any():
+        elif self._applies_to_none(to_apply):
             output = self.apply_non_transform_keypoint(input, params, flags, transform=transform)
         else:  # If any tensor needs to be transformed.
             output = self.apply_non_transform_keypoint(input, params, flags, transform=transform)
-            applied = self.apply_transform_keypoint(
-                input[to_apply],
-                params,
-                flags,
-                transform=transform if transform is None else transform[to_apply],
-            )
+            if full_batch:
+                # the keypoints are transformed in place
+                applied = self.apply_transform_keypoint(input.clone(), params, flags, transform=transform)
+            else:
+                applied = self.apply_transform_keypoint(
+                    input[to_apply],
+                    params,
+                    flags,
+                    transform=transform if transform is None else transform[to_apply],
+                )
             if is_autocast_enabled():
                 output = output.type(input.dtype)
                 applied = applied.type(input.dtype)
-            output = output.index_put((to_apply,), applied)
+            output = _put_applied(output, applied, to_apply, full_batch)
         return output
 
     def transform_classes(
@@ -463,19 +607,23 @@ class _AugmentationBase(_BasicAugmentationBase):
 
         batch_prob = params["batch_prob"]
         to_apply = batch_prob > 0.5  # NOTE: in case of Relaxed Distributions.
-        if to_apply.all():
+        full_batch = self.full_batch_params
+        if self._applies_to_all(to_apply):
             output = self.apply_transform_class(input, params, flags, transform=transform)
-        elif not to_apply.any():
+        elif self._applies_to_none(to_apply):
             output = self.apply_non_transform_class(input, params, flags, transform=transform)
         else:  # If any tensor needs to be transformed.
             output = self.apply_non_transform_class(input, params, flags, transform=transform)
-            applied = self.apply_transform_class(
-                input[to_apply],
-                params,
-                flags,
-                transform=transform if transform is None else transform[to_apply],
-            )
-            output = output.index_put((to_apply,), applied)
+            if full_batch:
+                applied = self.apply_transform_class(input, params, flags, transform=transform)
+            else:
+                applied = self.apply_transform_class(
+                    input[to_apply],
+                    params,
+                    flags,
+                    transform=transform if transform is None else transform[to_apply],
+                )
+            output = _put_applied(output, applied, to_apply, full_batch)
         return output
 
     def apply_non_transform_mask(
@@ -16,8 +16,11 @@
 #
 
 from kornia.augmentation.container.augment import AugmentationSequential
+from kornia.augmentation.container.bank import ParamBank
 from kornia.augmentation.container.base import ImageSequentialBase
 from kornia.augmentation.container.dispatcher import ManyToManyAugmentationDispather, ManyToOneAugmentationDispather
 from kornia.augmentation.container.image import ImageSequential
 from kornia.augmentation.container.patch import PatchSequential
+from kornia.augmentation.container.pool import AugmentationPool
+from kornia.augmentation.container.ragged import RaggedImages
 from kornia.augmentation.container.video import VideoSequential
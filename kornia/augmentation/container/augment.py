@@ -25,15 +25,18 @@ from kornia.augmentation._3d.base import AugmentationBase3D, RigidAffineAugmenta
 from kornia.augmentation.base import _AugmentationBase
 from kornia.constants import DataKey, Resample
 from kornia.core import Module, Tensor
+from kornia.core.check import KORNIA_CHECK
 from kornia.geometry.boxes import Boxes, VideoBoxes
 from kornia.geometry.keypoints import Keypoints, VideoKeypoints
 from kornia.utils import eye_like, is_autocast_enabled
 
 from .base import TransformMatrixMinIn
+from .fusion import FusedGeometricOps, FusedIntensityOps
 from .image import ImageSequential
 from .ops import AugmentationSequentialOps, DataType
 from .params import ParamItem
 from .patch import PatchSequential
+from .ragged import RaggedImages, RaggedSequentialOps
 from .video import VideoSequential
 
 __all__ = ["AugmentationSequential"]
@@ -82,6 +85,11 @@ class AugmentationSequential(TransformMatrixMinIn, ImageSequential):
         extra_args: to control the behaviour for each datakeys. By default, masks are handled by nearest interpolation
                     strategies.
 
+        fuse_geometric: if True, consecutive geometric augmentations that are expressed by a transformation matrix
+                        are applied at once by chaining their matrices and resampling the images and masks a single
+                        time. Boxes and keypoints are transformed by the chained matrices. See
+                        :class:`ImageSequential`.
+
     .. note::
         Mix augmentations (e.g. RandomMixUp, RandomCutMix) can only be working with "input"/"image" data key.
         It is not clear how to deal with the conversions of masks, bounding boxes and keypoints.
@@ -233,6 +241,7 @@ class AugmentationSequential(TransformMatrixMinIn, ImageSequential):
         random_apply_weights: Optional[List[float]] = None,
         transformation_matrix_mode: str = "silent",
         extra_args: Optional[Dict[DataKey, Dict[str, Any]]] = None,
+        fuse_geometric: bool = False,
     ) -> None:
         self._transform_matrix: Optional[Tensor]
         self._transform_matrices: List[Optional[Tensor]] = []
@@ -243,6 +252,7 @@ class AugmentationSequential(TransformMatrixMinIn, ImageSequential):
             keepdim=keepdim,
             random_apply=random_apply,
             random_apply_weights=random_apply_weights,
+            fuse_geometric=fuse_geometric,
         )
 
         self._parse_transformation_matrix_mode(transformation_matrix_mode)
@@ -288,7 +298,8 @@ class AugmentationSequential(TransformMatrixMinIn, ImageSequential):
         return super().clear_state()
 
     def _update_transform_matrix_for_valid_op(self, module: Module) -> None:
-        self._transform_matrices.append(module.transform_matrix)
+        augmentation = cast(Union[RigidAffineAugmentationBase2D, RigidAffineAugmentationBase3D], module)
+        self._transform_matrices.append(augmentation.transform_matrix)
 
     def identity_matrix(self, input: Tensor) -> Tensor:
         """Return identity matrix."""
@@ -442,6 +453,16 @@ class AugmentationSequential(TransformMatrixMinIn, ImageSequential):
 
         self._validate_args_datakeys(*args, data_keys=self.transform_op.data_keys)  # type: ignore
 
+        if self._is_ragged(*args, data_keys=self.transform_op.data_keys):  # type: ignore
+            ragged_outputs = self._forward_ragged(*cast(Tuple[DataType, ...], args), params=params)
+            self.transform_op.data_keys = self.data_keys
+            if isinstance(original_keys, tuple):
+                result = {k: v for v, k in zip(ragged_outputs, original_keys)}
+                if invalid_data:
+                    result.update(invalid_data)
+                return result
+            return ragged_outputs[0] if len(ragged_outputs) == 1 else ragged_outputs
+
         in_args = self._arguments_preproc(*args, data_keys=self.transform_op.data_keys)  # type: ignore
 
         if params is None:
@@ -459,11 +480,24 @@ class AugmentationSequential(TransformMatrixMinIn, ImageSequential):
             else:
                 raise ValueError("`params` must be provided whilst INPUT is not in data_keys.")
 
-        outputs: Union[Tensor, List[DataType]] = in_args
-        for param in params:
-            module = self.get_submodule(param.name)
+        outputs: List[DataType] = in_args
+        # the fused matrices are computed from the images
+        if DataKey.INPUT in self.transform_op.data_keys:
+            images = cast(Tensor, outputs[self.transform_op.data_keys.index(DataKey.INPUT)])
+            runs = self.get_fused_sequence(
+                params, self.extra_args.get(DataKey.INPUT, None), fuse_lut=images.dtype == torch.uint8
+            )
+        else:
+            runs = [[param] for param in params]
+        for run in runs:
+            if len(run) > 1:
+                outputs = self._transform_fused(outputs, run)
+                for param in run:
+                    self._update_transform_matrix_by_module(self.get_submodule(param.name))
+                continue
+            module = self.get_submodule(run[0].name)
             outputs = self.transform_op.transform(  # type: ignore
-                *outputs, module=module, param=param, extra_args=self.extra_args
+                *outputs, module=module, param=run[0], extra_args=self.extra_args
             )
             if not isinstance(outputs, (list, tuple)):
                 # Make sure we are unpacking a list whilst post-proc
@@ -487,6 +521,132 @@ class AugmentationSequential(TransformMatrixMinIn, ImageSequential):
 
         return outputs
 
+    def _is_ragged(self, *args: DataType, data_keys: List[DataKey]) -> bool:
+        return DataKey.INPUT in data_keys and isinstance(args[data_keys.index(DataKey.INPUT)], (list, RaggedImages))
+
+    def _forward_ragged(self, *args: DataType, params: Optional[List[ParamItem]] = None) -> List[DataType]:
+        """Transform a batch of images of different sizes, given as a list or as :class:`RaggedImages`.
+
+        The masks are given in the same form as the images, while the boxes and keypoints can be lists of tensors.
+        See :class:`~kornia.augmentation.container.ragged.RaggedSequentialOps`.
+        """
+        data_keys: List[DataKey] = self.transform_op.data_keys  # type: ignore
+        KORNIA_CHECK(
+            params is None, "Replaying the parameters of a batch of images of different sizes is not supported."
+        )
+        KORNIA_CHECK(
+            not (self.contains_video_sequential or self.contains_3d_augmentation or self.static_mode),
+            "Batches of images of different sizes are only supported by 2D augmentations out of the static mode.",
+        )
+        in_args: List[Any] = []
+        for arg, dcate in zip(args, data_keys):
+            if dcate in _IMG_OPTIONS or dcate in _MSK_OPTIONS:
+                ragged = arg if isinstance(arg, RaggedImages) else RaggedImages.from_list(cast(List[Tensor], arg))
+                if dcate in _IMG_OPTIONS:
+                    self.input_dtype = ragged.dtype
+                else:
+                    self.mask_dtype = ragged.dtype
+                    ragged = ragged.to(dtype=self.input_dtype or torch.float)
+                in_args.append(ragged)
+            elif dcate in _KEYPOINTS_OPTIONS:
+                in_args.append(self._preproc_keypoints(arg, dcate))
+            elif dcate in _BOXES_OPTIONS:
+                in_args.append(self._preproc_boxes(arg, dcate))
+            else:
+                in_args.append(arg)
+        images = cast(RaggedImages, in_args[data_keys.index(DataKey.INPUT)])
+        KORNIA_CHECK(
+            bool((images.sizes[:, 0] == images.sizes[0, 0]).all()),
+            f"Expected the images to have the same number of channels. Got {images.sizes[:, 0].tolist()}.",
+        )
+        for arg, dcate in zip(in_args, data_keys):
+            if dcate in _MSK_OPTIONS:
+                KORNIA_CHECK(
+                    bool((arg.sizes[:, 1:] == images.sizes[:, 1:]).all()),
+                    "Expected the masks to have the same height and width as the images.",
+                )
+
+        params = []
+        for name, module in self.get_forward_sequence():
+            in_args, param = RaggedSequentialOps.transform(
+                in_args, data_keys, module, name, self.extra_args, self.transform_op
+            )
+            self._update_transform_matrix_by_module(module)
+            params.append(param)
+        self._params = params
+
+        outputs: List[DataType] = []
+        for in_arg, out_arg, dcate in zip(args, in_args, data_keys):
+            if dcate in _MSK_OPTIONS:
+                out_arg = out_arg.to(dtype=self.mask_dtype)
+            if isinstance(out_arg, RaggedImages):
+                outputs.append(out_arg if isinstance(in_arg, RaggedImages) else out_arg.to_list())
+            elif dcate in _KEYPOINTS_OPTIONS:
+                outputs.append(self._postproc_keypoint(in_arg, out_arg, dcate))
+            elif dcate in _BOXES_OPTIONS:
+                outputs.append(self._postproc_boxes(in_arg, out_arg, dcate))
+            else:
+                outputs.append(out_arg)
+        return outputs
+
+    def _transform_fused(self, args: List[DataType], params: List[ParamItem]) -> List[DataType]:
+        """Apply a run of fused geometric or intensity augmentations to every data type."""
+        data_keys: List[DataKey] = self.transform_op.data_keys  # type: ignore
+        modules = [self.get_submodule(param.name) for param in params]
+        if FusedIntensityOps.is_fusable(modules[0]):
+            # only the images are changed by intensity augmentations
+            return [
+                FusedIntensityOps.transform_inputs(cast(Tensor, arg), modules, params, self.extra_args.get(dcate, None))
+                if dcate in _IMG_OPTIONS
+                else arg
+                for arg, dcate in zip(args, data_keys)
+            ]
+        images = cast(Tensor, args[data_keys.index(DataKey.INPUT)])
+        transform, edge_transform, size, flags = FusedGeometricOps.compute_transformation(
+            images, modules, params, self.extra_args.get(DataKey.INPUT, None)
+        )
+        outputs: List[DataType] = []
+        for arg, dcate in zip(args, data_keys):
+            if dcate in _IMG_OPTIONS:
+                arg = FusedGeometricOps.transform_inputs(
+                    cast(Tensor, arg), modules, transform, edge_transform, size, flags
+                )
+            elif dcate in _MSK_OPTIONS and isinstance(arg, list):
+                masks = RaggedImages.from_list([a.reshape(-1, *a.shape[-2:]) for a in arg])
+                data = FusedGeometricOps.transform_masks(
+                    masks.data,
+                    modules,
+                    params,
+                    transform,
+                    edge_transform,
+                    size,
+                    flags,
+                    self.extra_args.get(dcate, None),
+                )
+                sizes = masks.sizes.clone()
+                sizes[:, 1:] = torch.tensor(data.shape[-2:])
+                arg = [
+                    out.reshape(*a.shape[:-2], *out.shape[-2:])
+                    for a, out in zip(arg, RaggedImages(data, sizes).to_list())
+                ]
+            elif dcate in _MSK_OPTIONS:
+                arg = FusedGeometricOps.transform_masks(
+                    cast(Tensor, arg),
+                    modules,
+                    params,
+                    transform,
+                    edge_transform,
+                    size,
+                    flags,
+                    self.extra_args.get(dcate, None),
+                )
+            elif dcate in _BOXES_OPTIONS:
+                arg = FusedGeometricOps.transform_boxes(cast(Boxes, arg), transform)
+            elif dcate in _KEYPOINTS_OPTIONS:
+                arg = FusedGeometricOps.transform_keypoints(cast(Keypoints, arg), transform)
+            outputs.append(arg)
+        return outputs
+
     def __call__(
         self,
         *inputs: Any,
@@ -518,7 +678,7 @@ class AugmentationSequential(TransformMatrixMinIn, ImageSequential):
             if len(inputs) == 1 and isinstance(inputs[0], dict):
                 original_keys, in_data_keys, inputs, invalid_data = self._preproc_dict_data(inputs[0])
             else:
-                in_data_keys = kwargs.get("data_keys", self.data_keys)
+                in_data_keys = cast(List[DataKey], kwargs.get("data_keys", self.data_keys))
             data_keys = self.transform_op.preproc_datakeys(in_data_keys)
 
             if len(data_keys) > 1 and DataKey.INPUT in data_keys:
@@ -661,12 +821,15 @@ class AugmentationSequential(TransformMatrixMinIn, ImageSequential):
         elif isinstance(arg, (Keypoints,)):
             return arg
         else:
-            arg = cast(Tensor, arg)
-            if not torch.is_floating_point(arg):
+            arg = cast(Union[Tensor, List[Tensor]], arg)
+            if isinstance(arg, list):
+                if not torch.is_floating_point(arg[0]):
+                    dtype = arg[0].dtype
+                    arg = [a.float() for a in arg]
+            elif not torch.is_floating_point(arg):
                 dtype = arg.dtype
                 arg = arg.float()
-            # TODO: Add List[Tensor] in the future.
-            result = Keypoints.from_tensor(arg)
+            result = Keypoints(arg)
             return result.type(dtype) if dtype else result
 
     def _postproc_keypoint(
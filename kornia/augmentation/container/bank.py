@@ -0,0 +1,375 @@
+# LICENSE HEADER MANAGED BY add-license-header
+#
+# Copyright 2018 Kornia Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Precomputed parameters of augmentation pipelines, replayed by index."""
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, cast
+
+import torch
+
+import kornia.augmentation as K
+from kornia.augmentation.base import _AugmentationBase
+from kornia.core import Module, Tensor
+from kornia.core.check import KORNIA_CHECK
+from kornia.utils._compat import torch_version_ge
+
+from .base import ImageSequentialBase
+from .params import ParamItem
+from .patch import PatchSequential
+from .ragged import _SHARED_PARAMS
+from .video import VideoSequential
+
+__all__ = ["ParamBank"]
+
+_FORMAT_VERSION = 1
+
+# the kinds of columns: the rows of the samples, sliced by offsets, and the values shared by a whole batch
+_ROWS = "rows"
+_STEPS = "steps"
+
+_Params = Union[Dict[str, Tensor], List[ParamItem]]
+
+
+def _is_separable(module: Module) -> bool:
+    """Whether the parameters of a batch of ``N * B`` samples can be split into ``N`` batches of ``B`` samples."""
+    if isinstance(module, (K.MixAugmentationBaseV2, PatchSequential, VideoSequential)):
+        return False
+    if isinstance(module, ImageSequentialBase):
+        random_apply = getattr(module, "random_apply", False)
+        # out of static mode, random apply selects the operations of the whole batch
+        if random_apply and (not module.static_mode or module.same_on_batch):
+            return False
+        return all(_is_separable(child) for child in module.children())
+    if isinstance(module, _AugmentationBase):
+        return module.p_batch in (0.0, 1.0) and not module.same_on_batch
+    return True
+
+
+def _split(
+    params: Any,
+    columns: Dict[str, Tensor],
+    offsets: Dict[str, Tensor],
+    num_batches: int,
+    batch_size: int,
+    prefix: str = "",
+) -> Any:
+    """Split the parameters sampled for ``num_batches * batch_size`` samples into columns.
+
+    Returns the structure of the parameters, or None if they are not made of rows.
+    """
+    if params is None:
+        return None
+    if isinstance(params, list):
+        structure = []
+        for item in params:
+            item_structure = _split(item.data, columns, offsets, num_batches, batch_size, f"{prefix}{item.name}/")
+            if item_structure is None and item.data is not None:
+                return None
+            structure.append((item.name, item_structure))
+        return structure
+    if not isinstance(params, dict) or not isinstance(params.get("batch_prob", None), Tensor):
+        return None
+    to_apply = params["batch_prob"].view(num_batches, batch_size) > 0.5
+    full = torch.arange(num_batches + 1, device=to_apply.device) * batch_size
+    applied = None
+    spec: Dict[str, str] = {}
+    for key, value in params.items():
+        path = f"{prefix}{key}"
+        if key == "forward_input_shape":
+            shape = value.clone()
+            shape[0] = batch_size
+            columns[path] = shape.expand(num_batches, -1)
+            spec[key] = _STEPS
+            continue
+        if key in _SHARED_PARAMS or not isinstance(value, Tensor) or value.dim() == 0:
+            return None
+        if len(value) == num_batches * batch_size:
+            offsets[path] = full
+        else:
+            # the parameters of the applied samples only
+            if applied is None:
+                applied = torch.nn.functional.pad(to_apply.sum(1).cumsum(0), (1, 0))
+            if len(value) != int(applied[-1]):
+                return None
+            offsets[path] = applied
+        columns[path] = value.contiguous()
+        spec[key] = _ROWS
+    return spec
+
+
+def _structure(params: Any) -> Any:
+    """The structure of the parameters of a batch, with the kind of every value."""
+    if params is None:
+        return None
+    if isinstance(params, list):
+        return [(item.name, _structure(item.data)) for item in params]
+    KORNIA_CHECK(isinstance(params, dict), f"Expected the parameters to be dicts or lists. Got {type(params)}.")
+    spec = {}
+    for key, value in params.items():
+        KORNIA_CHECK(isinstance(value, Tensor), f"Expected the parameter `{key}` to be a tensor. Got {type(value)}.")
+        shared = key in _SHARED_PARAMS or value.dim() == 0
+        spec[key] = _STEPS if shared else _ROWS
+    return spec
+
+
+def _union(spec: Any, other: Any) -> bool:
+    """Add the keys of the structure ``other`` to ``spec``, or return False if the operations are not the same."""
+    if isinstance(spec, list):
+        if not isinstance(other, list) or len(spec) != len(other):
+            return False
+        return all(name == other_name and _union(a, b) for (name, a), (other_name, b) in zip(spec, other))
+    if isinstance(spec, dict):
+        if not isinstance(other, dict):
+            return False
+        for key, kind in other.items():
+            spec.setdefault(key, kind)
+        return True
+    return other is None
+
+
+def _kinds(spec: Any, prefix: str = "") -> Dict[str, str]:
+    """The kinds of the columns, by path."""
+    if isinstance(spec, list):
+        return {k: v for name, item_spec in spec for k, v in _kinds(item_spec, f"{prefix}{name}/").items()}
+    if isinstance(spec, dict):
+        return {f"{prefix}{key}": kind for key, kind in spec.items()}
+    return {}
+
+
+def _flatten(params: Any, prefix: str = "") -> Dict[str, Tensor]:
+    """The tensors of the parameters, by path."""
+    if isinstance(params, list):
+        return {k: v for item in params for k, v in _flatten(item.data, f"{prefix}{item.name}/").items()}
+    if isinstance(params, dict):
+        return {f"{prefix}{key}": value for key, value in params.items()}
+    return {}
+
+
+def _rebuild(spec: Any, get: Any, prefix: str = "") -> Any:
+    if spec is None:
+        return None
+    if isinstance(spec, list):
+        return [ParamItem(name, _rebuild(item_spec, get, f"{prefix}{name}/")) for name, item_spec in spec]
+    values = {key: get(f"{prefix}{key}", kind) for key, kind in spec.items()}
+    return {key: value for key, value in values.items() if value is not None}
+
+
+class ParamBank:
+    r"""Parameters of an augmentation pipeline sampled ahead of time, and replayed by index.
+
+    The parameters of ``num_batches`` batches, e.g. all the batches of several epochs, are sampled at once and stored
+    as columns: every parameter of every operation is a single tensor holding the rows of all the samples, with the
+    offsets of the batches. Replaying a batch only slices the columns, out of the random generators and of the
+    sampling code. A bank saved to a file can be memory-mapped, so that all the processes of a run read the same
+    parameters from the page cache.
+
+    The parameters are sampled with a single call of ``forward_parameters`` for the ``num_batches * B`` samples if
+    every operation samples its parameters per sample. Otherwise, e.g. for mix augmentations, a batch-level
+    probability ``p_batch``, ``same_on_batch``, the order of :class:`ColorJitter` or ``random_apply`` out of static
+    mode, they are sampled batch by batch. The parameters must then have the same structure for every batch, which
+    rules out ``random_apply`` out of static mode.
+
+    Args:
+        columns: the columns of the parameters.
+        offsets: the offsets of the batches in the columns of the rows, of shape :math:`(N + 1,)`.
+        structure: the structure of the parameters, as built by :meth:`sample`.
+        batch_shape: the shape of the batches.
+        present: the batches in which the parameters are present, of shape :math:`(N,)`, for the parameters missing
+            in some batches, e.g. those of the crops skipped by their batch-level probability.
+
+    .. note::
+        The parameters are replayed by the same pipeline, or a pipeline with the same operations and configuration.
+        The rows of the samples skipped by an operation are only stored if the operation samples the parameters of the
+        whole batch, e.g. in static mode or with a generator.
+
+    Example:
+        >>> import kornia.augmentation as K
+        >>> aug = K.AugmentationSequential(K.RandomAffine(30.0, p=0.5), K.ColorJitter(0.1, 0.1, p=0.5))
+        >>> bank = ParamBank.sample(aug, (2, 3, 8, 8), num_batches=10, seed=0)
+        >>> len(bank)
+        10
+        >>> aug(torch.rand(2, 3, 8, 8), params=bank[3]).shape
+        torch.Size([2, 3, 8, 8])
+
+    """
+
+    def __init__(
+        self,
+        columns: Dict[str, Tensor],
+        offsets: Dict[str, Tensor],
+        structure: Any,
+        batch_shape: Tuple[int, ...],
+        present: Optional[Dict[str, Tensor]] = None,
+    ) -> None:
+        lengths = {len(offset) - 1 for offset in offsets.values()}
+        lengths |= {len(column) for path, column in columns.items() if path not in offsets}
+        KORNIA_CHECK(len(lengths) == 1, "Expected all the columns to hold the same number of batches.")
+        self.columns = columns
+        self.offsets = offsets
+        self.structure = structure
+        self.batch_shape = tuple(batch_shape)
+        self.present = {} if present is None else present
+        self._num_batches = lengths.pop()
+        # the offsets are read on every replay, their host copies avoid a synchronization per column
+        self._host_offsets = {path: offset.tolist() for path, offset in offsets.items()}
+        self._host_present = {path: mask.tolist() for path, mask in self.present.items()}
+
+    @classmethod
+    def sample(
+        cls, augmentation: Module, batch_shape: Tuple[int, ...], num_batches: int, seed: Optional[int] = None
+    ) -> "ParamBank":
+        """Sample the parameters of ``num_batches`` batches.
+
+        Args:
+            augmentation: an augmentation or a container implementing ``forward_parameters``.
+            batch_shape: the shape of the batches, e.g. :math:`(B, C, H, W)`.
+            num_batches: the number of batches, e.g. the number of steps of all the epochs.
+            seed: the seed of the random generators while sampling. The global random state is left untouched if
+                given.
+
+        Returns:
+            the bank of the parameters.
+
+        """
+        KORNIA_CHECK(num_batches > 0, f"Expected at least one batch. Got {num_batches}.")
+        KORNIA_CHECK(
+            hasattr(augmentation, "forward_parameters"), "The augmentation must implement `forward_parameters`."
+        )
+        batch_shape = tuple(batch_shape)
+        devices = [] if seed is None or not torch.cuda.is_available() else list(range(torch.cuda.device_count()))
+        with torch.random.fork_rng(devices=devices, enabled=seed is not None):
+            if seed is not None:
+                torch.manual_seed(seed)
+            if _is_separable(augmentation):
+                columns: Dict[str, Tensor] = {}
+                offsets: Dict[str, Tensor] = {}
+                params = cast(Union[_AugmentationBase, ImageSequentialBase], augmentation).forward_parameters(
+                    torch.Size((num_batches * batch_shape[0], *batch_shape[1:]))
+                )
+                structure = _split(params, columns, offsets, num_batches, batch_shape[0])
+                if structure is not None:
+                    return cls(columns, offsets, structure, batch_shape)
+            return cls._sample_batches(augmentation, batch_shape, num_batches)
+
+    @classmethod
+    def _sample_batches(cls, augmentation: Module, batch_shape: Tuple[int, ...], num_batches: int) -> "ParamBank":
+        structure = None
+        batches: List[Dict[str, Tensor]] = []
+        sampler = cast(Union[_AugmentationBase, ImageSequentialBase], augmentation)
+        for _ in range(num_batches):
+            params = sampler.forward_parameters(torch.Size(batch_shape))
+            if structure is None:
+                structure = _structure(params)
+            KORNIA_CHECK(
+                _union(structure, _structure(params)),
+                "Expected the same operations in every batch, which is not the case with `random_apply` out of "
+                "static mode.",
+            )
+            batches.append(_flatten(params))
+        columns: Dict[str, Tensor] = {}
+        offsets: Dict[str, Tensor] = {}
+        present: Dict[str, Tensor] = {}
+        for path, kind in _kinds(structure).items():
+            values = [batch.get(path, None) for batch in batches]
+            mask = [value is not None for value in values]
+            first = next(value for value in values if value is not None)
+            if not all(mask):
+                present[path] = torch.tensor(mask)
+            if kind == _STEPS:
+                columns[path] = torch.stack([first.new_zeros(first.shape) if v is None else v for v in values])
+                continue
+            columns[path] = torch.cat([v for v in values if v is not None])
+            lengths = [0] + [0 if v is None else len(v) for v in values]
+            offsets[path] = torch.tensor(lengths, device=first.device).cumsum(0)
+        return cls(columns, offsets, structure, batch_shape, present)
+
+    def __len__(self) -> int:
+        return self._num_batches
+
+    def __getitem__(self, index: int) -> _Params:
+        return self.get(index)
+
+    def __iter__(self) -> Iterator[_Params]:
+        for index in range(len(self)):
+            yield self.get(index)
+
+    def get(self, index: int, device: Optional[torch.device] = None) -> _Params:
+        """Get the parameters of a batch.
+
+        Args:
+            index: the index of the batch.
+            device: the device to move the parameters to.
+
+        Returns:
+            the parameters, to be given to the ``params`` of the forward of the augmentation.
+
+        """
+        KORNIA_CHECK(-len(self) <= index < len(self), f"Expected an index below {len(self)}. Got {index}.")
+        index = index % len(self)
+
+        def get(path: str, kind: str) -> Optional[Tensor]:
+            if path in self._host_present and not self._host_present[path][index]:
+                return None
+            column = self.columns[path]
+            if kind == _STEPS:
+                value = column[index]
+            else:
+                offsets = self._host_offsets[path]
+                value = column[offsets[index] : offsets[index + 1]]
+            return value if device is None else value.to(device)
+
+        return _rebuild(self.structure, get)
+
+    def save(self, path: str) -> None:
+        """Save the bank to a file, which can be memory-mapped by :meth:`load`.
+
+        Args:
+            path: the path of the file.
+
+        """
+        torch.save(
+            {
+                "version": _FORMAT_VERSION,
+                "batch_shape": list(self.batch_shape),
+                "structure": self.structure,
+                "columns": {k: v.cpu() for k, v in self.columns.items()},
+                "offsets": {k: v.cpu() for k, v in self.offsets.items()},
+                "present": self.present,
+            },
+            path,
+        )
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "ParamBank":
+        """Load a bank saved by :meth:`save`.
+
+        Args:
+            path: the path of the file.
+            mmap: memory-map the columns instead of reading them, with PyTorch 2.1 or later.
+
+        Returns:
+            the bank of the parameters.
+
+        """
+        kwargs: Dict[str, Any] = {"map_location": "cpu"}
+        if torch_version_ge(2, 1):
+            kwargs.update(mmap=mmap, weights_only=True)
+        data = torch.load(path, **kwargs)
+        KORNIA_CHECK(
+            data.get("version", None) == _FORMAT_VERSION, f"Unsupported format of the parameter bank in {path}."
+        )
+        return cls(data["columns"], data["offsets"], data["structure"], tuple(data["batch_shape"]), data["present"])
@@ -17,7 +17,7 @@
 
 from collections import OrderedDict
 from itertools import zip_longest
-from typing import Any, Dict, Iterator, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import torch
 from torch import nn
@@ -34,6 +34,26 @@ from .params import ParamItem
 __all__ = ["BasicSequentialBase", "ImageSequentialBase", "SequentialBase"]
 
 
+def _mask_batch_prob(data: Union[Dict[str, Tensor], List[ParamItem], None], mask: Tensor) -> None:
+    """Restrict in place the samples the parameters of an operation, or of a sequence, are applied to."""
+    if isinstance(data, dict):
+        data["batch_prob"] = data["batch_prob"] * mask.to(data["batch_prob"])
+    elif isinstance(data, list):
+        for item in data:
+            _mask_batch_prob(item.data, mask)
+
+
+def _select_per_sample(num_samples: Tensor, weights: Tensor, rand: Tensor) -> Tensor:
+    """Select ``num_samples`` operations per sample without replacement, as a :math:`(B, N)` boolean mask.
+
+    The weighted sampling uses the Gumbel-top-k trick, with ``rand`` uniform samples of shape :math:`(B, N)`.
+    Operations with a null weight are never selected.
+    """
+    keys = weights.to(rand).log() - (-rand.clamp_min(1e-20).log()).log()
+    rank = keys.argsort(dim=1, descending=True).argsort(dim=1)
+    return (rank < num_samples.view(-1, 1)) & (weights.to(rand.device) > 0)
+
+
 class BasicSequentialBase(nn.Sequential):
     r"""BasicSequential for creating kornia modulized processing pipeline.
 
@@ -51,6 +71,8 @@ class BasicSequentialBase(nn.Sequential):
             _args.update({f"{mod.__class__.__name__}_{idx}": mod})
         super().__init__(_args)
         self._params: Optional[List[ParamItem]] = None
+        self._generator: Optional[torch.Generator] = None
+        self._static = False
 
     def get_submodule(self, target: str) -> Module:
         """Get submodule.
@@ -94,6 +116,39 @@ class BasicSequentialBase(nn.Sequential):
         """Reset self._params state to None."""
         self._params = None
 
+    def set_rng_generator(self, generator: Optional[torch.Generator]) -> None:
+        """Sample the parameters of every augmentation in the container from a shared generator.
+
+        See :meth:`kornia.augmentation.base._BasicAugmentationBase.set_rng_generator`.
+        """
+        self._generator = generator
+        for module in self.children():
+            fn = getattr(module, "set_rng_generator", None)
+            if callable(fn):
+                fn(generator)
+
+    def set_static_mode(self, enabled: bool = True) -> None:
+        """Run every augmentation in the container with static shapes, blending with the ``batch_prob`` masks.
+
+        Random selections of operations made by the container, such as ``random_apply``, are drawn per sample and
+        applied as masks on the probabilities of the operations. See
+        :meth:`kornia.augmentation.base._BasicAugmentationBase.set_static_mode`.
+        """
+        self._static = enabled
+        for module in self.children():
+            fn = getattr(module, "set_static_mode", None)
+            if callable(fn):
+                fn(enabled)
+
+    @property
+    def static_mode(self) -> bool:
+        """Whether the container runs in static mode."""
+        return self._static
+
+    def _rand(self, *size: int) -> Tensor:
+        device = None if self._generator is None else self._generator.device
+        return torch.rand(*size, device=device, generator=self._generator)
+
     # TODO: Implement this for all submodules.
     def forward_parameters(self, batch_shape: torch.Size) -> List[ParamItem]:
         raise NotImplementedError
@@ -0,0 +1,441 @@
+# LICENSE HEADER MANAGED BY add-license-header
+#
+# Copyright 2018 Kornia Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+r"""Fusion of consecutive geometric augmentations into a single resampling.
+
+Runs of augmentations that are fully described by a :math:`3 \times 3` matrix are applied by chaining their
+matrices and warping the data once to the output size of the run, instead of resampling after every operation.
+Likewise, runs of pointwise intensity augmentations of ``torch.uint8`` images are applied by composing their lookup
+tables and mapping the images once.
+
+Without ``align_corners``, every warp scales the sampled pixels by the size of its input and output, so a run is not
+warped with the product of the matrices of its augmentations but with the product of their matrices under the
+convention of their own warp, see :meth:`FusedGeometricOps.compute_transformation`.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+import torch
+
+import kornia.augmentation as K
+from kornia.augmentation._2d.base import RigidAffineAugmentationBase2D
+from kornia.augmentation._2d.intensity.base import IntensityAugmentationBase2D
+from kornia.augmentation.utils import override_parameters
+from kornia.augmentation.utils.helpers import _transform_output_shape
+from kornia.constants import Resample, SamplePadding
+from kornia.core import Module, Tensor
+from kornia.enhance.lut import apply_lut, identity_lut, lut_to_uint8
+from kornia.geometry.boxes import Boxes
+from kornia.geometry.keypoints import Keypoints
+from kornia.geometry.transform import warp_perspective
+
+from .params import ParamItem
+
+__all__ = ["FusedGeometricOps", "FusedIntensityOps", "get_fusion_flags"]
+
+# sampling flags used by a run made only of flips and slicing crops, which are exact under this setting
+_DEFAULT_FLAGS: Dict[str, Any] = {"resample": "bilinear", "padding_mode": "zeros", "align_corners": True}
+
+
+def _fusable_types() -> Tuple[type, ...]:
+    return (
+        K.RandomAffine,
+        K.RandomRotation,
+        K.RandomPerspective,
+        K.RandomShear,
+        K.RandomTranslate,
+        K.RandomHorizontalFlip,
+        K.RandomVerticalFlip,
+        K.RandomResizedCrop,
+        K.RandomCrop,
+        K.CenterCrop,
+    )
+
+
+def get_fusion_flags(module: Module, extra_args: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """Return the sampling flags a module needs to be fused, or ``None`` if it can not be fused.
+
+    A module can be fused if it warps its input with its transformation matrix. Flips and crops without padding are
+    exact integer mappings of the pixels and are compatible with any other flags, so they return an empty dict.
+
+    Args:
+        module: the module to check.
+        extra_args: flags overriding the ones of the module.
+
+    """
+    # subclasses may override ``apply_transform``
+    if type(module) not in _fusable_types():
+        return None
+    augmentation = cast(RigidAffineAugmentationBase2D, module)
+    flags: Dict[str, Any] = (
+        override_parameters(augmentation.flags, extra_args, in_place=False) if extra_args else augmentation.flags
+    )
+    if isinstance(module, (K.RandomHorizontalFlip, K.RandomVerticalFlip)):
+        return {}
+    if isinstance(module, K.RandomCrop) and (flags["padding"] is not None or flags["pad_if_needed"]):
+        return None
+    if isinstance(module, (K.RandomCrop, K.CenterCrop)) and flags["cropping_mode"] == "slice":
+        return {}
+    out = {"resample": Resample.get(flags["resample"]).name.lower(), "align_corners": flags["align_corners"]}
+    if isinstance(module, (K.RandomAffine, K.RandomShear, K.RandomTranslate)):
+        out["padding_mode"] = SamplePadding.get(flags["padding_mode"]).name.lower()
+    elif isinstance(module, (K.RandomRotation, K.RandomPerspective)):
+        out["padding_mode"] = "zeros"
+    return out
+
+
+def _merge_flags(flags: Dict[str, Any], other: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if any(k in flags and flags[k] != v for k, v in other.items()):
+        return None
+    return {**flags, **other}
+
+
+def _param_data(param: ParamItem) -> Dict[str, Tensor]:
+    if not isinstance(param.data, dict):
+        raise TypeError(f"Expected param (ParamItem.data) be a dictionary. Gotcha {param}.")
+    return param.data
+
+
+def _edge_matrix(size: Tensor, inverse: bool = False) -> Tensor:
+    r"""Return the matrices from the pixels to the coordinates sampled by a warp without ``align_corners``.
+
+    The warp of an input of size :math:`n` without ``align_corners`` samples the pixel :math:`x` at
+    :math:`x n / (n - 1) - 1 / 2`, and the output pixel :math:`x` is the input one of an ``affine_grid`` at
+    :math:`(x + 1 / 2) (n - 1) / n`.
+
+    Args:
+        size: the widths and heights of the images with shape :math:`(B, 2)`.
+        inverse: whether to return the inverse matrices.
+
+    Returns:
+        the matrices with shape :math:`(B, 3, 3)`.
+
+    """
+    scale = size / (size - 1).clamp_min(1)
+    shift = torch.full_like(size, -0.5)
+    if inverse:
+        scale, shift = 1 / scale, 0.5 / scale
+    mat = torch.zeros(size.shape[0], 3, 3, device=size.device, dtype=size.dtype)
+    mat[:, 0, 0], mat[:, 1, 1], mat[:, 2, 2] = scale[:, 0], scale[:, 1], 1
+    mat[:, :2, 2] = shift
+    return mat
+
+
+def _translation(offset: Tensor) -> Tensor:
+    mat = torch.eye(3, device=offset.device, dtype=offset.dtype).repeat(offset.shape[0], 1, 1)
+    mat[:, :2, 2] = offset
+    return mat
+
+
+class FusedGeometricOps:
+    """Apply runs of geometric augmentations with a single resampling for every data type."""
+
+    @classmethod
+    def get_runs(
+        cls, modules: List[Module], params: List[ParamItem], extra_args: Optional[Dict[str, Any]] = None
+    ) -> List[List[int]]:
+        """Group the indices of consecutive operations that can be fused together.
+
+        Two fusable operations are put in the same run only if they agree on the interpolation, padding and
+        alignment flags. Every other operation is returned in a run of its own.
+
+        Args:
+            modules: the modules of the sequence.
+            params: the corresponding parameters.
+            extra_args: flags overriding the ones of the modules.
+
+        """
+        runs: List[List[int]] = []
+        run_flags: Optional[Dict[str, Any]] = None
+        for idx, (module, param) in enumerate(zip(modules, params)):
+            flags = get_fusion_flags(module, extra_args) if isinstance(param.data, dict) else None
+            merged = None if flags is None or run_flags is None else _merge_flags(run_flags, flags)
+            if merged is not None:
+                runs[-1].append(idx)
+            else:
+                runs.append([idx])
+            run_flags = merged if merged is not None else flags
+        return runs
+
+    @classmethod
+    def compute_transformation(
+        cls,
+        input: Tensor,
+        modules: List[Module],
+        params: List[ParamItem],
+        extra_args: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Tensor, Tensor, Tuple[int, int], Dict[str, Any]]:
+        """Chain the transformation matrices of a run of operations.
+
+        Every module records its own matrix and parameters as if it had been applied, which keeps
+        ``transform_matrix`` and the inverse operations available.
+
+        The matrices are also chained under the convention of the warp of every module without ``align_corners``,
+        i.e. ``warp_affine`` for most of them. Flips and slicing crops are exact under both conventions.
+
+        Args:
+            input: the input images of the run.
+            modules: the modules of the run.
+            params: the corresponding parameters.
+            extra_args: flags overriding the ones of the modules.
+
+        Returns:
+            the fused transformation matrices :math:`(B, 3, 3)`, the fused matrices under the convention of the
+            warps without ``align_corners``, the output size and the sampling flags.
+
+        """
+        if extra_args is None:
+            extra_args = {}
+        augmentations = cast(List[RigidAffineAugmentationBase2D], modules)
+        in_tensor = augmentations[0].transform_tensor(input)
+        batch_size, channels, height, width = in_tensor.shape
+        transform: Optional[Tensor] = None
+        edge_transform: Optional[Tensor] = None
+        fused_flags: Dict[str, Any] = {}
+        for module, param in zip(augmentations, params):
+            _params = {k: v.to(in_tensor.device) if isinstance(v, Tensor) else v for k, v in _param_data(param).items()}
+            _params, flags = module._process_kwargs_to_params_and_flags(_params, module.flags, **extra_args)
+            # the matrices only depend on the shape of the intermediate images
+            dtype = in_tensor.dtype if in_tensor.is_floating_point() else module.dtype
+            placeholder = in_tensor.new_zeros((), dtype=dtype).expand(batch_size, channels, height, width)
+            mat = module.generate_transformation_matrix(placeholder, _params, flags)
+            module._transform_matrix = mat
+            in_size = (height, width)
+            if isinstance(module, (K.RandomResizedCrop, K.RandomCrop, K.CenterCrop)) and bool(
+                (_params["batch_prob"] > 0.5).all()
+            ):
+                size = flags["size"]
+                height, width = (size, size) if isinstance(size, int) else (int(size[0]), int(size[1]))
+            edge_mat = cls._edge_transformation(module, mat, _params, flags, in_size, (height, width))
+            transform = mat if transform is None else mat @ transform
+            edge_transform = edge_mat if edge_transform is None else edge_mat @ edge_transform
+            fused_flags.update(get_fusion_flags(module, extra_args) or {})
+        if transform is None or edge_transform is None:
+            raise ValueError("Expected at least one module to fuse.")
+        return transform, edge_transform, (height, width), {**_DEFAULT_FLAGS, **fused_flags}
+
+    @classmethod
+    def _edge_transformation(
+        cls,
+        module: Module,
+        mat: Tensor,
+        params: Dict[str, Tensor],
+        flags: Dict[str, Any],
+        in_size: Tuple[int, int],
+        out_size: Tuple[int, int],
+    ) -> Tensor:
+        """Return the matrices of a module under the convention of its own warp without ``align_corners``."""
+        if isinstance(module, (K.RandomHorizontalFlip, K.RandomVerticalFlip)) or (
+            isinstance(module, (K.RandomCrop, K.CenterCrop)) and flags["cropping_mode"] == "slice"
+        ):
+            return mat
+        in_wh = torch.tensor([[in_size[1], in_size[0]]], device=mat.device, dtype=mat.dtype)
+        out_wh = torch.tensor([[out_size[1], out_size[0]]], device=mat.device, dtype=mat.dtype)
+        if isinstance(module, K.RandomPerspective):
+            # ``warp_perspective`` samples the output pixels as they are
+            return mat @ _edge_matrix(in_wh, inverse=True)
+        src = params.get("src", None)
+        if (
+            isinstance(module, K.RandomResizedCrop)
+            and flags["cropping_mode"] == "slice"
+            and src is not None
+            and src.shape[0] == mat.shape[0]
+        ):
+            # the crop is resized, the sampled pixels are scaled by the size of the crop instead of the input. The
+            # half pixel on the border of the crop still differs, as the resize clamps it where the warp reads on.
+            src = src.to(mat)
+            origin = src[:, 0]
+            crop = _edge_matrix(src[:, 2] - origin + 1, inverse=True)
+            return _edge_matrix(out_wh) @ mat @ _translation(origin) @ crop @ _translation(-origin)
+        return _edge_matrix(out_wh) @ mat @ _edge_matrix(in_wh, inverse=True)
+
+    @classmethod
+    def _sampling_transform(
+        cls, input: Tensor, transform: Tensor, edge_transform: Tensor, align_corners: bool
+    ) -> Tensor:
+        """Return the matrices to warp the input with, as it is sampled differently without ``align_corners``."""
+        if align_corners:
+            return transform
+        height, width = input.shape[-2:]
+        wh = torch.tensor([[width, height]], device=edge_transform.device, dtype=edge_transform.dtype)
+        return edge_transform @ _edge_matrix(wh)
+
+    @classmethod
+    def transform_inputs(
+        cls,
+        input: Tensor,
+        modules: List[Module],
+        transform: Tensor,
+        edge_transform: Tensor,
+        size: Tuple[int, int],
+        flags: Dict[str, Any],
+    ) -> Tensor:
+        """Warp the images of a run at once.
+
+        Args:
+            input: the input images.
+            modules: the modules of the run.
+            transform: the fused transformation matrices.
+            edge_transform: the fused matrices under the convention of the warps without ``align_corners``.
+            size: the output size of the run.
+            flags: the sampling flags of the run.
+
+        """
+        augmentations = cast(List[RigidAffineAugmentationBase2D], modules)
+        in_tensor = augmentations[0].transform_tensor(input)
+        integer = not in_tensor.is_floating_point()
+        if integer:
+            # integer images are resampled as floats in [0, 1] and rounded back
+            in_tensor = in_tensor.to(transform.dtype) / 255.0
+        sampling = cls._sampling_transform(in_tensor, transform, edge_transform, flags["align_corners"])
+        output = warp_perspective(
+            in_tensor,
+            sampling.to(in_tensor),
+            size,
+            mode=flags["resample"],
+            padding_mode=flags["padding_mode"],
+            align_corners=flags["align_corners"],
+        )
+        if integer:
+            output = (output * 255.0).round().clamp(0, 255).to(input.dtype)
+        if all(module.keepdim for module in augmentations):
+            output = _transform_output_shape(output, input.shape)
+        return output
+
+    @classmethod
+    def transform_masks(
+        cls,
+        input: Tensor,
+        modules: List[Module],
+        params: List[ParamItem],
+        transform: Tensor,
+        edge_transform: Tensor,
+        size: Tuple[int, int],
+        flags: Dict[str, Any],
+        extra_args: Optional[Dict[str, Any]] = None,
+    ) -> Tensor:
+        """Warp the masks of a run at once, with nearest interpolation unless ``extra_args`` says otherwise.
+
+        Args:
+            input: the input masks.
+            modules: the modules of the run.
+            params: the corresponding parameters.
+            transform: the fused transformation matrices.
+            edge_transform: the fused matrices under the convention of the warps without ``align_corners``.
+            size: the output size of the run.
+            flags: the sampling flags of the run.
+            extra_args: flags overriding the ones of the run.
+
+        """
+        extra_args = extra_args or {}
+        augmentations = cast(List[RigidAffineAugmentationBase2D], modules)
+        mode = Resample.get(extra_args.get("resample", None) or Resample.NEAREST).name.lower()
+        align_corners = extra_args.get("align_corners", None)
+        align_corners = flags["align_corners"] if align_corners is None else align_corners
+        shape = _param_data(params[0])["forward_input_shape"]
+        in_tensor = augmentations[0].transform_tensor(input, shape=shape, match_channel=False)
+        integer = not in_tensor.is_floating_point()
+        if integer:
+            in_tensor = in_tensor.to(transform.dtype)
+        sampling = cls._sampling_transform(in_tensor, transform, edge_transform, align_corners)
+        output = warp_perspective(
+            in_tensor,
+            sampling.to(in_tensor),
+            size,
+            mode=mode,
+            padding_mode=flags["padding_mode"],
+            align_corners=align_corners,
+        )
+        if integer:
+            output = output.round().clamp(0, 255).to(input.dtype)
+        if all(module.keepdim for module in augmentations):
+            output = _transform_output_shape(output, input.shape, reference_shape=shape)
+        return output
+
+    @classmethod
+    def transform_boxes(cls, input: Boxes, transform: Tensor) -> Boxes:
+        """Transform the boxes with the fused matrices."""
+        return input.clone().transform_boxes_(transform)
+
+    @classmethod
+    def transform_keypoints(cls, input: Keypoints, transform: Tensor) -> Keypoints:
+        """Transform the keypoints with the fused matrices."""
+        return input.clone().transform_keypoints_(transform)
+
+
+class FusedIntensityOps:
+    """Apply runs of pointwise intensity augmentations of ``torch.uint8`` images with a single lookup table."""
+
+    @classmethod
+    def is_fusable(cls, module: Module) -> bool:
+        """Return whether the module is applied to ``torch.uint8`` images by a lookup table."""
+        return isinstance(module, K.IntensityAugmentationBase2D) and module._supports_lut
+
+    @classmethod
+    def get_runs(cls, modules: List[Module], params: List[ParamItem], runs: List[List[int]]) -> List[List[int]]:
+        """Merge the consecutive runs made of a single operation that can be applied by a lookup table.
+
+        Args:
+            modules: the modules of the sequence.
+            params: the corresponding parameters.
+            runs: the runs of the sequence so far, e.g. from :meth:`FusedGeometricOps.get_runs`.
+
+        """
+        out: List[List[int]] = []
+        fusable_run = False
+        for run in runs:
+            fusable = len(run) == 1 and isinstance(params[run[0]].data, dict) and cls.is_fusable(modules[run[0]])
+            if fusable and fusable_run:
+                out[-1].extend(run)
+            else:
+                out.append(list(run))
+            fusable_run = fusable
+        return out
+
+    @classmethod
+    def transform_inputs(
+        cls,
+        input: Tensor,
+        modules: List[Module],
+        params: List[ParamItem],
+        extra_args: Optional[Dict[str, Any]] = None,
+    ) -> Tensor:
+        """Compose the lookup tables of a run of operations and map the images at once.
+
+        The intermediate levels are not rounded, except before an equalization.
+
+        Args:
+            input: the input images of the run.
+            modules: the modules of the run.
+            params: the corresponding parameters.
+            extra_args: flags overriding the ones of the modules.
+
+        """
+        if extra_args is None:
+            extra_args = {}
+        augmentations = cast(List[IntensityAugmentationBase2D], modules)
+        in_tensor = augmentations[0].transform_tensor(input)
+        lut = identity_lut(in_tensor, augmentations[0].dtype)
+        for module, param in zip(augmentations, params):
+            _params = {k: v.to(in_tensor.device) if isinstance(v, Tensor) else v for k, v in _param_data(param).items()}
+            _params, flags = module._process_kwargs_to_params_and_flags(_params, module.flags, **extra_args)
+            lut = module.transform_lut(in_tensor, lut, _params, flags)
+            module._transform_matrix = module.identity_matrix(lut)
+        output = apply_lut(in_tensor, lut_to_uint8(lut))
+        if all(module.keepdim for module in augmentations):
+            output = _transform_output_shape(output, input.shape)
+        return output
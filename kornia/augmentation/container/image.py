@@ -26,7 +26,9 @@ from kornia.core import ImageModule, Module, Tensor, as_tensor
 from kornia.core.module import ImageModuleMixIn
 from kornia.utils import eye_like
 
-from .base import ImageSequentialBase
+from .base import ImageSequentialBase, _mask_batch_prob, _select_per_sample
+from .fusion import FusedGeometricOps, FusedIntensityOps
+from .ops import InputSequentialOps
 from .params import ParamItem
 
 __all__ = ["ImageSequential"]
@@ -67,6 +69,11 @@ class ImageSequential(ImageSequentialBase, ImageModuleForSequentialMixIn):
             If False, the whole list of args will be processed as a sequence in original order.
         random_apply_weights: a list of selection weights for each operation. The length shall be as
             same as the number of operations. By default, operations are sampled uniformly.
+        fuse_geometric: if True, consecutive geometric augmentations that are expressed by a transformation matrix
+            (e.g. ``RandomAffine``, ``RandomPerspective``, flips and crops) are applied at once by chaining their
+            matrices and resampling the images a single time to the output size of the run. This saves memory
+            traffic and avoids the blur of repeated interpolations. The operations of a run must share their
+            interpolation, padding and alignment flags.
 
     .. note::
         Transformation matrix returned only considers the transformation applied in ``kornia.augmentation`` module.
@@ -123,6 +130,7 @@ class ImageSequential(ImageSequentialBase, ImageModuleForSequentialMixIn):
         if_unsupported_ops: str = "raise",
         disable_item_features: bool = True,
         disable_sequential_features: bool = False,
+        fuse_geometric: bool = False,
     ) -> None:
         if disable_item_features:
             self.disable_item_features(*args)
@@ -138,6 +146,7 @@ class ImageSequential(ImageSequentialBase, ImageModuleForSequentialMixIn):
             )
         self.random_apply_weights = as_tensor(random_apply_weights or torch.ones((len(self),)))
         self.if_unsupported_ops = if_unsupported_ops
+        self.fuse_geometric = fuse_geometric
 
     def _read_random_apply(
         self, random_apply: Union[int, bool, Tuple[int, int]], max_length: int
@@ -206,6 +215,37 @@ class ImageSequential(ImageSequentialBase, ImageModuleForSequentialMixIn):
 
         return self.get_children_by_indices(indices), mix_added
 
+    def get_static_selection(self, batch_size: int) -> Tensor:
+        """Draw the operations applied to each sample when random apply is used in static mode.
+
+        Every operation is then run on the whole batch, in the original order, and masked by the selection. Unlike
+        the dynamic random apply, the selection is drawn per sample and without replacement.
+
+        Args:
+            batch_size: the number of samples.
+
+        Returns:
+            a boolean mask of shape :math:`(B, N)` for the :math:`N` operations of the sequence.
+
+        """
+        if not isinstance(self.random_apply, tuple):
+            raise TypeError(f"random apply should be a tuple. Gotcha {type(self.random_apply)}")
+        invalid = [
+            name
+            for name, module in self.named_children()
+            if not isinstance(module, (_AugmentationBase, ImageSequentialBase))
+            or isinstance(module, K.MixAugmentationBaseV2)
+        ]
+        if len(invalid) != 0:
+            raise NotImplementedError(
+                f"Random apply in static mode only supports non-mix augmentations and sequences. Got {invalid}."
+            )
+        num_rows = 1 if self.same_on_batch else batch_size
+        low, high = self.random_apply
+        num_samples = (self._rand(num_rows) * (high - low)).long() + low
+        selection = _select_per_sample(num_samples, self.random_apply_weights, self._rand(num_rows, len(self)))
+        return selection.expand(batch_size, -1)
+
     def get_mix_augmentation_indices(self, named_modules: Iterator[Tuple[str, Module]]) -> List[int]:
         """Get all the mix augmentations since they are label-involved.
 
@@ -219,7 +259,7 @@ class ImageSequential(ImageSequentialBase, ImageModuleForSequentialMixIn):
             # Mix augmentation can only be applied once per forward
             mix_indices = self.get_mix_augmentation_indices(self.named_children())
 
-            if self.random_apply:
+            if self.random_apply and not self.static_mode:
                 return self.get_random_forward_sequence()[0]
 
             if len(mix_indices) > 1:
@@ -245,8 +285,52 @@ class ImageSequential(ImageSequentialBase, ImageModuleForSequentialMixIn):
                 param = ParamItem(name, None)
             batch_shape = _get_new_batch_shape(param, batch_shape)
             params.append(param)
+        if self.random_apply and self.static_mode:
+            selection = self.get_static_selection(batch_shape[0])
+            for idx, param in enumerate(params):
+                _mask_batch_prob(param.data, selection[:, idx])
         return params
 
+    def get_fused_sequence(
+        self, params: List[ParamItem], extra_args: Optional[Dict[str, Any]] = None, fuse_lut: bool = False
+    ) -> List[List[ParamItem]]:
+        """Group the parameters into runs of operations applied at once.
+
+        Without ``fuse_geometric`` and ``fuse_lut``, every operation is a run of its own.
+
+        Args:
+            params: params for the sequence.
+            extra_args: Optional dictionary of extra arguments overriding the flags of the operations.
+            fuse_lut: whether to group the pointwise intensity operations applied by a lookup table, which is only
+                possible for ``torch.uint8`` images.
+        """
+        if not self.fuse_geometric and not fuse_lut:
+            return [[param] for param in params]
+        modules = [self.get_submodule(param.name) for param in params]
+        if self.fuse_geometric:
+            runs = FusedGeometricOps.get_runs(modules, params, extra_args)
+        else:
+            runs = [[idx] for idx in range(len(params))]
+        if fuse_lut:
+            runs = FusedIntensityOps.get_runs(modules, params, runs)
+        return [[params[idx] for idx in run] for run in runs]
+
+    def transform_inputs(
+        self, input: Tensor, params: List[ParamItem], extra_args: Optional[Dict[str, Any]] = None
+    ) -> Tensor:
+        for run in self.get_fused_sequence(params, extra_args, fuse_lut=input.dtype == torch.uint8):
+            modules = [self.get_submodule(param.name) for param in run]
+            if len(run) == 1:
+                input = InputSequentialOps.transform(input, module=modules[0], param=run[0], extra_args=extra_args)
+            elif FusedIntensityOps.is_fusable(modules[0]):
+                input = FusedIntensityOps.transform_inputs(input, modules, run, extra_args)
+            else:
+                transform, edge_transform, size, flags = FusedGeometricOps.compute_transformation(
+                    input, modules, run, extra_args
+                )
+                input = FusedGeometricOps.transform_inputs(input, modules, transform, edge_transform, size, flags)
+        return input
+
     def identity_matrix(self, input: Tensor) -> Tensor:
         """Return identity matrix."""
         return eye_like(3, input)
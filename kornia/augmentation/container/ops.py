@@ -15,22 +15,24 @@
 # limitations under the License.
 #
 
-import copy
 from abc import ABCMeta, abstractmethod
 from typing import Any, Callable, Dict, Generic, List, Optional, Type, TypeVar, Union
 
+import torch
 from typing_extensions import ParamSpec
 
 import kornia.augmentation as K
 from kornia.augmentation.base import _AugmentationBase
 from kornia.constants import DataKey
 from kornia.core import Module, Tensor
+from kornia.core.check import KORNIA_CHECK
 from kornia.geometry.boxes import Boxes
 from kornia.geometry.keypoints import Keypoints
 
 from .params import ParamItem
+from .ragged import RaggedImages
 
-DataType = Union[Tensor, List[Tensor], Boxes, Keypoints]
+DataType = Union[Tensor, List[Tensor], Boxes, Keypoints, RaggedImages]
 
 # NOTE: shouldn't this SequenceDataType alias be equals to List[DataType]?
 SequenceDataType = Union[List[Tensor], List[List[Tensor]], List[Boxes], List[Keypoints]]
@@ -317,64 +319,28 @@ class MaskSequentialOps(SequentialOpsInterface[Tensor]):
     ) -> List[Tensor]:
         """Apply a transformation with respect to the parameters.
 
+        The masks are packed in a padded buffer (see :class:`RaggedImages`) and transformed at once.
+
         Args:
-            input: list of input tensors.
+            input: list of input tensors, one per image of the batch, with shapes :math:`(*, H, W)`. The number of
+                channels may differ, e.g. one channel per instance.
             module: any torch Module but only kornia augmentation modules will count
                 to apply transformations.
             param: the corresponding parameters to the module.
             extra_args: Optional dictionary of extra arguments with specific options for different input types.
         """
-        if extra_args is None:
-            extra_args = {}
-        if isinstance(module, (K.GeometricAugmentationBase2D,)):
-            tfm_input = []
-            params = cls.get_instance_module_param(param)
-            params_i = copy.deepcopy(params)
-            for i, inp in enumerate(input):
-                params_i["batch_prob"] = params["batch_prob"][i]
-                tfm_inp = module.transform_masks(
-                    inp, params=params_i, flags=module.flags, transform=module.transform_matrix, **extra_args
-                )
-                tfm_input.append(tfm_inp)
-            input = tfm_input
-
-        elif isinstance(module, (K.GeometricAugmentationBase3D,)):
-            raise NotImplementedError(
-                "The support for 3d mask operations are not yet supported. You are welcome to file a PR in our repo."
-            )
-
-        elif isinstance(module, (_AugmentationBase)):
-            tfm_input = []
-            params = cls.get_instance_module_param(param)
-            params_i = copy.deepcopy(params)
-            for i, inp in enumerate(input):
-                params_i["batch_prob"] = params["batch_prob"][i]
-                tfm_inp = module.transform_masks(inp, params=params_i, flags=module.flags, **extra_args)
-                tfm_input.append(tfm_inp)
-            input = tfm_input
-
-        elif isinstance(module, K.ImageSequential) and not module.is_intensity_only():
-            tfm_input = []
-            seq_params = cls.get_sequential_module_param(param)
-            for inp in input:
-                tfm_inp = module.transform_masks(inp, params=seq_params, extra_args=extra_args)
-                tfm_input.append(tfm_inp)
-            input = tfm_input
-
-        elif isinstance(module, K.container.ImageSequentialBase):
-            tfm_input = []
-            seq_params = cls.get_sequential_module_param(param)
-            for inp in input:
-                tfm_inp = module.transform_masks(inp, params=seq_params, extra_args=extra_args)
-                tfm_input.append(tfm_inp)
-            input = tfm_input
-
-        elif isinstance(module, (K.auto.operations.OperationBase,)):
-            raise NotImplementedError(
-                "The support for list of masks under auto operations are not yet supported. You are welcome to file a"
-                " PR in our repo."
-            )
-        return input
+        masks = RaggedImages.from_list([inp.reshape(-1, *inp.shape[-2:]) for inp in input])
+        KORNIA_CHECK(
+            bool((masks.sizes[:, 1:] == masks.sizes[0, 1:]).all()),
+            f"Expected the masks to have the same height and width. Got {[inp.shape for inp in input]}.",
+        )
+        output = cls.transform(masks.data, module, param=param, extra_args=extra_args)
+        sizes = masks.sizes.clone()
+        sizes[:, 1:] = torch.tensor(output.shape[-2:])
+        return [
+            out.reshape(*inp.shape[:-2], *out.shape[-2:])
+            for inp, out in zip(input, RaggedImages(output, sizes).to_list())
+        ]
 
     @classmethod
     def inverse(
@@ -0,0 +1,280 @@
+# LICENSE HEADER MANAGED BY add-license-header
+#
+# Copyright 2018 Kornia Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Augmentation of batches in a pool of worker processes."""
+
+import queue
+import traceback
+from types import TracebackType
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, Union, cast
+
+import torch
+import torch.multiprocessing as mp
+from typing_extensions import Self
+
+from kornia.augmentation.base import _AugmentationBase
+from kornia.core import Module, Tensor
+from kornia.core.check import KORNIA_CHECK
+
+from .base import ImageSequentialBase
+
+__all__ = ["AugmentationPool"]
+
+# the interval to check that the workers are alive while waiting for a batch, in seconds
+_POLL_INTERVAL = 5.0
+
+
+def _as_tuple(batch: Union[Tensor, Sequence[Tensor]]) -> Tuple[Tensor, ...]:
+    return (batch,) if isinstance(batch, Tensor) else tuple(batch)
+
+
+def _matches(buffers: Optional[List[Tensor]], outputs: List[Tensor]) -> bool:
+    if buffers is None or len(buffers) != len(outputs):
+        return False
+    return all(b.shape == o.shape and b.dtype == o.dtype for b, o in zip(buffers, outputs))
+
+
+def _worker_loop(augmentation: Module, task_queue: Any, result_queue: Any, num_threads: Optional[int]) -> None:
+    """Apply the augmentation to the batches of the tasks, and write the outputs into the slots of the worker."""
+    if num_threads is not None:
+        torch.set_num_threads(num_threads)
+    slots: Dict[int, List[Tensor]] = {}
+    while True:
+        task = task_queue.get()
+        if task is None:
+            break
+        index, slot, seed, inputs, params = task
+        try:
+            torch.manual_seed(seed)
+            with torch.no_grad():
+                output = augmentation(*inputs, params=params)
+            outputs = [output] if isinstance(output, Tensor) else list(output)
+            KORNIA_CHECK(
+                all(isinstance(o, Tensor) for o in outputs), "The augmentation must return a tensor or tensors."
+            )
+            buffers = slots.get(slot, None)
+            # the slot is only reallocated when the shapes of the outputs change, its handles are sent once
+            new_buffers = not _matches(buffers, outputs)
+            if new_buffers:
+                buffers = [torch.empty(o.shape, dtype=o.dtype).share_memory_() for o in outputs]
+                slots[slot] = buffers
+            for buffer, o in zip(buffers, outputs):  # type: ignore[arg-type]
+                buffer.copy_(o)
+            result_queue.put((index, buffers if new_buffers else None, isinstance(output, Tensor), None))
+        except Exception:  # noqa: BLE001 - any error of the augmentation is sent back, the main process would hang
+            result_queue.put((index, None, False, traceback.format_exc()))
+
+
+class AugmentationPool:
+    r"""Apply an augmentation pipeline to a stream of batches in a pool of worker processes.
+
+    The parameters of every batch are sampled in the main process with ``forward_parameters`` and replayed by a
+    worker with ``params``, so that the outputs do not depend on the number of workers or on their scheduling. The
+    workers write the augmented batches into a ring of ``prefetch`` shared memory slots, which the main process reads
+    without copies or pickling of the outputs, while the next batches are being augmented.
+
+    The batches given to :meth:`imap` are moved to the workers through shared memory, and the augmentation module is
+    sent to every worker once, when the pool is created.
+
+    Args:
+        augmentation: the augmentation to apply, e.g. an :class:`AugmentationSequential`. It must implement
+            ``forward_parameters`` and accept ``params`` in its forward.
+        num_workers: the number of worker processes.
+        prefetch: the number of batches augmented ahead, i.e. the size of the ring of slots. It must be at least
+            ``num_workers``.
+        pin_memory: copy the outputs into page-locked memory for asynchronous transfers to the GPU.
+        num_threads: the number of threads of every worker. Default: one, to avoid oversubscribing the host.
+        multiprocessing_context: the start method of the workers, ``fork``, ``spawn`` or ``forkserver``. The
+            default start method of the platform is used if None.
+
+    .. note::
+        The tensors yielded by :meth:`imap` are views of the slots of the ring, which are valid until the next batch
+        is requested. Clone them to keep them longer.
+
+    Example:
+        >>> import kornia.augmentation as K
+        >>> aug = K.AugmentationSequential(K.RandomAffine(30.0, p=1.0), K.ColorJitter(0.1, 0.1, p=0.5))
+        >>> batches = [torch.rand(2, 3, 8, 8) for _ in range(3)]
+        >>> with AugmentationPool(aug, num_workers=1, prefetch=2) as pool:  # doctest: +SKIP
+        ...     for images in pool.imap(batches):
+        ...         print(images.shape)
+        torch.Size([2, 3, 8, 8])
+        torch.Size([2, 3, 8, 8])
+        torch.Size([2, 3, 8, 8])
+
+    """
+
+    def __init__(
+        self,
+        augmentation: Module,
+        num_workers: int = 2,
+        prefetch: int = 4,
+        pin_memory: bool = False,
+        num_threads: Optional[int] = 1,
+        multiprocessing_context: Optional[str] = None,
+    ) -> None:
+        KORNIA_CHECK(num_workers > 0, f"Expected at least one worker. Got {num_workers}.")
+        KORNIA_CHECK(
+            prefetch >= num_workers,
+            f"Expected `prefetch` to be at least `num_workers`. Got {prefetch} < {num_workers}.",
+        )
+        KORNIA_CHECK(
+            hasattr(augmentation, "forward_parameters"), "The augmentation must implement `forward_parameters`."
+        )
+        self.augmentation = augmentation
+        self.num_workers = num_workers
+        self.prefetch = prefetch
+        self.pin_memory = pin_memory and torch.cuda.is_available()
+
+        # only the concrete contexts of the start methods define ``Process``
+        ctx: Any = mp.get_context(multiprocessing_context)
+        self._result_queue = ctx.Queue()
+        self._task_queues = [ctx.Queue() for _ in range(num_workers)]
+        self._workers = [
+            ctx.Process(
+                target=_worker_loop,
+                args=(augmentation, task_queue, self._result_queue, num_threads),
+                daemon=True,
+            )
+            for task_queue in self._task_queues
+        ]
+        for worker in self._workers:
+            worker.start()
+        # the buffers of every slot of the ring, as shared by the workers, and their page-locked copies
+        self._slots: List[Optional[List[Tensor]]] = [None] * prefetch
+        self._pinned: List[Optional[List[Tensor]]] = [None] * prefetch
+        self._running = False
+        self._closed = False
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+    def imap(self, batches: Iterable[Union[Tensor, Sequence[Tensor]]], return_params: bool = False) -> Iterator[Any]:
+        """Augment the batches in the workers and yield the outputs in order.
+
+        Args:
+            batches: the batches to augment, a tensor or a sequence of tensors per batch, e.g. the images and masks
+                for the ``data_keys`` of an :class:`AugmentationSequential`.
+            return_params: also yield the parameters of every batch, which can be replayed on the main process.
+
+        Yields:
+            the outputs of the augmentation for every batch, and their parameters if ``return_params``.
+
+        """
+        KORNIA_CHECK(not self._closed, "The pool is closed.")
+        KORNIA_CHECK(not self._running, "The pool is already augmenting another stream of batches.")
+        self._running = True
+        stream = iter(batches)
+        # a different seed for every batch, for the randomness out of the parameters
+        base_seed = int(torch.empty((), dtype=torch.int64).random_())
+        params: Dict[int, Any] = {}
+        results: Dict[int, Tuple[bool, List[Tensor]]] = {}
+        submitted = 0
+        index = 0
+        try:
+            while submitted < self.prefetch and self._submit(stream, submitted, base_seed, params):
+                submitted += 1
+            while index < submitted:
+                single, outputs = self._wait(index, results)
+                output: Any = outputs[0] if single else outputs
+                batch_params = params.pop(index)
+                index += 1
+                yield (output, batch_params) if return_params else output
+                # the consumer is done with the slot of the previous batch, which is given to the next one
+                if self._submit(stream, submitted, base_seed, params):
+                    submitted += 1
+        finally:
+            # drain the batches in flight, so that the slots are free for the next stream
+            for pending in range(index, submitted):
+                if self._closed:
+                    break
+                self._wait(pending, results, raise_errors=False)
+            self._running = False
+
+    def close(self) -> None:
+        """Stop the workers."""
+        if getattr(self, "_closed", True):
+            return
+        self._closed = True
+        for task_queue in self._task_queues:
+            task_queue.put(None)
+        for worker in self._workers:
+            worker.join(timeout=_POLL_INTERVAL)
+            if worker.is_alive():
+                worker.terminate()
+        for q in [*self._task_queues, self._result_queue]:
+            q.cancel_join_thread()
+            q.close()
+
+    def _submit(self, stream: Iterator[Any], index: int, base_seed: int, params: Dict[int, Any]) -> bool:
+        try:
+            inputs = _as_tuple(next(stream))
+        except StopIteration:
+            return False
+        KORNIA_CHECK(
+            all(isinstance(x, Tensor) and x.device.type == "cpu" for x in inputs),
+            "Expected the batches to be CPU tensors.",
+        )
+        augmentation = cast(Union[_AugmentationBase, ImageSequentialBase], self.augmentation)
+        params[index] = augmentation.forward_parameters(inputs[0].shape)
+        slot = index % self.prefetch
+        task = (index, slot, (base_seed + index) % 2**63, inputs, params[index])
+        self._task_queues[slot % self.num_workers].put(task)
+        return True
+
+    def _wait(
+        self, index: int, results: Dict[int, Tuple[bool, List[Tensor]]], raise_errors: bool = True
+    ) -> Tuple[bool, List[Tensor]]:
+        """Wait for the batch ``index``, keeping the batches completed out of order."""
+        while index not in results:
+            try:
+                done, buffers, single, error = self._result_queue.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                if not all(worker.is_alive() for worker in self._workers):
+                    self.close()
+                    raise RuntimeError("An augmentation worker exited unexpectedly.") from None
+                continue
+            if error is not None:
+                results[done] = (single, [])
+                if raise_errors:
+                    raise RuntimeError(f"Caught an exception in an augmentation worker:\n{error}")
+                continue
+            slot = done % self.prefetch
+            if buffers is not None:
+                self._slots[slot] = buffers
+                self._pinned[slot] = None
+            results[done] = (single, self._slots[slot] or [])
+        single, outputs = results.pop(index)
+        if self.pin_memory and outputs:
+            slot = index % self.prefetch
+            pinned = self._pinned[slot]
+            if pinned is None:
+                pinned = [torch.empty(o.shape, dtype=o.dtype).pin_memory() for o in outputs]
+                self._pinned[slot] = pinned
+            outputs = [p.copy_(o) for p, o in zip(pinned, outputs)]
+        return single, outputs
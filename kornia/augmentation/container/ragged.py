@@ -0,0 +1,469 @@
+# LICENSE HEADER MANAGED BY add-license-header
+#
+# Copyright 2018 Kornia Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Augmentation of batches of images of different sizes.
+
+The images of a ragged batch are stored in a single zero padded buffer, together with the size of every image. The
+operations of a sequence are applied to the whole buffer with one batched call where the result does not depend on
+the padding, i.e. the geometric augmentations that warp their input with a matrix and the pointwise intensity
+augmentations. The other operations are applied once per group of images of the same size.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, cast
+
+import torch
+
+import kornia.augmentation as K
+from kornia.augmentation._2d.base import AugmentationBase2D, RigidAffineAugmentationBase2D
+from kornia.augmentation.base import _AugmentationBase
+from kornia.constants import DataKey
+from kornia.core import Module, Tensor
+from kornia.core.check import KORNIA_CHECK, KORNIA_CHECK_SHAPE
+from kornia.geometry.boxes import Boxes
+from kornia.geometry.keypoints import Keypoints
+
+from .fusion import FusedGeometricOps, get_fusion_flags
+from .params import ParamItem
+
+if TYPE_CHECKING:
+    from .ops import AugmentationSequentialOps
+
+__all__ = ["RaggedImages", "RaggedSequentialOps"]
+
+# parameters shared by the whole batch, which are not split by sample
+_SHARED_PARAMS = ("order", "forward_input_shape")
+
+
+class RaggedImages:
+    r"""A batch of images of different sizes stored in a single zero padded buffer.
+
+    Every image is anchored at the top left corner of its slot of the buffer, and the buffer is zero out of the
+    images. The images may have a different number of channels, e.g. the instance masks of a detection dataset.
+
+    Args:
+        data: the padded buffer with shape :math:`(B, C, H, W)`, where :math:`C`, :math:`H` and :math:`W` are the
+            largest sizes of the batch.
+        sizes: the number of channels, height and width of every image, with shape :math:`(B, 3)`.
+
+    Example:
+        >>> images = RaggedImages.from_list([torch.rand(3, 4, 5), torch.rand(3, 6, 2)])
+        >>> images.data.shape
+        torch.Size([2, 3, 6, 5])
+        >>> [image.shape for image in images.to_list()]
+        [torch.Size([3, 4, 5]), torch.Size([3, 6, 2])]
+
+    """
+
+    def __init__(self, data: Tensor, sizes: Tensor) -> None:
+        KORNIA_CHECK_SHAPE(data, ["B", "C", "H", "W"])
+        KORNIA_CHECK_SHAPE(sizes, ["B", "3"])
+        KORNIA_CHECK(data.shape[0] == sizes.shape[0], f"Expected one size per image. Got {sizes.shape}.")
+        self._data = data
+        # the sizes are metadata read on the host, e.g. to split the batch by size
+        self._sizes = sizes.to(device="cpu", dtype=torch.long)
+
+    @classmethod
+    def from_list(cls, images: List[Tensor]) -> "RaggedImages":
+        r"""Pack a list of images into a padded buffer.
+
+        Args:
+            images: the images with shapes :math:`(C_i, H_i, W_i)`.
+
+        """
+        KORNIA_CHECK(len(images) > 0, "Expected at least one image.")
+        for image in images:
+            KORNIA_CHECK_SHAPE(image, ["C", "H", "W"])
+        sizes = torch.tensor([tuple(image.shape) for image in images], dtype=torch.long)
+        channels, height, width = sizes.max(0).values.tolist()
+        data = images[0].new_zeros(len(images), channels, height, width)
+        for slot, image in zip(data, images):
+            slot[: image.shape[0], : image.shape[1], : image.shape[2]] = image
+        return cls(data, sizes)
+
+    def to_list(self) -> List[Tensor]:
+        """Return the images as a list of views of the buffer."""
+        return [self._data[i, :c, :h, :w] for i, (c, h, w) in enumerate(self._sizes.tolist())]
+
+    @property
+    def data(self) -> Tensor:
+        return self._data
+
+    @property
+    def sizes(self) -> Tensor:
+        return self._sizes
+
+    @property
+    def device(self) -> torch.device:
+        return self._data.device
+
+    @property
+    def dtype(self) -> torch.dtype:
+        return self._data.dtype
+
+    def __len__(self) -> int:
+        return self._data.shape[0]
+
+    def to(self, device: Optional[torch.device] = None, dtype: Optional[torch.dtype] = None) -> "RaggedImages":
+        """Like :func:`torch.Tensor.to()` method."""
+        return RaggedImages(self._data.to(device=device, dtype=dtype), self._sizes)
+
+    def buckets(self) -> List[Tuple[Tensor, Tuple[int, int]]]:
+        """Group the images of the same height and width.
+
+        Returns:
+            the indices of the images of every group and their height and width.
+
+        """
+        spatial, inverse = torch.unique(self._sizes[:, 1:], dim=0, return_inverse=True)
+        return [(torch.nonzero(inverse == k).flatten(), (h, w)) for k, (h, w) in enumerate(spatial.tolist())]
+
+    def valid_mask(self) -> Tensor:
+        """Return the mask of the buffer covered by the images, with shape :math:`(B, C, H, W)`."""
+        _, channels, height, width = self._data.shape
+        sizes = self._sizes.to(self._data.device)
+        ranges = [torch.arange(n, device=self._data.device) for n in (channels, height, width)]
+        valid_c, valid_h, valid_w = (r[None] < sizes[:, i, None] for i, r in enumerate(ranges))
+        return valid_c[:, :, None, None] & valid_h[:, None, :, None] & valid_w[:, None, None, :]
+
+    def zero_padding_(self) -> "RaggedImages":
+        """Zero the buffer out of the images in-place."""
+        if bool((self._sizes == torch.tensor(self._data.shape[1:])).all()):
+            return self
+        self._data.masked_fill_(~self.valid_mask(), 0)
+        return self
+
+
+def _merge_params(buckets: List[Tensor], params: List[Any]) -> Any:
+    """Merge the parameters generated for every group of images into the parameters of the whole batch."""
+    first = params[0]
+    if first is None or len(params) == 1:
+        return first
+    if isinstance(first, list):
+        names = [[p.name for p in bucket_params] for bucket_params in params]
+        KORNIA_CHECK(
+            all(n == names[0] for n in names),
+            "Nested sequences with `random_apply` are not supported for ragged batches.",
+        )
+        return [
+            ParamItem(p.name, _merge_params(buckets, [bucket_params[i].data for bucket_params in params]))
+            for i, p in enumerate(first)
+        ]
+    out: Dict[str, Any] = {}
+    for key, value in first.items():
+        if key in _SHARED_PARAMS or not isinstance(value, Tensor) or value.dim() == 0:
+            out[key] = value
+            continue
+        rows = []
+        for idx, bucket_params in zip(buckets, params):
+            if bucket_params[key].shape[0] != len(idx):
+                # the parameters are only generated for the images the augmentation is applied to
+                idx = idx[bucket_params["batch_prob"].cpu() > 0.5]
+            rows.append(idx)
+        order = torch.cat(rows).argsort().to(value.device)
+        out[key] = torch.cat([bucket_params[key] for bucket_params in params])[order]
+    return out
+
+
+def _share_params(params: List[Any]) -> None:
+    # the parameters shared by the batch are drawn once, e.g. the order of the ``ColorJitter`` operations
+    for bucket_params in params[1:]:
+        if isinstance(bucket_params, dict):
+            bucket_params.update({k: params[0][k] for k in _SHARED_PARAMS[:-1] if k in bucket_params})
+
+
+def _samples_once(module: Module) -> bool:
+    """Whether the parameters of a module can be drawn once for the padded buffer and fitted to every image."""
+    if isinstance(module, K.IntensityAugmentationBase2D):
+        return module._supports_ragged
+    return type(module) in (
+        K.RandomHorizontalFlip,
+        K.RandomVerticalFlip,
+        K.RandomRotation,
+        K.RandomAffine,
+        K.RandomShear,
+        K.RandomTranslate,
+        K.RandomPerspective,
+    )
+
+
+def _param_rows(params: Dict[str, Tensor], batch_size: int) -> Tensor:
+    """Return the indices of the images the rows of the parameters belong to."""
+    batch_prob = params["batch_prob"]
+    rows = [v.shape[0] for k, v in params.items() if k not in _SHARED_PARAMS and isinstance(v, Tensor) and v.dim()]
+    if all(n == batch_size for n in rows):
+        return torch.arange(batch_size)
+    # the parameters are only generated for the images the augmentation is applied to
+    return torch.nonzero(batch_prob.cpu() > 0.5).flatten()
+
+
+def _fit_params(module: Module, params: Dict[str, Tensor], sizes: Tensor, padded: Tuple[int, int]) -> None:
+    """Fit the parameters drawn for the padded buffer to the height and width of every image, in-place.
+
+    The parameters of the supported operations are proportional to the size of the images, e.g. the translations,
+    or computed from it, e.g. the centers and the corners.
+    """
+    wh = sizes.flip(-1).to(dtype=torch.float64)
+    scale = wh / torch.tensor([padded[1], padded[0]], dtype=torch.float64)
+    if isinstance(module, K.RandomTranslate):
+        params["translate_x"] = params["translate_x"] * scale[:, 0].to(params["translate_x"])
+        params["translate_y"] = params["translate_y"] * scale[:, 1].to(params["translate_y"])
+    elif isinstance(module, K.RandomPerspective):
+        start_points = params["start_points"]
+        corners = torch.tensor([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]], dtype=torch.float64)
+        fitted = (corners * (wh[:, None] - 1)).to(start_points)
+        params["end_points"] = fitted + (params["end_points"] - start_points) * scale[:, None].to(start_points)
+        params["start_points"] = fitted
+    elif isinstance(module, (K.RandomAffine, K.RandomShear)):
+        if isinstance(module, K.RandomAffine):
+            params["translations"] = params["translations"] * scale.to(params["translations"])
+        params["center"] = (wh / 2.0 - 0.5).to(params["center"])
+
+
+def _split_params(
+    params: Dict[str, Tensor], rows: Tensor, buckets: List[Tuple[Tensor, Tuple[int, int]]], channels: int
+) -> List[Dict[str, Tensor]]:
+    """Split the parameters of the whole batch into the parameters of every group of images."""
+    batch_size = params["batch_prob"].shape[0]
+    position = torch.full((batch_size,), -1, dtype=torch.long)
+    position[rows] = torch.arange(len(rows))
+    out: List[Dict[str, Tensor]] = []
+    for idx, (height, width) in buckets:
+        bucket_rows = position[idx]
+        bucket_rows = bucket_rows[bucket_rows >= 0]
+        bucket_params: Dict[str, Tensor] = {}
+        for key, value in params.items():
+            if key == "forward_input_shape":
+                bucket_params[key] = torch.tensor((len(idx), channels, height, width), dtype=torch.long)
+            elif key in _SHARED_PARAMS or not isinstance(value, Tensor) or value.dim() == 0:
+                bucket_params[key] = value
+            elif key == "batch_prob":
+                bucket_params[key] = value[idx.to(value.device)]
+            else:
+                bucket_params[key] = value[bucket_rows.to(value.device)]
+        out.append(bucket_params)
+    return out
+
+
+class RaggedSequentialOps:
+    """Apply the operations of a sequence to ragged batches."""
+
+    @classmethod
+    def transform(
+        cls,
+        args: List[Any],
+        data_keys: List[DataKey],
+        module: Module,
+        name: str,
+        extra_args: Dict[DataKey, Dict[str, Any]],
+        ops: "AugmentationSequentialOps",
+    ) -> Tuple[List[Any], ParamItem]:
+        """Generate the parameters of an operation for a ragged batch and apply it.
+
+        The parameters are generated once for the padded buffer when they do not depend on the size of the images,
+        or depend on it linearly, and are then fitted to every image. The parameters of the other operations are
+        generated for every group of images of the same size.
+
+        Args:
+            args: the data, with the images and masks as :class:`RaggedImages`, the boxes as :class:`Boxes`, the
+                keypoints as :class:`Keypoints` and the class labels as tensors.
+            data_keys: the data keys of ``args``.
+            module: the operation.
+            name: the name of the operation in the sequence.
+            extra_args: extra arguments for every data key.
+            ops: the operations applied to every data key.
+
+        Returns:
+            the transformed data and the parameters of the operation for the whole batch.
+
+        """
+        images: RaggedImages = args[data_keys.index(DataKey.INPUT)]
+        buckets = images.buckets()
+        channels = images.data.shape[1]
+        bucket_params: List[Any]
+        if len(buckets) > 1 and isinstance(module, AugmentationBase2D) and _samples_once(module):
+            padded = images.data.shape[-2:]
+            params = module.forward_parameters(torch.Size((len(images), channels, *padded)))
+            rows = _param_rows(params, len(images))
+            _fit_params(module, params, images.sizes[rows, 1:], (padded[0], padded[1]))
+            bucket_params = _split_params(params, rows, buckets, channels)
+            param = ParamItem(name, params)
+        else:
+            if isinstance(module, (_AugmentationBase, K.MixAugmentationBaseV2, K.container.ImageSequentialBase)):
+                bucket_params = [
+                    module.forward_parameters(torch.Size((len(idx), channels, *size))) for idx, size in buckets
+                ]
+                _share_params(bucket_params)
+            else:
+                bucket_params = [None] * len(buckets)
+            param = ParamItem(name, _merge_params([idx for idx, _ in buckets], bucket_params))
+        if isinstance(param.data, dict) and len(buckets) > 1:
+            param.data["forward_input_shape"] = torch.tensor(images.data.shape, dtype=torch.long)
+
+        if len(buckets) > 1 and cls._is_warp(module, images, extra_args):
+            outputs = cls._transform_warp(args, data_keys, module, param, buckets, bucket_params, extra_args)
+        elif len(buckets) > 1 and isinstance(module, K.IntensityAugmentationBase2D) and module._supports_ragged:
+            outputs = [
+                cls._transform_pointwise(arg, module, param, extra_args.get(dcate, {}))
+                if isinstance(arg, RaggedImages) and dcate != DataKey.MASK
+                else arg
+                for arg, dcate in zip(args, data_keys)
+            ]
+        else:
+            outputs = cls._transform_buckets(args, data_keys, module, name, buckets, bucket_params, extra_args, ops)
+        return outputs, param
+
+    @classmethod
+    def _is_warp(cls, module: Module, images: RaggedImages, extra_args: Dict[DataKey, Dict[str, Any]]) -> bool:
+        # the padding is only equivalent to the area out of the images if it is sampled as zeros. The fused matrices
+        # map the pixels of every image on their own, so the size of the buffer does not matter
+        flags = get_fusion_flags(module, extra_args.get(DataKey.INPUT, None))
+        if flags is None or flags.get("padding_mode", "zeros") != "zeros":
+            return False
+        return bool((images.sizes > 1).all())
+
+    @classmethod
+    def _transform_warp(
+        cls,
+        args: List[Any],
+        data_keys: List[DataKey],
+        module: Module,
+        param: ParamItem,
+        buckets: List[Tuple[Tensor, Tuple[int, int]]],
+        bucket_params: List[Any],
+        extra_args: Dict[DataKey, Dict[str, Any]],
+    ) -> List[Any]:
+        """Warp all the images with their own matrix at once."""
+        if not isinstance(module, AugmentationBase2D):
+            raise TypeError(f"Expected a geometric augmentation. Got {type(module)}.")
+        images: RaggedImages = args[data_keys.index(DataKey.INPUT)]
+        out_sizes = images.sizes.clone()
+        transform: Optional[Tensor] = None
+        edge_transform: Optional[Tensor] = None
+        flags: Dict[str, Any] = {}
+        for (idx, (height, width)), bucket_param in zip(buckets, bucket_params):
+            placeholder = images.data.new_zeros(()).expand(len(idx), images.data.shape[1], height, width)
+            mat, edge_mat, size, flags = FusedGeometricOps.compute_transformation(
+                placeholder, [module], [ParamItem(param.name, bucket_param)], extra_args.get(DataKey.INPUT, None)
+            )
+            if transform is None or edge_transform is None:
+                transform, edge_transform = mat.new_zeros(len(images), 3, 3), mat.new_zeros(len(images), 3, 3)
+            transform[idx.to(mat.device)] = mat
+            edge_transform[idx.to(mat.device)] = edge_mat
+            out_sizes[idx, 1:] = torch.tensor(size)
+        if transform is None or edge_transform is None:
+            raise ValueError("Expected at least one image.")
+        module._transform_matrix = transform
+        module._params = cast(Dict[str, Tensor], param.data)
+        out_size = (int(out_sizes[:, 1].max()), int(out_sizes[:, 2].max()))
+
+        outputs: List[Any] = []
+        for arg, dcate in zip(args, data_keys):
+            if isinstance(arg, RaggedImages) and dcate == DataKey.MASK:
+                data = FusedGeometricOps.transform_masks(
+                    arg.data, [module], [param], transform, edge_transform, out_size, flags, extra_args.get(dcate, {})
+                )
+                sizes = torch.cat([arg.sizes[:, :1], out_sizes[:, 1:]], 1)
+                arg = RaggedImages(data, sizes).zero_padding_()
+            elif isinstance(arg, RaggedImages):
+                data = FusedGeometricOps.transform_inputs(
+                    arg.data, [module], transform, edge_transform, out_size, flags
+                )
+                arg = RaggedImages(data, out_sizes).zero_padding_()
+            elif isinstance(arg, Boxes):
+                arg = FusedGeometricOps.transform_boxes(arg, transform)
+            elif isinstance(arg, Keypoints):
+                arg = FusedGeometricOps.transform_keypoints(arg, transform)
+            outputs.append(arg)
+        return outputs
+
+    @classmethod
+    def _transform_pointwise(
+        cls, images: RaggedImages, module: Module, param: ParamItem, extra_args: Dict[str, Any]
+    ) -> RaggedImages:
+        """Transform the whole buffer, the padding is zeroed afterwards."""
+        data = module(images.data, params=param.data, data_keys=[DataKey.INPUT], **extra_args)
+        return RaggedImages(data, images.sizes).zero_padding_()
+
+    @classmethod
+    def _transform_buckets(
+        cls,
+        args: List[Any],
+        data_keys: List[DataKey],
+        module: Module,
+        name: str,
+        buckets: List[Tuple[Tensor, Tuple[int, int]]],
+        bucket_params: List[Any],
+        extra_args: Dict[DataKey, Dict[str, Any]],
+        ops: "AugmentationSequentialOps",
+    ) -> List[Any]:
+        """Apply the operation to every group of images of the same size as a dense batch."""
+        whole = len(buckets) == 1
+        bucket_outputs: List[List[Any]] = []
+        transforms: List[Optional[Tensor]] = []
+        for (idx, (height, width)), bucket_param in zip(buckets, bucket_params):
+            bucket_args = [
+                (arg.data if whole else arg.data[idx])[..., :height, :width].contiguous()
+                if isinstance(arg, RaggedImages)
+                else arg
+                if whole
+                else arg[idx]
+                for arg in args
+            ]
+            outputs = ops.transform(
+                *bucket_args,
+                module=module,
+                param=ParamItem(name, bucket_param),
+                extra_args=extra_args,
+                data_keys=data_keys,
+            )
+            bucket_outputs.append(cast(List[Any], outputs) if len(data_keys) > 1 else [outputs])
+            transforms.append(module.transform_matrix if isinstance(module, RigidAffineAugmentationBase2D) else None)
+
+        batch_size = len(args[data_keys.index(DataKey.INPUT)])
+        mats = [mat for mat in transforms if mat is not None]
+        if not whole and len(mats) == len(transforms):
+            module._transform_matrix = cls._assemble(mats[0].new_zeros(batch_size, 3, 3), mats, buckets)
+        return [
+            cls._assemble(arg, [out[i] for out in bucket_outputs], buckets, dcate == DataKey.MASK)
+            for i, (arg, dcate) in enumerate(zip(args, data_keys))
+        ]
+
+    @classmethod
+    def _assemble(
+        cls, arg: Any, outputs: List[Any], buckets: List[Tuple[Tensor, Tuple[int, int]]], mask: bool = False
+    ) -> Any:
+        """Put the outputs of every group of images back in the order of the batch."""
+        if isinstance(arg, RaggedImages):
+            if len(outputs) == 1:
+                data = outputs[0]
+            else:
+                data = outputs[0].new_zeros(len(arg), *(max(out.shape[i] for out in outputs) for i in range(1, 4)))
+                for (idx, _), out in zip(buckets, outputs):
+                    data[idx.to(data.device), :, : out.shape[2], : out.shape[3]] = out
+            sizes = arg.sizes.clone()
+            for (idx, _), out in zip(buckets, outputs):
+                sizes[idx, 1:] = torch.tensor(out.shape[2:])
+            if not mask:
+                # the number of channels of the masks is unchanged, the one of the images may be
+                sizes[:, 0] = data.shape[1]
+            return RaggedImages(data, sizes)
+        if len(outputs) == 1 or not isinstance(arg, (Boxes, Keypoints, Tensor)):
+            return outputs[0]
+        arg = arg.clone()
+        for (idx, _), out in zip(buckets, outputs):
+            arg[idx.to(arg.device)] = out
+        return arg
@@ -162,13 +162,19 @@ class AffineGenerator(RandomGeneratorBase):
         if not (isinstance(width, (int,)) and isinstance(height, (int,)) and width > 0 and height > 0):
             raise AssertionError(f"`width` and `height` must be positive integers. Got {width}, {height}.")
 
-        angle = _adapted_rsampling((batch_size,), self.degree_sampler, same_on_batch).to(device=_device, dtype=_dtype)
+        angle = _adapted_rsampling((batch_size,), self.degree_sampler, same_on_batch, self.generator).to(
+            device=_device, dtype=_dtype
+        )
 
         # compute tensor ranges
         if self.scale_2_sampler is not None:
-            _scale = _adapted_rsampling((batch_size,), self.scale_2_sampler, same_on_batch).unsqueeze(1).repeat(1, 2)
+            _scale = (
+                _adapted_rsampling((batch_size,), self.scale_2_sampler, same_on_batch, self.generator)
+                .unsqueeze(1)
+                .repeat(1, 2)
+            )
             if self.scale_4_sampler is not None:
-                _scale[:, 1] = _adapted_rsampling((batch_size,), self.scale_4_sampler, same_on_batch)
+                _scale[:, 1] = _adapted_rsampling((batch_size,), self.scale_4_sampler, same_on_batch, self.generator)
             _scale = _scale.to(device=_device, dtype=_dtype)
         else:
             _scale = torch.ones((batch_size, 2), device=_device, dtype=_dtype)
@@ -176,8 +182,8 @@ class AffineGenerator(RandomGeneratorBase):
         if self.translate_x_sampler is not None and self.translate_y_sampler is not None:
             translations = stack(
                 [
-                    _adapted_rsampling((batch_size,), self.translate_x_sampler, same_on_batch) * width,
-                    _adapted_rsampling((batch_size,), self.translate_y_sampler, same_on_batch) * height,
+                    _adapted_rsampling((batch_size,), self.translate_x_sampler, same_on_batch, self.generator) * width,
+                    _adapted_rsampling((batch_size,), self.translate_y_sampler, same_on_batch, self.generator) * height,
                 ],
                 dim=-1,
             )
@@ -189,8 +195,8 @@ class AffineGenerator(RandomGeneratorBase):
         center = center.expand(batch_size, -1)
 
         if self.shear_x_sampler is not None and self.shear_y_sampler is not None:
-            sx = _adapted_rsampling((batch_size,), self.shear_x_sampler, same_on_batch)
-            sy = _adapted_rsampling((batch_size,), self.shear_y_sampler, same_on_batch)
+            sx = _adapted_rsampling((batch_size,), self.shear_x_sampler, same_on_batch, self.generator)
+            sy = _adapted_rsampling((batch_size,), self.shear_y_sampler, same_on_batch, self.generator)
             sx = sx.to(device=_device, dtype=_dtype)
             sy = sy.to(device=_device, dtype=_dtype)
         else:
@@ -67,7 +67,7 @@ class ChannelDropoutGenerator(RandomGeneratorBase):
 
         batch_idx = torch.arange(batch_size, device=_device, dtype=torch.long).reshape(batch_size, 1)
         channel_idx = torch.argsort(
-            _adapted_rsampling((batch_size, channels), self.drop_sampler, same_on_batch), dim=1
+            _adapted_rsampling((batch_size, channels), self.drop_sampler, same_on_batch, self.generator), dim=1
         )[:, : self.num_drop_channels].to(torch.long)
 
         return {
@@ -91,14 +91,14 @@ class ColorJiggleGenerator(RandomGeneratorBase):
         batch_size = batch_shape[0]
         _common_param_check(batch_size, same_on_batch)
         _device, _dtype = _extract_device_dtype([self.brightness, self.contrast, self.hue, self.saturation])
-        brightness_factor = _adapted_rsampling((batch_size,), self.brightness_sampler, same_on_batch)
-        contrast_factor = _adapted_rsampling((batch_size,), self.contrast_sampler, same_on_batch)
-        hue_factor = _adapted_rsampling((batch_size,), self.hue_sampler, same_on_batch)
-        saturation_factor = _adapted_rsampling((batch_size,), self.saturation_sampler, same_on_batch)
+        brightness_factor = _adapted_rsampling((batch_size,), self.brightness_sampler, same_on_batch, self.generator)
+        contrast_factor = _adapted_rsampling((batch_size,), self.contrast_sampler, same_on_batch, self.generator)
+        hue_factor = _adapted_rsampling((batch_size,), self.hue_sampler, same_on_batch, self.generator)
+        saturation_factor = _adapted_rsampling((batch_size,), self.saturation_sampler, same_on_batch, self.generator)
         return {
             "brightness_factor": brightness_factor.to(device=_device, dtype=_dtype),
             "contrast_factor": contrast_factor.to(device=_device, dtype=_dtype),
             "hue_factor": hue_factor.to(device=_device, dtype=_dtype),
             "saturation_factor": saturation_factor.to(device=_device, dtype=_dtype),
-            "order": self.randperm(4).to(device=_device, dtype=_dtype).long(),
+            "order": self.randperm(4, generator=self.generator).to(device=_device, dtype=_dtype).long(),
         }
@@ -23,6 +23,7 @@ from kornia.augmentation.random_generator.base import (
     RandomGeneratorBase,
     UniformDistribution,
 )
+from kornia.augmentation.random_generator.utils import randperm
 from kornia.augmentation.utils import (
     _adapted_rsampling,
     _joint_range_check,
@@ -97,15 +98,15 @@ class ColorJitterGenerator(RandomGeneratorBase):
 
     def forward(self, batch_shape: Tuple[int, ...], same_on_batch: bool = False) -> Dict[str, Tensor]:
         batch_size = batch_shape[0]
-        brightness_factor = _adapted_rsampling((batch_size,), self.brightness_sampler, same_on_batch)
-        contrast_factor = _adapted_rsampling((batch_size,), self.contrast_sampler, same_on_batch)
-        hue_factor = _adapted_rsampling((batch_size,), self.hue_sampler, same_on_batch)
-        saturation_factor = _adapted_rsampling((batch_size,), self.saturation_sampler, same_on_batch)
+        brightness_factor = _adapted_rsampling((batch_size,), self.brightness_sampler, same_on_batch, self.generator)
+        contrast_factor = _adapted_rsampling((batch_size,), self.contrast_sampler, same_on_batch, self.generator)
+        hue_factor = _adapted_rsampling((batch_size,), self.hue_sampler, same_on_batch, self.generator)
+        saturation_factor = _adapted_rsampling((batch_size,), self.saturation_sampler, same_on_batch, self.generator)
 
         return {
             "brightness_factor": brightness_factor,
             "contrast_factor": contrast_factor,
             "hue_factor": hue_factor,
             "saturation_factor": saturation_factor,
-            "order": torch.randperm(4, dtype=torch.long),
+            "order": randperm(4, ensure_perm=False, generator=self.generator, dtype=torch.long),
         }
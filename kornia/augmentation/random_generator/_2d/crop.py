@@ -23,6 +23,7 @@ from torch.distributions import Uniform
 from kornia.augmentation.random_generator.base import RandomGeneratorBase
 from kornia.augmentation.utils import _adapted_rsampling, _common_param_check, _joint_range_check
 from kornia.core import Device, Tensor, tensor, where, zeros
+from kornia.core.capabilities import needs_host_fallback
 from kornia.geometry.bbox import bbox_generator
 from kornia.utils.helpers import _extract_device_dtype
 
@@ -98,14 +99,20 @@ class CropGenerator(RandomGeneratorBase):
         if same_on_batch:
             # If same_on_batch, select the first then repeat.
             x_start = (
-                _adapted_rsampling((batch_size,), self.rand_sampler, same_on_batch).to(x_diff) * x_diff[0]
+                _adapted_rsampling((batch_size,), self.rand_sampler, same_on_batch, self.generator).to(x_diff)
+                * x_diff[0]
             ).floor()
             y_start = (
-                _adapted_rsampling((batch_size,), self.rand_sampler, same_on_batch).to(y_diff) * y_diff[0]
+                _adapted_rsampling((batch_size,), self.rand_sampler, same_on_batch, self.generator).to(y_diff)
+                * y_diff[0]
             ).floor()
         else:
-            x_start = (_adapted_rsampling((batch_size,), self.rand_sampler, same_on_batch).to(x_diff) * x_diff).floor()
-            y_start = (_adapted_rsampling((batch_size,), self.rand_sampler, same_on_batch).to(y_diff) * y_diff).floor()
+            x_start = (
+                _adapted_rsampling((batch_size,), self.rand_sampler, same_on_batch, self.generator).to(x_diff) * x_diff
+            ).floor()
+            y_start = (
+                _adapted_rsampling((batch_size,), self.rand_sampler, same_on_batch, self.generator).to(y_diff) * y_diff
+            ).floor()
         crop_src = bbox_generator(
             x_start.view(-1).to(device=_device, dtype=_dtype),
             y_start.view(-1).to(device=_device, dtype=_dtype),
@@ -228,9 +235,11 @@ class ResizedCropGenerator(CropGenerator):
                 "size": zeros([0, 2], device=_device, dtype=_dtype),
             }
 
-        rand = _adapted_rsampling((batch_size, 10), self.rand_sampler, same_on_batch).to(device=_device, dtype=_dtype)
+        rand = _adapted_rsampling((batch_size, 10), self.rand_sampler, same_on_batch, self.generator).to(
+            device=_device, dtype=_dtype
+        )
         area = (rand * (self.scale[1] - self.scale[0]) + self.scale[0]) * size[0] * size[1]
-        log_ratio = _adapted_rsampling((batch_size, 10), self.log_ratio_sampler, same_on_batch).to(
+        log_ratio = _adapted_rsampling((batch_size, 10), self.log_ratio_sampler, same_on_batch, self.generator).to(
             device=_device, dtype=_dtype
         )
         aspect_ratio = torch.exp(log_ratio)
@@ -242,7 +251,11 @@ class ResizedCropGenerator(CropGenerator):
 
         # torch.argmax is not reproducible across devices: https://github.com/pytorch/pytorch/issues/17738
         # Here, we will select the first occurrence of the duplicated elements.
-        cond_bool, argmax_dim1 = ((cond.cumsum(1) == 1) & cond.bool()).cpu().max(1) # SDAA "argmax_cpu" not implemented for 'Bool'
+        first = (cond.cumsum(1) == 1) & cond.bool()
+        if needs_host_fallback("reduce_bool", first):
+            cond_bool, argmax_dim1 = first.cpu().max(1)
+        else:
+            cond_bool, argmax_dim1 = first.max(1)
         h_out = w[torch.arange(0, batch_size, device=_device, dtype=torch.long), argmax_dim1]
         w_out = h[torch.arange(0, batch_size, device=_device, dtype=torch.long), argmax_dim1]
 
@@ -111,15 +111,17 @@ class CutmixGenerator(RandomGeneratorBase):
 
         with torch.no_grad():
             batch_probs: torch.Tensor = _adapted_sampling(
-                (batch_size * self.num_mix,), self.prob_sampler, same_on_batch
+                (batch_size * self.num_mix,), self.prob_sampler, same_on_batch, self.generator
             )
             mix_pairs: torch.Tensor = (
-                _adapted_sampling((self.num_mix, batch_size), self.pair_sampler, same_on_batch)
+                _adapted_sampling((self.num_mix, batch_size), self.pair_sampler, same_on_batch, self.generator)
                 .to(device=_device, dtype=_dtype)
                 .argsort(dim=1)
             )
 
-        cutmix_betas: torch.Tensor = _adapted_rsampling((batch_size * self.num_mix,), self.beta_sampler, same_on_batch)
+        cutmix_betas: torch.Tensor = _adapted_rsampling(
+            (batch_size * self.num_mix,), self.beta_sampler, same_on_batch, self.generator
+        )
 
         # Note: torch.clamp does not accept tensor, cutmix_betas.clamp(cut_size[0], cut_size[1]) throws:
         # Argument 1 to "clamp" of "_TensorBase" has incompatible type "Tensor"; expected "float"
@@ -136,12 +138,12 @@ class CutmixGenerator(RandomGeneratorBase):
             cut_width = cut_width[0]
 
         # Reserve at least 1 pixel for cropping.
-        x_start = _adapted_rsampling(_gen_shape, self.rand_sampler, same_on_batch).to(device=_device, dtype=_dtype) * (
-            width - cut_width - 1
-        )
-        y_start = _adapted_rsampling(_gen_shape, self.rand_sampler, same_on_batch).to(device=_device, dtype=_dtype) * (
-            height - cut_height - 1
-        )
+        x_start = _adapted_rsampling(_gen_shape, self.rand_sampler, same_on_batch, self.generator).to(
+            device=_device, dtype=_dtype
+        ) * (width - cut_width - 1)
+        y_start = _adapted_rsampling(_gen_shape, self.rand_sampler, same_on_batch, self.generator).to(
+            device=_device, dtype=_dtype
+        ) * (height - cut_height - 1)
         x_start = x_start.floor()
         y_start = y_start.floor()
 
@@ -75,5 +75,5 @@ class RandomGaussianBlurGenerator(RandomGeneratorBase):
     def forward(self, batch_shape: Tuple[int, ...], same_on_batch: bool = False) -> Dict[str, Tensor]:
         batch_size = batch_shape[0]
         _common_param_check(batch_size, same_on_batch)
-        sigma = _adapted_rsampling((batch_size,), self.sigma_sampler, same_on_batch)
+        sigma = _adapted_rsampling((batch_size,), self.sigma_sampler, same_on_batch, self.generator)
         return {"sigma": sigma}
@@ -106,18 +106,22 @@ class GaussianIlluminationGenerator(RandomGeneratorBase):
 
         # TODO: check whether we need generate all the parameters at once
 
-        gain_factor = _adapted_rsampling((batch_size, 1, 1, 1), self.gain_sampler, same_on_batch)
+        gain_factor = _adapted_rsampling((batch_size, 1, 1, 1), self.gain_sampler, same_on_batch, self.generator)
 
-        sigma_x = width * _adapted_rsampling((batch_size, 1), self.sigma_sampler, same_on_batch)
+        sigma_x = width * _adapted_rsampling((batch_size, 1), self.sigma_sampler, same_on_batch, self.generator)
 
-        center_x = torch.round(width * _adapted_rsampling((batch_size, 1), self.center_sampler, same_on_batch))
+        center_x = torch.round(
+            width * _adapted_rsampling((batch_size, 1), self.center_sampler, same_on_batch, self.generator)
+        )
 
-        sigma_y = height * _adapted_rsampling((batch_size, 1), self.sigma_sampler, same_on_batch)
+        sigma_y = height * _adapted_rsampling((batch_size, 1), self.sigma_sampler, same_on_batch, self.generator)
 
-        center_y = torch.round(height * _adapted_rsampling((batch_size, 1), self.center_sampler, same_on_batch))
+        center_y = torch.round(
+            height * _adapted_rsampling((batch_size, 1), self.center_sampler, same_on_batch, self.generator)
+        )
 
         sign = torch.where(
-            _adapted_rsampling((batch_size, 1, 1, 1), self.sign_sampler, same_on_batch) >= 0.0,
+            _adapted_rsampling((batch_size, 1, 1, 1), self.sign_sampler, same_on_batch, self.generator) >= 0.0,
             torch.tensor(1.0, device=_device, dtype=_dtype),
             torch.tensor(-1.0, device=_device, dtype=_dtype),
         )
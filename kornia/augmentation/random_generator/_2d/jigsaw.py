@@ -66,10 +66,13 @@ class JigsawGenerator(RandomGeneratorBase):
         if batch_size == 0:
             rand_ids = torch.zeros([0, perm_times], device=self._device)
         elif same_on_batch:
-            rand_ids = randperm(perm_times, ensure_perm=self.ensure_perm, device=self._device)
+            rand_ids = randperm(perm_times, ensure_perm=self.ensure_perm, generator=self.generator, device=self._device)
             rand_ids = torch.stack([rand_ids] * batch_size)
         else:
             rand_ids = torch.stack(
-                [randperm(perm_times, ensure_perm=self.ensure_perm, device=self._device) for _ in range(batch_size)]
+                [
+                    randperm(perm_times, ensure_perm=self.ensure_perm, generator=self.generator, device=self._device)
+                    for _ in range(batch_size)
+                ]
             )
         return {"permutation": rand_ids}
@@ -67,5 +67,5 @@ class JPEGGenerator(RandomGeneratorBase):
         batch_size = batch_shape[0]
         _common_param_check(batch_size, same_on_batch)
         _device, _dtype = _extract_device_dtype([self.jpeg_quality])
-        jpeg_quality_value = _adapted_rsampling((batch_size,), self.jpeg_quality_sampler, same_on_batch)
+        jpeg_quality_value = _adapted_rsampling((batch_size,), self.jpeg_quality_sampler, same_on_batch, self.generator)
         return {"jpeg_quality": jpeg_quality_value.to(device=_device, dtype=_dtype)}
@@ -73,34 +73,36 @@ class LinearIlluminationGenerator(RandomGeneratorBase):
 
     def forward(self, batch_shape: tuple[int, ...], same_on_batch: bool = False) -> dict[str, Tensor]:
         r"""Generate random 2D Gaussian illumination patterns."""
-        batch_size, channels, height, width = batch_shape
+        batch_size, _, height, width = batch_shape
         _common_param_check(batch_size, same_on_batch)
         _device, _dtype = _extract_device_dtype([self.gain, self.sign])
 
-        gain_factor = _adapted_rsampling((batch_size, 1, 1, 1), self.gain_sampler, same_on_batch).to(
+        gain_factor = _adapted_rsampling((batch_size, 1, 1, 1), self.gain_sampler, same_on_batch, self.generator).to(
             device=_device, dtype=_dtype
         )
         sign = torch.where(
-            _adapted_rsampling((batch_size, 1, 1, 1), self.sign_sampler, same_on_batch) >= 0.0,
+            _adapted_rsampling((batch_size, 1, 1, 1), self.sign_sampler, same_on_batch, self.generator) >= 0.0,
             torch.tensor(1),
             torch.tensor(-1),
         ).to(device=_device, dtype=_dtype)
 
-        directions = _adapted_rsampling((batch_size, 1, 1, 1), self.directions_sampler, same_on_batch).to(
+        directions = _adapted_rsampling(
+            (batch_size, 1, 1, 1), self.directions_sampler, same_on_batch, self.generator
+        ).to(
             device=_device,
             dtype=torch.int8,
         )
 
-        gradient = torch.zeros(batch_shape)
-        for _b in range(batch_size):
-            if directions[_b] == 0:  # Lower
-                gradient[_b] = torch.linspace(0, 1, height).unsqueeze(1).expand(channels, height, width)
-            elif directions[_b] == 1:  # Upper
-                gradient[_b] = torch.linspace(1, 0, height).unsqueeze(1).expand(channels, height, width)
-            elif directions[_b] == 2:  # Left
-                gradient[_b] = torch.linspace(0, 1, width).unsqueeze(0).expand(channels, height, width)
-            elif directions[_b] == 3:  # Right
-                gradient[_b] = torch.linspace(1, 0, width).unsqueeze(0).expand(channels, height, width)
+        # the pattern of every direction, selected for the whole batch at once
+        patterns = torch.stack(
+            [
+                torch.linspace(0, 1, height).unsqueeze(1).expand(height, width),  # Lower
+                torch.linspace(1, 0, height).unsqueeze(1).expand(height, width),  # Upper
+                torch.linspace(0, 1, width).unsqueeze(0).expand(height, width),  # Left
+                torch.linspace(1, 0, width).unsqueeze(0).expand(height, width),  # Right
+            ]
+        )
+        gradient = patterns[directions.view(-1).long().cpu()].unsqueeze(1).expand(batch_shape)
 
         gradient = sign * gain_factor * gradient
 
@@ -160,32 +162,34 @@ class LinearCornerIlluminationGenerator(RandomGeneratorBase):
         _common_param_check(batch_size, same_on_batch)
         _device, _dtype = _extract_device_dtype([self.gain, self.sign])
 
-        gain_factor = _adapted_rsampling((batch_size, 1, 1, 1), self.gain_sampler, same_on_batch).to(
+        gain_factor = _adapted_rsampling((batch_size, 1, 1, 1), self.gain_sampler, same_on_batch, self.generator).to(
             device=_device, dtype=_dtype
         )
         sign = torch.where(
-            _adapted_rsampling((batch_size, 1, 1, 1), self.sign_sampler, same_on_batch) >= 0.0,
+            _adapted_rsampling((batch_size, 1, 1, 1), self.sign_sampler, same_on_batch, self.generator) >= 0.0,
             torch.tensor(1),
             torch.tensor(-1),
         ).to(device=_device, dtype=_dtype)
 
-        directions = _adapted_rsampling((batch_size, 1, 1, 1), self.directions_sampler, same_on_batch).to(
+        directions = _adapted_rsampling(
+            (batch_size, 1, 1, 1), self.directions_sampler, same_on_batch, self.generator
+        ).to(
             device=_device,
             dtype=torch.int8,
         )
 
         y_grad = torch.linspace(0, 1, height).unsqueeze(1).expand(channels, height, width)
         x_grad = torch.linspace(0, 1, width).unsqueeze(0).expand(channels, height, width)
-        gradient = torch.zeros(batch_shape)
-        for _b in range(batch_size):
-            if directions[_b] == 0:  # Bottom right
-                gradient[_b] = x_grad + y_grad
-            elif directions[_b] == 1:  # Bottom left
-                gradient[_b] = -x_grad + y_grad
-            elif directions[_b] == 2:  # Upper right
-                gradient[_b] = x_grad - y_grad
-            elif directions[_b] == 3:  # Upper left
-                gradient[_b] = 1 - (x_grad + y_grad)
+        # the pattern of every direction, selected for the whole batch at once
+        patterns = torch.stack(
+            [
+                x_grad + y_grad,  # Bottom right
+                -x_grad + y_grad,  # Bottom left
+                x_grad - y_grad,  # Upper right
+                1 - (x_grad + y_grad),  # Upper left
+            ]
+        )
+        gradient = patterns[directions.view(-1).long().cpu()]
         gradient = sign * gain_factor * normalize_min_max(gradient)
 
         return {
@@ -21,6 +21,7 @@ import torch
 from torch.distributions import Bernoulli
 
 from kornia.augmentation.random_generator.base import RandomGeneratorBase, UniformDistribution
+from kornia.augmentation.random_generator.utils import randperm
 from kornia.augmentation.utils import _adapted_rsampling, _adapted_sampling, _common_param_check, _joint_range_check
 from kornia.utils.helpers import _extract_device_dtype
 
@@ -72,9 +73,15 @@ class MixupGenerator(RandomGeneratorBase):
         _device, _dtype = _extract_device_dtype([self.lambda_val])
 
         with torch.no_grad():
-            batch_probs: torch.Tensor = _adapted_sampling((batch_size,), self.prob_sampler, same_on_batch)
-        mixup_pairs: torch.Tensor = torch.randperm(batch_size, device=_device, dtype=_dtype).long()
-        mixup_lambdas: torch.Tensor = _adapted_rsampling((batch_size,), self.lambda_sampler, same_on_batch)
+            batch_probs: torch.Tensor = _adapted_sampling(
+                (batch_size,), self.prob_sampler, same_on_batch, self.generator
+            )
+        mixup_pairs: torch.Tensor = randperm(
+            batch_size, ensure_perm=False, generator=self.generator, device=_device, dtype=_dtype
+        ).long()
+        mixup_lambdas: torch.Tensor = _adapted_rsampling(
+            (batch_size,), self.lambda_sampler, same_on_batch, self.generator
+        )
         mixup_lambdas = mixup_lambdas * batch_probs
 
         return {
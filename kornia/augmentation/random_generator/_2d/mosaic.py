@@ -21,8 +21,8 @@ import torch
 from torch.distributions import Uniform
 
 from kornia.augmentation.random_generator.base import RandomGeneratorBase
+from kornia.augmentation.random_generator.utils import randperm
 from kornia.augmentation.utils import _adapted_rsampling, _common_param_check
-from kornia.core import Tensor
 from kornia.geometry.bbox import bbox_generator
 from kornia.utils.helpers import _extract_device_dtype
 
@@ -87,7 +87,8 @@ class MosaicGenerator(RandomGeneratorBase):
 
         perm_times = self.mosaic_grid[0] * self.mosaic_grid[1]
         # Generate mosiac order in one shot
-        rand_ids = torch.randperm(batch_size * (perm_times - 1), device=_device) % batch_size
+        rand_ids = randperm(batch_size * (perm_times - 1), ensure_perm=False, generator=self.generator, device=_device)
+        rand_ids = rand_ids % batch_size
         mosiac_ids = (
             torch.cat([torch.arange(0, batch_size, device=_device), rand_ids])
             .reshape(perm_times, batch_size)
@@ -95,7 +96,7 @@ class MosaicGenerator(RandomGeneratorBase):
         )
 
         start_corner_factor = _adapted_rsampling(
-            (batch_size, 2), self.start_ratio_range_sampler, same_on_batch=False
+            (batch_size, 2), self.start_ratio_range_sampler, same_on_batch=False, generator=self.generator
         ).to(device=_device, dtype=_dtype)
         start_corner_x = start_corner_factor[:, 0] * batch_shape[-2]
         start_corner_y = start_corner_factor[:, 1] * batch_shape[-1]
@@ -113,11 +114,7 @@ class MosaicGenerator(RandomGeneratorBase):
         # NOTE: In case we support a list of tensor images later. For a better consistency.
         # B x 3
 
-        batch_shapes: Tensor
-        if batch_size == 0:
-            batch_shapes = torch.zeros([0, 3], device=_device, dtype=torch.long)
-        else:
-            batch_shapes = torch.stack([torch.as_tensor(batch_shape[1:], device=_device) for _ in range(batch_size)])
+        batch_shapes = torch.as_tensor(batch_shape[1:], device=_device, dtype=torch.long).repeat(batch_size, 1)
         return {
             "permutation": mosiac_ids.to(device=_device, dtype=torch.long),
             "src": crop_src,
@@ -96,9 +96,11 @@ class MotionBlurGenerator(RandomGeneratorBase):
         _common_param_check(batch_size, same_on_batch)
         # self.ksize_factor.expand((batch_size, -1))
         _device, _dtype = _extract_device_dtype([self.angle, self.direction])
-        angle_factor = _adapted_rsampling((batch_size,), self.angle_sampler, same_on_batch)
-        direction_factor = _adapted_rsampling((batch_size,), self.direction_sampler, same_on_batch)
-        ksize_factor = _adapted_rsampling((batch_size,), self.ksize_sampler, same_on_batch).int() * 2 + 1
+        angle_factor = _adapted_rsampling((batch_size,), self.angle_sampler, same_on_batch, self.generator)
+        direction_factor = _adapted_rsampling((batch_size,), self.direction_sampler, same_on_batch, self.generator)
+        ksize_factor = (
+            _adapted_rsampling((batch_size,), self.ksize_sampler, same_on_batch, self.generator).int() * 2 + 1
+        )
 
         return {
             "ksize_factor": ksize_factor.to(device=_device, dtype=torch.int32),
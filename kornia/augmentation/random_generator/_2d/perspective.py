@@ -90,9 +90,9 @@ class PerspectiveGenerator(RandomGeneratorBase):
         factor = torch.stack([fx, fy], dim=0).view(-1, 1, 2).to(device=_device, dtype=_dtype)
 
         # TODO: This line somehow breaks the gradcheck
-        rand_val: Tensor = _adapted_rsampling(start_points.shape, self.rand_val_sampler, same_on_batch).to(
-            device=_device, dtype=_dtype
-        )
+        rand_val: Tensor = _adapted_rsampling(
+            start_points.shape, self.rand_val_sampler, same_on_batch, self.generator
+        ).to(device=_device, dtype=_dtype)
         if self.sampling_method == "basic":
             pts_norm = tensor([[[1, 1], [-1, 1], [-1, -1], [1, -1]]], device=_device, dtype=_dtype)
             offset = factor * rand_val * pts_norm
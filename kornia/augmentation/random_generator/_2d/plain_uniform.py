@@ -97,6 +97,8 @@ class PlainUniformGenerator(RandomGeneratorBase):
         _device, _dtype = _extract_device_dtype([t for t, _, _, _ in self.samplers])
 
         return {
-            name: _adapted_rsampling((batch_size,), dist, same_on_batch).to(device=_device, dtype=_dtype)
+            name: _adapted_rsampling((batch_size,), dist, same_on_batch, self.generator).to(
+                device=_device, dtype=_dtype
+            )
             for name, dist in self.sampler_dict.items()
         }
@@ -41,6 +41,6 @@ class PlanckianJitterGenerator(RandomGeneratorBase):
     def forward(self, batch_shape: Tuple[int, ...], same_on_batch: bool = False) -> Dict[str, torch.Tensor]:
         batch_size = batch_shape[0]
         _common_param_check(batch_size, same_on_batch)
-        pl_idx = _adapted_rsampling((batch_size,), self.pl_idx_dist, same_on_batch)
+        pl_idx = _adapted_rsampling((batch_size,), self.pl_idx_dist, same_on_batch, self.generator)
 
         return {"idx": pl_idx.long()}
@@ -68,5 +68,5 @@ class PosterizeGenerator(RandomGeneratorBase):
         batch_size = batch_shape[0]
         _common_param_check(batch_size, same_on_batch)
         _device, _ = _extract_device_dtype([self.bits_factor if isinstance(self.bits_factor, Tensor) else None])
-        bits_factor = _adapted_rsampling((batch_size,), self.bit_sampler, same_on_batch)
+        bits_factor = _adapted_rsampling((batch_size,), self.bit_sampler, same_on_batch, self.generator)
         return {"bits_factor": bits_factor.round().to(device=_device, dtype=torch.int32)}
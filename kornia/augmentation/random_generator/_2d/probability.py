@@ -58,7 +58,7 @@ class ProbabilityGenerator(RandomGeneratorBase):
 
     def forward(self, batch_shape: Tuple[int, ...], same_on_batch: bool = False) -> Dict[str, Tensor]:
         batch_size = batch_shape[0]
-        probs_mask: Tensor = _adapted_sampling((batch_size,), self.sampler, same_on_batch).bool()
+        probs_mask: Tensor = _adapted_sampling((batch_size,), self.sampler, same_on_batch, self.generator).bool()
         return {"probs": probs_mask}
 
 
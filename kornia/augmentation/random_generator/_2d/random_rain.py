@@ -71,19 +71,20 @@ class RainGenerator(RandomGeneratorBase):
         _common_param_check(batch_size, same_on_batch)
         _device, _dtype = _extract_device_dtype([self.drop_width, self.drop_height, self.number_of_drops])
         # self.ksize_factor.expand((batch_size, -1))
-        number_of_drops_factor = _adapted_rsampling((batch_size,), self.number_of_drops_sampler).to(
-            device=_device, dtype=torch.long
-        )
-        drop_height_factor = _adapted_rsampling((batch_size,), self.drop_height_sampler, same_on_batch).to(
-            device=_device, dtype=torch.long
-        )
-        drop_width_factor = _adapted_rsampling((batch_size,), self.drop_width_sampler, same_on_batch).to(
-            device=_device, dtype=torch.long
-        )
+        number_of_drops_factor = _adapted_rsampling(
+            (batch_size,), self.number_of_drops_sampler, generator=self.generator
+        ).to(device=_device, dtype=torch.long)
+        drop_height_factor = _adapted_rsampling(
+            (batch_size,), self.drop_height_sampler, same_on_batch, self.generator
+        ).to(device=_device, dtype=torch.long)
+        drop_width_factor = _adapted_rsampling(
+            (batch_size,), self.drop_width_sampler, same_on_batch, self.generator
+        ).to(device=_device, dtype=torch.long)
         coordinates_factor = _adapted_rsampling(
             (batch_size, int(number_of_drops_factor.max().item()) if number_of_drops_factor.numel() > 0 else 0, 2),
             self.coordinates_sampler,
             same_on_batch=same_on_batch,
+            generator=self.generator,
         ).to(device=_device)
         return {
             "number_of_drops_factor": number_of_drops_factor,
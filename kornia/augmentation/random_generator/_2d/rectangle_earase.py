@@ -99,22 +99,28 @@ class RectangleEraseGenerator(RandomGeneratorBase):
         _device, _dtype = _extract_device_dtype([self.ratio, self.scale])
         images_area = height * width
         target_areas = (
-            _adapted_rsampling((batch_size,), self.scale_sampler, same_on_batch).to(device=_device, dtype=_dtype)
+            _adapted_rsampling((batch_size,), self.scale_sampler, same_on_batch, self.generator).to(
+                device=_device, dtype=_dtype
+            )
             * images_area
         )
 
         if self.ratio[0] < 1.0 and self.ratio[1] > 1.0:
-            aspect_ratios1 = _adapted_rsampling((batch_size,), self.ratio_sampler1, same_on_batch)
-            aspect_ratios2 = _adapted_rsampling((batch_size,), self.ratio_sampler2, same_on_batch)
+            aspect_ratios1 = _adapted_rsampling((batch_size,), self.ratio_sampler1, same_on_batch, self.generator)
+            aspect_ratios2 = _adapted_rsampling((batch_size,), self.ratio_sampler2, same_on_batch, self.generator)
             if same_on_batch:
                 rand_idxs = (
-                    torch.round(_adapted_rsampling((1,), self.index_sampler, same_on_batch)).repeat(batch_size).bool()
+                    torch.round(_adapted_rsampling((1,), self.index_sampler, same_on_batch, self.generator))
+                    .repeat(batch_size)
+                    .bool()
                 )
             else:
-                rand_idxs = torch.round(_adapted_rsampling((batch_size,), self.index_sampler, same_on_batch)).bool()
+                rand_idxs = torch.round(
+                    _adapted_rsampling((batch_size,), self.index_sampler, same_on_batch, self.generator)
+                ).bool()
             aspect_ratios = where(rand_idxs, aspect_ratios1, aspect_ratios2)
         else:
-            aspect_ratios = _adapted_rsampling((batch_size,), self.ratio_sampler, same_on_batch)
+            aspect_ratios = _adapted_rsampling((batch_size,), self.ratio_sampler, same_on_batch, self.generator)
 
         aspect_ratios = aspect_ratios.to(device=_device, dtype=_dtype)
 
@@ -133,10 +139,10 @@ class RectangleEraseGenerator(RandomGeneratorBase):
             tensor(width, device=_device, dtype=_dtype),
         )
 
-        xs_ratio = _adapted_rsampling((batch_size,), self.uniform_sampler, same_on_batch).to(
+        xs_ratio = _adapted_rsampling((batch_size,), self.uniform_sampler, same_on_batch, self.generator).to(
             device=_device, dtype=_dtype
         )
-        ys_ratio = _adapted_rsampling((batch_size,), self.uniform_sampler, same_on_batch).to(
+        ys_ratio = _adapted_rsampling((batch_size,), self.uniform_sampler, same_on_batch, self.generator).to(
             device=_device, dtype=_dtype
         )
 
@@ -81,19 +81,19 @@ class SaltAndPepperGenerator(RandomGeneratorBase):
         _common_param_check(batch_size, same_on_batch)
         _device, _dtype = _extract_device_dtype([self.amount, self.salt_and_pepper])
 
-        amount_factor = _adapted_rsampling((batch_size,), self.amount_sampler, same_on_batch).to(
-            device=_device, dtype=_dtype
-        )
-        salt_and_pepper_factor = _adapted_rsampling((batch_size,), self.salt_and_pepper_sampler, same_on_batch).to(
+        amount_factor = _adapted_rsampling((batch_size,), self.amount_sampler, same_on_batch, self.generator).to(
             device=_device, dtype=_dtype
         )
+        salt_and_pepper_factor = _adapted_rsampling(
+            (batch_size,), self.salt_and_pepper_sampler, same_on_batch, self.generator
+        ).to(device=_device, dtype=_dtype)
 
         ## Generate noise masks.
         mask_noise = _adapted_uniform(
-            (batch_size, 1, H, W), low=0.0, high=1.0, same_on_batch=same_on_batch
+            (batch_size, 1, H, W), low=0.0, high=1.0, same_on_batch=same_on_batch, generator=self.generator
         ) < amount_factor.view(batch_size, 1, 1, 1)
         mask_salt = _adapted_uniform(
-            (batch_size, 1, H, W), low=0.0, high=1.0, same_on_batch=same_on_batch
+            (batch_size, 1, H, W), low=0.0, high=1.0, same_on_batch=same_on_batch, generator=self.generator
         ) < salt_and_pepper_factor.view(batch_size, 1, 1, 1)
 
         # If the number of channels is greater than one (3), replicate the generated mask for each channel.
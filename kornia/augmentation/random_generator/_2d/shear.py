@@ -99,8 +99,8 @@ class ShearGenerator(RandomGeneratorBase):
         center: Tensor = tensor([width, height], device=_device, dtype=_dtype).view(1, 2) / 2.0 - 0.5
         center = center.expand(batch_size, -1)
 
-        sx = _adapted_rsampling((batch_size,), self.shear_x_sampler, same_on_batch)
-        sy = _adapted_rsampling((batch_size,), self.shear_y_sampler, same_on_batch)
+        sx = _adapted_rsampling((batch_size,), self.shear_x_sampler, same_on_batch, self.generator)
+        sy = _adapted_rsampling((batch_size,), self.shear_y_sampler, same_on_batch, self.generator)
         sx = sx.to(device=_device, dtype=_dtype)
         sy = sy.to(device=_device, dtype=_dtype)
 
@@ -94,7 +94,7 @@ class TranslateGenerator(RandomGeneratorBase):
 
         if self.translate_x_sampler is not None:
             translate_x = (
-                _adapted_rsampling((batch_size,), self.translate_x_sampler, same_on_batch).to(
+                _adapted_rsampling((batch_size,), self.translate_x_sampler, same_on_batch, self.generator).to(
                     device=_device, dtype=_dtype
                 )
                 * width
@@ -104,7 +104,7 @@ class TranslateGenerator(RandomGeneratorBase):
 
         if self.translate_y_sampler is not None:
             translate_y = (
-                _adapted_rsampling((batch_size,), self.translate_y_sampler, same_on_batch).to(
+                _adapted_rsampling((batch_size,), self.translate_y_sampler, same_on_batch, self.generator).to(
                     device=_device, dtype=_dtype
                 )
                 * height
@@ -179,18 +179,18 @@ class AffineGenerator3D(RandomGeneratorBase):
         _device, _dtype = _extract_device_dtype([self.degrees, self.translate, self.scale, self.shears])
 
         # degrees = degrees.to(device=device, dtype=dtype)
-        yaw = _adapted_rsampling((batch_size,), self.yaw_sampler, same_on_batch)
-        pitch = _adapted_rsampling((batch_size,), self.pitch_sampler, same_on_batch)
-        roll = _adapted_rsampling((batch_size,), self.roll_sampler, same_on_batch)
+        yaw = _adapted_rsampling((batch_size,), self.yaw_sampler, same_on_batch, self.generator)
+        pitch = _adapted_rsampling((batch_size,), self.pitch_sampler, same_on_batch, self.generator)
+        roll = _adapted_rsampling((batch_size,), self.roll_sampler, same_on_batch, self.generator)
         angles = torch.stack([yaw, pitch, roll], dim=1)
 
         # compute tensor ranges
         if self._scale is not None:
             scale = torch.stack(
                 [
-                    _adapted_rsampling((batch_size,), self.scale_1_sampler, same_on_batch),
-                    _adapted_rsampling((batch_size,), self.scale_2_sampler, same_on_batch),
-                    _adapted_rsampling((batch_size,), self.scale_3_sampler, same_on_batch),
+                    _adapted_rsampling((batch_size,), self.scale_1_sampler, same_on_batch, self.generator),
+                    _adapted_rsampling((batch_size,), self.scale_2_sampler, same_on_batch, self.generator),
+                    _adapted_rsampling((batch_size,), self.scale_3_sampler, same_on_batch, self.generator),
                 ],
                 dim=1,
             )
@@ -204,9 +204,15 @@ class AffineGenerator3D(RandomGeneratorBase):
             # translations should be in x,y,z
             translations = torch.stack(
                 [
-                    (_adapted_rsampling((batch_size,), self.uniform_sampler, same_on_batch) - 0.5) * max_dx * 2,
-                    (_adapted_rsampling((batch_size,), self.uniform_sampler, same_on_batch) - 0.5) * max_dy * 2,
-                    (_adapted_rsampling((batch_size,), self.uniform_sampler, same_on_batch) - 0.5) * max_dz * 2,
+                    (_adapted_rsampling((batch_size,), self.uniform_sampler, same_on_batch, self.generator) - 0.5)
+                    * max_dx
+                    * 2,
+                    (_adapted_rsampling((batch_size,), self.uniform_sampler, same_on_batch, self.generator) - 0.5)
+                    * max_dy
+                    * 2,
+                    (_adapted_rsampling((batch_size,), self.uniform_sampler, same_on_batch, self.generator) - 0.5)
+                    * max_dz
+                    * 2,
                 ],
                 dim=1,
             )
@@ -218,12 +224,12 @@ class AffineGenerator3D(RandomGeneratorBase):
         center = center.expand(batch_size, -1)
 
         if self.shears is not None:
-            sxy = _adapted_rsampling((batch_size,), self.sxy_sampler, same_on_batch)
-            sxz = _adapted_rsampling((batch_size,), self.sxz_sampler, same_on_batch)
-            syx = _adapted_rsampling((batch_size,), self.syx_sampler, same_on_batch)
-            syz = _adapted_rsampling((batch_size,), self.syz_sampler, same_on_batch)
-            szx = _adapted_rsampling((batch_size,), self.szx_sampler, same_on_batch)
-            szy = _adapted_rsampling((batch_size,), self.szy_sampler, same_on_batch)
+            sxy = _adapted_rsampling((batch_size,), self.sxy_sampler, same_on_batch, self.generator)
+            sxz = _adapted_rsampling((batch_size,), self.sxz_sampler, same_on_batch, self.generator)
+            syx = _adapted_rsampling((batch_size,), self.syx_sampler, same_on_batch, self.generator)
+            syz = _adapted_rsampling((batch_size,), self.syz_sampler, same_on_batch, self.generator)
+            szx = _adapted_rsampling((batch_size,), self.szx_sampler, same_on_batch, self.generator)
+            szy = _adapted_rsampling((batch_size,), self.szy_sampler, same_on_batch, self.generator)
         else:
             sxy = sxz = syx = syz = szx = szy = torch.tensor([0] * batch_size, device=_device, dtype=_dtype)
 
@@ -102,9 +102,15 @@ class CropGenerator3D(RandomGeneratorBase):
                 "dst": zeros([0, 8, 3], device=_device, dtype=_dtype),
             }
 
-        x_start = _adapted_rsampling((batch_size,), self.rand_sampler, same_on_batch).to(device=_device, dtype=_dtype)
-        y_start = _adapted_rsampling((batch_size,), self.rand_sampler, same_on_batch).to(device=_device, dtype=_dtype)
-        z_start = _adapted_rsampling((batch_size,), self.rand_sampler, same_on_batch).to(device=_device, dtype=_dtype)
+        x_start = _adapted_rsampling((batch_size,), self.rand_sampler, same_on_batch, self.generator).to(
+            device=_device, dtype=_dtype
+        )
+        y_start = _adapted_rsampling((batch_size,), self.rand_sampler, same_on_batch, self.generator).to(
+            device=_device, dtype=_dtype
+        )
+        z_start = _adapted_rsampling((batch_size,), self.rand_sampler, same_on_batch, self.generator).to(
+            device=_device, dtype=_dtype
+        )
 
         x_start = (x_start * x_diff).floor()
         y_start = (y_start * y_diff).floor()
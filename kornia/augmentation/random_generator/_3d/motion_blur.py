@@ -101,13 +101,15 @@ class MotionBlurGenerator3D(RandomGeneratorBase):
         _common_param_check(batch_size, same_on_batch)
         # self.ksize_factor.expand((batch_size, -1))
         _device, _dtype = _extract_device_dtype([self.angle, self.direction])
-        yaw_factor = _adapted_rsampling((batch_size,), self.yaw_sampler, same_on_batch)
-        pitch_factor = _adapted_rsampling((batch_size,), self.pitch_sampler, same_on_batch)
-        roll_factor = _adapted_rsampling((batch_size,), self.roll_sampler, same_on_batch)
+        yaw_factor = _adapted_rsampling((batch_size,), self.yaw_sampler, same_on_batch, self.generator)
+        pitch_factor = _adapted_rsampling((batch_size,), self.pitch_sampler, same_on_batch, self.generator)
+        roll_factor = _adapted_rsampling((batch_size,), self.roll_sampler, same_on_batch, self.generator)
         angle_factor = stack([yaw_factor, pitch_factor, roll_factor], 1)
 
-        direction_factor = _adapted_rsampling((batch_size,), self.direction_sampler, same_on_batch)
-        ksize_factor = _adapted_rsampling((batch_size,), self.ksize_sampler, same_on_batch).int() * 2 + 1
+        direction_factor = _adapted_rsampling((batch_size,), self.direction_sampler, same_on_batch, self.generator)
+        ksize_factor = (
+            _adapted_rsampling((batch_size,), self.ksize_sampler, same_on_batch, self.generator).int() * 2 + 1
+        )
 
         return {
             "ksize_factor": ksize_factor.to(device=_device, dtype=torch.int32),
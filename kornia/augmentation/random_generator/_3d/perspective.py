@@ -93,7 +93,7 @@ class PerspectiveGenerator3D(RandomGeneratorBase):
 
         factor = stack([fx, fy, fz], 0).view(-1, 1, 3).to(device=_device, dtype=_dtype)
 
-        rand_val: Tensor = _adapted_rsampling(start_points.shape, self.rand_sampler, same_on_batch).to(
+        rand_val: Tensor = _adapted_rsampling(start_points.shape, self.rand_sampler, same_on_batch, self.generator).to(
             device=_device, dtype=_dtype
         )
 
@@ -79,11 +79,13 @@ class RotationGenerator3D(RandomGeneratorBase):
         _device, _dtype = _extract_device_dtype([self.degrees])
 
         return {
-            "yaw": _adapted_rsampling((batch_size,), self.yaw_sampler, same_on_batch).to(device=_device, dtype=_dtype),
-            "pitch": _adapted_rsampling((batch_size,), self.pitch_sampler, same_on_batch).to(
+            "yaw": _adapted_rsampling((batch_size,), self.yaw_sampler, same_on_batch, self.generator).to(
                 device=_device, dtype=_dtype
             ),
-            "roll": _adapted_rsampling((batch_size,), self.roll_sampler, same_on_batch).to(
+            "pitch": _adapted_rsampling((batch_size,), self.pitch_sampler, same_on_batch, self.generator).to(
+                device=_device, dtype=_dtype
+            ),
+            "roll": _adapted_rsampling((batch_size,), self.roll_sampler, same_on_batch, self.generator).to(
                 device=_device, dtype=_dtype
             ),
         }
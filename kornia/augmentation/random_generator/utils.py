@@ -15,17 +15,27 @@
 # limitations under the License.
 #
 
-from typing import Any
+from typing import Any, Optional
 
 import torch
 
-from kornia.core import Tensor
+from kornia.core import Device, Tensor
 
 
-def randperm(n: int, ensure_perm: bool = True, **kwargs: Any) -> Tensor:
-    """`randomperm` with the ability to ensure the different arrangement generated."""
-    perm = torch.randperm(n, **kwargs)
+def randperm(
+    n: int,
+    ensure_perm: bool = True,
+    generator: Optional[torch.Generator] = None,
+    device: Optional[Device] = None,
+    **kwargs: Any,
+) -> Tensor:
+    """`randomperm` with the ability to ensure the different arrangement generated.
+
+    With a generator, the permutation is drawn on the device of the generator and moved to ``device`` afterwards.
+    """
+    sample_device = device if generator is None else generator.device
+    perm = torch.randperm(n, generator=generator, device=sample_device, **kwargs)
     if ensure_perm:
         while torch.all(torch.eq(perm, torch.arange(n, device=perm.device))):
-            perm = torch.randperm(n, **kwargs)
-    return perm
+            perm = torch.randperm(n, generator=generator, device=sample_device, **kwargs)
+    return perm if device is None else perm.to(device)
@@ -19,7 +19,8 @@ from functools import wraps
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import torch
-from torch.distributions import Beta, Uniform
+from torch.distributions import Bernoulli, Beta, Categorical, Distribution, Normal, RelaxedBernoulli, Uniform
+from torch.distributions.utils import clamp_probs
 
 from kornia.core import Tensor, as_tensor
 from kornia.geometry.boxes import Boxes
@@ -283,39 +284,140 @@ def _validate_input_shape(input: Tensor, channel_index: int, number: int) -> boo
     return input.shape[channel_index] == number
 
 
+class DistributionWithMapper(Distribution):
+    """Wraps a distribution with a value mapper function.
+
+    This is used to restrict the output values of a given distribution by a value mapper function.
+    The value mapper function can be functions like sigmoid, tanh, etc.
+
+    Args:
+        dist: the target distribution.
+        map_fn: the callable function to adjust the output from distributions.
+
+    Example:
+        >>> from torch.distributions import Normal
+        >>> import torch.nn as nn
+        >>> # without mapper
+        >>> dist = DistributionWithMapper(Normal(0., 1.,), map_fn=None)
+        >>> _ = torch.manual_seed(0)
+        >>> dist.rsample((8,))
+        tensor([ 1.5410, -0.2934, -2.1788,  0.5684, -1.0845, -1.3986,  0.4033,  0.8380])
+        >>> # with sigmoid mapper
+        >>> dist = DistributionWithMapper(Normal(0., 1.,), map_fn=nn.Sigmoid())
+        >>> _ = torch.manual_seed(0)
+        >>> dist.rsample((8,))
+        tensor([0.8236, 0.4272, 0.1017, 0.6384, 0.2527, 0.1980, 0.5995, 0.6980])
+
+    """
+
+    def __init__(self, dist: Distribution, map_fn: Optional[Callable[[Tensor], Tensor]] = None) -> None:
+        self.dist = dist
+        self.map_fn = map_fn
+
+    def rsample(self, sample_shape: Tuple[int, ...]) -> Tensor:  # type: ignore[override]
+        out = self.dist.rsample(torch.Size(sample_shape))
+        if self.map_fn is not None:
+            out = self.map_fn(out)
+        return out
+
+    def sample(self, sample_shape: Tuple[int, ...]) -> Tensor:  # type: ignore[override]
+        out = self.dist.sample(torch.Size(sample_shape))
+        if self.map_fn is not None:
+            out = self.map_fn(out)
+        return out
+
+    def sample_n(self, n: int) -> Tensor:
+        out = self.dist.sample_n(n)
+        if self.map_fn is not None:
+            out = self.map_fn(out)
+        return out
+
+    def __getattr__(self, attr: str) -> Any:
+        try:
+            return getattr(self, attr)
+        except AttributeError:
+            return getattr(self.dist, attr)
+
+
+def _sample_from_generator(
+    shape: torch.Size, dist: torch.distributions.Distribution, generator: torch.Generator
+) -> Tensor:
+    r"""Sample from a distribution with the given generator.
+
+    The distributions of ``torch.distributions`` do not accept a generator, so the sampling of the ones used by the
+    augmentations is reimplemented on top of the samplers taking one. The values are drawn on the device of the
+    generator and stay differentiable with respect to the parameters of the distribution, except for ``Beta``.
+    """
+    if isinstance(dist, DistributionWithMapper):
+        out = _sample_from_generator(shape, dist.dist, generator)
+        return out if dist.map_fn is None else dist.map_fn(out)
+    ext_shape = dist._extended_shape(shape)
+    if isinstance(dist, Uniform):
+        rand = torch.rand(ext_shape, dtype=dist.low.dtype, device=generator.device, generator=generator)
+        return dist.low + rand * (dist.high - dist.low)
+    if isinstance(dist, Normal):
+        eps = torch.randn(ext_shape, dtype=dist.loc.dtype, device=generator.device, generator=generator)
+        return dist.loc + eps * dist.scale
+    if isinstance(dist, Bernoulli):
+        return torch.bernoulli(dist.probs.to(generator.device).expand(ext_shape), generator=generator)
+    if isinstance(dist, RelaxedBernoulli):
+        probs = dist.probs.to(generator.device).expand(ext_shape)
+        uniforms = clamp_probs(torch.rand(ext_shape, dtype=probs.dtype, device=generator.device, generator=generator))
+        logits = (uniforms.log() - (-uniforms).log1p() + probs.log() - (-probs).log1p()) / dist.temperature
+        return logits.sigmoid()
+    if isinstance(dist, Beta):
+        concentration = torch.stack([dist.concentration1, dist.concentration0], -1).to(generator.device)
+        concentration = concentration.expand(*ext_shape, 2)
+        return torch._sample_dirichlet(concentration, generator=generator).select(-1, 0)
+    if isinstance(dist, Categorical):
+        probs_2d = dist.probs.to(generator.device).reshape(-1, dist._num_events)
+        return torch.multinomial(probs_2d, shape.numel(), True, generator=generator).T.reshape(ext_shape)
+    raise NotImplementedError(f"Sampling `{type(dist).__name__}` from a generator is not supported.")
+
+
 def _adapted_rsampling(
     shape: Union[Tuple[int, ...], torch.Size],
     dist: torch.distributions.Distribution,
     same_on_batch: Optional[bool] = False,
+    generator: Optional[torch.Generator] = None,
 ) -> Tensor:
     r"""Sample from a uniform reparameterized sampling function that accepts 'same_on_batch'.
 
     If same_on_batch is True, all values generated will be exactly same given a batch_size (shape[0]). By default,
-    same_on_batch is set to False.
+    same_on_batch is set to False. If a generator is given, the values are sampled from it instead of the global
+    random stream.
     """
     if isinstance(shape, tuple):
         shape = torch.Size(shape)
 
-    if same_on_batch:
-        rsample_size = torch.Size((1, *shape[1:]))
+    rsample_size = torch.Size((1, *shape[1:])) if same_on_batch else shape
+    if generator is not None:
+        rsample = _sample_from_generator(rsample_size, dist, generator)
+    else:
         rsample = dist.rsample(rsample_size)
+    if same_on_batch:
         return rsample.repeat(shape[0], *[1] * (len(rsample.shape) - 1))
-    return dist.rsample(shape)
+    return rsample
 
 
 def _adapted_sampling(
     shape: Union[Tuple[int, ...], torch.Size],
     dist: torch.distributions.Distribution,
     same_on_batch: Optional[bool] = False,
+    generator: Optional[torch.Generator] = None,
 ) -> Tensor:
     r"""Sample from a uniform sampling function that accepts 'same_on_batch'.
 
     If same_on_batch is True, all values generated will be exactly same given a batch_size (shape[0]). By default,
-    same_on_batch is set to False.
+    same_on_batch is set to False. If a generator is given, the values are sampled from it instead of the global
+    random stream.
     """
     if isinstance(shape, tuple):
         shape = torch.Size(shape)
 
+    if generator is not None:
+        with torch.no_grad():
+            return _adapted_rsampling(shape, dist, same_on_batch, generator)
     if same_on_batch:
         return dist.sample(torch.Size((1, *shape[1:]))).repeat(shape[0], *[1] * (len(shape) - 1))
     return dist.sample(shape)
@@ -326,6 +428,7 @@ def _adapted_uniform(
     low: Union[float, Tensor],
     high: Union[float, Tensor],
     same_on_batch: bool = False,
+    generator: Optional[torch.Generator] = None,
 ) -> Tensor:
     r"""Sample from a uniform sampling function that accepts 'same_on_batch'.
 
@@ -343,7 +446,7 @@ def _adapted_uniform(
     # validate_args=False to fix pytorch 1.7.1 error:
     #     ValueError: Uniform is not defined when low>= high.
     dist = Uniform(low, high, validate_args=False)
-    return _adapted_rsampling(shape, dist, same_on_batch)
+    return _adapted_rsampling(shape, dist, same_on_batch, generator)
 
 
 def _adapted_beta(
@@ -351,6 +454,7 @@ def _adapted_beta(
     a: Union[float, Tensor],
     b: Union[float, Tensor],
     same_on_batch: bool = False,
+    generator: Optional[torch.Generator] = None,
 ) -> Tensor:
     r"""Sample from a beta sampling function that accepts 'same_on_batch'.
 
@@ -364,7 +468,7 @@ def _adapted_beta(
     a = as_tensor(a, device=device, dtype=dtype)
     b = as_tensor(b, device=device, dtype=dtype)
     dist = Beta(a, b, validate_args=False)
-    return _adapted_rsampling(shape, dist, same_on_batch)
+    return _adapted_rsampling(shape, dist, same_on_batch, generator)
 
 
 def _shape_validation(param: Tensor, shape: Union[Tuple[int, ...], List[int]], name: str) -> None:
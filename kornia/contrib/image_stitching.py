@@ -25,6 +25,7 @@ from kornia.feature import LocalFeatureMatcher, LoFTR
 from kornia.geometry.homography import find_homography_dlt_iterated
 from kornia.geometry.ransac import RANSAC
 from kornia.geometry.transform import warp_perspective
+from kornia.utils import pad_by_batch_indexes
 
 
 class ImageStitcher(Module):
@@ -83,6 +84,17 @@ class ImageStitcher(Module):
     def estimate_transform(self, *args: Tensor, **kwargs: Tensor) -> Tensor:
         """Compute the corresponding homography."""
         kp1, kp2, idx = kwargs["keypoints0"], kwargs["keypoints1"], kwargs["batch_indexes"]
+        if self.estimator == "ransac" and len(idx) > 0:
+            # all the image pairs are verified in a single batched RANSAC run
+            num_pairs = len(idx.unique())
+            kp1_pad, mask = pad_by_batch_indexes(kp1, idx, num_pairs)
+            kp2_pad, _ = pad_by_batch_indexes(kp2, idx, num_pairs)
+            # the match confidences guide the sampling when ``self.ransac`` uses the prosac or weighted sampling
+            weights = kwargs.get("confidence", None)
+            if weights is not None:
+                weights, _ = pad_by_batch_indexes(weights, idx, num_pairs)
+            batch_homos, _ = self.ransac.forward_batch(kp2_pad, kp1_pad, mask, weights)
+            return batch_homos
         homos = [self._estimate_homography(kp1[idx == i], kp2[idx == i]) for i in range(len(idx.unique()))]
 
         if len(homos) == 0:
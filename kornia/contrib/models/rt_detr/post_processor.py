@@ -24,6 +24,7 @@ from typing import Optional, Union
 import torch
 
 from kornia.core import Module, Tensor, concatenate, tensor
+from kornia.geometry.bbox import batched_nms
 from kornia.models.detection.utils import BoxFiltering
 
 
@@ -57,14 +58,18 @@ class DETRPostProcessor(Module):
         num_top_queries: int = 300,
         confidence_filtering: bool = True,
         filter_as_zero: bool = False,
+        iou_threshold: Optional[float] = None,
     ) -> None:
         super().__init__()
         self.confidence_threshold = confidence_threshold
         self.num_classes = num_classes
         self.confidence_filtering = confidence_filtering
         self.num_top_queries = num_top_queries
+        self.iou_threshold = iou_threshold
         self.box_filtering = BoxFiltering(
-            tensor(confidence_threshold) if confidence_threshold is not None else None, filter_as_zero=filter_as_zero
+            tensor(confidence_threshold) if confidence_threshold is not None else None,
+            filter_as_zero=filter_as_zero,
+            iou_threshold=iou_threshold,
         )
 
     def forward(self, logits: Tensor, boxes: Tensor, original_sizes: Tensor) -> Union[Tensor, list[Tensor]]:
@@ -80,7 +85,9 @@ class DETRPostProcessor(Module):
 
         Returns:
             Processed detections. For each image, the detections have shape (D, 6), where D is the number of detections
-            in that image, 6 represent (class_id, confidence_score, x, y, w, h).
+            in that image, 6 represent (class_id, confidence_score, x, y, w, h). Without the confidence filtering,
+            the detections of all the images are a tensor of shape (N, Q', 6), where the boxes suppressed by
+            ``iou_threshold`` are set to zero.
 
         """
         # NOTE: consider using kornia BoundingBox
@@ -110,6 +117,11 @@ class DETRPostProcessor(Module):
         all_boxes = concatenate([labels[..., None], scores[..., None], boxes], -1)
 
         if not self.confidence_filtering or self.confidence_threshold == 0:
-            return all_boxes
+            if self.iou_threshold is None:
+                return all_boxes
+            # without the confidence filtering, the suppressed boxes are set to zero and the output stays a tensor
+            xy, wh = boxes[..., :2], boxes[..., 2:]
+            keep = batched_nms(concatenate([xy, xy + wh], -1), scores, self.iou_threshold, labels)
+            return all_boxes * keep[..., None]
 
         return self.box_filtering(all_boxes, self.confidence_threshold)
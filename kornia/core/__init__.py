@@ -15,7 +15,7 @@
 # limitations under the License.
 #
 
-from . import external
+from . import capabilities, external, profiling
 from ._backend import (
     Device,
     Dtype,
@@ -76,6 +76,7 @@ __all__ = [
     "TensorWrapper",
     "arange",
     "as_tensor",
+    "capabilities",
     "complex",
     "concatenate",
     "cos",
@@ -90,6 +91,7 @@ __all__ = [
     "ones",
     "ones_like",
     "pad",
+    "profiling",
     "rad2deg",
     "rand",
     "sin",
@@ -0,0 +1,251 @@
+# LICENSE HEADER MANAGED BY add-license-header
+#
+# Copyright 2018 Kornia Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Registry of the operators each device type supports and a host fallback dispatcher.
+
+Some accelerators lack kernels for a subset of operators or dtypes (e.g. ``float64`` matrix products). Instead of
+hard-coding ``.cpu()`` round-trips at every call site, kornia functions ask this registry whether an operator is
+available for a given tensor and only move the data to the host when it is not.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Iterator, Optional, TypeVar
+
+import torch
+
+from kornia.core._backend import Device, Dtype, Tensor
+
+__all__ = [
+    "DeviceProfile",
+    "device_profile",
+    "dispatch_op",
+    "get_device_profile",
+    "is_op_supported",
+    "needs_host_fallback",
+    "register_device_profile",
+]
+
+T = TypeVar("T")
+
+HOST_DEVICE = torch.device("cpu")
+
+
+@dataclass
+class DeviceProfile:
+    r"""Operator capabilities of a device type.
+
+    Operators are identified by a short name (e.g. ``"matmul"``, ``"conv2d"``). An operator missing from
+    ``unsupported`` is assumed to run natively for every dtype.
+
+    Args:
+        device_type: the device type the profile applies to, e.g. ``"cuda"`` or ``"sdaa"``.
+        unsupported: mapping from operator name to the dtypes the device can not run it with. ``None`` means the
+          operator is not available for any dtype.
+
+    Example:
+        >>> profile = DeviceProfile("cpu", {"matmul": frozenset({torch.float64})})
+        >>> profile.supports("matmul", torch.float32)
+        True
+        >>> profile.supports("matmul", torch.float64)
+        False
+
+    """
+
+    device_type: str
+    unsupported: Dict[str, Optional[FrozenSet[torch.dtype]]] = field(default_factory=dict)
+
+    def supports(self, op: str, dtype: Dtype = None) -> bool:
+        """Return whether the operator runs natively on the device for the given dtype."""
+        if op not in self.unsupported:
+            return True
+        dtypes = self.unsupported[op]
+        if dtypes is None:
+            return False
+        return dtype not in dtypes
+
+
+_FLOAT64 = frozenset({torch.float64})
+
+# NOTE: keep the operator names in sync with the call sites using `needs_host_fallback` and `dispatch_op`.
+_DEVICE_PROFILES: Dict[str, DeviceProfile] = {
+    "sdaa": DeviceProfile(
+        "sdaa",
+        {
+            # float64 matrix products (`@`, `mm`, `bmm`, `matmul`)
+            "matmul": _FLOAT64,
+            "conv2d": None,
+            "tan": _FLOAT64,
+            "acos": None,
+            # reductions over boolean tensors (`min`, `max`, `argmin`, ...)
+            "reduce_bool": None,
+            # `topk` on inputs with an empty dimension
+            "topk_empty": None,
+            "conv1d": None,
+            "interpolate": None,
+            "kl_div": None,
+            "round": _FLOAT64,
+            "scatter": _FLOAT64,
+            "sign": _FLOAT64,
+            # elementwise operators whose results are wrong on some inputs, e.g. `sqrt` of zeros or the `sign` of
+            # small values
+            "sign_values": None,
+            "sqrt": None,
+            "div": None,
+            # boolean mask assignments and writes into strided views
+            "index_put": None,
+            "strided_copy": None,
+        },
+    ),
+}
+
+
+def register_device_profile(profile: DeviceProfile) -> None:
+    """Register (or replace) the capability profile of a device type.
+
+    Args:
+        profile: the profile to register.
+
+    """
+    _DEVICE_PROFILES[profile.device_type] = profile
+
+
+def get_device_profile(device: Device) -> DeviceProfile:
+    """Return the capability profile of a device.
+
+    Device types without a registered profile are assumed to support every operator.
+
+    Args:
+        device: the device or device type to query.
+
+    """
+    if device is None:
+        device_type = HOST_DEVICE.type
+    elif isinstance(device, str):
+        # NOTE: parse by hand, `torch.device` rejects the types of backends whose extension is not loaded.
+        device_type = device.split(":")[0]
+    else:
+        device_type = device.type
+    return _DEVICE_PROFILES.get(device_type, DeviceProfile(device_type))
+
+
+@contextmanager
+def device_profile(profile: DeviceProfile) -> Iterator[DeviceProfile]:
+    """Temporarily override the capability profile of a device type.
+
+    Useful to exercise the fallback paths on any machine by faking the profile of the ``cpu`` device.
+
+    Args:
+        profile: the profile to use inside the context.
+
+    Example:
+        >>> with device_profile(DeviceProfile("cpu", {"matmul": None})):
+        ...     is_op_supported("matmul", "cpu", torch.float32)
+        False
+
+    """
+    previous = _DEVICE_PROFILES.get(profile.device_type, None)
+    register_device_profile(profile)
+    try:
+        yield profile
+    finally:
+        if previous is None:
+            _DEVICE_PROFILES.pop(profile.device_type, None)
+        else:
+            _DEVICE_PROFILES[profile.device_type] = previous
+
+
+def is_op_supported(op: str, device: Device, dtype: Dtype = None) -> bool:
+    """Return whether an operator runs natively on a device for the given dtype.
+
+    Args:
+        op: the operator name.
+        device: the device to query.
+        dtype: the dtype of the operands.
+
+    """
+    return get_device_profile(device).supports(op, dtype)
+
+
+@torch.jit.ignore
+def needs_host_fallback(op: str, x: Tensor) -> bool:
+    """Return whether the operator must run on the host for the device and dtype of a tensor.
+
+    This is the scriptable counterpart of :func:`dispatch_op`, for call sites that need to keep their own
+    fallback branch.
+
+    Args:
+        op: the operator name.
+        x: a representative operand.
+
+    """
+    return not is_op_supported(op, x.device, x.dtype)
+
+
+def _first_tensor(args: Any) -> Optional[Tensor]:
+    for arg in args:
+        if isinstance(arg, Tensor):
+            return arg
+        if isinstance(arg, (list, tuple)):
+            found = _first_tensor(arg)
+            if found is not None:
+                return found
+    return None
+
+
+def _move(data: T, device: torch.device) -> T:
+    if isinstance(data, Tensor):
+        return data.to(device)  # type: ignore[return-value]
+    if isinstance(data, tuple) and hasattr(data, "_fields"):  # namedtuple, e.g. torch.return_types
+        return type(data)(*(_move(d, device) for d in data))
+    if isinstance(data, (list, tuple)):
+        return type(data)(_move(d, device) for d in data)
+    if isinstance(data, dict):
+        return {k: _move(v, device) for k, v in data.items()}  # type: ignore[return-value]
+    return data
+
+
+def dispatch_op(op: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    r"""Run an operator natively or, if the device does not support it, on the host.
+
+    The device and dtype are taken from the first tensor found in ``args`` (or ``kwargs``). When the registry
+    reports the operator as unsupported, all the tensor inputs are copied to the host, ``fn`` is evaluated there and
+    its outputs are copied back to the original device. Otherwise ``fn`` is called directly without any copy.
+
+    Args:
+        op: the operator name to look up in the registry.
+        fn: the callable implementing the operator.
+        args: positional arguments for ``fn``.
+        kwargs: keyword arguments for ``fn``.
+
+    Returns:
+        the output of ``fn`` on the device of the inputs.
+
+    Example:
+        >>> a = torch.eye(3, dtype=torch.float64)
+        >>> dispatch_op("matmul", torch.matmul, a, a).device
+        device(type='cpu')
+
+    """
+    ref = _first_tensor(args)
+    if ref is None:
+        ref = _first_tensor(tuple(kwargs.values()))
+    if ref is None or is_op_supported(op, ref.device, ref.dtype):
+        return fn(*args, **kwargs)
+    device = ref.device
+    out = fn(*_move(args, HOST_DEVICE), **_move(kwargs, HOST_DEVICE))
+    return _move(out, device)
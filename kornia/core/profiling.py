@@ -0,0 +1,232 @@
+# LICENSE HEADER MANAGED BY add-license-header
+#
+# Copyright 2018 Kornia Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Instrumentation of the host synchronization points hit inside kornia functions.
+
+Host-device copies, ``.item()`` calls and operators with data-dependent output shapes force the host to wait for
+the accelerator. :func:`track_sync_points` records every such point reached from kornia code, attributes it to the
+innermost kornia function on the call stack and optionally raises once a budget is exceeded.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from dataclasses import dataclass, field
+from types import FrameType, TracebackType
+from typing import Any, Dict, List, Optional, Type
+
+import torch
+
+from kornia.core._backend import Tensor
+
+__all__ = ["SyncEvent", "SyncPointError", "SyncReport", "track_sync_points"]
+
+try:
+    from torch.utils._python_dispatch import TorchDispatchMode
+except ImportError:  # pragma: no cover
+    TorchDispatchMode = object  # type: ignore[misc,assignment]
+
+# operators that read a tensor value back to the host
+_SCALAR_OPS = {"_local_scalar_dense", "is_nonzero", "equal"}
+# operators whose output shape depends on the data
+_DATA_DEPENDENT_OPS = {
+    "nonzero",
+    "masked_select",
+    "_unique2",
+    "unique_dim",
+    "unique_consecutive",
+    "repeat_interleave",
+}
+_COPY_OPS = {"_to_copy", "copy_"}
+
+# frames of these modules are never reported as the origin of a sync point
+_SKIPPED_MODULES = ("kornia.core.profiling", "kornia.core.capabilities")
+
+
+class SyncPointError(RuntimeError):
+    """Raised by :func:`track_sync_points` when the sync point budget is exceeded."""
+
+
+@dataclass
+class SyncEvent:
+    r"""A synchronization point hit inside a kornia function.
+
+    Args:
+        op: qualified name of the kornia function that triggered it, e.g. ``kornia.geometry.ransac.RANSAC.verify``.
+        kind: one of ``"item"``, ``"data_dependent"``, ``"host_to_device"``, ``"device_to_host"`` or
+          ``"device_to_device"``.
+        aten_op: the name of the underlying aten operator.
+        elapsed: wall time spent in the operator, in seconds.
+        nbytes: bytes copied for transfers, zero otherwise.
+
+    """
+
+    op: str
+    kind: str
+    aten_op: str
+    elapsed: float
+    nbytes: int = 0
+
+
+@dataclass
+class SyncReport:
+    """Collection of the sync points recorded by :func:`track_sync_points`."""
+
+    events: List[SyncEvent] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def count(self, kind: Optional[str] = None) -> int:
+        """Return the number of events, optionally only of the given kind."""
+        return sum(1 for e in self.events if kind is None or e.kind == kind)
+
+    @property
+    def total_time(self) -> float:
+        """Total wall time spent in the recorded operators, in seconds."""
+        return sum(e.elapsed for e in self.events)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Aggregate the events per kornia function.
+
+        Returns:
+            a dictionary mapping each function to its number of events per kind, the copied bytes and the total
+            time spent.
+
+        """
+        out: Dict[str, Dict[str, Any]] = {}
+        for e in self.events:
+            entry = out.setdefault(e.op, {"count": 0, "kinds": {}, "nbytes": 0, "time": 0.0})
+            entry["count"] += 1
+            entry["kinds"][e.kind] = entry["kinds"].get(e.kind, 0) + 1
+            entry["nbytes"] += e.nbytes
+            entry["time"] += e.elapsed
+        return dict(sorted(out.items(), key=lambda kv: kv[1]["time"], reverse=True))
+
+    def __repr__(self) -> str:
+        lines = [f"SyncReport({len(self)} sync points, {1e3 * self.total_time:.3f} ms)"]
+        for op, entry in self.summary().items():
+            kinds = ", ".join(f"{k}={v}" for k, v in entry["kinds"].items())
+            lines.append(f"  {op}: {entry['count']} ({kinds}), {entry['nbytes']} bytes, {1e3 * entry['time']:.3f} ms")
+        return "\n".join(lines)
+
+
+def _kornia_caller(frame: Optional[FrameType]) -> Optional[str]:
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("kornia.") and not module.startswith(_SKIPPED_MODULES):
+            name = getattr(frame.f_code, "co_qualname", frame.f_code.co_name)
+            return f"{module}.{name}"
+        frame = frame.f_back
+    return None
+
+
+def _classify(func: Any, args: Any, kwargs: Dict[str, Any]) -> Optional[tuple[str, int]]:
+    name = func.overloadpacket.__name__
+    if name in _SCALAR_OPS:
+        return "item", 0
+    if name in _DATA_DEPENDENT_OPS:
+        if name == "repeat_interleave" and kwargs.get("output_size", None) is not None:
+            return None
+        return "data_dependent", 0
+    if name == "index":
+        indices = args[1] if len(args) > 1 else kwargs.get("indices", [])
+        if any(isinstance(i, Tensor) and i.dtype == torch.bool for i in indices):
+            return "data_dependent", 0
+        return None
+    if name in _COPY_OPS:
+        if name == "_to_copy":
+            src, dst_device = args[0], kwargs.get("device", None)
+        else:
+            src, dst_device = args[1], args[0].device
+        if dst_device is None or not isinstance(src, Tensor) or src.device == torch.device(dst_device):
+            return None
+        src_host, dst_host = src.device.type == "cpu", torch.device(dst_device).type == "cpu"
+        kind = "host_to_device" if src_host else "device_to_host" if dst_host else "device_to_device"
+        return kind, src.numel() * src.element_size()
+    return None
+
+
+class _SyncPointMode(TorchDispatchMode):
+    def __init__(self, report: SyncReport, budget: Optional[int]) -> None:
+        super().__init__()
+        self.report = report
+        self.budget = budget
+
+    def __torch_dispatch__(self, func: Any, types: Any, args: Any = (), kwargs: Any = None) -> Any:
+        kwargs = kwargs or {}
+        classified = _classify(func, args, kwargs)
+        if classified is None:
+            return func(*args, **kwargs)
+        op = _kornia_caller(sys._getframe(1))
+        if op is None:
+            return func(*args, **kwargs)
+        kind, nbytes = classified
+        if self.budget is not None and len(self.report) >= self.budget:
+            raise SyncPointError(f"Sync point budget of {self.budget} exceeded by {kind} ({func}) in {op}.")
+        start = time.perf_counter()
+        out = func(*args, **kwargs)
+        self.report.events.append(SyncEvent(op, kind, str(func), time.perf_counter() - start, nbytes))
+        return out
+
+
+class track_sync_points:
+    r"""Context manager recording the host synchronization points hit inside kornia functions.
+
+    Tracked are host-device copies (including the host fallbacks of :mod:`kornia.core.capabilities`), scalar reads
+    such as ``.item()`` or ``bool(tensor)``, and operators with data-dependent output shapes (``nonzero``, boolean
+    indexing, ``unique``, ...). Each event is attributed to the innermost kornia function on the call stack; sync
+    points outside kornia are ignored. Scalar reads and data-dependent operators are reported on every device since
+    they become syncs as soon as the data lives on an accelerator.
+
+    .. note::
+        The reported time is the wall time of the operator itself. Asynchronous copies are only accounted for
+        until they are enqueued.
+
+    Args:
+        strict: raise :class:`SyncPointError` on the first sync point. Shorthand for ``budget=0``.
+        budget: maximum number of sync points allowed inside the context before raising.
+
+    Example:
+        >>> with track_sync_points() as report:
+        ...     _ = kornia.geometry.bbox.nms(torch.rand(4, 4), torch.rand(4), 0.5)
+        >>> report.count() > 0
+        True
+
+        >>> with track_sync_points(strict=True):
+        ...     out = kornia.filters.gaussian_blur2d(torch.rand(1, 1, 5, 5), (3, 3), (1.0, 1.0))
+
+    """
+
+    def __init__(self, strict: bool = False, budget: Optional[int] = None) -> None:
+        if TorchDispatchMode is object:  # pragma: no cover
+            raise RuntimeError("track_sync_points requires a PyTorch version providing TorchDispatchMode.")
+        self.report = SyncReport()
+        self._mode = _SyncPointMode(self.report, 0 if strict else budget)
+
+    def __enter__(self) -> SyncReport:
+        self._mode.__enter__()
+        return self.report
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self._mode.__exit__(exc_type, exc_value, exc_tb)
@@ -51,6 +51,7 @@ from .equalization import equalize_clahe
 from .histogram import histogram, histogram2d, image_histogram2d
 from .integral import IntegralImage, IntegralTensor, integral_image, integral_tensor
 from .jpeg import JPEGCodecDifferentiable, jpeg_codec_differentiable
+from .lut import apply_lut, identity_lut, lut_to_uint8
 from .normalize import Denormalize, Normalize, denormalize, normalize, normalize_min_max
 from .rescale import Rescale
 from .shift_rgb import shift_rgb
@@ -90,18 +91,21 @@ __all__ = [
     "adjust_saturation_raw",
     "adjust_saturation_with_gray_subtraction",
     "adjust_sigmoid",
+    "apply_lut",
     "denormalize",
     "equalize",
     "equalize3d",
     "equalize_clahe",
     "histogram",
     "histogram2d",
+    "identity_lut",
     "image_histogram2d",
     "integral_image",
     "integral_tensor",
     "invert",
     "jpeg_codec_differentiable",
     "linear_transform",
+    "lut_to_uint8",
     "normalize",
     "normalize_min_max",
     "posterize",
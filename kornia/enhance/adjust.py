@@ -30,7 +30,6 @@ from kornia.core.check import (
     KORNIA_CHECK_IS_COLOR_OR_GRAY,
     KORNIA_CHECK_IS_TENSOR,
 )
-from kornia.utils.helpers import _torch_histc_cast
 from kornia.utils.image import perform_keep_shape_image, perform_keep_shape_video
 
 
@@ -870,66 +869,107 @@ def sharpness(input: Tensor, factor: Union[float, Tensor]) -> Tensor:
     padded_degenerate = torch.nn.functional.pad(degenerate, [1, 1, 1, 1])
     result = torch.where(padded_mask == 1, padded_degenerate, input)
 
-    if len(factor.size()) == 0:
-        return _blend_one(result, input, factor)
-    return torch.stack([_blend_one(result[i], input[i], factor[i]) for i in range(len(factor))])
+    if len(factor.size()) != 0:
+        factor = factor.view(-1, 1, 1, 1)
+    return _blend(result, input, factor)
 
 
-def _blend_one(input1: Tensor, input2: Tensor, factor: Tensor) -> Tensor:
+def _blend(input1: Tensor, input2: Tensor, factor: Tensor) -> Tensor:
     r"""Blend two images into one.
 
+    The blended values are clamped to :math:`[0, 1]` when extrapolating, i.e. for factors out of :math:`[0, 1]`.
+
+    Args:
+        input1: image tensor with shapes like :math:`(B, C, H, W)`, returned for a null factor.
+        input2: image tensor with the same shape as ``input1``, returned for a factor of one.
+        factor: factor tensor broadcastable to the images, e.g. of shape :math:`(B, 1, 1, 1)`.
+
+    Returns:
+        the blended images.
+
+    """
+    res = input1 + (input2 - input1) * factor
+    res = torch.where((factor > 0.0) & (factor < 1.0), res, res.clamp(0, 1))
+    return torch.where(factor == 0.0, input1, torch.where(factor == 1.0, input2, res))
+
+
+def _level_histogram(levels: Tensor, weights: Optional[Tensor] = None, dtype: torch.dtype = torch.float32) -> Tensor:
+    r"""Count the occurrences of the 256 levels along the last dimension.
+
+    Args:
+        levels: integer levels in :math:`[0, 255]` with shape :math:`(*, N)`.
+        weights: the weight of every occurrence, with shape :math:`(*, N)`. Default: ones.
+        dtype: the dtype of the histograms, used when ``weights`` is not given.
+
+    Returns:
+        the histograms with shape :math:`(*, 256)`.
+
+    """
+    if weights is None:
+        weights = torch.ones((), device=levels.device, dtype=dtype).expand(levels.shape)
+    histo = torch.zeros(*levels.shape[:-1], 256, device=levels.device, dtype=weights.dtype)
+    return histo.scatter_add_(-1, levels.long(), weights)
+
+
+def _equalize_step(histo: Tensor) -> Tensor:
+    # the count of the last non-empty level is filtered out for the purposes of computing the step
+    levels = torch.arange(256, device=histo.device, dtype=histo.dtype)
+    last = (levels * (histo != 0)).argmax(-1, keepdim=True)
+    return torch.div(histo.sum(-1, keepdim=True) - histo.gather(-1, last), 255, rounding_mode="trunc")
+
+
+def _equalize_lut(histo: Tensor) -> Tensor:
+    r"""Build the equalization lookup tables of a batch of histograms.
+
     Args:
-        input1: image tensor with shapes like :math:`(H, W)` or :math:`(D, H, W)`.
-        input2: image tensor with shapes like :math:`(H, W)` or :math:`(D, H, W)`.
-        factor: factor 0-dim tensor.
+        histo: histograms of the 256 levels with shape :math:`(*, 256)`.
 
     Returns:
-        : image tensor with the batch in the zero position.
+        the equalized levels in :math:`[0, 255]` with shape :math:`(*, 256)`, the identity where the step is zero.
 
     """
-    if not isinstance(input1, Tensor):
-        raise AssertionError(f"`input1` must be a tensor. Got {input1}.")
-    if not isinstance(input2, Tensor):
-        raise AssertionError(f"`input1` must be a tensor. Got {input2}.")
-
-    if isinstance(factor, Tensor) and len(factor.size()) != 0:
-        raise AssertionError(f"Factor shall be a float or single element tensor. Got {factor}.")
-    if factor == 0.0:
-        return input1
-    if factor == 1.0:
-        return input2
-    diff = (input2 - input1) * factor
-    res = input1 + diff
-    if factor > 0.0 and factor < 1.0:
-        return res
-    return torch.clamp(res, 0, 1)
-
-
-def _build_lut(histo: Tensor, step: Tensor) -> Tensor:
-    # Compute the cumulative sum, shifting by step // 2
-    # and then normalization by step.
-    step_trunc = torch.div(step, 2, rounding_mode="trunc")
-    lut = torch.div(torch.cumsum(histo, 0) + step_trunc, step, rounding_mode="trunc")
-    # Shift lut, prepending with 0.
-    lut = torch.cat([torch.zeros(1, device=lut.device, dtype=lut.dtype), lut[:-1]])
-    # Clip the counts to be in range.  This is done
-    # in the C code for image.point.
-    return torch.clamp(lut, 0, 255)
-
-
-# Code taken from: https://github.com/pytorch/vision/pull/796
-def _scale_channel(im: Tensor) -> Tensor:
-    r"""Scale the data in the channel to implement equalize.
+    levels = torch.arange(256, device=histo.device, dtype=histo.dtype)
+    step = _equalize_step(histo)
+    step_safe = step.clamp(min=1)
+    # Compute the cumulative sum, shifting by step // 2 and then normalization by step.
+    step_trunc = torch.div(step_safe, 2, rounding_mode="trunc")
+    # reduced precision counts are divided in float32, as by the scalar division of a single histogram
+    div_dtype = histo.dtype if histo.dtype in (torch.float32, torch.float64) else torch.float32
+    lut = torch.div(
+        (torch.cumsum(histo, -1) + step_trunc).to(div_dtype), step_safe.to(div_dtype), rounding_mode="trunc"
+    ).to(histo.dtype)
+    # Shift lut, prepending with 0. Clip the counts to be in range. This is done in the C code for image.point.
+    lut = torch.cat([torch.zeros_like(lut[..., :1]), lut[..., :-1]], -1).clamp(0, 255)
+    return torch.where(step == 0, levels, lut)
+
+
+# number of values equalized at once on the host, the temporaries of a block stay in the CPU caches
+_EQUALIZE_BLOCK_SIZE_CPU = 2**20
+
+
+# Code adapted from: https://github.com/pytorch/vision/pull/796
+def _equalize_flat(input: Tensor) -> Tensor:
+    r"""Equalize every row of a batch of flattened channels independently.
+
+    The histograms of a block of rows are computed with a single scatter and their lookup tables are applied with a
+    single gather. On accelerators, all the rows are a single block.
 
     Args:
-        im: image tensor with shapes like :math:`(H, W)` or :math:`(D, H, W)`.
+        input: channels in the range of [0, 1] with shape :math:`(N, L)`.
 
     Returns:
-        image tensor with the batch in the zero position.
+        the equalized channels with shape :math:`(N, L)`.
 
     """
-    min_ = im.min()
-    max_ = im.max()
+    if input.device.type == "cpu" and input.shape[0] * input.shape[1] > _EQUALIZE_BLOCK_SIZE_CPU:
+        rows = max(1, _EQUALIZE_BLOCK_SIZE_CPU // max(1, input.shape[1]))
+        return torch.cat([_equalize_block(block) for block in input.split(rows)])
+    return _equalize_block(input)
+
+
+def _equalize_block(input: Tensor) -> Tensor:
+    min_ = input.min()
+    max_ = input.max()
 
     if min_.item() < 0.0 and not torch.isclose(min_, torch.as_tensor(0.0, dtype=min_.dtype)):
         raise ValueError(f"Values in the input tensor must greater or equal to 0.0. Found {min_.item()}.")
@@ -937,27 +977,18 @@ def _scale_channel(im: Tensor) -> Tensor:
     if max_.item() > 1.0 and not torch.isclose(max_, torch.as_tensor(1.0, dtype=max_.dtype)):
         raise ValueError(f"Values in the input tensor must lower or equal to 1.0. Found {max_.item()}.")
 
-    ndims = len(im.shape)
-    if ndims not in (2, 3):
-        raise TypeError(f"Input tensor must have 2 or 3 dimensions. Found {ndims}.")
-
-    im = im * 255.0
-    # Compute the histogram of the image channel.
-    histo = _torch_histc_cast(im, bins=256, min=0, max=255)
-    # For the purposes of computing the step, filter out the nonzeros.
-    nonzero_histo = torch.reshape(histo[histo != 0], [-1])
-    step = torch.div(torch.sum(nonzero_histo) - nonzero_histo[-1], 255, rounding_mode="trunc")
-
-    # If step is zero, return the original image.  Otherwise, build
-    # lut from the full histogram and step and then index from it.
-    if step == 0:
-        result = im
-    else:
-        # can't index using 2d index. Have to flatten and then reshape
-        result = torch.gather(_build_lut(histo, step), 0, im.flatten().long())
-        result = result.reshape_as(im)
+    im = input * 255.0
+    # the bins of `torch.histc(im, bins=256, min=0, max=255)`, the values within the tolerance out of the range are
+    # counted in the first and last bins (the truncation rounds the small negative values to zero)
+    hist_dtype = im.dtype if im.dtype in (torch.float32, torch.float64) else torch.float32
+    bins = (im.detach().to(hist_dtype) * 256).div_(255).long().clamp_(max=255)
+    # the counts are rounded to the dtype of the input, as by `_torch_histc_cast`
+    histo = _level_histogram(bins, dtype=hist_dtype).to(input.dtype)
 
-    return result / 255.0
+    # If step is zero, return the original image. Otherwise, build the lut from the histogram and index from it.
+    step = _equalize_step(histo)
+    lut = _equalize_lut(histo) / 255.0
+    return torch.where(step == 0, im / 255.0, lut.gather(-1, im.detach().long().clamp_(0, 255)))
 
 
 @perform_keep_shape_image
@@ -969,6 +1000,8 @@ def equalize(input: Tensor) -> Tensor:
     Implements Equalize function from PIL using PyTorch ops based on uint8 format:
     https://github.com/tensorflow/tpu/blob/5f71c12a020403f863434e96982a840578fdd127/models/official/efficientnet/autoaugment.py#L355
 
+    Every channel is equalized independently, all the channels of the batch at once.
+
     Args:
         input: image tensor to equalize with shape :math:`(*, C, H, W)`.
 
@@ -981,13 +1014,7 @@ def equalize(input: Tensor) -> Tensor:
         torch.Size([1, 2, 3, 3])
 
     """
-    res = []
-    for image in input:
-        # Assumes RGB for now.  Scales each channel independently
-        # and then stacks the result.
-        scaled_image = torch.stack([_scale_channel(image[i, :, :]) for i in range(len(image))])
-        res.append(scaled_image)
-    return torch.stack(res)
+    return _equalize_flat(input.flatten(-2)).view_as(input)
 
 
 @perform_keep_shape_video
@@ -997,6 +1024,8 @@ def equalize3d(input: Tensor) -> Tensor:
     Implements Equalize function for a sequence of images using PyTorch ops based on uint8 format:
     https://github.com/tensorflow/tpu/blob/master/models/official/efficientnet/autoaugment.py#L352
 
+    Every channel is equalized independently over its whole volume, all the channels of the batch at once.
+
     Args:
         input: image tensor with shape :math:`(*, C, D, H, W)` to equalize.
 
@@ -1004,14 +1033,7 @@ def equalize3d(input: Tensor) -> Tensor:
         Equalized volume with shape :math:`(B, C, D, H, W)`.
 
     """
-    res = []
-    for volume in input:
-        # Assumes RGB for now.  Scales each channel independently
-        # and then stacks the result.
-        scaled_input = torch.stack([_scale_channel(volume[i, :, :, :]) for i in range(len(volume))])
-        res.append(scaled_input)
-
-    return torch.stack(res)
+    return _equalize_flat(input.flatten(-3)).view_as(input)
 
 
 def invert(image: Tensor, max_val: Optional[Tensor] = None) -> Tensor:
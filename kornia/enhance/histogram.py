@@ -20,6 +20,7 @@ from typing import Optional, Tuple
 import torch
 
 from kornia.core import Tensor
+from kornia.core.capabilities import needs_host_fallback
 
 
 def marginal_pdf(values: Tensor, bins: Tensor, sigma: Tensor, epsilon: float = 1e-10) -> Tuple[Tensor, Tensor]:
@@ -95,8 +96,7 @@ def joint_pdf(kernel_values1: Tensor, kernel_values2: Tensor, epsilon: float = 1
             f" Got {kernel_values1.shape} and {kernel_values2.shape}"
         )
 
-    # SDAA torch.matmul not support fp64
-    if kernel_values1.dtype == torch.float64 and 'sdaa' in kernel_values1.device.type:
+    if needs_host_fallback("matmul", kernel_values1):
         device = kernel_values1.device
         joint_kernel_values = torch.matmul(kernel_values1.cpu().transpose(1, 2), kernel_values2.cpu()).to(device)
     else:
@@ -0,0 +1,90 @@
+# LICENSE HEADER MANAGED BY add-license-header
+#
+# Copyright 2018 Kornia Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Lookup tables over the 256 levels of ``torch.uint8`` images."""
+
+import torch
+
+from kornia.core import Tensor
+from kornia.core.check import KORNIA_CHECK, KORNIA_CHECK_IS_TENSOR, KORNIA_CHECK_SHAPE
+
+
+def identity_lut(input: Tensor, dtype: torch.dtype = torch.float32) -> Tensor:
+    r"""Return the lookup tables mapping every level of ``torch.uint8`` images to itself, scaled to :math:`[0, 1]`.
+
+    Args:
+        input: image tensor with shape :math:`(*, C, H, W)`.
+        dtype: the dtype of the lookup tables.
+
+    Returns:
+        Lookup tables with shape :math:`(*, C, 256)`.
+
+    Example:
+        >>> identity_lut(torch.zeros(2, 3, 4, 4, dtype=torch.uint8)).shape
+        torch.Size([2, 3, 256])
+
+    """
+    KORNIA_CHECK_SHAPE(input, ["*", "C", "H", "W"])
+    levels = torch.arange(256, device=input.device, dtype=dtype) / 255.0
+    return levels.expand(*input.shape[:-2], 256)
+
+
+def lut_to_uint8(lut: Tensor) -> Tensor:
+    r"""Quantize lookup tables with values in :math:`[0, 1]` to the levels of ``torch.uint8`` images.
+
+    Args:
+        lut: lookup tables with shape :math:`(*, 256)`.
+
+    Returns:
+        Lookup tables of ``torch.uint8`` with shape :math:`(*, 256)`.
+
+    Example:
+        >>> lut = identity_lut(torch.zeros(1, 1, 2, 2, dtype=torch.uint8))
+        >>> torch.equal(lut_to_uint8(lut)[0, 0], torch.arange(256, dtype=torch.uint8))
+        True
+
+    """
+    KORNIA_CHECK_SHAPE(lut, ["*", "256"])
+    return (lut * 255.0).round().clamp(0, 255).to(torch.uint8)
+
+
+def apply_lut(input: Tensor, lut: Tensor) -> Tensor:
+    r"""Map the levels of ``torch.uint8`` images through per image and channel lookup tables.
+
+    All the tables are applied with a single gather, which reads and writes the images once.
+
+    Args:
+        input: image tensor of ``torch.uint8`` with shape :math:`(*, C, H, W)`.
+        lut: lookup tables with shape :math:`(*, C, 256)`, or any shape broadcastable to it.
+
+    Returns:
+        The mapped images with shape :math:`(*, C, H, W)` and the dtype of ``lut``.
+
+    Example:
+        >>> img = torch.randint(0, 256, (2, 3, 4, 4), dtype=torch.uint8)
+        >>> inverse = torch.arange(255, -1, -1, dtype=torch.uint8)
+        >>> torch.equal(apply_lut(img, inverse), 255 - img)
+        True
+
+    """
+    KORNIA_CHECK_IS_TENSOR(input)
+    KORNIA_CHECK(input.dtype == torch.uint8, f"Expected the input to be of torch.uint8. Got {input.dtype}.")
+    KORNIA_CHECK_SHAPE(input, ["*", "C", "H", "W"])
+    KORNIA_CHECK(lut.shape[-1] == 256, f"Expected lookup tables of 256 levels. Got {lut.shape}.")
+    lut = lut.expand(*input.shape[:-2], 256).reshape(-1, 256)
+    out = lut.gather(1, input.reshape(lut.shape[0], -1).long())
+    return out.view(input.shape)
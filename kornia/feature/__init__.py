@@ -16,8 +16,10 @@
 #
 
 from .affine_shape import LAFAffineShapeEstimator, LAFAffNetShapeEstimator, PatchAffineShapeEstimator
+from .cache import FeatureCache
 from .dedode import DeDoDe
 from .defmo import DeFMO
+from .descriptor_index import DescriptorIndex
 from .disk import DISK, DISKFeatures
 from .hardnet import HardNet, HardNet8
 from .hynet import TLU, FilterResponseNorm2d, HyNet
@@ -103,8 +105,10 @@ __all__ = [
     "DeDoDe",
     "DeFMO",
     "DenseSIFTDescriptor",
+    "DescriptorIndex",
     "DescriptorMatcher",
     "DescriptorMatcher",
+    "FeatureCache",
     "FilterResponseNorm2d",
     "GFTTAffNetHardNet",
     "GFTTAffNetHardNet",
@@ -0,0 +1,262 @@
+# LICENSE HEADER MANAGED BY add-license-header
+#
+# Copyright 2018 Kornia Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Cache of the features of images, shared by the matchers."""
+
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+import torch
+
+from kornia.core import Tensor, concatenate
+from kornia.core.check import KORNIA_CHECK
+
+__all__ = ["FeatureCache"]
+
+_Features = Dict[str, Tensor]
+
+# the multipliers and offsets of the checksums of the images, odd for the products to keep all the bits
+_CHECKSUM_PARAMS = ((0x5851F42D4C957F2D, 0x14057B7EF767814F), (0x2545F4914F6CDD1D, 0x3C6EF372FE94F82B))
+
+
+def _checksums(data: Tensor) -> Tensor:
+    """Compute checksums of the bytes of a tensor on its device, weighting every word by a hash of its position."""
+    data = data.detach().contiguous().view(-1)
+    nbytes = data.numel() * data.element_size()
+    words = (data.view(torch.int32) if nbytes % 4 == 0 else data.view(torch.uint8)).to(torch.int64)
+    index = torch.arange(words.numel(), device=words.device, dtype=torch.int64)
+    sums = []
+    for mult, inc in _CHECKSUM_PARAMS:
+        # the products and the sums wrap around, as 64-bit integers do
+        weight = index * mult + inc
+        weight = (weight ^ (weight >> 29)) | 1
+        sums.append((words * weight).sum())
+    return torch.stack(sums)
+
+
+def _nbytes(features: _Features) -> int:
+    return sum(v.numel() * v.element_size() for v in features.values())
+
+
+class FeatureCache:
+    r"""Cache of the features of images, evicting the least recently used ones beyond a budget of bytes.
+
+    The features are stored per image, under the key of the image, e.g. its id in a dataset, or the hash of its content
+    by default. When matching every image against many others, e.g. exhaustive or retrieval-based pair matching, the
+    features of every image are then computed once, however many pairs it belongs to. The same cache can be given to
+    several models, e.g. :class:`~kornia.feature.LocalFeatureMatcher` and :class:`~kornia.feature.LoFTR`, the
+    features of every model being stored under a namespace of its own.
+
+    Args:
+        max_bytes: the budget of the features kept in memory, on their device.
+        spill_dir: a directory where the evicted features are saved, to be loaded back instead of recomputed. A
+            temporary directory is created if ``True``. The evicted features are dropped if None.
+
+    Example:
+        >>> cache = FeatureCache(max_bytes=2**20)
+        >>> images = torch.rand(3, 1, 32, 32)
+        >>> feats = cache.get_batch("pool", images, lambda x: {"mean": x.mean((1, 2, 3))}, keys=[0, 1, 0])
+        >>> feats["mean"].shape, len(cache)
+        (torch.Size([3]), 2)
+
+    """
+
+    def __init__(self, max_bytes: int = 2**30, spill_dir: Optional[Union[str, bool]] = None) -> None:
+        KORNIA_CHECK(max_bytes >= 0, f"Expected a non-negative budget. Got {max_bytes}.")
+        self.max_bytes = max_bytes
+        self._tmpdir: Optional[tempfile.TemporaryDirectory] = None  # type: ignore[type-arg]
+        if spill_dir is True:
+            self._tmpdir = tempfile.TemporaryDirectory()
+            spill_dir = self._tmpdir.name
+        self.spill_dir = spill_dir or None
+        self._memory: OrderedDict[Hashable, Tuple[_Features, int]] = OrderedDict()
+        self._disk: Dict[Hashable, Tuple[str, torch.device]] = {}
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes of the features kept in memory."""
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._memory) + len(self._disk)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._memory or key in self._disk
+
+    @staticmethod
+    def image_key(image: Tensor) -> str:
+        """Hash the content of an image, to be used as its key.
+
+        The values are reduced to checksums on the device of the image, only these are copied to the host. Give the
+        keys of the images, e.g. their ids, to the methods of the cache to skip the hashing.
+
+        Args:
+            image: the image, of any shape.
+
+        Returns:
+            the hexadecimal digest of the shape, type and values of the image.
+
+        """
+        digest = hashlib.blake2b(f"{tuple(image.shape)}{image.dtype}".encode(), digest_size=20)
+        digest.update(_checksums(image).cpu().numpy().tobytes())
+        return digest.hexdigest()
+
+    def image_keys(self, images: Tensor, keys: Optional[Union[Tensor, Sequence[Hashable]]] = None) -> List[Hashable]:
+        """Get the keys of a batch of images.
+
+        Args:
+            images: the images of shape :math:`(B, C, H, W)`.
+            keys: the keys of the images, e.g. their ids, as a sequence or a tensor of shape :math:`(B,)`. The
+                images are hashed if None.
+
+        Returns:
+            the keys of the images.
+
+        """
+        if keys is None:
+            return [self.image_key(image) for image in images]
+        keys = keys.tolist() if isinstance(keys, Tensor) else list(keys)
+        KORNIA_CHECK(len(keys) == len(images), f"Expected one key per image. Got {len(keys)} and {len(images)}.")
+        return keys
+
+    def get(self, key: Hashable) -> Optional[_Features]:
+        """Get the features stored under a key, or None if there are none.
+
+        Args:
+            key: the key of the image.
+
+        """
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return self._memory[key][0]
+        if key in self._disk:
+            path, device = self._disk.pop(key)
+            features = {k: v.to(device) for k, v in torch.load(path, map_location="cpu").items()}
+            os.remove(path)
+            self.hits += 1
+            self.put(key, features)
+            return features
+        self.misses += 1
+        return None
+
+    def put(self, key: Hashable, features: _Features) -> None:
+        """Store the features of an image, evicting the least recently used ones beyond the budget.
+
+        Args:
+            key: the key of the image.
+            features: the features of the image.
+
+        """
+        self.discard(key)
+        features = {k: v.detach() for k, v in features.items()}
+        nbytes = _nbytes(features)
+        self._memory[key] = (features, nbytes)
+        self._nbytes += nbytes
+        while self._nbytes > self.max_bytes and self._memory:
+            self._evict()
+
+    def discard(self, key: Hashable) -> None:
+        """Remove the features stored under a key, if any."""
+        if key in self._memory:
+            self._nbytes -= self._memory.pop(key)[1]
+        if key in self._disk:
+            os.remove(self._disk.pop(key)[0])
+
+    def clear(self) -> None:
+        """Remove all the features."""
+        for key in list(self._disk):
+            self.discard(key)
+        self._memory.clear()
+        self._nbytes = 0
+
+    def get_batch(
+        self,
+        namespace: str,
+        images: Tensor,
+        compute: Callable[[Tensor], _Features],
+        keys: Optional[Union[Tensor, Sequence[Hashable]]] = None,
+    ) -> _Features:
+        """Get the features of a batch of images, computing only the missing ones.
+
+        The missing images are processed in a single call of ``compute``, once each if they appear several times in
+        the batch.
+
+        Args:
+            namespace: the namespace of the features, e.g. the name of the model computing them.
+            images: the images of shape :math:`(B, C, H, W)`.
+            compute: the function computing the features of a batch of images, as a dictionary of tensors with the
+                samples in the first dimension.
+            keys: the keys of the images, e.g. their ids, as a sequence or a tensor of shape :math:`(B,)`. The
+                images are hashed if None.
+
+        Returns:
+            the features of the batch, concatenated over the images.
+
+        """
+        full_keys = [(namespace, key) for key in self.image_keys(images, keys)]
+
+        found: Dict[Hashable, _Features] = {}
+        missing: Dict[Hashable, int] = {}
+        for idx, key in enumerate(full_keys):
+            if key in found or key in missing:
+                continue
+            features = self.get(key)
+            if features is None:
+                missing[key] = idx
+            else:
+                found[key] = features
+        if len(missing) > 0:
+            computed = compute(images[list(missing.values())])
+            for pos, missing_key in enumerate(missing):
+                # a view would keep the storage of the whole batch alive, beyond the bytes accounted for
+                features = {k: v[pos : pos + 1].clone() for k, v in computed.items()}
+                found[missing_key] = features
+                self.put(missing_key, features)
+
+        names = list(found[full_keys[0]].keys())
+        try:
+            return {name: concatenate([found[key][name] for key in full_keys], 0) for name in names}
+        except RuntimeError as e:
+            raise RuntimeError("The features of the images of a batch must have the same shapes.") from e
+
+    def _evict(self) -> None:
+        key, (features, nbytes) = self._memory.popitem(last=False)
+        self._nbytes -= nbytes
+        if self.spill_dir is None:
+            return
+        os.makedirs(self.spill_dir, exist_ok=True)
+        path = os.path.join(self.spill_dir, f"{hashlib.blake2b(repr(key).encode(), digest_size=20).hexdigest()}.pt")
+        device = next(iter(features.values())).device if features else torch.device("cpu")
+        torch.save({k: v.cpu() for k, v in features.items()}, path)
+        self._disk[key] = (path, device)
+
+    def __del__(self) -> None:
+        if getattr(self, "_tmpdir", None) is not None:
+            self._tmpdir.cleanup()  # type: ignore[union-attr]
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(max_bytes={self.max_bytes}, spill_dir={self.spill_dir}, "
+            f"in_memory={len(self._memory)}, on_disk={len(self._disk)})"
+        )
@@ -0,0 +1,194 @@
+# LICENSE HEADER MANAGED BY add-license-header
+#
+# Copyright 2018 Kornia Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Approximate nearest neighbor search over a fixed set of descriptors."""
+
+import math
+from typing import List, Optional, Tuple
+
+import torch
+
+from kornia.core import Module, Tensor
+from kornia.core.check import KORNIA_CHECK, KORNIA_CHECK_SHAPE
+
+__all__ = ["DescriptorIndex"]
+
+
+class DescriptorIndex(Module):
+    r"""Inverted file (IVF) index for approximate nearest neighbor search of descriptors.
+
+    The reference descriptors are clustered by k-means into ``num_lists`` inverted lists. A query is only compared
+    with the descriptors of the ``num_probes`` lists whose centroids are the closest, which divides the cost of the
+    brute-force search by about ``num_lists / num_probes``. The distances returned are exact L2 distances, only
+    the neighbors stored in the lists which were not probed can be missed.
+
+    The index is built once with :meth:`build` and queried many times with :meth:`search`, e.g. when matching
+    frames against the same target. It can be given to :class:`~kornia.feature.DescriptorMatcher`.
+
+    Args:
+        num_lists: number of inverted lists. Default: :math:`\sqrt{N}` for :math:`N` reference descriptors.
+        num_probes: number of lists visited per query. Probing all the lists gives the exact neighbors.
+        num_iters: number of k-means iterations.
+        max_memory: memory budget of the distance tiles computed at once by :meth:`search`, in bytes.
+
+    Example:
+        >>> desc = torch.rand(1000, 128)
+        >>> index = DescriptorIndex(num_lists=16, num_probes=4).build(desc)
+        >>> dists, idxs = index.search(torch.rand(10, 128), k=2)
+        >>> idxs.shape
+        torch.Size([10, 2])
+
+    """
+
+    def __init__(
+        self, num_lists: Optional[int] = None, num_probes: int = 8, num_iters: int = 10, max_memory: int = 2**28
+    ) -> None:
+        super().__init__()
+        self.num_lists = num_lists
+        self.num_probes = num_probes
+        self.num_iters = num_iters
+        self.max_memory = max_memory
+
+        self.reference: Optional[Tensor] = None
+        self._reference_version = -1
+        self.centroids: Tensor
+        self.order: Tensor
+        self.sorted_descriptors: Tensor
+        self.list_sizes: List[int] = []
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(num_lists={self.num_lists}, num_probes={self.num_probes}, "
+            f"num_iters={self.num_iters}, max_memory={self.max_memory})"
+        )
+
+    @property
+    def is_built(self) -> bool:
+        return self.reference is not None
+
+    def is_built_on(self, desc: Tensor) -> bool:
+        """Return whether the index was built on these descriptors, which were not modified since."""
+        ref = self.reference
+        return (
+            ref is not None
+            and desc.data_ptr() == ref.data_ptr()
+            and desc.shape == ref.shape
+            and desc.stride() == ref.stride()
+            and desc.device == ref.device
+            and desc._version == self._reference_version
+        )
+
+    def empty_like(self) -> "DescriptorIndex":
+        """Return an index with the same parameters, not built yet."""
+        return DescriptorIndex(self.num_lists, self.num_probes, self.num_iters, self.max_memory)
+
+    @torch.no_grad()
+    def build(self, desc: Tensor) -> "DescriptorIndex":
+        """Cluster the reference descriptors into the inverted lists.
+
+        Args:
+            desc: reference descriptors of a shape :math:`(N, D)`.
+
+        Returns:
+            the index itself.
+
+        """
+        KORNIA_CHECK_SHAPE(desc, ["N", "DIM"])
+        N = desc.shape[0]
+        num_lists = self.num_lists if self.num_lists is not None else int(math.sqrt(N))
+        num_lists = max(1, min(num_lists, N))
+        # k-means, initialized with evenly strided reference descriptors, the global random state is left untouched
+        centroids = desc[torch.arange(num_lists, device=desc.device) * N // num_lists].clone()
+        assign = torch.zeros(N, dtype=torch.long, device=desc.device)
+        for i in range(self.num_iters + 1):
+            assign = self._nearest_centroids(desc, centroids, 1)[:, 0]
+            if i == self.num_iters:
+                break
+            sums = torch.zeros_like(centroids).index_add_(0, assign, desc)
+            counts = torch.bincount(assign, minlength=num_lists).to(desc.dtype)[:, None]
+            # empty lists keep their previous centroid
+            centroids = torch.where(counts > 0, sums / counts.clamp(min=1), centroids)
+
+        self.centroids = centroids
+        # the reference descriptors are stored contiguously, list after list
+        self.order = assign.argsort(stable=True)
+        self.sorted_descriptors = desc[self.order]
+        self.list_sizes = torch.bincount(assign, minlength=num_lists).tolist()
+        self.reference = desc
+        self._reference_version = desc._version
+        return self
+
+    def _nearest_centroids(self, desc: Tensor, centroids: Tensor, k: int) -> Tensor:
+        step = max(1, self.max_memory // (2 * desc.element_size() * len(centroids)))
+        out = [torch.cdist(d, centroids).topk(k, dim=1, largest=False)[1] for d in desc.split(step)]
+        return torch.cat(out)
+
+    @torch.no_grad()
+    def search(self, query: Tensor, k: int = 2) -> Tuple[Tensor, Tensor]:
+        """Find approximate nearest neighbors of the queries among the reference descriptors.
+
+        Args:
+            query: query descriptors of a shape :math:`(Q, D)`.
+            k: number of neighbors.
+
+        Returns:
+            - The L2 distances to the neighbors in ascending order, shape of :math:`(Q, k)`. Missing neighbors,
+              e.g. when the probed lists hold less than ``k`` descriptors, get an infinite distance.
+            - The indexes of the neighbors in the reference descriptors, shape of :math:`(Q, k)`.
+
+        """
+        KORNIA_CHECK(self.is_built, "The index must be built before searching it.")
+        KORNIA_CHECK_SHAPE(query, ["Q", "DIM"])
+        KORNIA_CHECK(
+            query.shape[1] == self.centroids.shape[1],
+            f"Query dimension {query.shape[1]} does not match the index dimension {self.centroids.shape[1]}.",
+        )
+        num_lists = len(self.list_sizes)
+        num_probes = min(self.num_probes, num_lists)
+        Q = query.shape[0]
+        dists = query.new_full((Q, k), float("inf"))
+        idxs = torch.zeros(Q, k, dtype=torch.long, device=query.device)
+        if Q == 0:
+            return dists, idxs
+        # (query, probed list) pairs, grouped by list so that each list is compared with all its queries at once
+        probes = self._nearest_centroids(query, self.centroids, num_probes).flatten()
+        pair_order = probes.argsort(stable=True)
+        pair_queries = query[pair_order // num_probes]
+        pair_counts = torch.bincount(probes, minlength=num_lists).tolist()
+        cand_dists = query.new_full((len(probes), k), float("inf"))
+        cand_idxs = torch.zeros(len(probes), k, dtype=torch.long, device=query.device)
+        pair_start, list_start = 0, 0
+        for num_pairs, list_size in zip(pair_counts, self.list_sizes):
+            if num_pairs > 0 and list_size > 0:
+                step = max(1, self.max_memory // (2 * query.element_size() * list_size))
+                ref = self.sorted_descriptors[list_start : list_start + list_size]
+                for s in range(pair_start, pair_start + num_pairs, step):
+                    e = min(s + step, pair_start + num_pairs)
+                    vals, pos = torch.cdist(pair_queries[s:e], ref).topk(min(k, list_size), dim=1, largest=False)
+                    cand_dists[s:e, : vals.shape[1]] = vals
+                    cand_idxs[s:e, : vals.shape[1]] = self.order[list_start + pos]
+            pair_start += num_pairs
+            list_start += list_size
+        # back to the query order, then merge the candidates of the probed lists
+        unsorted_dists, unsorted_idxs = torch.empty_like(cand_dists), torch.empty_like(cand_idxs)
+        unsorted_dists[pair_order], unsorted_idxs[pair_order] = cand_dists, cand_idxs
+        unsorted_dists, unsorted_idxs = unsorted_dists.view(Q, -1), unsorted_idxs.view(Q, -1)
+        kk = min(k, unsorted_dists.shape[1])
+        best_dists, best_pos = unsorted_dists.topk(kk, dim=1, largest=False)
+        dists[:, :kk] = best_dists
+        idxs[:, :kk] = unsorted_idxs.gather(1, best_pos)
+        return dists, idxs
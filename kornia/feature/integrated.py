@@ -16,23 +16,24 @@
 #
 
 import warnings
-from typing import ClassVar, Dict, List, Optional, Tuple
+from typing import Any, ClassVar, Dict, List, Optional, Sequence, Tuple, cast
 
 import torch
 
 from kornia.color import rgb_to_grayscale
 from kornia.constants import pi
 from kornia.core import Device, Module, Tensor, concatenate, deg2rad
-from kornia.core.check import KORNIA_CHECK_LAF
+from kornia.core.check import KORNIA_CHECK, KORNIA_CHECK_LAF
 from kornia.geometry.subpix import ConvQuadInterp3d
 from kornia.geometry.transform import ScalePyramid
 
 from .affine_shape import LAFAffNetShapeEstimator
+from .cache import FeatureCache
 from .hardnet import HardNet
 from .keynet import KeyNetDetector
 from .laf import extract_patches_from_pyramid, get_laf_center, get_laf_orientation, get_laf_scale, scale_laf
 from .lightglue import LightGlue
-from .matching import GeometryAwareDescriptorMatcher, _no_match
+from .matching import DescriptorMatcher, GeometryAwareDescriptorMatcher, _no_match
 from .orientation import LAFOrienter, OriNet, PassLAF
 from .responses import BlobDoG, BlobDoGSingle, BlobHessian, CornerGFTT
 from .scale_space_detector import (
@@ -45,7 +46,13 @@ from .siftdesc import SIFTDescriptor
 
 
 def get_laf_descriptors(
-    img: Tensor, lafs: Tensor, patch_descriptor: Module, patch_size: int = 32, grayscale_descriptor: bool = True
+    img: Tensor,
+    lafs: Tensor,
+    patch_descriptor: Module,
+    patch_size: int = 32,
+    grayscale_descriptor: bool = True,
+    chunk_size: Optional[int] = None,
+    pyramid: Optional[List[Tensor]] = None,
 ) -> Tensor:
     r"""Get local descriptors, corresponding to LAFs (keypoints).
 
@@ -56,6 +63,10 @@ def get_laf_descriptors(
             or :class:`~kornia.feature.HardNet`.
         patch_size: patch size in pixels, which descriptor expects.
         grayscale_descriptor: True if ``patch_descriptor`` expects single-channel image.
+        chunk_size: maximum number of patches sampled at once,
+            see :func:`~kornia.feature.extract_patches_from_pyramid`. Default: all at once.
+        pyramid: optional precomputed levels of ``img``,
+            see :func:`~kornia.feature.extract_patches_from_pyramid`.
 
     Returns:
         Local descriptors of shape :math:`(B,N,D)` where :math:`D` is descriptor size.
@@ -71,8 +82,10 @@ def get_laf_descriptors(
         return torch.empty(lafs.shape[0], lafs.shape[1], 128, dtype=lafs.dtype, device=lafs.device)
     if grayscale_descriptor and img.size(1) == 3:
         timg = rgb_to_grayscale(img)
+        if pyramid is not None:
+            pyramid = [rgb_to_grayscale(level) for level in pyramid]
 
-    patches: Tensor = extract_patches_from_pyramid(timg, lafs, patch_size)
+    patches: Tensor = extract_patches_from_pyramid(timg, lafs, patch_size, chunk_size=chunk_size, pyramid=pyramid)
     # Descriptor accepts standard tensor [B, CH, H, W], while patches are [B, N, CH, H, W] shape
     # So we need to reshape a bit :)
     B, N, CH, H, W = patches.size()
@@ -89,11 +102,17 @@ class LAFDescriptor(Module):
             or :class:`~kornia.feature.HardNet`. Default: :class:`~kornia.feature.HardNet`.
         patch_size: patch size in pixels, which descriptor expects.
         grayscale_descriptor: ``True`` if patch_descriptor expects single-channel image.
+        chunk_size: maximum number of patches sampled at once, bounds the memory of the patch extraction.
+            Default: all at once.
 
     """
 
     def __init__(
-        self, patch_descriptor_module: Optional[Module] = None, patch_size: int = 32, grayscale_descriptor: bool = True
+        self,
+        patch_descriptor_module: Optional[Module] = None,
+        patch_size: int = 32,
+        grayscale_descriptor: bool = True,
+        chunk_size: Optional[int] = None,
     ) -> None:
         super().__init__()
         if patch_descriptor_module is None:
@@ -101,6 +120,7 @@ class LAFDescriptor(Module):
         self.descriptor = patch_descriptor_module
         self.patch_size = patch_size
         self.grayscale_descriptor = grayscale_descriptor
+        self.chunk_size = chunk_size
 
     def __repr__(self) -> str:
         return (
@@ -124,7 +144,9 @@ class LAFDescriptor(Module):
             Local descriptors of shape :math:`(B,N,D)` where :math:`D` is descriptor size.
 
         """
-        return get_laf_descriptors(img, lafs, self.descriptor, self.patch_size, self.grayscale_descriptor)
+        return get_laf_descriptors(
+            img, lafs, self.descriptor, self.patch_size, self.grayscale_descriptor, chunk_size=self.chunk_size
+        )
 
 
 class LocalFeature(Module):
@@ -329,7 +351,10 @@ class LocalFeatureMatcher(Module):
 
     Args:
         local_feature: Local feature detector. See :class:`~kornia.feature.GFTTAffNetHardNet`.
-        matcher: Descriptor matcher, see :class:`~kornia.feature.DescriptorMatcher`.
+        matcher: Descriptor matcher, see :class:`~kornia.feature.DescriptorMatcher`, or a geometry-aware matcher, see
+            :class:`~kornia.feature.LightGlueMatcher`.
+        cache: a cache of the features of the images, so that the features of an image matched against several
+            others are extracted once, see :class:`~kornia.feature.FeatureCache`. It is not used in training mode.
 
     Returns:
         Dict[str, Tensor]: Dictionary with image correspondences and confidence scores.
@@ -345,10 +370,11 @@ class LocalFeatureMatcher(Module):
 
     """
 
-    def __init__(self, local_feature: Module, matcher: Module) -> None:
+    def __init__(self, local_feature: Module, matcher: Module, cache: Optional[FeatureCache] = None) -> None:
         super().__init__()
         self.local_feature = local_feature
         self.matcher = matcher
+        self.cache = cache
         self.eval()
 
     def extract_features(self, image: Tensor, mask: Optional[Tensor] = None) -> Dict[str, Tensor]:
@@ -356,6 +382,28 @@ class LocalFeatureMatcher(Module):
         lafs0, resps0, descs0 = self.local_feature(image, mask)
         return {"lafs": lafs0, "responses": resps0, "descriptors": descs0}
 
+    def _get_features(self, data: Dict[str, Tensor], idx: int) -> Dict[str, Tensor]:
+        image = data[f"image{idx}"]
+        if self.cache is None or self.training:
+            return self.extract_features(image)
+        namespace = f"{self.local_feature.__class__.__name__}-{id(self.local_feature)}"
+        return self.cache.get_batch(namespace, image, self.extract_features, data.get(f"keys{idx}", None))
+
+    def _matches_batch(self, num_pairs: int) -> bool:
+        """Whether the pairs are matched at once, i.e. exactly and with the whole distance matrices."""
+        matcher = self.matcher
+        if not isinstance(matcher, DescriptorMatcher) or num_pairs < 2:
+            return False
+        return matcher.index is None and matcher.max_memory is None
+
+    def _match(self, data: Dict[str, Tensor], descs0: Tensor, descs1: Tensor, lafs0: Tensor, lafs1: Tensor) -> Any:
+        if isinstance(self.matcher, LightGlueMatcher):
+            hw0, hw1 = data["image0"].shape[-2:], data["image1"].shape[-2:]
+            return self.matcher(descs0, descs1, lafs0[None], lafs1[None], (hw0[0], hw0[1]), (hw1[0], hw1[1]))
+        if isinstance(self.matcher, GeometryAwareDescriptorMatcher):
+            return self.matcher(descs0, descs1, lafs0[None], lafs1[None])
+        return self.matcher(descs0, descs1)
+
     def no_match_output(self, device: Device, dtype: torch.dtype) -> Dict[str, Tensor]:
         return {
             "keypoints0": torch.empty(0, 2, device=device, dtype=dtype),
@@ -377,6 +425,9 @@ class LocalFeatureMatcher(Module):
             image1: right image with shape :math:`(N, 1, H2, W2)`.
             mask0 (optional): left image mask. '0' indicates a padded position :math:`(N, H1, W1)`.
             mask1 (optional): right image mask. '0' indicates a padded position :math:`(N, H2, W2)`.
+            keys0 (optional): the keys of the left images in the cache, e.g. their ids, :math:`(N)`. The images are
+                hashed if not given.
+            keys1 (optional): the keys of the right images in the cache :math:`(N)`.
 
         Returns:
             - ``keypoints0``, matching keypoints from image0 :math:`(NC, 2)`.
@@ -391,13 +442,13 @@ class LocalFeatureMatcher(Module):
 
         if ("lafs0" not in data.keys()) or ("descriptors0" not in data.keys()):
             # One can supply pre-extracted local features
-            feats_dict0: Dict[str, Tensor] = self.extract_features(data["image0"])
+            feats_dict0: Dict[str, Tensor] = self._get_features(data, 0)
             lafs0, descs0 = feats_dict0["lafs"], feats_dict0["descriptors"]
         else:
             lafs0, descs0 = data["lafs0"], data["descriptors0"]
 
         if ("lafs1" not in data.keys()) or ("descriptors1" not in data.keys()):
-            feats_dict1: Dict[str, Tensor] = self.extract_features(data["image1"])
+            feats_dict1: Dict[str, Tensor] = self._get_features(data, 1)
             lafs1, descs1 = feats_dict1["lafs"], feats_dict1["descriptors"]
         else:
             lafs1, descs1 = data["lafs1"], data["descriptors1"]
@@ -405,6 +456,20 @@ class LocalFeatureMatcher(Module):
         keypoints0: Tensor = get_laf_center(lafs0)
         keypoints1: Tensor = get_laf_center(lafs1)
 
+        if self._matches_batch(len(descs0)):
+            # all the pairs are matched at once
+            dists, idxs, batch_idxs = cast(DescriptorMatcher, self.matcher).match_batch(descs0, descs1)
+            if len(idxs) == 0:
+                return self.no_match_output(data["image0"].device, data["image0"].dtype)
+            return {
+                "keypoints0": keypoints0[batch_idxs, idxs[:, 0]].view(-1, 2),
+                "keypoints1": keypoints1[batch_idxs, idxs[:, 1]].view(-1, 2),
+                "lafs0": lafs0[batch_idxs, idxs[:, 0]].view(1, -1, 2, 3),
+                "lafs1": lafs1[batch_idxs, idxs[:, 1]].view(1, -1, 2, 3),
+                "confidence": (1.0 - dists).view(-1),
+                "batch_indexes": batch_idxs,
+            }
+
         out_keypoints0: List[Tensor] = []
         out_keypoints1: List[Tensor] = []
         out_confidence: List[Tensor] = []
@@ -413,7 +478,7 @@ class LocalFeatureMatcher(Module):
         out_lafs1: List[Tensor] = []
 
         for batch_idx in range(num_image_pairs):
-            dists, idxs = self.matcher(descs0[batch_idx], descs1[batch_idx])
+            dists, idxs = self._match(data, descs0[batch_idx], descs1[batch_idx], lafs0[batch_idx], lafs1[batch_idx])
             if len(idxs) == 0:
                 continue
 
@@ -503,45 +568,71 @@ class LightGlueMatcher(GeometryAwareDescriptorMatcher):
         """
         if (desc1.shape[0] < 2) or (desc2.shape[0] < 2):
             return _no_match(desc1)
-        keypoints1 = get_laf_center(lafs1)
-        keypoints2 = get_laf_center(lafs2)
-        if len(desc1.shape) == 2:
-            desc1 = desc1.unsqueeze(0)
-        if len(desc2.shape) == 2:
-            desc2 = desc2.unsqueeze(0)
-        dev = lafs1.device
-        if hw1 is None:
-            hw1_ = keypoints1.max(dim=1)[0].squeeze().flip(0)
-        else:
-            hw1_ = torch.tensor(hw1, device=dev)
-        if hw2 is None:
-            hw2_ = keypoints2.max(dim=1)[0].squeeze().flip(0)
-        else:
-            hw2_ = torch.tensor(hw2, device=dev)
-        ori0 = deg2rad(get_laf_orientation(lafs1).reshape(1, -1))
-        ori0[ori0 < 0] += 2.0 * pi
-        ori1 = deg2rad(get_laf_orientation(lafs2).reshape(1, -1))
-        ori1[ori1 < 0] += 2.0 * pi
-        input_dict = {
-            "image0": {
-                "keypoints": keypoints1,
-                "scales": get_laf_scale(lafs1).reshape(1, -1),
-                "oris": ori0,
-                "lafs": lafs1,
-                "descriptors": desc1,
-                "image_size": hw1_.flip(0).reshape(-1, 2).to(dev),
-            },
-            "image1": {
-                "keypoints": keypoints2,
-                "lafs": lafs2,
-                "scales": get_laf_scale(lafs2).reshape(1, -1),
-                "oris": ori1,
-                "descriptors": desc2,
-                "image_size": hw2_.flip(0).reshape(-1, 2).to(dev),
-            },
-        }
+        input_dict = {"image0": self._image_data(desc1, lafs1, hw1), "image1": self._image_data(desc2, lafs2, hw2)}
         pred = self.matcher(input_dict)
         matches0, mscores0 = pred["matches0"], pred["matching_scores0"]
         valid = matches0 > -1
         matches = torch.stack([torch.where(valid)[1], matches0[valid]], -1)
         return mscores0[valid].reshape(-1, 1), matches
+
+    def match_shortlist(
+        self,
+        desc1: Tensor,
+        descs2: Sequence[Tensor],
+        lafs1: Tensor,
+        lafs2: Sequence[Tensor],
+        hw1: Optional[Tuple[int, int]] = None,
+        hw2: Optional[Sequence[Optional[Tuple[int, int]]]] = None,
+    ) -> Tuple[Tensor, Tensor, Tensor]:
+        """Match the descriptors of one image against those of several images at once.
+
+        All the pairs go through LightGlue together, see :meth:`~kornia.feature.LightGlue.match_shortlist`. The
+        matches of every pair are the same as those of :meth:`forward`, and in the same order.
+
+        Args:
+            desc1: Batch of descriptors of a shape :math:`(B1, D)`.
+            descs2: K batches of descriptors of a shape :math:`(B2_k, D)`.
+            lafs1: LAFs of a shape :math:`(1, B1, 2, 3)`.
+            lafs2: K LAFs of a shape :math:`(1, B2_k, 2, 3)`.
+            hw1: Height/width of image.
+            hw2: Height/width of the K images.
+
+        Return:
+            - Descriptor distance of matching descriptors, shape of :math:`(B3, 1)`.
+            - Long tensor indexes of matching descriptors in desc1 and the desc2 of their pair, shape of
+              :math:`(B3, 2)`.
+            - Long tensor indexes of the pairs of the matches, shape of :math:`(B3,)`.
+
+        """
+        KORNIA_CHECK(len(descs2) == len(lafs2), "Expected as many LAFs as descriptors")
+        hw2 = [None] * len(descs2) if hw2 is None else hw2
+        # like forward, the images with less than two descriptors have no match
+        pairs = [k for k, desc2 in enumerate(descs2) if desc2.shape[0] >= 2]
+        if desc1.shape[0] < 2 or len(pairs) == 0:
+            dists, idxs = _no_match(desc1)
+            return dists, idxs, idxs[:, 0]
+        pred = self.matcher.match_shortlist(
+            self._image_data(desc1, lafs1, hw1), [self._image_data(descs2[k], lafs2[k], hw2[k]) for k in pairs]
+        )
+        pair_idxs = torch.tensor(pairs, device=desc1.device)[pred["pair_idxs"]]
+        return pred["scores"].reshape(-1, 1), pred["matches"], pair_idxs
+
+    def _image_data(self, desc: Tensor, lafs: Tensor, hw: Optional[Tuple[int, int]] = None) -> Dict[str, Tensor]:
+        keypoints = get_laf_center(lafs)
+        if len(desc.shape) == 2:
+            desc = desc.unsqueeze(0)
+        dev = lafs.device
+        if hw is None:
+            hw_ = keypoints.max(dim=1)[0].squeeze().flip(0)
+        else:
+            hw_ = torch.tensor(hw, device=dev)
+        ori = deg2rad(get_laf_orientation(lafs).reshape(1, -1))
+        ori[ori < 0] += 2.0 * pi
+        return {
+            "keypoints": keypoints,
+            "scales": get_laf_scale(lafs).reshape(1, -1),
+            "oris": ori,
+            "lafs": lafs,
+            "descriptors": desc,
+            "image_size": hw_.flip(0).reshape(-1, 2).to(dev),
+        }
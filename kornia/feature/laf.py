@@ -22,10 +22,12 @@ import torch
 import torch.nn.functional as F
 
 from kornia.core import Tensor, concatenate, cos, sin, stack, tensor, zeros
+from kornia.core.capabilities import needs_host_fallback
 from kornia.core.check import KORNIA_CHECK_LAF, KORNIA_CHECK_SHAPE
 from kornia.geometry.conversions import angle_to_rotation_matrix, convert_points_from_homogeneous, rad2deg
 from kornia.geometry.linalg import transform_points
 from kornia.geometry.transform import pyrdown
+from kornia.utils.misc import pad_by_batch_indexes
 
 
 def get_laf_scale(LAF: Tensor) -> Tensor:
@@ -105,8 +107,7 @@ def rotate_laf(LAF: Tensor, angles_degrees: Tensor) -> Tensor:
     B, N = LAF.shape[:2]
     rotmat = angle_to_rotation_matrix(angles_degrees).view(B * N, 2, 2)
     out_laf = LAF.clone()
-    # SDAA torch.bmm not support fp64
-    if LAF.dtype == torch.float64 and 'sdaa' in LAF.device.type:
+    if needs_host_fallback("matmul", LAF):
         device = LAF.device
         out_laf[:, :, :2, :2] = torch.bmm(LAF[:, :, :2, :2].reshape(B * N, 2, 2).cpu(), rotmat.cpu()).to(device).reshape(B, N, 2, 2)
     else:
@@ -288,8 +289,7 @@ def laf_to_boundary_points(LAF: Tensor, n_pts: int = 50) -> Tensor:
     pts = pts.to(LAF.device).to(LAF.dtype)
     aux = tensor([0.0, 0.0, 1.0]).view(1, 1, 3).expand(B * N, 1, 3)
     HLAF = concatenate([LAF.view(-1, 2, 3), aux.to(LAF.device).to(LAF.dtype)], dim=1)
-    # SDAA torch.bmm not support fp64
-    if pts.dtype == torch.float64 and 'sdaa' in pts.device.type:
+    if needs_host_fallback("matmul", pts):
         device = pts.device
         pts_h = torch.bmm(HLAF.cpu(), pts.permute(0, 2, 1).cpu()).permute(0, 2, 1).to(device)
     else:
@@ -406,13 +406,34 @@ def generate_patch_grid_from_normalized_LAF(img: Tensor, LAF: Tensor, PS: int =
     LAF_renorm = denormalize_laf(LAF, img)
 
     grid = F.affine_grid(LAF_renorm.view(B * N, 2, 3), [B * N, ch, PS, PS], align_corners=False)
-    grid[..., :, 0] = 2.0 * grid[..., :, 0].clone() / float(w - 1) - 1.0
-    grid[..., :, 1] = 2.0 * grid[..., :, 1].clone() / float(h - 1) - 1.0
-    return grid
+    return 2.0 * grid / tensor([w - 1, h - 1], device=grid.device, dtype=grid.dtype) - 1.0
+
+
+def _sample_patches(img: Tensor, nlaf: Tensor, PS: int, chunk_size: Optional[int] = None) -> Tensor:
+    r"""Sample the patches of normalized LAFs from their images in a single ``grid_sample`` call per chunk.
+
+    The grids of the N patches of an image are stacked into one :math:`(N \cdot PS, PS)` grid, so the image is
+    sampled as is instead of being expanded N times.
+    """
+    B, N = nlaf.shape[:2]
+    ch = img.shape[1]
+    out = img.new_empty(B, N, ch, PS, PS)
+    step = N if chunk_size is None else max(1, chunk_size // max(B, 1))
+    for start in range(0, N, max(step, 1)):
+        nlaf_chunk = nlaf[:, start : start + step]
+        n = nlaf_chunk.shape[1]
+        grid = generate_patch_grid_from_normalized_LAF(img, nlaf_chunk, PS).to(img.device)
+        patches = F.grid_sample(img, grid.view(B, n * PS, PS, 2), padding_mode="border", align_corners=False)
+        out[:, start : start + n] = patches.view(B, ch, n, PS, PS).permute(0, 2, 1, 3, 4)
+    return out
 
 
 def extract_patches_simple(
-    img: Tensor, laf: Tensor, PS: int = 32, normalize_lafs_before_extraction: bool = True
+    img: Tensor,
+    laf: Tensor,
+    PS: int = 32,
+    normalize_lafs_before_extraction: bool = True,
+    chunk_size: Optional[int] = None,
 ) -> Tensor:
     """Extract patches defined by LAFs from image tensor.
 
@@ -423,6 +444,8 @@ def extract_patches_simple(
         laf: :math:`(B, N, 2, 3)`.
         PS: patch size.
         normalize_lafs_before_extraction: if True, lafs are normalized to image size.
+        chunk_size: maximum number of patches sampled at once, bounds the temporary memory to about
+            ``chunk_size * PS * PS * (CH + 2)`` elements. Default: all at once.
 
     Returns:
         patches with shape :math:`(B, N, CH, PS,PS)`.
@@ -433,22 +456,16 @@ def extract_patches_simple(
         nlaf = normalize_laf(laf, img)
     else:
         nlaf = laf
-    _, ch, h, w = img.size()
-    B, N, _, _ = laf.size()
-    out = []
-    # for loop temporarily, to be refactored
-    for i in range(B):
-        grid = generate_patch_grid_from_normalized_LAF(img[i : i + 1], nlaf[i : i + 1], PS).to(img.device)
-        out.append(
-            F.grid_sample(
-                img[i : i + 1].expand(grid.size(0), ch, h, w), grid, padding_mode="border", align_corners=False
-            )
-        )
-    return concatenate(out, dim=0).view(B, N, ch, PS, PS)
+    return _sample_patches(img, nlaf, PS, chunk_size)
 
 
 def extract_patches_from_pyramid(
-    img: Tensor, laf: Tensor, PS: int = 32, normalize_lafs_before_extraction: bool = True
+    img: Tensor,
+    laf: Tensor,
+    PS: int = 32,
+    normalize_lafs_before_extraction: bool = True,
+    chunk_size: Optional[int] = None,
+    pyramid: Optional[List[Tensor]] = None,
 ) -> Tensor:
     """Extract patches defined by LAFs from image tensor.
 
@@ -459,6 +476,11 @@ def extract_patches_from_pyramid(
         laf: :math:`(B, N, 2, 3)`.
         PS: patch size.
         normalize_lafs_before_extraction: if True, lafs are normalized to image size.
+        chunk_size: maximum number of patches sampled at once, bounds the temporary memory to about
+            ``chunk_size * PS * PS * (CH + 2)`` elements. Default: all the patches of a level at once.
+        pyramid: optional precomputed levels :math:`[(B, CH, H / 2^i, W / 2^i)]`, starting with ``img``, e.g. the
+            first image of every octave of :class:`~kornia.geometry.ScalePyramid` computed without upsampling.
+            Default: built with :func:`~kornia.geometry.transform.pyrdown`, only down to the coarsest level needed.
 
     Returns:
         patches with shape :math:`(B, N, CH, PS,PS)`.
@@ -470,32 +492,27 @@ def extract_patches_from_pyramid(
     else:
         nlaf = laf
     B, N, _, _ = laf.size()
-    _, ch, h, w = img.size()
+    _, ch, _, _ = img.size()
     scale = 2.0 * get_laf_scale(denormalize_laf(nlaf, img)) / float(PS)
     max_level = min(img.size(2), img.size(3)) // PS
-    pyr_idx = scale.log2().clamp(min=0.0, max=max(0, max_level - 1)).long()
+    if pyramid is not None:
+        max_level = min(max_level, len(pyramid))
+    pyr_idx = scale.log2().clamp(min=0.0, max=max(0, max_level - 1)).long().view(B, N)
+    out = zeros(B, N, ch, PS, PS, device=nlaf.device, dtype=nlaf.dtype)
+    if N == 0:
+        return out
+    num_levels = int(pyr_idx.max()) + 1
     cur_img = img
-    cur_pyr_level = 0
-    out = torch.zeros(B, N, ch, PS, PS).to(nlaf.dtype).to(nlaf.device)
-    we_are_in_business = True
-    while we_are_in_business:
-        _, ch, h, w = cur_img.size()
-        # for loop temporarily, to be refactored
-        for i in range(B):
-            scale_mask = (pyr_idx[i] == cur_pyr_level).squeeze()
-            if (scale_mask.float().sum().item()) == 0:
-                continue
-            scale_mask = (scale_mask > 0).view(-1)
-            grid = generate_patch_grid_from_normalized_LAF(cur_img[i : i + 1], nlaf[i : i + 1, scale_mask, :, :], PS)
-            patches = F.grid_sample(
-                cur_img[i : i + 1].expand(grid.shape[0], ch, h, w), grid, padding_mode="border", align_corners=False
-            )
-            out[i].masked_scatter_(scale_mask.view(-1, 1, 1, 1), patches.to(nlaf.dtype))
-        we_are_in_business = min(cur_img.size(2), cur_img.size(3)) >= PS
-        if not we_are_in_business:
-            break
-        cur_img = pyrdown(cur_img)
-        cur_pyr_level += 1
+    for cur_pyr_level in range(num_levels):
+        if cur_pyr_level > 0:
+            cur_img = pyramid[cur_pyr_level] if pyramid is not None else pyrdown(cur_img)
+        batch_idx, laf_idx = (pyr_idx == cur_pyr_level).nonzero(as_tuple=True)
+        if len(batch_idx) == 0:
+            continue
+        # the LAFs of the level are packed per image, so that every image is sampled once
+        level_laf, level_mask = pad_by_batch_indexes(nlaf[batch_idx, laf_idx], batch_idx, B)
+        patches = _sample_patches(cur_img, level_laf, PS, chunk_size)
+        out[batch_idx, laf_idx] = patches[level_mask].to(nlaf.dtype)
     return out
 
 
@@ -519,9 +536,11 @@ def laf_is_inside_image(laf: Tensor, images: Tensor, border: int = 0) -> Tensor:
     good_lafs_mask = (
         (pts[..., 0] >= border) * (pts[..., 0] <= w - border) * (pts[..., 1] >= border) * (pts[..., 1] <= h - border)
     )
-    # SDAA argmin not implemented for 'Bool'
-    device = good_lafs_mask.device
-    good_lafs_mask = good_lafs_mask.cpu().min(dim=2)[0].to(device)
+    if needs_host_fallback("reduce_bool", good_lafs_mask):
+        device = good_lafs_mask.device
+        good_lafs_mask = good_lafs_mask.cpu().min(dim=2)[0].to(device)
+    else:
+        good_lafs_mask = good_lafs_mask.min(dim=2)[0]
     return good_lafs_mask
 
 
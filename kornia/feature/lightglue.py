@@ -19,7 +19,7 @@ import math
 import warnings
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Any, Callable, ClassVar, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Sequence, Tuple, cast
 
 import torch
 import torch.nn.functional as F
@@ -117,7 +117,7 @@ class TokenConfidence(Module):
 
     def forward(self, desc0: Tensor, desc1: Tensor) -> Tuple[Tensor, Tensor]:
         """Get confidence tokens."""
-        dtype = self.token[0].weight.dtype
+        dtype = next(self.token.parameters()).dtype
         orig_dtype = desc0.dtype
         return (
             self.token(desc0.detach().to(dtype)).squeeze(-1).to(orig_dtype),
@@ -273,22 +273,39 @@ class TransformerLayer(Module):
     def masked_forward(
         self, desc0: Tensor, desc1: Tensor, encoding0: Tensor, encoding1: Tensor, mask0: Tensor, mask1: Tensor
     ) -> Tensor:
-        mask = mask0 & mask1.transpose(-1, -2)
-        mask0 = mask0 & mask0.transpose(-1, -2)
-        mask1 = mask1 & mask1.transpose(-1, -2)
+        # the masks are broadcast over the heads
+        mask = (mask0 & mask1.transpose(-1, -2)).unsqueeze(1)
+        mask0 = (mask0 & mask0.transpose(-1, -2)).unsqueeze(1)
+        mask1 = (mask1 & mask1.transpose(-1, -2)).unsqueeze(1)
         desc0 = self.self_attn(desc0, encoding0, mask0)
         desc1 = self.self_attn(desc1, encoding1, mask1)
         return self.cross_attn(desc0, desc1, mask)
 
 
-def sigmoid_log_double_softmax(sim: Tensor, z0: Tensor, z1: Tensor) -> Tensor:
-    """Create the log assignment matrix from logits and similarity."""
+def _attention_masks(keep0: Tensor, keep1: Tensor, pruned0: bool) -> Tuple[Optional[Tensor], Tensor, Tensor]:
+    """Get the self-attention and cross-attention masks of the points kept in a batch of pairs [B x N x 1]."""
+    # the mask of image0 is skipped until its points may have been pruned, as it is not padded
+    mask0 = (keep0 & keep0.transpose(-1, -2)).unsqueeze(1) if pruned0 else None
+    mask1 = (keep1 & keep1.transpose(-1, -2)).unsqueeze(1)
+    return mask0, mask1, (keep0 & keep1.transpose(-1, -2)).unsqueeze(1)
+
+
+def sigmoid_log_double_softmax(sim: Tensor, z0: Tensor, z1: Tensor, mask: Optional[Tensor] = None) -> Tensor:
+    """Create the log assignment matrix from logits and similarity.
+
+    The pairs of points out of ``mask`` [B x M x N], if given, get a log assignment of -inf.
+    """
     b, m, n = sim.shape
+    if mask is not None:
+        sim = sim.masked_fill(~mask, -float("inf"))
     certainties = F.logsigmoid(z0) + F.logsigmoid(z1).transpose(1, 2)
     scores0 = F.log_softmax(sim, 2)
     scores1 = F.log_softmax(sim.transpose(-1, -2).contiguous(), 2).transpose(-1, -2)
     scores = sim.new_full((b, m + 1, n + 1), 0)
     scores[:, :m, :n] = scores0 + scores1 + certainties
+    if mask is not None:
+        # the rows and columns without any valid pair are NaN
+        scores[:, :m, :n] = scores[:, :m, :n].masked_fill(~mask, -float("inf"))
     scores[:, :-1, -1] = F.logsigmoid(-z0.squeeze(-1))
     scores[:, -1, :-1] = F.logsigmoid(-z1.squeeze(-1))
     return scores
@@ -301,15 +318,15 @@ class MatchAssignment(Module):
         self.matchability = nn.Linear(dim, 1, bias=True)
         self.final_proj = nn.Linear(dim, dim, bias=True)
 
-    def forward(self, desc0: Tensor, desc1: Tensor) -> Tuple[Tensor, Tensor]:
-        """Build assignment matrix from descriptors."""
+    def forward(self, desc0: Tensor, desc1: Tensor, mask: Optional[Tensor] = None) -> Tuple[Tensor, Tensor]:
+        """Build assignment matrix from descriptors, restricted to the pairs of points in ``mask`` if given."""
         mdesc0, mdesc1 = self.final_proj(desc0), self.final_proj(desc1)
         _, _, d = mdesc0.shape
         mdesc0, mdesc1 = mdesc0 / d**0.25, mdesc1 / d**0.25
         sim = einsum("bmd,bnd->bmn", mdesc0, mdesc1)
         z0 = self.matchability(desc0)
         z1 = self.matchability(desc1)
-        scores = sigmoid_log_double_softmax(sim, z0, z1)
+        scores = sigmoid_log_double_softmax(sim, z0, z1, mask)
         return scores, sim
 
     def get_matchability(self, desc: Tensor) -> Tensor:
@@ -336,6 +353,8 @@ def filter_matches(scores: Tensor, th: float) -> Tuple[Tensor, Tensor, Tensor, T
 
 
 class LightGlue(Module):
+    confidence_thresholds: Tensor
+
     default_conf: ClassVar[Dict[str, Any]] = {
         "name": "lightglue",  # just for interfacing
         "input_dim": 256,  # input descriptor dimension (autoselected from weights)
@@ -489,8 +508,9 @@ class LightGlue(Module):
             )
 
         for i in range(self.conf.n_layers):
-            self.transformers[i].masked_forward = torch.compile(  # type: ignore[assignment]
-                self.transformers[i].masked_forward, mode=mode, fullgraph=True
+            layer = cast(TransformerLayer, self.transformers[i])
+            layer.masked_forward = torch.compile(  # type: ignore[method-assign]
+                layer.masked_forward, mode=mode, fullgraph=True
             )
 
         self.static_lengths = static_lengths  # type: ignore
@@ -526,42 +546,8 @@ class LightGlue(Module):
         b, m, _ = kpts0.shape
         b, n, _ = kpts1.shape
         device = kpts0.device
-        size0, size1 = data0.get("image_size"), data1.get("image_size")
-        size0 = size0 if size0 is not None else data0["image"].shape[-2:][::-1]
-        size1 = size1 if size1 is not None else data1["image"].shape[-2:][::-1]
-
-        kpts0 = normalize_keypoints(kpts0, size0).clone()
-        kpts1 = normalize_keypoints(kpts1, size1).clone()
-        KORNIA_CHECK(torch.all(kpts0 >= -1).item() and torch.all(kpts0 <= 1).item(), "")  # type: ignore
-        KORNIA_CHECK(torch.all(kpts1 >= -1).item() and torch.all(kpts1 <= 1).item(), "")  # type: ignore
-        if self.conf.add_scale_ori:
-            kpts0 = concatenate([kpts0] + [data0[k].unsqueeze(-1) for k in ("scales", "oris")], -1)
-            if self.conf.scale_coef != 1.0:
-                kpts0[..., -2] = kpts0[..., -2] * self.conf.scale_coef
-            kpts1 = concatenate([kpts1] + [data1[k].unsqueeze(-1) for k in ("scales", "oris")], -1)
-            if self.conf.scale_coef != 1.0:
-                kpts1[..., -2] = kpts1[..., -2] * self.conf.scale_coef
-        elif self.conf.add_laf:
-            laf0 = scale_laf(data0["lafs"], self.conf.scale_coef)
-            laf1 = scale_laf(data1["lafs"], self.conf.scale_coef)
-            laf0 = laf_to_three_points(laf0)
-            laf1 = laf_to_three_points(laf1)
-            kpts0 = concatenate(
-                [
-                    kpts0,
-                    normalize_keypoints(laf0[..., 0], size0).clone().to(kpts0.dtype),
-                    normalize_keypoints(laf0[..., 1], size0).clone().to(kpts0.dtype),
-                ],
-                -1,
-            )
-            kpts1 = concatenate(
-                [
-                    kpts1,
-                    normalize_keypoints(laf1[..., 0], size1).clone().to(kpts1.dtype),
-                    normalize_keypoints(laf1[..., 1], size1).clone().to(kpts1.dtype),
-                ],
-                -1,
-            )
+        kpts0 = self._prepare_keypoints(data0)
+        kpts1 = self._prepare_keypoints(data1)
 
         desc0 = data0["descriptors"].detach().contiguous()
         desc1 = data1["descriptors"].detach().contiguous()
@@ -609,7 +595,7 @@ class LightGlue(Module):
                 if self.check_if_stop(token0[..., :m, :], token1[..., :n, :], i, m + n):
                     break
             if do_point_pruning and desc0.shape[-2] > pruning_th:
-                scores0 = self.log_assignment[i].get_matchability(desc0)
+                scores0 = cast(MatchAssignment, self.log_assignment[i]).get_matchability(desc0)
                 prunemask0 = self.get_pruning_mask(token0, scores0, i)  # type: ignore
                 keep0 = where(prunemask0)[1]
                 ind0 = ind0.index_select(1, keep0)
@@ -617,7 +603,7 @@ class LightGlue(Module):
                 encoding0 = encoding0.index_select(-2, keep0)
                 prune0[:, ind0] += 1
             if do_point_pruning and desc1.shape[-2] > pruning_th:
-                scores1 = self.log_assignment[i].get_matchability(desc1)
+                scores1 = cast(MatchAssignment, self.log_assignment[i]).get_matchability(desc1)
                 prunemask1 = self.get_pruning_mask(token1, scores1, i)  # type: ignore
                 keep1 = where(prunemask1)[1]
                 ind1 = ind1.index_select(1, keep1)
@@ -645,8 +631,8 @@ class LightGlue(Module):
             m1_ = torch.full((b, n), -1, device=m1.device, dtype=m1.dtype)
             m0_[:, ind0] = where(m0 == -1, -1, ind1.gather(1, m0.clamp(min=0)))
             m1_[:, ind1] = where(m1 == -1, -1, ind0.gather(1, m1.clamp(min=0)))
-            mscores0_ = zeros((b, m), device=mscores0.device)
-            mscores1_ = zeros((b, n), device=mscores1.device)
+            mscores0_ = zeros((b, m), device=mscores0.device, dtype=mscores0.dtype)
+            mscores1_ = zeros((b, n), device=mscores1.device, dtype=mscores1.dtype)
             mscores0_[:, ind0] = mscores0
             mscores1_[:, ind1] = mscores1
             m0, m1, mscores0, mscores1 = m0_, m1_, mscores0_, mscores1_
@@ -669,6 +655,192 @@ class LightGlue(Module):
 
         return pred
 
+    def match_shortlist(
+        self, query: Dict[str, Tensor], candidates: Sequence[Dict[str, Tensor]], batched: Optional[bool] = None
+    ) -> Dict[str, Tensor]:
+        """Match the keypoints of one image against those of several images at once.
+
+        The candidates may have different numbers of keypoints: they are padded to the largest number and masked out
+        of the attention, so that all the pairs go through the model together. The input projection, the positional
+        encoding and the first self-attention of the query are computed once and shared by all the pairs. The early
+        stopping and the point pruning are decided per pair, so that the matches are the same as those of
+        :meth:`forward` run on every pair. This saves the launches of the model on accelerators; on CPU, where the
+        pairs gain nothing from running together, the padding makes it slower than :meth:`forward` in a loop.
+
+        Args:
+            query: the image to match.
+            candidates: the images to match the query against.
+            batched: whether to run the pairs together. By default, only on accelerators; the pairs are otherwise
+                matched one by one with :meth:`forward`.
+
+        Input:
+            query: dict, as image0 of :meth:`forward`, for a single image
+                keypoints: [1 x M x 2]
+                descriptors: [1 x M x D]
+                image: [1 x C x H x W] or image_size: [1 x 2]
+            candidates: List[dict], as image1 of :meth:`forward`, for a single image each
+                keypoints: [1 x Nk x 2]
+                descriptors: [1 x Nk x D]
+                image: [1 x C x H x W] or image_size: [1 x 2]
+        Output (dict):
+            matches: [S x 2], the indexes of the matching keypoints in the query and in their candidate
+            scores: [S]
+            pair_idxs: [S], the index of the candidate of every match
+            stop: [K], the number of layers run for every candidate
+        """
+        KORNIA_CHECK(len(candidates) > 0, "Expected at least one candidate")
+        if batched is None:
+            batched = query["keypoints"].device.type != "cpu"
+        if not batched:
+            return self._match_pairs(query, candidates)
+        with torch.autocast(enabled=self.conf.mp, device_type="cuda"):
+            return self._match_shortlist(query, candidates)
+
+    def _match_pairs(self, query: dict, candidates: Sequence[dict]) -> dict:  # type: ignore
+        preds = [self({"image0": query, "image1": data}) for data in candidates]
+        matches = concatenate([pred["matches"][0] for pred in preds])
+        device = matches.device
+        return {
+            "matches": matches,
+            "scores": concatenate([pred["scores"][0] for pred in preds]),
+            "pair_idxs": concatenate(
+                [torch.full((len(pred["matches"][0]),), k, device=device) for k, pred in enumerate(preds)]
+            ),
+            "stop": torch.tensor([pred["stop"] for pred in preds], device=device),
+        }
+
+    def _match_shortlist(self, query: dict, candidates: Sequence[dict]) -> dict:  # type: ignore
+        for data in [query, *candidates]:
+            KORNIA_CHECK(data["keypoints"].shape[0] == 1, "Expected a single image per query and candidate")
+            KORNIA_CHECK(
+                data["descriptors"].shape[-1] == self.conf.input_dim,
+                "Descriptor dimension does not match input dim in config",
+            )
+        num_pairs = len(candidates)
+        lengths = [data["keypoints"].shape[1] for data in candidates]
+        m, n = query["keypoints"].shape[1], max(lengths)
+        device = query["keypoints"].device
+
+        kpts0 = self._prepare_keypoints(query)
+        desc0 = query["descriptors"].detach().contiguous()
+        padded1 = [pad_to_length(self._prepare_keypoints(data), n) for data in candidates]
+        kpts1 = concatenate([kpts for kpts, _ in padded1], 0)
+        desc1 = concatenate([pad_to_length(data["descriptors"].detach(), n)[0] for data in candidates], 0)
+        desc1 = desc1.contiguous()
+        # the keypoints of every pair which are neither padding nor pruned
+        keep0 = ones(num_pairs, m, 1, dtype=torch.bool, device=device)
+        keep1 = concatenate([keep for _, keep in padded1], 0)
+        num_points = torch.tensor(lengths, device=device) + m
+
+        if torch.is_autocast_enabled():
+            desc0 = desc0.half()
+            desc1 = desc1.half()
+        desc0 = self.input_proj(desc0)
+        desc1 = self.input_proj(desc1)
+        encoding0 = self.posenc(kpts0)
+        encoding1 = self.posenc(kpts1)
+
+        # the first self-attention of the query does not depend on the candidates
+        layers = [cast(TransformerLayer, layer) for layer in self.transformers]
+        assignments = [cast(MatchAssignment, assignment) for assignment in self.log_assignment]
+        desc0 = layers[0].self_attn(desc0, encoding0).expand(num_pairs, -1, -1)
+        encoding0 = encoding0.expand(-1, num_pairs, -1, -1, -1)
+        # the query is not padded, its points are masked once they may have been pruned
+        pruned0 = False
+        masks = _attention_masks(keep0, keep1, pruned0)
+
+        # the descriptors of the pairs are stored when they stop, the others go on with the next layers
+        final0, final1 = desc0.new_empty(desc0.shape), desc1.new_empty(desc1.shape)
+        final_keep0, final_keep1 = keep0.clone(), keep1.clone()
+        stop = torch.full((num_pairs,), self.conf.n_layers, device=device)
+        active = arange(num_pairs, device=device)
+        do_early_stop = self.conf.depth_confidence > 0
+        do_point_pruning = self.conf.width_confidence > 0
+        pruning_th = self.pruning_min_kpts(device)
+        for i in range(self.conf.n_layers):
+            layer = layers[i]
+            if i > 0:
+                desc0 = layer.self_attn(desc0, encoding0, masks[0])
+            desc1 = layer.self_attn(desc1, encoding1, masks[1])
+            desc0, desc1 = layer.cross_attn(desc0, desc1, masks[2])
+            if i == self.conf.n_layers - 1:
+                continue  # no early stopping or adaptive width at last layer
+
+            token0, token1 = None, None
+            if do_early_stop:
+                token0, token1 = self.token_confidence[i](desc0, desc1)
+                threshold = self.confidence_thresholds[i]
+                unconfident0 = (token0 < threshold) & keep0[..., 0]
+                unconfident1 = (token1 < threshold) & keep1[..., 0]
+                done = 1.0 - (unconfident0.sum(1) + unconfident1.sum(1)) / num_points > self.conf.depth_confidence
+                if done.any():
+                    idxs = active[done]
+                    stop[idxs] = i + 1
+                    final0[idxs], final1[idxs] = desc0[done], desc1[done]
+                    final_keep0[idxs], final_keep1[idxs] = keep0[done], keep1[done]
+                    go_on = ~done
+                    if not go_on.any():
+                        break
+                    active, desc0, desc1, keep0, keep1 = (t[go_on] for t in (active, desc0, desc1, keep0, keep1))
+                    token0, token1, num_points = token0[go_on], token1[go_on], num_points[go_on]
+                    encoding0, encoding1 = encoding0[:, go_on], encoding1[:, go_on]
+                    masks = _attention_masks(keep0, keep1, pruned0)
+            if do_point_pruning:
+                prune0 = keep0[..., 0].sum(1, keepdim=True) > pruning_th
+                scores0 = assignments[i].get_matchability(desc0)
+                keep0 = keep0 & (self.get_pruning_mask(token0, scores0, i) | ~prune0)[..., None]  # type: ignore
+                prune1 = keep1[..., 0].sum(1, keepdim=True) > pruning_th
+                scores1 = assignments[i].get_matchability(desc1)
+                keep1 = keep1 & (self.get_pruning_mask(token1, scores1, i) | ~prune1)[..., None]  # type: ignore
+                pruned0 = pruned0 or m > pruning_th
+                masks = _attention_masks(keep0, keep1, pruned0)
+        else:  # the pairs which did not stop early
+            final0[active], final1[active] = desc0, desc1
+            final_keep0[active], final_keep1[active] = keep0, keep1
+
+        matches, mscores, pair_idxs = [], [], []
+        for num_layers in stop.unique().tolist():
+            idxs = where(stop == num_layers)[0]
+            keep0, keep1 = final_keep0[idxs], final_keep1[idxs]
+            mask = keep0 & keep1.transpose(-1, -2)
+            scores, _ = assignments[num_layers - 1](final0[idxs], final1[idxs], mask)
+            m0, _, mscores0, _ = filter_matches(scores, self.conf.filter_threshold)
+            valid = (m0 > -1) & keep0[..., 0]
+            pair, m_indices_0 = where(valid)
+            matches.append(stack([m_indices_0, m0[valid]], -1))
+            mscores.append(mscores0[valid])
+            pair_idxs.append(idxs[pair])
+        pair_idxs_, order = torch.sort(concatenate(pair_idxs), stable=True)
+
+        return {
+            "matches": concatenate(matches)[order],
+            "scores": concatenate(mscores)[order],
+            "pair_idxs": pair_idxs_,
+            "stop": stop,
+        }
+
+    def _prepare_keypoints(self, data: dict) -> Tensor:  # type: ignore
+        """Normalize the keypoints of an image and append their scales and orientations, or their LAFs."""
+        size = data.get("image_size")
+        size = size if size is not None else data["image"].shape[-2:][::-1]
+        kpts = normalize_keypoints(data["keypoints"], size).clone()
+        KORNIA_CHECK(torch.all(kpts >= -1).item() and torch.all(kpts <= 1).item(), "")  # type: ignore
+        if self.conf.add_scale_ori:
+            kpts = concatenate([kpts] + [data[k].unsqueeze(-1) for k in ("scales", "oris")], -1)
+            if self.conf.scale_coef != 1.0:
+                kpts[..., -2] = kpts[..., -2] * self.conf.scale_coef
+        elif self.conf.add_laf:
+            laf = laf_to_three_points(scale_laf(data["lafs"], self.conf.scale_coef))
+            kpts = concatenate(
+                [
+                    kpts,
+                    normalize_keypoints(laf[..., 0], size).clone().to(kpts.dtype),
+                    normalize_keypoints(laf[..., 1], size).clone().to(kpts.dtype),
+                ],
+                -1,
+            )
+        return kpts
+
     def confidence_threshold(self, layer_index: int) -> float:
         """Scaled confidence threshold."""
         threshold = 0.8 + 0.1 * math.exp(-4.0 * layer_index / self.conf.n_layers)
@@ -22,6 +22,7 @@ from typing import Any, Optional
 import torch
 
 from kornia.core import Module, Tensor
+from kornia.feature.cache import FeatureCache
 from kornia.geometry import resize
 
 from .backbone import build_backbone
@@ -80,6 +81,8 @@ class LoFTR(Module):
         pretrained: Download and set pretrained weights to the model. Options: 'outdoor', 'indoor'.
                     'outdoor' is trained on the MegaDepth dataset and 'indoor'
                     on the ScanNet.
+        cache: a cache of the features of the CNN backbone, so that the features of an image matched against several
+            others are computed once, see :class:`~kornia.feature.FeatureCache`. It is not used in training mode.
 
     Returns:
         Dictionary with image correspondences and confidence scores.
@@ -93,7 +96,12 @@ class LoFTR(Module):
 
     """
 
-    def __init__(self, pretrained: Optional[str] = "outdoor", config: dict[str, Any] = default_cfg) -> None:
+    def __init__(
+        self,
+        pretrained: Optional[str] = "outdoor",
+        config: dict[str, Any] = default_cfg,
+        cache: Optional[FeatureCache] = None,
+    ) -> None:
         super().__init__()
         # Misc
         self.config = config
@@ -110,6 +118,7 @@ class LoFTR(Module):
         self.loftr_fine = LocalFeatureTransformer(config["fine"])
         self.fine_matching = FineMatching()
         self.pretrained = pretrained
+        self.cache = cache
         if pretrained is not None:
             if pretrained not in urls.keys():
                 raise ValueError(f"pretrained should be None or one of {urls.keys()}")
@@ -129,6 +138,9 @@ class LoFTR(Module):
             image1: right image with shape :math:`(N, 1, H2, W2)`.
             mask0 (optional): left image mask. '0' indicates a padded position :math:`(N, H1, W1)`.
             mask1 (optional): right image mask. '0' indicates a padded position :math:`(N, H2, W2)`.
+            keys0 (optional): the keys of the left images in the cache, e.g. their ids, :math:`(N)`. The images are
+                hashed if not given.
+            keys1 (optional): the keys of the right images in the cache :math:`(N)`.
 
         Returns:
             - ``keypoints0``, matching keypoints from image0 :math:`(NC, 2)`.
@@ -144,7 +156,9 @@ class LoFTR(Module):
             "hw1_i": data["image1"].shape[2:],
         }
 
-        if _data["hw0_i"] == _data["hw1_i"]:  # faster & better BN convergence
+        if self.cache is not None and not self.training:
+            (feat_c0, feat_f0), (feat_c1, feat_f1) = self._cached_backbone(data)
+        elif _data["hw0_i"] == _data["hw1_i"]:  # faster & better BN convergence
             feats_c, feats_f = self.backbone(torch.cat([data["image0"], data["image1"]], dim=0))
             (feat_c0, feat_c1), (feat_f0, feat_f1) = feats_c.split(_data["bs"]), feats_f.split(_data["bs"])
         else:  # handle different input shapes
@@ -205,6 +219,29 @@ class LoFTR(Module):
                 raise TypeError(f"Expected Tensor for item `{k}`. Gotcha {type(_d)}")
         return out
 
+    def _cached_backbone(self, data: dict[str, Tensor]) -> list[tuple[Tensor, Tensor]]:
+        """Run the backbone on the images missing from the cache, at once if they have the same shape."""
+        cache = self.cache
+        if cache is None:
+            raise TypeError("Expected a feature cache.")
+        namespace = f"{self.backbone.__class__.__name__}-{id(self.backbone)}"
+
+        def backbone(images: Tensor) -> dict[str, Tensor]:
+            feat_c, feat_f = self.backbone(images)
+            return {"coarse": feat_c, "fine": feat_f}
+
+        keys = [cache.image_keys(data[f"image{i}"], data.get(f"keys{i}", None)) for i in range(2)]
+        if data["image0"].shape[1:] == data["image1"].shape[1:]:
+            images = torch.cat([data["image0"], data["image1"]], dim=0)
+            feats = cache.get_batch(namespace, images, backbone, keys[0] + keys[1])
+            bs = data["image0"].size(0)
+            return [(feats["coarse"][:bs], feats["fine"][:bs]), (feats["coarse"][bs:], feats["fine"][bs:])]
+        out = []
+        for i in range(2):
+            feats = cache.get_batch(namespace, data[f"image{i}"], backbone, keys[i])
+            out.append((feats["coarse"], feats["fine"]))
+        return out
+
     def load_state_dict(self, state_dict: dict[str, Any], *args: Any, **kwargs: Any) -> Any:  # type: ignore[override]
         for k in list(state_dict.keys()):
             if k.startswith("matcher."):
@@ -20,7 +20,9 @@ from typing import Any, ClassVar, Dict, List, Optional, Tuple
 import torch
 
 from kornia.core import Module, Tensor, concatenate
+from kornia.core.capabilities import needs_host_fallback
 from kornia.core.check import KORNIA_CHECK_DM_DESC, KORNIA_CHECK_SHAPE
+from kornia.feature.descriptor_index import DescriptorIndex
 from kornia.feature.laf import get_laf_center
 from kornia.feature.steerers import DiscreteSteerer
 from kornia.utils.helpers import is_mps_tensor_safe
@@ -32,9 +34,9 @@ def _cdist(d1: Tensor, d2: Tensor) -> Tensor:
     r"""Manual `torch.cdist` for M1."""
     if (not is_mps_tensor_safe(d1)) and (not is_mps_tensor_safe(d2)):
         return torch.cdist(d1, d2)
-    d1_sq = (d1**2).sum(dim=1, keepdim=True)
-    d2_sq = (d2**2).sum(dim=1, keepdim=True)
-    dm = d1_sq.repeat(1, d2.size(0)) + d2_sq.repeat(1, d1.size(0)).t() - 2.0 * d1 @ d2.t()
+    d1_sq = (d1**2).sum(dim=-1, keepdim=True)
+    d2_sq = (d2**2).sum(dim=-1, keepdim=True)
+    dm = d1_sq + d2_sq.transpose(-2, -1) - 2.0 * d1 @ d2.transpose(-2, -1)
     dm = dm.clamp(min=0.0).sqrt()
     return dm
 
@@ -75,6 +77,108 @@ def _no_match(dm: Tensor) -> Tuple[Tensor, Tensor]:
     return dists, idxs
 
 
+def _merge_top2(vals: Tensor, idxs: Tensor, new_vals: Tensor, new_idxs: Tensor) -> Tuple[Tensor, Tensor]:
+    """Merge running two smallest distances per row with the ones of a new block of candidates."""
+    all_vals = concatenate([vals, new_vals], 1)
+    merged_vals, pos = torch.topk(all_vals, 2, dim=1, largest=False)
+    return merged_vals, concatenate([idxs, new_idxs], 1).gather(1, pos)
+
+
+def _top2_tiled(
+    desc1: Tensor, desc2: Tensor, max_memory: int, both_ways: bool = True
+) -> Tuple[Tensor, Tensor, Tensor, Tensor]:
+    r"""Find the two nearest neighbors of every descriptor without materializing the full distance matrix.
+
+    The distance matrix is streamed in tiles fitting in ``max_memory`` bytes, keeping running two smallest distances
+    and their indexes for the rows and, if ``both_ways``, for the columns.
+
+    Args:
+        desc1: Batch of descriptors of a shape :math:`(B1, D)`.
+        desc2: Batch of descriptors of a shape :math:`(B2, D)`.
+        max_memory: memory budget of a distance tile and its merge buffer, in bytes.
+        both_ways: also search the nearest neighbors of desc2 in desc1.
+
+    Returns:
+        - Two smallest distances from desc1 to desc2, shape of :math:`(B1, 2)`, padded with inf.
+        - Their indexes in desc2, shape of :math:`(B1, 2)`.
+        - Two smallest distances from desc2 to desc1, shape of :math:`(B2, 2)`, inf if not ``both_ways``.
+        - Their indexes in desc1, shape of :math:`(B2, 2)`.
+
+    """
+    B1, B2 = desc1.shape[0], desc2.shape[0]
+    vals1 = torch.full((B1, 2), float("inf"), device=desc1.device, dtype=desc1.dtype)
+    idxs1 = torch.zeros(B1, 2, device=desc1.device, dtype=torch.long)
+    vals2 = torch.full((B2, 2), float("inf"), device=desc1.device, dtype=desc1.dtype)
+    idxs2 = torch.zeros(B2, 2, device=desc1.device, dtype=torch.long)
+    tile_size = max(1, max_memory // (2 * desc1.element_size()))
+    cols = max(1, min(B2, tile_size))
+    rows = max(1, min(B1, tile_size // cols))
+    for r0 in range(0, B1, rows):
+        r1 = min(r0 + rows, B1)
+        for c0 in range(0, B2, cols):
+            c1 = min(c0 + cols, B2)
+            dm = _cdist(desc1[r0:r1], desc2[c0:c1])
+            k = min(2, c1 - c0)
+            v, i = torch.topk(dm, k, dim=1, largest=False)
+            vals1[r0:r1], idxs1[r0:r1] = _merge_top2(vals1[r0:r1], idxs1[r0:r1], v, i + c0)
+            if both_ways:
+                k = min(2, r1 - r0)
+                v, i = torch.topk(dm.t(), k, dim=1, largest=False)
+                vals2[c0:c1], idxs2[c0:c1] = _merge_top2(vals2[c0:c1], idxs2[c0:c1], v, i + r0)
+    return vals1, idxs1, vals2, idxs2
+
+
+def _mutual_matches(vals1: Tensor, idxs1: Tensor, vals2: Tensor, idxs2: Tensor) -> Tuple[Tensor, Tensor]:
+    """Mutual nearest neighbors from the nearest neighbors in both directions, ordered like :func:`match_mnn`."""
+    B1, B2 = vals1.shape[0], vals2.shape[0]
+    if B1 <= B2:
+        idxs_in1 = torch.arange(B1, device=idxs1.device)
+        mutual = idxs2[idxs1[:, 0], 0] == idxs_in1
+        matches_idxs = torch.stack([idxs_in1, idxs1[:, 0]], 1)[mutual]
+        match_dists = vals1[:, 0][mutual]
+    else:
+        idxs_in2 = torch.arange(B2, device=idxs2.device)
+        mutual = idxs1[idxs2[:, 0], 0] == idxs_in2
+        matches_idxs = torch.stack([idxs2[:, 0], idxs_in2], 1)[mutual]
+        match_dists = vals2[:, 0][mutual]
+    return match_dists.view(-1, 1), matches_idxs.view(-1, 2)
+
+
+def _snn_matches(vals1: Tensor, idxs1: Tensor, th: float) -> Tuple[Tensor, Tensor]:
+    """Matches passing the second nearest neighbor ratio test, like :func:`match_snn`."""
+    ratio = vals1[:, 0] / vals1[:, 1]
+    mask = ratio <= th
+    idxs_in1 = torch.arange(vals1.shape[0], device=idxs1.device)
+    matches_idxs = torch.stack([idxs_in1, idxs1[:, 0]], 1)[mask]
+    return ratio[mask].view(-1, 1), matches_idxs.view(-1, 2)
+
+
+def _smnn_matches(vals1: Tensor, idxs1: Tensor, vals2: Tensor, idxs2: Tensor, th: float) -> Tuple[Tensor, Tensor]:
+    """Mutual matches passing the ratio test in both directions, like :func:`match_smnn`.
+
+    The mutual check compares the nearest neighbor indexes directly.
+    """
+    ratio1 = vals1[:, 0] / vals1[:, 1]
+    ratio2 = vals2[:, 0] / vals2[:, 1]
+    nn12 = idxs1[:, 0]
+    idxs_in1 = torch.arange(vals1.shape[0], device=idxs1.device)
+    ratio2_nn = ratio2[nn12]
+    mask = (ratio1 <= th) & (ratio2_nn <= th) & (idxs2[nn12, 0] == idxs_in1)
+    match_dists = torch.max(ratio1, ratio2_nn)[mask]
+    matches_idxs = torch.stack([idxs_in1, nn12], 1)[mask]
+    return match_dists.view(-1, 1), matches_idxs.view(-1, 2)
+
+
+def _top2_batched(dm: Tensor) -> Tuple[Tensor, Tensor]:
+    """Two smallest distances of every row of batched distance matrices, padded with inf."""
+    k = min(2, dm.shape[-1])
+    vals, idxs = torch.topk(dm, k, dim=-1, largest=False)
+    if k < 2:
+        vals = torch.nn.functional.pad(vals, (0, 2 - k), value=float("inf"))
+        idxs = torch.nn.functional.pad(idxs, (0, 2 - k))
+    return vals, idxs
+
+
 def match_nn(desc1: Tensor, desc2: Tensor, dm: Optional[Tensor] = None) -> Tuple[Tensor, Tensor]:
     r"""Find nearest neighbors in desc2 for each vector in desc1.
 
@@ -166,8 +270,7 @@ def match_snn(desc1: Tensor, desc2: Tensor, th: float = 0.8, dm: Optional[Tensor
     if desc2.shape[0] < 2:  # We cannot perform snn check, so output empty matches
         return _no_match(desc1)
     distance_matrix = _get_lazy_distance_matrix(desc1, desc2, dm)
-    # SDAA not support input shape <= 0
-    if len(distance_matrix) == 0:
+    if len(distance_matrix) == 0 and needs_host_fallback("topk_empty", distance_matrix):
         device = distance_matrix.device
         vals, idxs_in_2 = torch.topk(distance_matrix.cpu(), 2, dim=1, largest=False)
         vals, idxs_in_2 = vals.to(device), idxs_in_2.to(device)
@@ -210,32 +313,11 @@ def match_smnn(desc1: Tensor, desc2: Tensor, th: float = 0.95, dm: Optional[Tens
     if (desc1.shape[0] < 2) or (desc2.shape[0] < 2):
         return _no_match(desc1)
     distance_matrix = _get_lazy_distance_matrix(desc1, desc2, dm)
-
-    dists1, idx1 = match_snn(desc1, desc2, th, distance_matrix)
-    dists2, idx2 = match_snn(desc2, desc1, th, distance_matrix.t())
-
-    if len(dists2) > 0 and len(dists1) > 0:
-        idx2 = idx2.flip(1)
-        if not is_mps_tensor_safe(idx1):
-            idxs_dm = torch.cdist(idx1.float(), idx2.float(), p=1.0)
-        else:
-            idxs1_rep = idx1.to(desc1).repeat_interleave(idx2.size(0), dim=0)
-            idxs_dm = (idx2.to(desc2).repeat(idx1.size(0), 1) - idxs1_rep).abs().sum(dim=1)
-            idxs_dm = idxs_dm.reshape(idx1.size(0), idx2.size(0))
-        mutual_idxs1 = idxs_dm.min(dim=1)[0] < 1e-8
-        mutual_idxs2 = idxs_dm.min(dim=0)[0] < 1e-8
-        good_idxs1 = idx1[mutual_idxs1.view(-1)]
-        good_idxs2 = idx2[mutual_idxs2.view(-1)]
-        dists1_good = dists1[mutual_idxs1.view(-1)]
-        dists2_good = dists2[mutual_idxs2.view(-1)]
-        _, idx_upl1 = torch.sort(good_idxs1[:, 0])
-        _, idx_upl2 = torch.sort(good_idxs2[:, 0])
-        good_idxs1 = good_idxs1[idx_upl1]
-        match_dists = torch.max(dists1_good[idx_upl1], dists2_good[idx_upl2])
-        matches_idxs = good_idxs1
-        match_dists, matches_idxs = match_dists.view(-1, 1), matches_idxs.view(-1, 2)
-    else:
-        match_dists, matches_idxs = _no_match(distance_matrix)
+    vals1, idxs1 = torch.topk(distance_matrix, 2, dim=1, largest=False)
+    vals2, idxs2 = torch.topk(distance_matrix.t(), 2, dim=1, largest=False)
+    match_dists, matches_idxs = _smnn_matches(vals1, idxs1, vals2, idxs2, th)
+    if len(match_dists) == 0:
+        return _no_match(distance_matrix)
     return match_dists, matches_idxs
 
 
@@ -326,10 +408,31 @@ class DescriptorMatcher(Module):
     Args:
         match_mode: type of matching, can be `nn`, `snn`, `mnn`, `smnn`.
         th: threshold on distance ratio, or other quality measure.
+        max_memory: if set, the distance matrix is never built as a whole. It is streamed in tiles of at most
+            about ``max_memory`` bytes, keeping only the two nearest neighbors of every descriptor, which allows
+            matching descriptor sets whose distance matrix does not fit in memory.
+        index: if set, the nearest neighbors are searched approximately with this
+            :class:`~kornia.feature.DescriptorIndex`. Build it with :meth:`build_index` on the reference descriptors,
+            either ``desc1`` or ``desc2``, which are then recognized on every call and not indexed again. The other
+            set, and the reference set when it was not indexed, are indexed on the fly when needed.
+
+    Example:
+        >>> desc1, desc2 = torch.rand(100, 128), torch.rand(50, 128)
+        >>> dists, idxs = DescriptorMatcher("smnn", 0.95, max_memory=2**12)(desc1, desc2)
+
+        >>> matcher = DescriptorMatcher("snn", 0.9, index=DescriptorIndex(num_lists=8, num_probes=2))
+        >>> matcher.build_index(desc2)
+        >>> dists, idxs = matcher(desc1, desc2)
 
     """
 
-    def __init__(self, match_mode: str = "snn", th: float = 0.8) -> None:
+    def __init__(
+        self,
+        match_mode: str = "snn",
+        th: float = 0.8,
+        max_memory: Optional[int] = None,
+        index: Optional[DescriptorIndex] = None,
+    ) -> None:
         super().__init__()
         _match_mode: str = match_mode.lower()
         self.known_modes = ["nn", "mnn", "snn", "smnn"]
@@ -337,6 +440,8 @@ class DescriptorMatcher(Module):
             raise NotImplementedError(f"{match_mode} is not supported. Try one of {self.known_modes}")
         self.match_mode = _match_mode
         self.th = th
+        self.max_memory = max_memory
+        self.index = index
 
     def forward(self, desc1: Tensor, desc2: Tensor) -> Tuple[Tensor, Tensor]:
         """Run forward.
@@ -351,6 +456,10 @@ class DescriptorMatcher(Module):
                 shape of :math:`(B3, 2)` where :math:`0 <= B3 <= B1`.
 
         """
+        if self.index is not None:
+            return self.match_with_index(desc1, desc2)
+        if self.max_memory is not None:
+            return self.match_tiled(desc1, desc2, self.max_memory)
         if self.match_mode == "nn":
             out = match_nn(desc1, desc2)
         elif self.match_mode == "mnn":
@@ -363,6 +472,158 @@ class DescriptorMatcher(Module):
             raise NotImplementedError
         return out
 
+    def match_tiled(self, desc1: Tensor, desc2: Tensor, max_memory: int) -> Tuple[Tensor, Tensor]:
+        """Match streaming the distance matrix in tiles of at most ``max_memory`` bytes.
+
+        Args:
+            desc1: Batch of descriptors of a shape :math:`(B1, D)`.
+            desc2: Batch of descriptors of a shape :math:`(B2, D)`.
+            max_memory: memory budget of a distance tile, in bytes.
+
+        Returns:
+            the same as :meth:`forward`.
+
+        """
+        KORNIA_CHECK_SHAPE(desc1, ["B", "DIM"])
+        KORNIA_CHECK_SHAPE(desc2, ["B", "DIM"])
+        # the ratio test needs two neighbors
+        min_size1 = 2 if self.match_mode == "smnn" else 1
+        min_size2 = 2 if self.match_mode in ["snn", "smnn"] else 1
+        if len(desc1) < min_size1 or len(desc2) < min_size2:
+            return _no_match(desc1)
+        both_ways = self.match_mode in ["mnn", "smnn"]
+        vals1, idxs1, vals2, idxs2 = _top2_tiled(desc1, desc2, max_memory, both_ways)
+        return self._matches_from_top2(vals1, idxs1, vals2, idxs2)
+
+    @torch.jit.unused
+    def build_index(self, desc: Tensor) -> None:
+        """Build the index on the reference descriptors, which are then recognized in :meth:`forward`.
+
+        Args:
+            desc: reference descriptors of a shape :math:`(N, D)`, passed later as ``desc1`` or ``desc2``.
+
+        """
+        if self.index is None:
+            raise RuntimeError("The matcher has no index, create it with `index=DescriptorIndex()`.")
+        self.index.build(desc)
+
+    @torch.jit.unused
+    def match_with_index(self, desc1: Tensor, desc2: Tensor) -> Tuple[Tensor, Tensor]:
+        """Match searching the nearest neighbors approximately with the index.
+
+        Args:
+            desc1: Batch of descriptors of a shape :math:`(B1, D)`.
+            desc2: Batch of descriptors of a shape :math:`(B2, D)`.
+
+        Returns:
+            the same as :meth:`forward`.
+
+        """
+        KORNIA_CHECK_SHAPE(desc1, ["B", "DIM"])
+        KORNIA_CHECK_SHAPE(desc2, ["B", "DIM"])
+        min_size1 = 2 if self.match_mode == "smnn" else 1
+        min_size2 = 2 if self.match_mode in ["snn", "smnn"] else 1
+        if len(desc1) < min_size1 or len(desc2) < min_size2:
+            return _no_match(desc1)
+        index = self.index
+        if index is None:
+            raise RuntimeError("The matcher has no index.")
+        if not index.is_built_on(desc1) and not index.is_built_on(desc2):
+            index.build(desc2)
+
+        def _index_on(desc: Tensor) -> DescriptorIndex:
+            return index if index.is_built_on(desc) else index.empty_like().build(desc)
+
+        vals1, idxs1 = _index_on(desc2).search(desc1, 2)
+        if self.match_mode in ["mnn", "smnn"]:
+            vals2, idxs2 = _index_on(desc1).search(desc2, 2)
+        else:
+            vals2, idxs2 = vals1[:0], idxs1[:0]
+        return self._matches_from_top2(vals1, idxs1, vals2, idxs2)
+
+    def match_batch(
+        self, desc1: Tensor, desc2: Tensor, mask1: Optional[Tensor] = None, mask2: Optional[Tensor] = None
+    ) -> Tuple[Tensor, Tensor, Tensor]:
+        """Match the descriptors of several pairs of images at once.
+
+        The matches of every pair are the same as those of :meth:`forward` on its valid descriptors, and in the same
+        order. The distance matrices of all the pairs are computed at once.
+
+        Args:
+            desc1: Batch of descriptors of the pairs, of a shape :math:`(B, N1, D)`.
+            desc2: Batch of descriptors of the pairs, of a shape :math:`(B, N2, D)`.
+            mask1: the valid descriptors of desc1, of a shape :math:`(B, N1)`. All are valid if None.
+            mask2: the valid descriptors of desc2, of a shape :math:`(B, N2)`. All are valid if None.
+
+        Returns:
+            - Descriptor distance of matching descriptors, shape of :math:`(B3, 1)`.
+            - Long tensor indexes of matching descriptors in desc1 and desc2 of their pair, shape of :math:`(B3, 2)`.
+            - Long tensor indexes of the pairs of the matches, shape of :math:`(B3,)`.
+
+        """
+        KORNIA_CHECK_SHAPE(desc1, ["B", "N1", "DIM"])
+        KORNIA_CHECK_SHAPE(desc2, ["B", "N2", "DIM"])
+        B, N1, N2 = desc1.shape[0], desc1.shape[1], desc2.shape[1]
+        device = desc1.device
+        if N1 == 0 or N2 == 0:
+            dists, idxs = _no_match(desc1)
+            return dists, idxs, idxs[:, 0]
+
+        dm = _cdist(desc1, desc2)
+        if mask1 is not None or mask2 is not None:
+            mask1 = torch.ones(B, N1, device=device, dtype=torch.bool) if mask1 is None else mask1
+            mask2 = torch.ones(B, N2, device=device, dtype=torch.bool) if mask2 is None else mask2
+            dm = dm.masked_fill(~(mask1[:, :, None] & mask2[:, None, :]), float("inf"))
+            num1, num2 = mask1.sum(1, keepdim=True), mask2.sum(1, keepdim=True)
+        else:
+            mask1 = torch.ones(B, N1, device=device, dtype=torch.bool)
+            num1, num2 = torch.full((B, 1), N1, device=device), torch.full((B, 1), N2, device=device)
+        # the ratio test needs two neighbors
+        min_size1 = 2 if self.match_mode == "smnn" else 1
+        min_size2 = 2 if self.match_mode in ["snn", "smnn"] else 1
+        valid = mask1 & (num1 >= min_size1) & (num2 >= min_size2)
+        order_by_2 = None
+        if self.match_mode in ["nn", "mnn"]:
+            dists, nn12 = torch.min(dm, dim=2)
+            if self.match_mode == "mnn":
+                nn21 = torch.min(dm, dim=1)[1]
+                valid = valid & (nn21.gather(1, nn12) == torch.arange(N1, device=device))
+                # the mutual matches are ordered by their index in the smaller set, like :func:`match_mnn`
+                order_by_2 = (num1 > num2).expand(-1, N1)
+        else:
+            vals1, idxs1 = _top2_batched(dm)
+            nn12 = idxs1[..., 0]
+            dists = vals1[..., 0] / vals1[..., 1]
+            valid = valid & (dists <= self.th)
+            if self.match_mode == "smnn":
+                vals2, idxs2 = _top2_batched(dm.transpose(1, 2))
+                ratio2_nn = (vals2[..., 0] / vals2[..., 1]).gather(1, nn12)
+                mutual = idxs2[..., 0].gather(1, nn12) == torch.arange(N1, device=device)
+                valid = valid & mutual & (ratio2_nn <= self.th)
+                dists = torch.max(dists, ratio2_nn)
+
+        batch_idxs, idxs_in1 = torch.where(valid)
+        idxs_in2 = nn12[batch_idxs, idxs_in1]
+        if order_by_2 is not None:
+            key = torch.where(order_by_2[batch_idxs, idxs_in1], idxs_in2, idxs_in1) + batch_idxs * max(N1, N2)
+            order = torch.sort(key, stable=True)[1]
+            batch_idxs, idxs_in1, idxs_in2 = batch_idxs[order], idxs_in1[order], idxs_in2[order]
+        matches_idxs = torch.stack([idxs_in1, idxs_in2], 1)
+        return dists[batch_idxs, idxs_in1].view(-1, 1), matches_idxs, batch_idxs
+
+    def _matches_from_top2(self, vals1: Tensor, idxs1: Tensor, vals2: Tensor, idxs2: Tensor) -> Tuple[Tensor, Tensor]:
+        if self.match_mode == "nn":
+            idxs_in1 = torch.arange(len(vals1), device=vals1.device)
+            return vals1[:, :1], torch.stack([idxs_in1, idxs1[:, 0]], 1)
+        elif self.match_mode == "mnn":
+            return _mutual_matches(vals1, idxs1, vals2, idxs2)
+        elif self.match_mode == "snn":
+            return _snn_matches(vals1, idxs1, self.th)
+        elif self.match_mode == "smnn":
+            return _smnn_matches(vals1, idxs1, vals2, idxs2, self.th)
+        else:
+            raise NotImplementedError
+
 
 class DescriptorMatcherWithSteerer(Module):
     """Matching that is invariant under rotations, using Steerers.
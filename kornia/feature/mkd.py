@@ -23,6 +23,7 @@ from torch import nn
 
 from kornia.constants import pi
 from kornia.core import Tensor, cos, sin, tensor, zeros
+from kornia.core.capabilities import needs_host_fallback
 from kornia.filters import GaussianBlur2d, SpatialGradient
 from kornia.geometry.conversions import cart2pol
 from kornia.utils import create_meshgrid
@@ -477,8 +478,7 @@ class Whitening(nn.Module):
             raise ValueError(f"Invalid input shape, we expect NxD. Got: {x.shape}")
         x = x - self.mean  # Center the data.
         x = x @ self.evecs  # Apply rotation and/or scaling.
-        # SDAA torch.sign not support fp64
-        if x.dtype == torch.float64 and 'sdaa' in x.device.type:
+        if needs_host_fallback("sign", x):
             device = x.device
             x = torch.sign(x.cpu()).to(device) * torch.pow(torch.abs(x), self.pval)  # Powerlaw.
         else:
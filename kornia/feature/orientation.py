@@ -22,6 +22,7 @@ import torch.nn.functional as F
 from torch import nn
 
 from kornia.constants import pi
+from kornia.core.capabilities import needs_host_fallback
 from kornia.core.check import KORNIA_CHECK_LAF, KORNIA_CHECK_SHAPE
 from kornia.filters import SpatialGradient, get_gaussian_discrete_kernel1d, get_gaussian_kernel2d
 from kornia.geometry import rad2deg
@@ -118,8 +119,7 @@ class PatchDominantGradientOrientation(nn.Module):
             )
             ang_bins_list.append(ang_bins_i)
         ang_bins = torch.cat(ang_bins_list, 1).view(-1, 1, self.num_ang_bins)
-        # SDAA subnormal
-        if 'sdaa' in ang_bins.device.type:
+        if needs_host_fallback("conv1d", ang_bins):
             device = ang_bins.device
             self.angular_smooth = self.angular_smooth.cpu()
             ang_bins = self.angular_smooth(ang_bins.cpu()).view(-1, self.num_ang_bins).to(device)
@@ -23,11 +23,12 @@ import torch.nn.functional as F
 from typing_extensions import TypedDict
 
 from kornia.core import Device, Module, Tensor, concatenate, eye, tensor, where, zeros
+from kornia.core.capabilities import needs_host_fallback
 from kornia.core.check import KORNIA_CHECK_SHAPE
 from kornia.geometry.subpix import ConvSoftArgmax3d, NonMaximaSuppression2d
 from kornia.geometry.transform import ScalePyramid, pyrdown, resize
 
-from .laf import laf_from_center_scale_ori, laf_is_inside_image
+from .laf import laf_from_center_scale_ori, laf_to_boundary_points
 from .orientation import PassLAF
 from .responses import BlobHessian
 
@@ -154,8 +155,21 @@ class ScaleSpaceDetector(Module):
         sigmas: List[Tensor]
         sp, sigmas, _ = self.scale_pyr(img)
         all_responses: List[Tensor] = []
-        all_lafs: List[Tensor] = []
+        all_coords: List[Tensor] = []
+        all_px_sizes: List[Tensor] = []
+        all_sizes: List[Tensor] = []
         px_size = 0.5 if self.scale_pyr.double_image else 1.0
+
+        if isinstance(self.scale_pyr.n_levels, Tensor):
+            num_levels = int(self.scale_pyr.n_levels.item())
+        elif isinstance(self.scale_pyr.n_levels, int):
+            num_levels = self.scale_pyr.n_levels
+        else:
+            raise TypeError(
+                "Expected the scale pyramid module to have `n_levels` as a Tensor or int."
+                f"Gotcha {type(self.scale_pyr.n_levels)}"
+            )
+
         for oct_idx, octave in enumerate(sp):
             sigmas_oct = sigmas[oct_idx]
             B, CH, L, H, W = octave.size()
@@ -176,15 +190,18 @@ class ScaleSpaceDetector(Module):
                 oct_mask: Tensor = _create_octave_mask(mask, oct_resp.shape)
                 oct_resp = oct_mask * oct_resp
 
-            # Differentiable nms
+            # Differentiable nms, of the minima in the same call as the maxima
             coord_max: Tensor
             response_max: Tensor
-            coord_max, response_max = self.nms(oct_resp)
             if self.minima_are_also_good:
-                coord_min, response_min = self.nms(-oct_resp)
+                coord_both, response_both = self.nms(concatenate([oct_resp, -oct_resp], 0))
+                coord_max, coord_min = coord_both[:B], coord_both[B:]
+                response_max, response_min = response_both[:B], response_both[B:]
                 take_min_mask = (response_min > response_max).to(response_max.dtype)
                 response_max = response_min * take_min_mask + (1 - take_min_mask) * response_max
                 coord_max = coord_min * take_min_mask.unsqueeze(2) + (1 - take_min_mask.unsqueeze(2)) * coord_max
+            else:
+                coord_max, response_max = self.nms(oct_resp)
 
             # Now, lets crop out some small responses
             responses_flatten = response_max.view(response_max.size(0), -1)  # [B, N]
@@ -199,43 +216,39 @@ class ScaleSpaceDetector(Module):
             B, N = resp_flat_best.size()
 
             # Converts scale level index from ConvSoftArgmax3d to the actual scale, using the sigmas
+            all_coords.append(_scale_index_to_scale(max_coords_best, sigmas_oct, num_levels))
+            all_responses.append(resp_flat_best)
+            all_px_sizes.append(torch.full((B, N, 1, 1), px_size, device=dev, dtype=dtype))
+            # the size of the octave, in the pixels of the image
+            all_sizes.append(torch.tensor([W * px_size, H * px_size], device=dev, dtype=dtype).expand(B, N, 2))
+            px_size *= 2
 
-            if isinstance(self.scale_pyr.n_levels, Tensor):
-                num_levels = int(self.scale_pyr.n_levels.item())
-            elif isinstance(self.scale_pyr.n_levels, int):
-                num_levels = self.scale_pyr.n_levels
-            else:
-                raise TypeError(
-                    "Expected the scale pyramid module to have `n_levels` as a Tensor or int."
-                    f"Gotcha {type(self.scale_pyr.n_levels)}"
-                )
-
-            max_coords_best = _scale_index_to_scale(max_coords_best, sigmas_oct, num_levels)
-
-            # Create local affine frames (LAFs)
-            rotmat = eye(2, dtype=dtype, device=dev).view(1, 1, 2, 2)
-            current_lafs = concatenate(
-                [
-                    self.mr_size * max_coords_best[:, :, 0].view(B, N, 1, 1) * rotmat,
-                    max_coords_best[:, :, 1:3].view(B, N, 2, 1),
-                ],
-                3,
-            )
-
-            # Zero response lafs, which touch the boundary
-            good_mask = laf_is_inside_image(current_lafs, octave[:, 0])
-            resp_flat_best = resp_flat_best * good_mask.to(dev, dtype)
+        # The local affine frames (LAFs) of all the octaves are created at once
+        responses = concatenate(all_responses, 1)
+        max_coords = concatenate(all_coords, 1)
+        px_sizes = concatenate(all_px_sizes, 1)
+        sizes = concatenate(all_sizes, 1)
+        B, N = responses.size()
+        rotmat = eye(2, dtype=dtype, device=dev).view(1, 1, 2, 2)
+        lafs = concatenate(
+            [self.mr_size * max_coords[:, :, 0].view(B, N, 1, 1) * rotmat, max_coords[:, :, 1:3].view(B, N, 2, 1)], 3
+        )
 
-            # Normalize LAFs
-            current_lafs *= px_size
+        # Normalize LAFs
+        lafs = lafs * px_sizes
 
-            all_responses.append(resp_flat_best)
-            all_lafs.append(current_lafs)
-            px_size *= 2
+        # Zero response lafs, which touch the boundary of their octave
+        pts = laf_to_boundary_points(lafs, 12)
+        good_mask = (
+            (pts[..., 0] >= 0) * (pts[..., 0] <= sizes[..., :1]) * (pts[..., 1] >= 0) * (pts[..., 1] <= sizes[..., 1:])
+        )
+        if needs_host_fallback("reduce_bool", good_mask):
+            good_mask = good_mask.cpu().min(dim=2)[0].to(dev)
+        else:
+            good_mask = good_mask.min(dim=2)[0]
+        responses = responses * good_mask.to(dev, dtype)
 
         # Sort and keep best n
-        responses = concatenate(all_responses, 1)
-        lafs = concatenate(all_lafs, 1)
         responses, idxs = torch.topk(responses, k=num_feats, dim=1)
         lafs = torch.gather(lafs, 1, idxs.unsqueeze(-1).unsqueeze(-1).repeat(1, 1, 2, 3))
         return responses, lafs
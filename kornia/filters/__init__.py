@@ -35,6 +35,7 @@ from .gaussian import GaussianBlur2d, gaussian_blur2d, gaussian_blur2d_t
 from .guided import GuidedBlur, guided_blur
 from .in_range import InRange, in_range
 from .kernels import (
+    KernelCache,
     gaussian,
     get_binary_kernel2d,
     get_box_kernel1d,
@@ -50,6 +51,7 @@ from .kernels import (
     get_gaussian_kernel3d_t,
     get_hanning_kernel1d,
     get_hanning_kernel2d,
+    get_kernel_cache,
     get_laplacian_kernel1d,
     get_laplacian_kernel2d,
     get_sobel_kernel2d,
@@ -75,6 +77,7 @@ __all__ = [
     "GuidedBlur",
     "InRange",
     "JointBilateralBlur",
+    "KernelCache",
     "Laplacian",
     "MaxBlurPool2D",
     "MedianBlur",
@@ -109,6 +112,7 @@ __all__ = [
     "get_gaussian_kernel3d_t",
     "get_hanning_kernel1d",
     "get_hanning_kernel2d",
+    "get_kernel_cache",
     "get_laplacian_kernel1d",
     "get_laplacian_kernel2d",
     "get_motion_kernel2d",
@@ -20,6 +20,7 @@ from __future__ import annotations
 import torch.nn.functional as F
 
 from kornia.core import Tensor, pad
+from kornia.core.capabilities import dispatch_op
 from kornia.core.check import KORNIA_CHECK, KORNIA_CHECK_IS_TENSOR, KORNIA_CHECK_SHAPE
 
 from .kernels import normalize_kernel2d
@@ -144,8 +145,7 @@ def filter2d(
     input = input.view(-1, tmp_kernel.size(0), input.size(-2), input.size(-1))
 
     # convolve the tensor with the kernel.
-    device = input.device
-    output = F.conv2d(input.cpu(), tmp_kernel.cpu(), groups=tmp_kernel.size(0), padding=0, stride=1).to(device)
+    output = dispatch_op("conv2d", F.conv2d, input, tmp_kernel, groups=tmp_kernel.size(0), padding=0, stride=1)
 
     if padding == "same":
         out = output.view(b, c, h, w)
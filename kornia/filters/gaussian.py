@@ -25,7 +25,13 @@ from kornia.core.check import KORNIA_CHECK_IS_TENSOR
 from kornia.utils import deprecated
 
 from .filter import filter2d, filter2d_separable
-from .kernels import _unpack_2d_ks, get_gaussian_kernel1d, get_gaussian_kernel2d
+from .kernels import (
+    _cached_gaussian_kernel1d,
+    _cached_gaussian_kernel2d,
+    _unpack_2d_ks,
+    get_gaussian_kernel1d,
+    get_gaussian_kernel2d,
+)
 
 
 def gaussian_blur2d(
@@ -70,6 +76,17 @@ def gaussian_blur2d(
     """
     KORNIA_CHECK_IS_TENSOR(input)
 
+    if isinstance(sigma, tuple) and all(isinstance(s, (int, float)) for s in sigma):
+        # the kernels of constant sigmas are reused from the shared cache
+        sigma_y, sigma_x = float(sigma[0]), float(sigma[1])
+        if separable:
+            ky, kx = _unpack_2d_ks(kernel_size)
+            kernel_x = _cached_gaussian_kernel1d(kx, sigma_x, input.device, input.dtype)
+            kernel_y = _cached_gaussian_kernel1d(ky, sigma_y, input.device, input.dtype)
+            return filter2d_separable(input, kernel_x, kernel_y, border_type)
+        kernel = _cached_gaussian_kernel2d(_unpack_2d_ks(kernel_size), (sigma_y, sigma_x), input.device, input.dtype)
+        return filter2d(input, kernel, border_type)
+
     if isinstance(sigma, tuple):
         sigma = tensor([sigma], device=input.device, dtype=input.dtype)
     else:
@@ -22,6 +22,7 @@ from torch.nn.functional import interpolate
 
 from kornia.core import ImageModule as Module
 from kornia.core import Tensor
+from kornia.core.capabilities import needs_host_fallback
 from kornia.core.check import KORNIA_CHECK, KORNIA_CHECK_IS_TENSOR, KORNIA_CHECK_SHAPE
 
 from .blur import box_blur
@@ -114,7 +115,7 @@ def _guided_blur_multichannel_guidance(
     else:
         _eps = guidance.new_full((C,), eps).diag().view(1, 1, 1, C, C)
     a = torch.linalg.solve(var_I + _eps, cov_Ip)  # B, H, W, C_guidance, C_input
-    if 'sdaa' in device.type and a.dtype == torch.float64:
+    if needs_host_fallback("matmul", a):
         b = mean_p - (mean_I.unsqueeze(-2).cpu() @ a.cpu()).to(device).squeeze(-2)  # B, H, W, C_input
     else:
         b = mean_p - (mean_I.unsqueeze(-2) @ a).squeeze(-2)  # B, H, W, C_input
@@ -128,7 +129,7 @@ def _guided_blur_multichannel_guidance(
     mean_a = mean_a.view(B, C, -1, H * subsample, W * subsample)
 
     # einsum might not be contiguous, thus mean_b is the first argument
-    if 'sdaa' in device.type and guidance.dtype == torch.float64:
+    if needs_host_fallback("matmul", guidance):
         return mean_b + torch.einsum("BCHW,BCcHW->BcHW", guidance.cpu(), mean_a.cpu()).to(device)
     else:
         return mean_b + torch.einsum("BCHW,BCcHW->BcHW", guidance, mean_a)
@@ -18,8 +18,9 @@
 from __future__ import annotations
 
 import math
+from collections import OrderedDict
 from math import sqrt
-from typing import Any, Optional, Union
+from typing import Any, Callable, Hashable, Optional, Union
 
 import torch
 
@@ -1005,6 +1006,98 @@ def get_hanning_kernel2d(
     return kernel2d
 
 
+class KernelCache:
+    r"""Bounded cache of constant filter kernels, evicting the least recently used ones.
+
+    The kernels depending only on python scalars, e.g. the gaussian kernels of a fixed sigma and size, are
+    computed once per device and dtype, instead of on every call. This matters for the filters run repeatedly
+    on frames of a video, where building a kernel on the host and copying it to the device can cost as much as
+    the filter itself. The cached kernels are shared and must not be modified in place.
+
+    Args:
+        max_size: the maximum number of kernels kept. Nothing is cached if 0.
+
+    Example:
+        >>> cache = KernelCache(max_size=2)
+        >>> kernel = cache.get(("box", 3), lambda: torch.ones(1, 3) / 3)
+        >>> cache.get(("box", 3), lambda: torch.ones(1, 3) / 3) is kernel
+        True
+
+    """
+
+    def __init__(self, max_size: int = 256) -> None:
+        KORNIA_CHECK(max_size >= 0, f"Expected a non-negative size. Got {max_size}.")
+        self.max_size = max_size
+        self._kernels: OrderedDict[Hashable, Tensor] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._kernels)
+
+    def get(self, key: Hashable, make: Callable[[], Tensor]) -> Tensor:
+        """Get the kernel stored under a key, computing and storing it if missing.
+
+        Args:
+            key: the key of the kernel, which must identify its values, device and dtype.
+            make: the function computing the kernel.
+
+        """
+        if key in self._kernels:
+            self._kernels.move_to_end(key)
+            self.hits += 1
+            return self._kernels[key]
+        self.misses += 1
+        # a kernel made in inference mode could not be saved for the backward of the later callers
+        with torch.inference_mode(False):
+            kernel = make()
+        if self.max_size > 0:
+            self._kernels[key] = kernel
+            while len(self._kernels) > self.max_size:
+                self._kernels.popitem(last=False)
+        return kernel
+
+    def clear(self) -> None:
+        """Remove all the kernels."""
+        self._kernels.clear()
+
+
+_kernel_cache = KernelCache()
+
+
+def get_kernel_cache() -> KernelCache:
+    r"""Return the cache of the kernels shared by the filters, e.g. to resize or clear it.
+
+    It is used by :func:`~kornia.filters.gaussian_blur2d` when sigma is given as floats, by the pyramid functions of
+    :mod:`kornia.geometry.transform` and by :class:`~kornia.geometry.transform.ScalePyramid`.
+
+    Example:
+        >>> get_kernel_cache().max_size = 64
+
+    """
+    return _kernel_cache
+
+
+@torch.jit.ignore
+def _cached_gaussian_kernel1d(kernel_size: int, sigma: float, device: Device, dtype: Dtype) -> Tensor:
+    """Get the gaussian kernel of :func:`get_gaussian_kernel1d` for a float sigma, from the shared cache."""
+    return _kernel_cache.get(
+        ("gaussian1d", kernel_size, sigma, device, dtype),
+        lambda: get_gaussian_kernel1d(kernel_size, tensor([[sigma]], device=device, dtype=dtype)),
+    )
+
+
+@torch.jit.ignore
+def _cached_gaussian_kernel2d(
+    kernel_size: tuple[int, int], sigma: tuple[float, float], device: Device, dtype: Dtype
+) -> Tensor:
+    """Get the gaussian kernel of :func:`get_gaussian_kernel2d` for float sigmas, from the shared cache."""
+    return _kernel_cache.get(
+        ("gaussian2d", kernel_size, sigma, device, dtype),
+        lambda: get_gaussian_kernel2d(kernel_size, tensor([sigma], device=device, dtype=dtype)),
+    )
+
+
 @deprecated(replace_with="get_gaussian_kernel1d", version="6.9.10")
 def get_gaussian_kernel1d_t(*args: Any, **kwargs: Any) -> Tensor:  # noqa: D103
     return get_gaussian_kernel1d(*args, **kwargs)
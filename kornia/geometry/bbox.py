@@ -22,11 +22,12 @@ from typing import Optional
 
 import torch
 
-from kornia.core import arange, ones_like, stack, where, zeros
+from kornia.core import arange, ones_like, stack, zeros
 
 from .linalg import transform_points
 
 __all__ = [
+    "batched_nms",
     "bbox_generator",
     "bbox_generator3d",
     "bbox_to_mask",
@@ -34,6 +35,7 @@ __all__ = [
     "infer_bbox_shape",
     "infer_bbox_shape3d",
     "nms",
+    "soft_nms",
     "transform_bbox",
     "validate_bbox",
     "validate_bbox3d",
@@ -559,29 +561,200 @@ def nms(boxes: torch.Tensor, scores: torch.Tensor, iou_threshold: float) -> torc
     if boxes.shape[0] != scores.shape[0]:
         raise ValueError(f"boxes and scores mus have same shape. Got: {boxes.shape, scores.shape}.")
 
-    x1, y1, x2, y2 = boxes.unbind(-1)
-    areas = (x2 - x1) * (y2 - y1)
+    keep = batched_nms(boxes, scores, iou_threshold)
+    _, order = scores.sort(descending=True, stable=True)
+    return order[keep[order]]
+
+
+def _box_overlap(boxes1: torch.Tensor, boxes2: torch.Tensor, method: str = "iou") -> torch.Tensor:
+    """Compute the pairwise IoU (or DIoU) of two batches of boxes :math:`(B, N, 4)` and :math:`(B, M, 4)`."""
+    x11, y11, x12, y12 = (c[:, :, None] for c in boxes1.unbind(-1))
+    x21, y21, x22, y22 = (c[:, None] for c in boxes2.unbind(-1))
+    inter = (torch.min(x12, x22) - torch.max(x11, x21)).clamp_(min=0.0)
+    inter = inter.mul_((torch.min(y12, y22) - torch.max(y11, y21)).clamp_(min=0.0))
+    union = ((x12 - x11) * (y12 - y11) + (x22 - x21) * (y22 - y21)).sub_(inter)
+    iou = inter.div_(union)
+    if method == "iou":
+        return iou
+    # DIoU: penalize by the distance between the centers relative to the diagonal of the enclosing box
+    centers = ((x11 + x12 - x21 - x22).pow(2) + (y11 + y12 - y21 - y22).pow(2)) / 4.0
+    diagonal = (torch.max(x12, x22) - torch.min(x11, x21)).pow(2) + (torch.max(y12, y22) - torch.min(y11, y21)).pow(2)
+    return iou - centers / diagonal.clamp(min=torch.finfo(diagonal.dtype).eps)
+
+
+def _sort_boxes(
+    boxes: torch.Tensor,
+    scores: torch.Tensor,
+    class_ids: Optional[torch.Tensor],
+    mask: Optional[torch.Tensor],
+) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+    if boxes.dim() == 2:
+        boxes, scores = boxes[None], scores[None]
+        class_ids = class_ids[None] if class_ids is not None else None
+        mask = mask[None] if mask is not None else None
+    if boxes.dim() != 3 or boxes.shape[-1] != 4:
+        raise ValueError(f"boxes expected as BxNx4 or Nx4. Got: {boxes.shape}.")
+    if scores.shape != boxes.shape[:2]:
+        raise ValueError(f"scores expected as BxN or N matching the boxes. Got: {boxes.shape, scores.shape}.")
+    if class_ids is None:
+        class_ids = torch.zeros_like(scores, dtype=torch.long)
+    if mask is None:
+        mask = torch.ones_like(scores, dtype=torch.bool)
+    order = scores.masked_fill(~mask, float("-inf")).argsort(dim=1, descending=True, stable=True)
+    return (
+        order,
+        boxes.gather(1, order[..., None].expand_as(boxes)),
+        scores.gather(1, order),
+        class_ids.gather(1, order),
+        mask.gather(1, order),
+    )
 
-    _, order = scores.sort(descending=True)
 
-    keep = []
-    while order.shape[0] > 0:
-        i = order[0]
-        keep.append(i)
-        xx1 = torch.max(x1[i], x1[order[1:]])
-        yy1 = torch.max(y1[i], y1[order[1:]])
-        xx2 = torch.min(x2[i], x2[order[1:]])
-        yy2 = torch.min(y2[i], y2[order[1:]])
+def batched_nms(
+    boxes: torch.Tensor,
+    scores: torch.Tensor,
+    iou_threshold: float,
+    class_ids: Optional[torch.Tensor] = None,
+    mask: Optional[torch.Tensor] = None,
+    method: str = "iou",
+    chunk_size: int = 1024,
+) -> torch.Tensor:
+    r"""Perform class-aware non-maxima suppression (NMS) on a batch of images at once.
 
-        w = torch.clamp(xx2 - xx1, min=0.0)
-        h = torch.clamp(yy2 - yy1, min=0.0)
-        inter = w * h
-        ovr = inter / (areas[i] + areas[order[1:]] - inter)
+    The boxes are sorted by decreasing score and the suppression is solved in a matrix formulation: a box is kept
+    if no kept box with a higher score overlaps it by more than ``iou_threshold``. This is the same set of boxes as
+    the greedy NMS, computed with a few tensor operations over the lower triangular overlap matrix instead of one
+    iteration per kept box. The boxes are processed in chunks of ``chunk_size`` to bound the memory of the overlap
+    matrices to :math:`O(B \cdot N \cdot \text{chunk\_size})`.
 
-        inds = where(ovr <= iou_threshold)[0]
-        order = order[inds + 1]
+    Args:
+        boxes: the boxes with the shape :math:`(B, N, (x_1, y_1, x_2, y_2))` or :math:`(N, 4)`.
+        scores: the scores of the boxes with the shape :math:`(B, N)` or :math:`(N,)`.
+        iou_threshold: the threshold to discard the overlapping boxes.
+        class_ids: the class of the boxes with the shape :math:`(B, N)` or :math:`(N,)`. Boxes of different classes
+          never suppress each other. If None, all the boxes belong to the same class.
+        mask: boolean mask of the valid boxes with the shape :math:`(B, N)` or :math:`(N,)`, e.g. for padded
+          batches. Invalid boxes are never kept and never suppress other boxes.
+        method: the overlap criterion, either ``"iou"`` or ``"diou"`` for DIoU-NMS :cite:`zheng2020distance`,
+          which subtracts from the IoU the squared distance of the box centers normalized by the squared diagonal
+          of the smallest enclosing box.
+        chunk_size: number of boxes processed at once.
+
+    Return:
+        A boolean mask of the kept boxes with the shape of ``scores``.
 
-    if len(keep) > 0:
-        return stack(keep)
+    Example:
+        >>> boxes = torch.tensor([[
+        ...     [10., 10., 20., 20.],
+        ...     [11., 11., 21., 21.],
+        ...     [11., 11., 21., 21.],
+        ...     [100., 100., 200., 200.]]])
+        >>> scores = torch.tensor([[0.9, 0.8, 0.7, 0.6]])
+        >>> class_ids = torch.tensor([[0, 0, 1, 0]])
+        >>> batched_nms(boxes, scores, 0.5, class_ids)
+        tensor([[ True, False,  True,  True]])
 
-    return torch.tensor(keep)
+    """
+    if method not in ("iou", "diou"):
+        raise ValueError(f"method expected as `iou` or `diou`. Got: {method}.")
+    order, boxes_s, _, class_s, mask_s = _sort_boxes(boxes, scores, class_ids, mask)
+    _, N = mask_s.shape
+    keep_s = torch.zeros_like(mask_s)
+    for start in range(0, N, chunk_size):
+        end = min(start + chunk_size, N)
+        blk_boxes, blk_class = boxes_s[:, start:end], class_s[:, start:end]
+        candidates = mask_s[:, start:end]
+        if start > 0:
+            # suppressed by a box kept in the previous chunks
+            overlap = _box_overlap(blk_boxes, boxes_s[:, :start], method) > iou_threshold
+            overlap &= (blk_class[:, :, None] == class_s[:, None, :start]) & keep_s[:, None, :start]
+            candidates = candidates & ~overlap.any(-1)
+        # suppression[b, i, j]: box j has a higher score than box i and overlaps it
+        suppression = _box_overlap(blk_boxes, blk_boxes, method) > iou_threshold
+        suppression &= blk_class[:, :, None] == blk_class[:, None, :]
+        suppression &= torch.ones(end - start, end - start, dtype=torch.bool, device=boxes.device).tril(-1)
+        suppression &= candidates[:, None, :]
+        # fixed point of `keep_i = not any_j(keep_j and suppression_ij)`: a box is final once the boxes with a higher
+        # score are, so the boxes up to the first one changed by an iteration are final and not computed again. In
+        # practice it converges after a few iterations whatever the number of boxes.
+        keep = candidates
+        settled = 0
+        while settled < end - start:
+            new_keep = candidates[:, settled:] & ~(suppression[:, settled:] & keep[:, None, :]).any(-1)
+            changed = (new_keep != keep[:, settled:]).any(0)
+            if not changed.any():
+                break
+            keep = torch.cat([keep[:, :settled], new_keep], 1)
+            settled += int(changed.nonzero()[0]) + 1
+        keep_s[:, start:end] = keep
+    out = torch.zeros_like(keep_s).scatter(1, order, keep_s)
+    return out if scores.dim() == 2 else out[0]
+
+
+def soft_nms(
+    boxes: torch.Tensor,
+    scores: torch.Tensor,
+    sigma: float = 0.5,
+    class_ids: Optional[torch.Tensor] = None,
+    mask: Optional[torch.Tensor] = None,
+    kernel: str = "gaussian",
+    chunk_size: int = 1024,
+) -> torch.Tensor:
+    r"""Decay the scores of the overlapping boxes instead of discarding them (Soft-NMS) :cite:`bodla2017soft`.
+
+    The scores are decayed in parallel with the matrix formulation of :cite:`wang2020solov2`: the score of a box is
+    multiplied by the smallest decay caused by a box with a higher score, each decay being compensated by how much
+    the suppressing box is itself suppressed. Threshold the returned scores to select the boxes.
+
+    Args:
+        boxes: the boxes with the shape :math:`(B, N, (x_1, y_1, x_2, y_2))` or :math:`(N, 4)`.
+        scores: the scores of the boxes with the shape :math:`(B, N)` or :math:`(N,)`.
+        sigma: the spread of the gaussian kernel :math:`\exp(-\text{iou}^2 / \sigma)`.
+        class_ids: the class of the boxes with the shape :math:`(B, N)` or :math:`(N,)`. Boxes of different classes
+          never decay each other. If None, all the boxes belong to the same class.
+        mask: boolean mask of the valid boxes with the shape :math:`(B, N)` or :math:`(N,)`. Invalid boxes get a
+          zero score and never decay other boxes.
+        kernel: the decay function of the IoU, either ``"gaussian"`` or ``"linear"`` (:math:`1 - \text{iou}`).
+        chunk_size: number of boxes processed at once.
+
+    Return:
+        The decayed scores with the shape of ``scores``.
+
+    Example:
+        >>> boxes = torch.tensor([[10., 10., 20., 20.], [11., 11., 21., 21.], [100., 100., 200., 200.]])
+        >>> scores = torch.tensor([0.9, 0.8, 0.7])
+        >>> soft_nms(boxes, scores, sigma=0.5)
+        tensor([0.9000, 0.3167, 0.7000])
+
+    """
+    if kernel not in ("gaussian", "linear"):
+        raise ValueError(f"kernel expected as `gaussian` or `linear`. Got: {kernel}.")
+    order, boxes_s, scores_s, class_s, mask_s = _sort_boxes(boxes, scores, class_ids, mask)
+    _, N = mask_s.shape
+
+    def _overlap(rows: slice, cols: slice) -> torch.Tensor:
+        # overlap[b, i, j] of the box i with the box j having a lower score
+        iou = _box_overlap(boxes_s[:, rows], boxes_s[:, cols])
+        valid = (class_s[:, rows, None] == class_s[:, None, cols]) & mask_s[:, rows, None]
+        i = torch.arange(N, device=boxes.device)
+        valid &= i[rows, None] < i[None, cols]
+        return iou.masked_fill(~valid, 0.0)
+
+    # max_overlap: how much each box is suppressed by the boxes with a higher score, which are all in the rows
+    # preceding its column
+    max_overlap = torch.zeros_like(scores_s)
+    decay = torch.ones_like(scores_s)
+    for start in range(0, N, chunk_size):
+        cols = slice(start, min(start + chunk_size, N))
+        iou = _overlap(slice(0, cols.stop), cols)
+        max_overlap[:, cols] = iou.amax(1)
+        compensation = max_overlap[:, : cols.stop, None]
+        if kernel == "gaussian":
+            decay[:, cols] = torch.exp(-(iou.pow(2) - compensation.pow(2)).amax(1) / sigma)
+        else:
+            ratio = (1.0 - iou) / (1.0 - compensation).clamp(min=torch.finfo(iou.dtype).eps)
+            decay[:, cols] = ratio.amin(1)
+    decay = decay.clamp(max=1.0)
+    decayed = torch.where(mask_s, scores_s * decay, torch.zeros_like(scores_s))
+    out = torch.zeros_like(decayed).scatter(1, order, decayed)
+    return out if scores.dim() == 2 else out[0]
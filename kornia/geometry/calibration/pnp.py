@@ -21,6 +21,7 @@ import torch
 from torch.linalg import qr as linalg_qr
 
 from kornia.core import arange, ones_like, where, zeros
+from kornia.core.capabilities import needs_host_fallback
 from kornia.core.check import KORNIA_CHECK, KORNIA_CHECK_IS_TENSOR, KORNIA_CHECK_SAME_SHAPE, KORNIA_CHECK_SHAPE
 from kornia.geometry.conversions import convert_points_to_homogeneous, normalize_points_with_intrinsics
 from kornia.geometry.linalg import transform_points
@@ -208,8 +209,7 @@ def solve_pnp_dlt(
     solution_4x4[:, :3, :] = solution
 
     # De-normalizing the solution
-    # SDAA bmm not support fp64
-    if 'sdaa' in solution_4x4.device.type and solution_4x4.dtype == torch.float64:
+    if needs_host_fallback("matmul", solution_4x4):
         device = solution_4x4.device
         intermediate = torch.bmm(solution_4x4.cpu(), world_transform_norm.cpu()).to(device)
         solution = torch.bmm(inv_img_transform_norm.cpu(), intermediate[:, :3, :].cpu()).to(device)
@@ -248,8 +248,7 @@ def solve_pnp_dlt(
     # the column ortho[i, :, j]. The below code performs the necessary
     # operations in a better way.
     mask = eye_like(3, ortho)
-    # SDAA bmm not support fp64
-    if 'sdaa' in ortho.device.type and ortho.dtype == torch.float64:
+    if needs_host_fallback("matmul", ortho):
         device = ortho.device
         col_sign_fix = torch.sign(mask.cpu() * right.cpu()).to(device)
         rot_mat = torch.bmm(ortho.cpu(), col_sign_fix.cpu()).to(device)
@@ -18,10 +18,10 @@
 # inspired by: shttps://github.com/farm-ng/sophus-rs/blob/main/src/sensor/kannala_brandt.rs
 import kornia.core as ops
 from kornia.core import Tensor
+from kornia.core.capabilities import needs_host_fallback
 from kornia.core.check import KORNIA_CHECK_SHAPE
 from kornia.geometry.camera.distortion_affine import distort_points_affine
 
-import torch
 
 def _distort_points_kannala_brandt_impl(
     projected_points_in_camera_z1_plane: Tensor,
@@ -171,8 +171,7 @@ def undistort_points_kannala_brandt(distorted_points_in_camera: Tensor, params:
         if iters >= 20:
             break
 
-    # SDAA not support tan fp64
-    if 'sdaa' in th.device.type and th.dtype == torch.float64:
+    if needs_host_fallback("tan", th):
         device = th.device
         radius_undistorted = th.cpu().tan().to(device)
     else:
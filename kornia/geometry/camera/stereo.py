@@ -20,6 +20,7 @@ from typing import Any
 import torch
 
 from kornia.core import Tensor, stack, zeros
+from kornia.core.capabilities import needs_host_fallback
 from kornia.geometry.linalg import transform_points
 from kornia.utils.grid import create_meshgrid
 
@@ -204,8 +205,7 @@ class StereoCamera:
             Tensor of shape :math:`(B)`
 
         """
-        # SDAA prec bug 10. / 1. = 9.999999046325684
-        if 'sdaa' in self.fx.device.type:
+        if needs_host_fallback("div", self.fx):
             device = self.fx.device
             return (-self.rectified_right_camera[..., 0, 3].cpu() / self.fx.cpu()).to(device)
         return -self.rectified_right_camera[..., 0, 3] / self.fx
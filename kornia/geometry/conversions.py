@@ -24,6 +24,7 @@ import torch.nn.functional as F
 
 from kornia.constants import pi
 from kornia.core import Tensor, concatenate, cos, pad, sin, stack, tensor, where, zeros_like
+from kornia.core.capabilities import needs_host_fallback
 from kornia.core.check import KORNIA_CHECK, KORNIA_CHECK_SHAPE
 from kornia.utils import deprecated
 from kornia.utils.helpers import _torch_inverse_cast
@@ -350,8 +351,7 @@ def axis_angle_to_rotation_matrix(axis_angle: Tensor) -> Tensor:
     # stolen from ceres/rotation.h
 
     _axis_angle = torch.unsqueeze(axis_angle, dim=1)
-    # SDAA matmul not support fp64
-    if 'sdaa' in _axis_angle.device.type and _axis_angle.dtype == torch.float64:
+    if needs_host_fallback("matmul", _axis_angle):
         device = _axis_angle.device
         theta2 = torch.matmul(_axis_angle.cpu(), _axis_angle.transpose(1, 2).cpu()).to(device)
     else:
@@ -732,7 +732,7 @@ def quaternion_exp_to_log(quaternion: Tensor, eps: float = 1.0e-8) -> Tensor:
     norm_q: Tensor = torch.norm(quaternion_vector, p=2, dim=-1, keepdim=True).clamp(min=eps)
 
     # apply log map
-    if 'sdaa' in quaternion_scalar.device.type:
+    if needs_host_fallback("acos", quaternion_scalar):
         quaternion_log: Tensor = quaternion_vector * torch.acos(torch.clamp(quaternion_scalar, min=-1.0, max=1.0).cpu()).to(norm_q.device) / norm_q
     else:
         quaternion_log: Tensor = quaternion_vector * torch.acos(torch.clamp(quaternion_scalar, min=-1.0, max=1.0)) / norm_q
@@ -1060,8 +1060,7 @@ def normalize_homography(
     dst_norm_trans_dst_pix: Tensor = normal_transform_pixel(dst_h, dst_w).to(dst_pix_trans_src_pix)
 
     # compute chain transformations
-    # SDAA not support fp64
-    if 'sdaa' in dst_norm_trans_dst_pix.device.type and dst_norm_trans_dst_pix.dtype == torch.float64:
+    if needs_host_fallback("matmul", dst_norm_trans_dst_pix):
         device = dst_norm_trans_dst_pix.device
         dst_norm_trans_src_norm: Tensor = (dst_norm_trans_dst_pix.cpu() @ (dst_pix_trans_src_pix.cpu() @ src_pix_trans_src_norm.cpu())).to(device)
     else:
@@ -1172,8 +1171,7 @@ def denormalize_homography(
     dst_norm_trans_dst_pix: Tensor = normal_transform_pixel(dst_h, dst_w).to(dst_pix_trans_src_pix)
     dst_denorm_trans_dst_pix = _torch_inverse_cast(dst_norm_trans_dst_pix)
     # compute chain transformations
-    # SDAA not support fp64
-    if 'sdaa' in dst_denorm_trans_dst_pix.device.type and dst_denorm_trans_dst_pix.dtype == torch.float64:
+    if needs_host_fallback("matmul", dst_denorm_trans_dst_pix):
         device = dst_denorm_trans_dst_pix.device
         dst_norm_trans_src_norm: Tensor = (dst_denorm_trans_dst_pix.cpu() @ (dst_pix_trans_src_pix.cpu() @ src_norm_trans_src_pix.cpu())).to(device)
     else:
@@ -1214,8 +1212,7 @@ def normalize_homography3d(
     src_pix_trans_src_norm = _torch_inverse_cast(src_norm_trans_src_pix)
     dst_norm_trans_dst_pix: Tensor = normal_transform_pixel3d(dst_d, dst_h, dst_w).to(dst_pix_trans_src_pix)
     # compute chain transformations
-    # SDAA not support fp64
-    if 'sdaa' in dst_norm_trans_dst_pix.device.type and dst_norm_trans_dst_pix.dtype == torch.float64:
+    if needs_host_fallback("matmul", dst_norm_trans_dst_pix):
         device = dst_norm_trans_dst_pix.device
         dst_norm_trans_src_norm: Tensor = (dst_norm_trans_dst_pix.cpu() @ (dst_pix_trans_src_pix.cpu() @ src_pix_trans_src_norm.cpu())).to(device)
     else:
@@ -1379,8 +1376,7 @@ def camtoworld_graphics_to_vision_4x4(extrinsics_graphics: Tensor) -> Tensor:
         dtype=extrinsics_graphics.dtype,
         device=extrinsics_graphics.device,
     )
-    # SDAA not support fp64
-    if 'sdaa' in invert_yz.device.type and invert_yz.dtype == torch.float64:
+    if needs_host_fallback("matmul", invert_yz):
         device = invert_yz.device
         return (extrinsics_graphics.cpu() @ invert_yz.cpu()).to(device)
     else:
@@ -1444,8 +1440,7 @@ def camtoworld_vision_to_graphics_4x4(extrinsics_vision: Tensor) -> Tensor:
         dtype=extrinsics_vision.dtype,
         device=extrinsics_vision.device,
     )
-    # SDAA not support fp64
-    if 'sdaa' in invert_yz.device.type and invert_yz.dtype == torch.float64:
+    if needs_host_fallback("matmul", invert_yz):
         device = invert_yz.device
         return (extrinsics_vision.cpu() @ invert_yz.cpu()).to(device)
     else:
@@ -1510,8 +1505,7 @@ def camtoworld_to_worldtocam_Rt(R: Tensor, t: Tensor) -> tuple[Tensor, Tensor]:
     KORNIA_CHECK_SHAPE(t, ["B", "3", "1"])
 
     R_inv = R.transpose(1, 2)
-    # SDAA not support fp64
-    if 'sdaa' in R_inv.device.type and R_inv.dtype == torch.float64:
+    if needs_host_fallback("matmul", R_inv):
         device = R_inv.device
         new_t: Tensor = (-R_inv.cpu() @ t.cpu()).to(device)
     else:
@@ -1545,8 +1539,7 @@ def worldtocam_to_camtoworld_Rt(R: Tensor, t: Tensor) -> tuple[Tensor, Tensor]:
     KORNIA_CHECK_SHAPE(t, ["B", "3", "1"])
 
     R_inv = R.transpose(1, 2)
-    # SDAA not support fp64
-    if 'sdaa' in R_inv.device.type and R_inv.dtype == torch.float64:
+    if needs_host_fallback("matmul", R_inv):
         device = R_inv.device
         new_t: Tensor = (-R_inv.cpu() @ t.cpu()).to(device)
     else:
@@ -25,6 +25,7 @@ import torch
 
 import kornia.core as kornia_ops
 from kornia.core import Module, Tensor, tensor
+from kornia.core.capabilities import needs_host_fallback
 from kornia.core.check import KORNIA_CHECK, KORNIA_CHECK_IS_TENSOR, KORNIA_CHECK_SHAPE
 from kornia.filters.sobel import spatial_gradient
 from kornia.utils import create_meshgrid
@@ -254,7 +255,7 @@ def depth_from_plane_equation(
     denom = torch.sum(rays * plane_normals_exp, dim=-1)  # (B, N)
     denom_abs = torch.abs(denom)
     zero_mask = denom_abs < eps
-    if 'sdaa' in denom.device.type:
+    if needs_host_fallback("sign_values", denom):
         device = denom.device
         denom = torch.where(zero_mask, eps * torch.sign(denom.cpu()).to(device), denom)
     else:
@@ -17,9 +17,9 @@
 
 """Module including useful metrics for Structure from Motion."""
 
-import torch
 from torch import Tensor
 
+from kornia.core.capabilities import needs_host_fallback
 from kornia.core.check import KORNIA_CHECK_IS_TENSOR
 from kornia.geometry.conversions import convert_points_to_homogeneous
 from kornia.geometry.linalg import point_line_distance
@@ -63,8 +63,7 @@ def sampson_epipolar_distance(
 
     # Instead we can just transpose F once and switch the order of multiplication
     F_t: Tensor = Fm.transpose(dim0=-2, dim1=-1)
-    # SDAA mm not support fp64
-    if 'sdaa' in F_t.device.type and F_t.dtype == torch.float64:
+    if needs_host_fallback("matmul", F_t):
         device = F_t.device
         line1_in_2: Tensor = (pts1.cpu() @ F_t.cpu()).to(device)
         line2_in_1: Tensor = (pts2.cpu() @ Fm.cpu()).to(device)
@@ -121,8 +120,7 @@ def symmetrical_epipolar_distance(
 
     # Instead we can just transpose F once and switch the order of multiplication
     F_t: Tensor = Fm.transpose(dim0=-2, dim1=-1)
-    # SDAA mm not support fp64
-    if 'sdaa' in F_t.device.type and F_t.dtype == torch.float64:
+    if needs_host_fallback("matmul", F_t):
         device = F_t.device
         line1_in_2: Tensor = (pts1.cpu() @ F_t.cpu()).to(device)
         line2_in_1: Tensor = (pts2.cpu() @ Fm.cpu()).to(device)
@@ -172,8 +170,7 @@ def left_to_right_epipolar_distance(pts1: Tensor, pts2: Tensor, Fm: Tensor) -> T
         pts1 = convert_points_to_homogeneous(pts1)
 
     F_t: Tensor = Fm.transpose(dim0=-2, dim1=-1)
-    # SDAA mm not support fp64
-    if 'sdaa' in F_t.device.type and F_t.dtype == torch.float64:
+    if needs_host_fallback("matmul", F_t):
         device = F_t.device
         line1_in_2: Tensor = (pts1.cpu() @ F_t.cpu()).to(device)
     else:
@@ -210,8 +207,7 @@ def right_to_left_epipolar_distance(pts1: Tensor, pts2: Tensor, Fm: Tensor) -> T
     if pts2.shape[-1] == 2:
         pts2 = convert_points_to_homogeneous(pts2)
 
-    # SDAA mm not support fp64
-    if 'sdaa' in Fm.device.type and Fm.dtype == torch.float64:
+    if needs_host_fallback("matmul", Fm):
         device = Fm.device
         line2_in_1: Tensor = (pts2.cpu() @ Fm.cpu()).to(device)
     else:
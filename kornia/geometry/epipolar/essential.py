@@ -22,6 +22,7 @@ from typing import Optional, Tuple
 import torch
 
 from kornia.core import eye, ones_like, stack, where, zeros
+from kornia.core.capabilities import needs_host_fallback
 from kornia.core.check import KORNIA_CHECK, KORNIA_CHECK_SAME_SHAPE, KORNIA_CHECK_SHAPE
 from kornia.geometry import solvers
 from kornia.utils import eye_like, vec_like
@@ -76,9 +77,8 @@ def run_5point(points1: torch.Tensor, points2: torch.Tensor, weights: Optional[t
     X = torch.cat([x1 * x2, x1 * y2, x1, y1 * x2, y1 * y2, y1, x2, y2, ones], dim=-1)
 
     # apply the weights to the linear system
-    # SDAA mm not support fp64
     device = X.device
-    if 'sdaa' in X.device.type and X.dtype == torch.float64:
+    if needs_host_fallback("matmul", X):
         X = X.cpu()
     if weights is None:
         X = X.transpose(-2, -1) @ X
@@ -247,8 +247,7 @@ def null_to_Nister_solution(X: torch.Tensor, batch_size: int) -> torch.Tensor:
 
     xzs = torch.matmul(torch.inverse(Bs[:, :, 0:2, 0:2]), bs[:, :, 0:2])
 
-    # SDAA not support fp64
-    if 'sdaa' in Bs.device.type and Bs.dtype == torch.float64:
+    if needs_host_fallback("matmul", Bs):
         device = Bs.device
         mask = (abs((Bs[:, 2].unsqueeze(1).cpu() @ xzs.cpu()).to(device) - bs[:, 2].unsqueeze(1)) > 1e-3).flatten()
     else:
@@ -305,8 +304,7 @@ def essential_from_fundamental(F_mat: torch.Tensor, K1: torch.Tensor, K2: torch.
     KORNIA_CHECK_SHAPE(F_mat, ["*", "3", "3"])
     KORNIA_CHECK_SHAPE(K1, ["*", "3", "3"])
     KORNIA_CHECK_SHAPE(K2, ["*", "3", "3"])
-    # SDAA mm not support fp64
-    if 'sdaa' in F_mat.device.type and F_mat.dtype == torch.float64:
+    if needs_host_fallback("matmul", F_mat):
         device = F_mat.device
         return (K2.transpose(-2, -1).cpu() @ F_mat.cpu() @ K1.cpu()).to(device)
     else:
@@ -346,8 +344,7 @@ def decompose_essential_matrix(E_mat: torch.Tensor) -> Tuple[torch.Tensor, torch
     W[..., 2, 2] += 1.0
 
     # reconstruct rotations and retrieve translation vector
-    # SDAA not support fp64
-    if 'sdaa' in U.device.type and U.dtype == torch.float64:
+    if needs_host_fallback("matmul", U):
         device = U.device
         U_W_Vt = (U.cpu() @ W.cpu() @ Vt.cpu()).to(device)
         U_Wt_Vt = (U.cpu() @ W.transpose(-2, -1).cpu() @ Vt.cpu()).to(device)
@@ -387,8 +384,7 @@ def decompose_essential_matrix_no_svd(E_mat: torch.Tensor) -> Tuple[torch.Tensor
     e1, e2, e3 = E_mat[..., 0], E_mat[..., 1], E_mat[..., 2]
 
     # sqrt(1/2 trace(EE^T)), B
-    # SDAA not support fp64
-    if 'sdaa' in E_mat.device.type and E_mat.dtype == torch.float64:
+    if needs_host_fallback("matmul", E_mat):
         device = E_mat.device
         scale_factor = torch.sqrt(0.5 * torch.diagonal((E_mat.cpu() @ E_mat.transpose(-1, -2).cpu()).to(device), dim1=-1, dim2=-2).sum(-1))
     else:
@@ -426,8 +422,7 @@ def decompose_essential_matrix_no_svd(E_mat: torch.Tensor) -> Tuple[torch.Tensor
 
     # Eq.24, recover R
     # (bb)R = Cofactors(E)^T - BE
-    # SDAA not supprot fp64
-    if 'sdaa' in E_mat.device.type and E_mat.dtype == torch.float64:
+    if needs_host_fallback("matmul", E_mat):
         device = E_mat.device
         R1 = (matrix_cofactor_tensor(E_mat) - (B1.cpu() @ E_mat.cpu()).to(device)) / (b1 * b1).sum().unsqueeze(-1)
         R2 = (matrix_cofactor_tensor(E_mat) - (B2.cpu() @ E_mat.cpu()).to(device)) / (b2 * b2).sum().unsqueeze(-1)
@@ -464,8 +459,7 @@ def essential_from_Rt(R1: torch.Tensor, t1: torch.Tensor, R2: torch.Tensor, t2:
     # get the cross product from relative translation vector
     Tx = cross_product_matrix(t[..., 0])
 
-    # SDAA not support fp64
-    if 'sdaa' in Tx.device.type and Tx.dtype == torch.float64:
+    if needs_host_fallback("matmul", Tx):
         device = Tx.device
         return (Tx.cpu() @ R.cpu()).to(device)
     else:
@@ -628,8 +622,7 @@ def relative_camera_motion(
     KORNIA_CHECK_SHAPE(t1, ["*", "3", "1"])
     KORNIA_CHECK_SHAPE(t2, ["*", "3", "1"])
 
-    # SDAA not support fp64
-    if 'sdaa' in R2.device.type and R2.dtype == torch.float64:
+    if needs_host_fallback("matmul", R2):
         device = R2.device
         # compute first the relative rotation
         R = R2.cpu() @ R1.transpose(-2, -1).cpu()
@@ -22,6 +22,7 @@ from typing import Literal, Optional, Tuple
 import torch
 
 from kornia.core import Tensor, concatenate, ones_like, stack, where, zeros
+from kornia.core.capabilities import needs_host_fallback
 from kornia.core.check import KORNIA_CHECK_SAME_SHAPE, KORNIA_CHECK_SHAPE
 from kornia.geometry.conversions import convert_points_from_homogeneous, convert_points_to_homogeneous
 from kornia.geometry.linalg import transform_points
@@ -140,8 +141,7 @@ def run_7point(points1: Tensor, points2: Tensor) -> Tensor:
     f1_det = torch.linalg.det(f1)
     f2_det = torch.linalg.det(f2)
     coeffs[:, 0] = f1_det
-    # SDAA not support fp64
-    if 'sdaa' in f2.device.type and f2.dtype == torch.float64:
+    if needs_host_fallback("matmul", f2):
         device = f2.device
         coeffs[:, 1] = torch.einsum("bii->b", (f2.cpu() @ safe_inverse_with_mask(f1)[0].cpu()).to(device)) * f1_det
         coeffs[:, 2] = torch.einsum("bii->b", (f1.cpu() @ safe_inverse_with_mask(f2)[0].cpu()).to(device)) * f2_det
@@ -179,8 +179,7 @@ def run_7point(points1: Tensor, points2: Tensor) -> Tensor:
 
     mat_ind = zeros(3, 3, dtype=torch.bool)
     mat_ind[2, 2] = True
-    # SDAA bug
-    if 'sdaa' in fmatrix.device.type:
+    if needs_host_fallback("index_put", fmatrix):
         device = fmatrix.device
         fmatrix = fmatrix.cpu()
         fmatrix[_s_non_zero_mask.cpu(), mat_ind.cpu()] = 1.0
@@ -239,9 +238,8 @@ def run_8point(points1: Tensor, points2: Tensor, weights: Optional[Tensor] = Non
     X = torch.cat([x2 * x1, x2 * y1, x2, y2 * x1, y2 * y1, y2, x1, y1, ones], dim=-1)  # BxNx9
 
     # apply the weights to the linear system
-    # SDAA not support fp64
     device = X.device
-    if 'sdaa' in X.device.type and X.dtype == torch.float64:
+    if needs_host_fallback("matmul", X):
         X = X.cpu()
     if weights is None:
         X = X.transpose(-2, -1) @ X
@@ -258,7 +256,7 @@ def run_8point(points1: Tensor, points2: Tensor, weights: Optional[Tensor] = Non
     U, S, V = _torch_svd_cast(F_mat)
     rank_mask = torch.tensor([1.0, 1.0, 0.0], device=F_mat.device, dtype=F_mat.dtype)
 
-    if 'sdaa' in U.device.type and U.dtype == torch.float64:
+    if needs_host_fallback("matmul", U):
         F_projected = (U.cpu() @ (torch.diag_embed(S * rank_mask).cpu() @ V.transpose(-2, -1).cpu())).to(device)
         F_est = (transform2.transpose(-2, -1).cpu() @ (F_projected.cpu() @ transform1.cpu())).to(device)
     else:
@@ -318,8 +316,7 @@ def compute_correspond_epilines(points: Tensor, F_mat: Tensor) -> Tensor:
     KORNIA_CHECK_SHAPE(F_mat, ["*", "3", "3"])
     # project points and retrieve lines components
     points_h = torch.transpose(points_h, dim0=-2, dim1=-1)
-    # SDAA not support fp64
-    if 'sdaa' in F_mat.device.type and F_mat.dtype == torch.float64:
+    if needs_host_fallback("matmul", F_mat):
         device = F_mat.device
         a, b, c = torch.chunk(F_mat.cpu() @ points_h.cpu(), dim=-2, chunks=3)
         a, b, c = a.to(device), b.to(device), c.to(device)
@@ -408,8 +405,7 @@ def fundamental_from_essential(E_mat: Tensor, K1: Tensor, K2: Tensor) -> Tensor:
     if not len(E_mat.shape[:-2]) == len(K1.shape[:-2]) == len(K2.shape[:-2]):
         raise AssertionError
 
-    # SDAA not support fp64
-    if 'sdaa' in K2.device.type and K2.dtype == torch.float64:
+    if needs_host_fallback("matmul", K2):
         device = K2.device
         return ((safe_inverse_with_mask(K2)[0]).transpose(-2, -1).cpu() @ E_mat.cpu() @ (safe_inverse_with_mask(K1)[0]).cpu()).to(device)
     else:
@@ -23,6 +23,7 @@ import torch
 from torch.linalg import qr as linalg_qr
 
 from kornia.core import Tensor, concatenate, ones_like, pad, stack, zeros_like
+from kornia.core.capabilities import needs_host_fallback
 from kornia.core.check import KORNIA_CHECK_SHAPE
 from kornia.utils import eye_like, vec_like
 from kornia.utils.helpers import _torch_svd_cast
@@ -126,8 +127,7 @@ def projection_from_KRt(K: Tensor, R: Tensor, t: Tensor) -> Tensor:
     K_h = pad(K, [0, 1, 0, 1], "constant", 0.0)  # 4x4
     K_h[..., -1, -1] += 1.0
 
-    # SDAA not support fp16
-    if 'sdaa' in K.device.type and K.dtype == torch.float64:
+    if needs_host_fallback("matmul", K):
         device = K.device
         return (K.cpu() @ Rt.cpu()).to(device)
     else:
@@ -154,9 +154,8 @@ def KRt_from_projection(P: Tensor, eps: float = 1e-6) -> Tuple[Tensor, Tensor, T
     # Trick to turn QR-decomposition into RQ-decomposition
     reverse = torch.tensor([[0, 0, 1], [0, 1, 0], [1, 0, 0]], device=P.device, dtype=P.dtype).unsqueeze(0)
 
-    # SDAA matmul not support fp64
     device = reverse.device
-    if 'sdaa' in device.type and reverse.dtype == torch.float64:
+    if needs_host_fallback("matmul", reverse):
         submat_3x3 = torch.matmul(reverse.cpu(), submat_3x3.cpu()).to(device).permute(0, 2, 1)
         ortho_mat, upper_mat = linalg_qr(submat_3x3)
         ortho_mat = torch.matmul(reverse.cpu(), ortho_mat.permute(0, 2, 1).cpu()).to(device)
@@ -169,13 +168,13 @@ def KRt_from_projection(P: Tensor, eps: float = 1e-6) -> Tuple[Tensor, Tensor, T
 
     # Turning the `upper_mat's` diagonal elements to positive.
     diagonals = torch.diagonal(upper_mat, dim1=-2, dim2=-1) + eps
-    if 'sdaa' in device.type:
+    if needs_host_fallback("sign_values", diagonals):
         signs = torch.sign(diagonals.cpu()).to(device)
     else:
         signs = torch.sign(diagonals)
     signs_mat = torch.diag_embed(signs)
 
-    if 'sdaa' in device.type and upper_mat.dtype == torch.float64:
+    if needs_host_fallback("matmul", upper_mat):
         K = torch.matmul(upper_mat.cpu(), signs_mat.cpu()).to(device)
         R = torch.matmul(signs_mat.cpu(), ortho_mat.cpu()).to(device)
         t = torch.matmul(torch.inverse(K).cpu(), last_column.cpu()).to(device)
@@ -235,8 +234,7 @@ def projections_from_fundamental(F_mat: Tensor) -> Tensor:
 
     _, e2 = _nullspace(Ft_mat)
 
-    # SDAA not support fp64
-    if 'sdaa' in e2.device.type and e2.dtype == torch.float64:
+    if needs_host_fallback("matmul", e2):
         device = e2.device
         R2 = (cross_product_matrix(e2.cpu()) @ F_mat.cpu()).to(device)  # Bx3x3
     else:
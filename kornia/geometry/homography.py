@@ -21,6 +21,7 @@ from typing import Optional, Tuple
 import torch
 
 from kornia.core import Tensor
+from kornia.core.capabilities import needs_host_fallback
 from kornia.core.check import KORNIA_CHECK_SHAPE
 from kornia.utils import _extract_device_dtype, safe_inverse_with_mask, safe_solve_with_mask
 from kornia.utils.helpers import _torch_svd_cast
@@ -131,8 +132,7 @@ def line_segment_transfer_error_one_way(ls1: Tensor, ls2: Tensor, H: Tensor, squ
     ln2 = ps2_h.cross(pe2_h, dim=3)
     ps1_in2 = convert_points_to_homogeneous(transform_points(H, ps1))
     pe1_in2 = convert_points_to_homogeneous(transform_points(H, pe1))
-    # SDAA not support fp64
-    if 'sdaa' in ln2.device.type and ln2.dtype == torch.float64:
+    if needs_host_fallback("matmul", ln2):
         device = ln2.device
         er_st1 = (ln2.cpu() @ ps1_in2.transpose(-2, -1).cpu()).to(device).view(B, N).abs()
         er_end1 = (ln2.cpu() @ pe1_in2.transpose(-2, -1).cpu()).to(device).view(B, N).abs()
@@ -185,9 +185,8 @@ def find_homography_dlt(
     ay = torch.cat([x1, y1, ones, zeros, zeros, zeros, -x2 * x1, -x2 * y1, -x2], dim=-1)
     A = torch.cat((ax, ay), dim=-1).reshape(ax.shape[0], -1, ax.shape[-1])
 
-    # SDAA not support fp64
     device = A.device
-    if 'sdaa' in A.device.type and A.dtype == torch.float64:
+    if needs_host_fallback("matmul", A):
         A = A.cpu()
     if weights is None:
         # All points are equally important
@@ -213,8 +212,7 @@ def find_homography_dlt(
         H = sol.reshape(-1, 3, 3)
     else:
         raise NotImplementedError
-    # SDAA not support fp64
-    if 'sdaa' in transform2.device.type and transform2.dtype == torch.float64:
+    if needs_host_fallback("matmul", transform2):
         device = transform2.device
         H = (safe_inverse_with_mask(transform2)[0].cpu() @ (H.cpu() @ transform1.cpu())).to(device)
     else:
@@ -274,8 +272,7 @@ def sample_is_valid_for_homography(points1: Tensor, points2: Tensor) -> Tensor:
 
     src_perm = points_src_h[:, idx_perm]
     dst_perm = points_dst_h[:, idx_perm]
-    # SDAA not support fp64
-    if 'sdaa' in src_perm.device.type and src_perm.dtype == torch.float64:
+    if needs_host_fallback("matmul", src_perm):
         device = src_perm.device
         left_sign = (
             torch.cross(src_perm[..., 1:2, :], (src_perm[..., 2:3, :]).cpu() @ src_perm[..., 0:1, :].permute(0, 1, 3, 2).cpu()).to(device)
@@ -290,8 +287,7 @@ def sample_is_valid_for_homography(points1: Tensor, points2: Tensor) -> Tensor:
         right_sign = (
             torch.cross(dst_perm[..., 1:2, :], dst_perm[..., 2:3, :]) @ dst_perm[..., 0:1, :].permute(0, 1, 3, 2)
         ).sign()
-    # SDAA min not support bool
-    if 'sdaa' in left_sign.device.type:
+    if needs_host_fallback("reduce_bool", left_sign):
         device = left_sign.device
         sample_is_valid = (left_sign == right_sign).view(-1, 4).cpu().min(dim=1)[0].to(device)
     else:
@@ -348,9 +344,8 @@ def find_homography_lines_dlt(ls1: Tensor, ls2: Tensor, weights: Optional[Tensor
     ay = torch.cat([A * xe1, A * ye1, A, B * xe1, B * ye1, B, C * xe1, C * ye1, C], dim=-1)
     A = torch.cat((ax, ay), dim=-1).reshape(ax.shape[0], -1, ax.shape[-1])
 
-    # SDAA not support fp64
     device = A.device
-    if 'sdaa' in device.type and A.dtype == torch.float64:
+    if needs_host_fallback("matmul", A):
         A = A.cpu()
     if weights is None:
         # All points are equally important
@@ -370,8 +365,7 @@ def find_homography_lines_dlt(ls1: Tensor, ls2: Tensor, weights: Optional[Tensor
         return torch.empty((points1_norm.size(0), 3, 3), device=device, dtype=dtype)
 
     H = V[..., -1].view(-1, 3, 3)
-    # SDAA not support fp64
-    if 'sdaa' in transform2.device.type and transform2.dtype == torch.float64:
+    if needs_host_fallback("matmul", transform2):
         device = transform2.device
         H = (safe_inverse_with_mask(transform2)[0].cpu() @ (H.cpu() @ transform1.cpu())).to(device)
     else:
@@ -26,8 +26,13 @@ from kornia.geometry import transform_points
 __all__ = ["Keypoints", "Keypoints3D"]
 
 
-def _merge_keypoint_list(keypoints: List[Tensor]) -> Tensor:
-    raise NotImplementedError
+def _merge_keypoint_list(keypoints: List[Tensor]) -> Tuple[Tensor, List[int]]:
+    r"""Merge a list of keypoints into one tensor, padded to the largest number of keypoints."""
+    if not all(kp.dim() == 2 and kp.shape[-1] == keypoints[0].shape[-1] for kp in keypoints):
+        raise TypeError(f"Input keypoints must be a list of (N, D) shaped. Got: {[kp.shape for kp in keypoints]}.")
+    max_N = max(kp.shape[0] for kp in keypoints)
+    stats = [max_N - kp.shape[0] for kp in keypoints]
+    return torch.nn.utils.rnn.pad_sequence(keypoints, batch_first=True), stats
 
 
 class Keypoints:
@@ -160,7 +165,9 @@ class Keypoints:
             self._data = transformed_boxes
             return self
 
-        return Keypoints(transformed_boxes, False)
+        obj = Keypoints(transformed_boxes, False)
+        obj._N = self._N
+        return obj
 
     def transform_keypoints_(self, M: Tensor) -> "Keypoints":
         """Inplace version of :func:`Keypoints.transform_keypoints`."""
@@ -183,12 +190,14 @@ class Keypoints:
             Keypoints tensor :math:`(B, N, 2)`
 
         """
-        if as_padded_sequence:
-            raise NotImplementedError
+        if self._N is not None and not as_padded_sequence:
+            return [kp[: kp.shape[0] - n] for kp, n in zip(self._data, self._N)]
         return self._data
 
     def clone(self) -> "Keypoints":
-        return Keypoints(self._data.clone(), False)
+        obj = type(self)(self._data.clone(), False)
+        obj._N = self._N
+        return obj
 
     def type(self, dtype: torch.dtype) -> "Keypoints":
         self._data = self._data.type(dtype)
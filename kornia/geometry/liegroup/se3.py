@@ -35,6 +35,7 @@ from kornia.core import (
     where,
     zeros_like,
 )
+from kornia.core.capabilities import needs_host_fallback
 from kornia.core.check import KORNIA_CHECK, KORNIA_CHECK_SAME_DEVICES
 from kornia.geometry.liegroup.so3 import So3
 from kornia.geometry.linalg import batched_dot_product
@@ -186,8 +187,7 @@ class Se3(Module):
         omega = v[..., 3:]
         omega_hat = So3.hat(omega)
         omega_hat_sq = omega_hat @ omega_hat
-        # SDAA tensor 0.sqrt bug
-        if 'sdaa' in omega.device.type:
+        if needs_host_fallback("sqrt", omega):
             device = omega.device
             theta = batched_dot_product(omega, omega).cpu().sqrt().to(device)
         else:
@@ -212,7 +212,7 @@ class Se3(Module):
 
         """
         omega = self.r.log()
-        if 'sdaa' in omega.device.type:
+        if needs_host_fallback("sqrt", omega):
             device = omega.device
             theta = batched_dot_product(omega, omega).cpu().sqrt().to(device)
         else:
@@ -22,6 +22,7 @@ from __future__ import annotations
 from typing import Optional
 
 from kornia.core import Device, Dtype, Module, Tensor, concatenate, eye, stack, tensor, where, zeros, zeros_like
+from kornia.core.capabilities import needs_host_fallback
 from kornia.core.check import KORNIA_CHECK_TYPE
 from kornia.geometry.conversions import vector_to_skew_symmetric_matrix
 from kornia.geometry.linalg import batched_dot_product
@@ -145,7 +146,7 @@ class So3(Module):
                     [0., 0., 0.]], grad_fn=<WhereBackward0>)
 
         """
-        if 'sdaa' in self.q.vec.device.type:
+        if needs_host_fallback("sqrt", self.q.vec):
             device = self.q.vec.device
             theta = batched_dot_product(self.q.vec, self.q.vec).cpu().sqrt().to(device)
         else:
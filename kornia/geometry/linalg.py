@@ -20,6 +20,7 @@ from __future__ import annotations
 import torch
 
 from kornia.core import Tensor, zeros_like
+from kornia.core.capabilities import needs_host_fallback
 from kornia.core.check import KORNIA_CHECK_IS_TENSOR, KORNIA_CHECK_SHAPE
 from kornia.geometry.conversions import convert_points_from_homogeneous, convert_points_to_homogeneous
 
@@ -79,8 +80,7 @@ def compose_transformations(trans_01: Tensor, trans_12: Tensor) -> Tensor:
     tvec_12: Tensor = trans_12[..., :3, -1:]  # Nx3x1
 
     # compute the actual transforms composition
-    # SDAA not support matmul fp64
-    if 'sdaa' in rmat_01.device.type and rmat_01.dtype == torch.float64:
+    if needs_host_fallback("matmul", rmat_01):
         device = rmat_01.device
         rmat_02: Tensor = torch.matmul(rmat_01.cpu(), rmat_12.cpu()).to(device)
         tvec_02: Tensor = torch.matmul(rmat_01.cpu(), tvec_12.cpu()).to(device) + tvec_01
@@ -129,8 +129,7 @@ def inverse_transformation(trans_12: Tensor) -> Tensor:
 
     # compute the actual inverse
     rmat_21 = torch.transpose(rmat_12, -1, -2)
-    # SDAA matmul not support fp64
-    if 'sdaa' in rmat_21.device.type and rmat_21.dtype == torch.float64:
+    if needs_host_fallback("matmul", rmat_21):
         device = rmat_21.device
         tvec_21 = torch.matmul(-rmat_21.cpu(), tvec_12.cpu()).to(device)
     else:
@@ -222,8 +221,7 @@ def transform_points(trans_01: Tensor, points_1: Tensor) -> Tensor:
     # to homogeneous
     points_1_h = convert_points_to_homogeneous(points_1)  # BxNxD+1
     # transform coordinates
-    # SDAA torch.bmm not support fp64
-    if points_1_h.dtype == torch.float64 and 'sdaa' in points_1_h.device.type:
+    if needs_host_fallback("matmul", points_1_h):
         device = points_1_h.device
         points_0_h = torch.bmm(points_1_h.cpu(), trans_01.permute(0, 2, 1).cpu()).to(device)
     else:
@@ -24,7 +24,7 @@ from typing import Callable, Optional, Tuple
 import torch
 
 from kornia.core import Device, Module, Tensor, zeros
-from kornia.core.check import KORNIA_CHECK_SHAPE
+from kornia.core.check import KORNIA_CHECK, KORNIA_CHECK_SHAPE
 from kornia.geometry import (
     find_fundamental,
     find_homography_dlt,
@@ -42,6 +42,22 @@ from kornia.geometry.homography import (
 __all__ = ["RANSAC"]
 
 
+def _sample_without_replacement(pop_size: Tensor, sample_size: int) -> Tensor:
+    r"""Draw ``sample_size`` distinct integers in :math:`[0, pop\_size)` for every entry of ``pop_size``.
+
+    Robert Floyd's algorithm, vectorised over the entries: it costs :math:`O(sample\_size^2)` per entry instead of
+    the :math:`O(pop\_size)` of sorting random keys. The first ``k`` columns of the output are themselves a uniform
+    sample of :math:`[0, pop\_size - sample\_size + k)`.
+    """
+    out = torch.empty(*pop_size.shape, sample_size, dtype=torch.long, device=pop_size.device)
+    for j in range(sample_size):
+        high = (pop_size - sample_size + j + 1).clamp(min=1)
+        cand = (torch.rand(pop_size.shape, device=pop_size.device) * high).long().clamp(max=high - 1)
+        taken = (out[..., :j] == cand[..., None]).any(dim=-1)
+        out[..., j] = torch.where(taken, high - 1, cand)
+    return out
+
+
 class RANSAC(Module):
     """Module for robust geometry estimation with RANSAC. https://en.wikipedia.org/wiki/Random_sample_consensus.
 
@@ -53,6 +69,12 @@ class RANSAC(Module):
         max_iterations: maximum batches to generate. Actual number of models to try is ``batch_size * max_iterations``.
         confidence: desired confidence of the result, used for the early stopping.
         max_local_iterations: number of local optimization (polishing) iterations.
+        sampling: how the minimal samples are drawn when correspondence weights are given to :meth:`forward`,
+            either ``"uniform"`` (the weights are ignored), ``"prosac"`` (progressive sampling from the best ranked
+            correspondences :cite:`chum2005prosac`) or ``"weighted"`` (probability proportional to the weights).
+            Without weights the sampling is uniform.
+        sprt: whether to reject bad hypotheses early with Wald's sequential probability ratio test
+            :cite:`chum2008optimal`, scoring them on growing random subsets of the correspondences.
 
     """
 
@@ -64,6 +86,8 @@ class RANSAC(Module):
         max_iter: int = 10,
         confidence: float = 0.99,
         max_lo_iters: int = 5,
+        sprt: bool = False,
+        sampling: str = "uniform",
     ) -> None:
         super().__init__()
         self.supported_models = ["homography", "fundamental", "fundamental_7pt", "homography_from_linesegments"]
@@ -74,6 +98,21 @@ class RANSAC(Module):
         self.confidence = confidence
         self.max_lo_iters = max_lo_iters
         self.model_type = model_type
+        self.sprt = sprt
+        # size of the first subset evaluated by the SPRT, doubled at every stage
+        self.sprt_min_points = 64
+        # cost of estimating a model, in units of the cost of verifying a single correspondence
+        self.sprt_model_cost = 200.0
+        # prior on the inlier ratio until a better model is found, models far below it are rejected
+        self.sprt_min_inlier_ratio = 0.05
+        self.supported_samplings = ["uniform", "prosac", "weighted"]
+        if sampling not in self.supported_samplings:
+            raise NotImplementedError(f"{sampling} sampling is unknown. Try one of {self.supported_samplings}")
+        self.sampling = sampling
+        # number of samples after which PROSAC has grown to all the correspondences and becomes uniform RANSAC
+        self.prosac_max_samples = 200000
+        # probability of a correspondence supporting a wrong model, for the PROSAC non-randomness test
+        self.prosac_beta = 0.05
 
         self.error_fn: Callable[..., Tensor]
         self.minimal_solver: Callable[..., Tensor]
@@ -102,16 +141,38 @@ class RANSAC(Module):
         else:
             raise NotImplementedError(f"{model_type} is unknown. Try one of {self.supported_models}")
 
-    def sample(self, sample_size: int, pop_size: int, batch_size: int, device: Optional[Device] = None) -> Tensor:
-        """Minimal sampler, but unlike traditional RANSAC we sample in batches.
+    def sample(
+        self,
+        sample_size: int,
+        pop_size: int,
+        batch_size: int,
+        device: Optional[Device] = None,
+        weights: Optional[Tensor] = None,
+    ) -> Tensor:
+        r"""Minimal sampler, but unlike traditional RANSAC we sample in batches.
 
         Yields the benefit of the parallel processing, esp. on GPU.
+
+        Args:
+            sample_size: number of distinct indices per sample.
+            pop_size: number of elements to draw from.
+            batch_size: number of samples.
+            device: device of the output.
+            weights: optional non-negative weights :math:`(pop\_size,)`. Each sample is then drawn sequentially
+                without replacement, with probabilities proportional to the weights.
+
+        Returns:
+            the sampled indices, shape of :math:`(batch\_size, sample\_size)`.
+
         """
+        if weights is not None:
+            # Efraimidis-Spirakis weighted sampling: keep the largest log(u) / w keys
+            keys = torch.rand(batch_size, pop_size, device=weights.device).log() / weights.clamp(min=1e-12)
+            return keys.topk(k=sample_size, dim=1)[1]
         if device is None:
             device = torch.device("cpu")
-        rand = torch.rand(batch_size, pop_size, device=device)
-        _, out = rand.topk(k=sample_size, dim=1)
-        return out
+        pop = torch.full((batch_size,), pop_size, dtype=torch.long, device=device)
+        return _sample_without_replacement(pop, sample_size)
 
     @staticmethod
     def max_samples_by_conf(n_inl: int, num_tc: int, sample_size: int, conf: float) -> float:
@@ -128,48 +189,18 @@ class RANSAC(Module):
         H = self.minimal_solver(kp1, kp2, torch.ones(batch_size, sample_size, dtype=kp1.dtype, device=kp1.device))
         return H
 
-    def verify(self, kp1: Tensor, kp2: Tensor, models: Tensor, inl_th: float) -> Tuple[Tensor, Tensor, float]:
-        if len(kp1.shape) == 2:
-            kp1 = kp1[None]
-        if len(kp2.shape) == 2:
-            kp2 = kp2[None]
-        batch_size = models.shape[0]
-        if self.model_type == "homography_from_linesegments":
-            errors = self.error_fn(kp1.expand(batch_size, -1, 2, 2), kp2.expand(batch_size, -1, 2, 2), models)
-        else:
-            errors = self.error_fn(kp1.expand(batch_size, -1, 2), kp2.expand(batch_size, -1, 2), models)
-        inl = errors <= inl_th
-        models_score = inl.to(kp1).sum(dim=1)
-        best_model_idx = models_score.argmax()
-        best_model_score = models_score[best_model_idx].item()
-        model_best = models[best_model_idx].clone()
-        inliers_best = inl[best_model_idx]
-        return model_best, inliers_best, best_model_score
-
-    def remove_bad_samples(self, kp1: Tensor, kp2: Tensor) -> Tuple[Tensor, Tensor]:
+    def sample_is_valid(self, kp1: Tensor, kp2: Tensor) -> Tensor:
         # ToDo: add (model-specific) verification of the samples,
         # E.g. constraints on not to be a degenerate sample
         if self.model_type == "homography":
-            mask = sample_is_valid_for_homography(kp1, kp2)
-            return kp1[mask], kp2[mask]
-        return kp1, kp2
+            return sample_is_valid_for_homography(kp1, kp2)
+        return torch.ones(kp1.shape[0], dtype=torch.bool, device=kp1.device)
 
-    def remove_bad_models(self, models: Tensor) -> Tensor:
+    def model_is_valid(self, models: Tensor) -> Tensor:
         # ToDo: add more and better degenerate model rejection
         # For now it is simple and hardcoded
-        main_diagonal = torch.diagonal(models, dim1=1, dim2=2)
-        mask = main_diagonal.abs().min(dim=1)[0] > 1e-4
-        return models[mask]
-
-    def polish_model(self, kp1: Tensor, kp2: Tensor, inliers: Tensor) -> Tensor:
-        # TODO: Replace this with MAGSAC++ polisher
-        kp1_inl = kp1[inliers][None]
-        kp2_inl = kp2[inliers][None]
-        num_inl = kp1_inl.size(1)
-        model = self.polisher_solver(
-            kp1_inl, kp2_inl, torch.ones(1, num_inl, dtype=kp1_inl.dtype, device=kp1_inl.device)
-        )
-        return model
+        main_diagonal = torch.diagonal(models, dim1=-2, dim2=-1)
+        return main_diagonal.abs().min(dim=-1)[0] > 1e-4
 
     def validate_inputs(self, kp1: Tensor, kp2: Tensor, weights: Optional[Tensor] = None) -> None:
         if self.model_type in ["homography", "fundamental"]:
@@ -196,61 +227,414 @@ class RANSAC(Module):
         Args:
             kp1: source image keypoints :math:`(N, 2)`.
             kp2: distance image keypoints :math:`(N, 2)`.
-            weights: optional correspondences weights. Not used now.
+            weights: optional correspondences weights :math:`(N,)`, higher is better, e.g. the ``confidence`` of
+                a matcher. They guide the sampling, see ``sampling``. For descriptor distances pass e.g.
+                ``1 - dists``.
 
         Returns:
-            - Estimated model, shape of :math:`(1, 3, 3)`.
-            - The inlier/outlier mask, shape of :math:`(1, N)`, where N is number of input correspondences.
+            - Estimated model, shape of :math:`(3, 3)`.
+            - The inlier/outlier mask, shape of :math:`(N,)`, where N is number of input correspondences.
 
         """
         self.validate_inputs(kp1, kp2, weights)
-        best_score_total: float = float(self.minimal_sample_size)
-        num_tc: int = len(kp1)
-        best_model_total = zeros(3, 3, dtype=kp1.dtype, device=kp1.device)
-        inliers_best_total: Tensor = zeros(num_tc, 1, device=kp1.device, dtype=torch.bool)
+        # the batched engine keeps the scores on device and only syncs to decide the termination
+        models, inliers = self.forward_batch(kp1[None], kp2[None], weights=None if weights is None else weights[None])
+        return models[0], inliers[0]
+
+    @staticmethod
+    def max_samples_by_conf_batch(n_inl: Tensor, num_tc: Tensor, sample_size: int, conf: float) -> Tensor:
+        """Vectorised :meth:`max_samples_by_conf` over a batch of correspondence sets."""
+        eps = 1e-9
+        ratio = (n_inl / num_tc.clamp(min=1)).clamp(max=1.0)
+        denom = torch.log((1.0 - ratio.pow(sample_size)).clamp(min=eps)).clamp(max=-eps)
+        out = math.log(1.0 - conf) / denom
+        done = (num_tc <= sample_size) | (n_inl >= num_tc)
+        return torch.where(done, torch.ones_like(out), out)
+
+    def prosac_sizes(self, mask: Tensor, num_drawn: int) -> Tensor:
+        r"""Compute the PROSAC sampling pool size of the next ``batch_size`` hypotheses :cite:`chum2005prosac`.
+
+        The hypotheses are drawn from the :math:`n` best ranked correspondences, where :math:`n` grows following the
+        growth function :math:`T'_n` so that after ``prosac_max_samples`` hypotheses all the correspondences are used.
+
+        Args:
+            mask: validity of the correspondences :math:`(B, N)`.
+            num_drawn: number of hypotheses already drawn for each set.
+
+        Returns:
+            the pool sizes, shape of :math:`(B, batch\_size)`. Hypotheses past the end of the growth get a size
+            larger than the set.
+
+        """
+        B, N = mask.shape
+        m = self.minimal_sample_size
+        n = torch.arange(m, max(N, m) + 1, device=mask.device, dtype=torch.float64)
+        total = mask.sum(dim=1, keepdim=True).to(torch.float64)
+        # T_n = T_N * prod_{i<m} (n - i) / (N - i), the expected number of samples drawn from the n best only
+        T_n = torch.full((B, len(n)), float(self.prosac_max_samples), device=mask.device, dtype=torch.float64)
+        for i in range(m):
+            T_n = T_n * (n - i) / (total - i).clamp(min=1)
+        # T'_m = 1 and T'_{n+1} = T'_n + ceil(T_{n+1} - T_n)
+        T_prime = torch.cat([T_n.new_ones(B, 1), T_n.diff(dim=1).ceil().clamp(min=0.0)], dim=1).cumsum(dim=1)
+        T_prime = T_prime.masked_fill(n > total, float("inf"))
+        t = torch.arange(num_drawn + 1, num_drawn + self.batch_size + 1, device=mask.device, dtype=torch.float64)
+        return m + torch.searchsorted(T_prime, t.expand(B, -1).contiguous())
+
+    def prosac_max_samples_batch(self, inliers: Tensor, mask: Tensor, weights: Tensor) -> Tensor:
+        """Compute the PROSAC termination length of each correspondence set :cite:`chum2005prosac`.
+
+        For every prefix of the ranked correspondences supporting the model non-randomly, the number of samples
+        needed to reach ``confidence`` is computed from the inlier ratio of the prefix. The smallest one is returned,
+        which stops much earlier than :meth:`max_samples_by_conf_batch` when the inliers are ranked first.
+
+        Args:
+            inliers: the inliers of the best models :math:`(B, N)`.
+            mask: validity of the correspondences :math:`(B, N)`.
+            weights: the correspondence weights :math:`(B, N)`, higher is better.
+
+        Returns:
+            the required number of samples, shape of :math:`(B,)`.
+
+        """
+        B, N = mask.shape
+        m = self.minimal_sample_size
+        order = weights.masked_fill(~mask, -float("inf")).argsort(dim=1, descending=True, stable=True)
+        inl_n = (inliers & mask).gather(1, order).to(weights.dtype).cumsum(dim=1)
+        n = torch.arange(1, N + 1, device=mask.device, dtype=weights.dtype).expand(B, -1)
+        # normal approximation of the binomial support of a random model, on top of its own minimal sample
+        support = (n - m).clamp(min=0.0)
+        beta = self.prosac_beta
+        random_support = support * beta + 1.645 * (support * beta * (1.0 - beta)).sqrt()
+        non_random = inl_n >= m + random_support.ceil().clamp(min=m)
+        k_n = self.max_samples_by_conf_batch(inl_n, n, m, self.confidence)
+        k_n = k_n.masked_fill(~non_random | (n > mask.sum(dim=1, keepdim=True)), float("inf"))
+        return k_n.min(dim=1)[0]
+
+    def sample_batch(self, mask: Tensor, weights: Optional[Tensor] = None, num_drawn: int = 0) -> Tensor:
+        r"""Draw ``batch_size`` minimal samples for each correspondence set.
+
+        Without weights, or with the ``"uniform"`` sampling, the samples are uniform over the valid correspondences.
+        Otherwise they follow ``sampling``:
+        PROSAC draws each sample from a pool of the best ranked correspondences growing with ``num_drawn``, always
+        including the last one of the pool, while weighted sampling draws every correspondence with a probability
+        proportional to its weight.
+
+        Args:
+            mask: validity of the correspondences :math:`(B, N)`.
+            weights: optional correspondence weights :math:`(B, N)`, higher is better.
+            num_drawn: number of hypotheses already drawn for each set, drives the PROSAC growth.
+
+        Returns:
+            the indices of the sampled correspondences, shape of :math:`(B, batch\_size, minimal\_sample\_size)`.
+
+        """
+        B, N = mask.shape
+        m = self.minimal_sample_size
+        if weights is not None and self.sampling == "weighted":
+            # Efraimidis-Spirakis keys, padded correspondences are never drawn
+            rand = torch.rand(B, self.batch_size, N, device=mask.device, dtype=weights.dtype)
+            keys = (rand.log() / weights.clamp(min=1e-12)[:, None]).masked_fill(~mask[:, None], -float("inf"))
+            return keys.topk(k=m, dim=2)[1]
+        num_tc = mask.sum(dim=1)
+        pool = num_tc[:, None].expand(B, self.batch_size)
+        if weights is None or self.sampling == "uniform":
+            # valid correspondences first, the positions are drawn among them
+            order = (~mask).to(torch.uint8).argsort(dim=1, stable=True)
+            pos = _sample_without_replacement(pool, m)
+        else:
+            order = weights.masked_fill(~mask, -float("inf")).argsort(dim=1, descending=True, stable=True)
+            sizes = self.prosac_sizes(mask, num_drawn)
+            growing = sizes <= pool
+            pool = torch.where(growing, sizes, pool)
+            # m - 1 correspondences among the n - 1 best and the n-th one, uniform once the pool stopped growing
+            pos = _sample_without_replacement(pool, m)
+            pos[..., -1] = torch.where(growing, pool - 1, pos[..., -1])
+        return order.gather(1, pos.flatten(1)).view(B, self.batch_size, m)
+
+    def estimate_models_batch(
+        self, kp1: Tensor, kp2: Tensor, mask: Tensor, idxs: Optional[Tensor] = None
+    ) -> Tuple[Tensor, Tensor]:
+        """Sample minimal sets and estimate ``batch_size`` hypotheses for each correspondence set.
+
+        Args:
+            kp1: source keypoints :math:`(B, N, ...)`.
+            kp2: destination keypoints :math:`(B, N, ...)`.
+            mask: validity of the correspondences :math:`(B, N)`.
+            idxs: optional minimal samples :math:`(B, S, m)`, drawn by :meth:`sample_batch` otherwise.
+
+        Returns:
+            - The models, shape of :math:`(B, M, 3, 3)`.
+            - The validity of the models, shape of :math:`(B, M)`.
+
+        """
+        B = mask.shape[0]
+        if idxs is None:
+            idxs = self.sample_batch(mask)
+        batch_idxs = torch.arange(B, device=kp1.device)[:, None, None]
+        kp1_sampled = kp1[batch_idxs, idxs].flatten(0, 1)
+        kp2_sampled = kp2[batch_idxs, idxs].flatten(0, 1)
+        sample_ok = self.sample_is_valid(kp1_sampled, kp2_sampled)
+        models = self.estimate_model_from_minsample(kp1_sampled, kp2_sampled)
+        # solvers returning several solutions per sample (e.g. 7pt) are flattened into extra hypotheses
+        num_solutions = models.numel() // (9 * kp1_sampled.shape[0])
+        models = models.reshape(B, -1, 3, 3)
+        sample_ok = sample_ok.view(B, -1, 1).expand(-1, -1, num_solutions).reshape(B, -1)
+        models_ok = sample_ok & self.model_is_valid(models) & models.isfinite().flatten(-2).all(-1)
+        return models, models_ok
+
+    def verify_batch(
+        self, kp1: Tensor, kp2: Tensor, mask: Tensor, models: Tensor, models_ok: Tensor, inl_th: float
+    ) -> Tuple[Tensor, Tensor, Tensor]:
+        """Score the hypotheses of each correspondence set and select the best one, without host syncs.
+
+        Args:
+            kp1: source keypoints :math:`(B, N, ...)`.
+            kp2: destination keypoints :math:`(B, N, ...)`.
+            mask: validity of the correspondences :math:`(B, N)`.
+            models: the hypotheses :math:`(B, M, 3, 3)`.
+            models_ok: validity of the hypotheses :math:`(B, M)`.
+            inl_th: inlier threshold.
+
+        Returns:
+            - The best model per set, shape of :math:`(B, 3, 3)`.
+            - Its inlier mask, shape of :math:`(B, N)`.
+            - Its score, shape of :math:`(B,)`. Sets without any valid hypothesis get a score of -1.
+
+        """
+        B, M = models.shape[:2]
+        kp1_exp = kp1[:, None].expand(B, M, *kp1.shape[1:]).reshape(B * M, *kp1.shape[1:])
+        kp2_exp = kp2[:, None].expand(B, M, *kp2.shape[1:]).reshape(B * M, *kp2.shape[1:])
+        errors = self.error_fn(kp1_exp, kp2_exp, models.reshape(B * M, 3, 3)).view(B, M, -1)
+        inl = (errors <= inl_th) & mask[:, None]
+        scores = inl.to(kp1).sum(dim=-1).masked_fill(~models_ok, -1.0)
+        best_scores, best_idx = scores.max(dim=1)
+        batch_idxs = torch.arange(B, device=kp1.device)
+        return models[batch_idxs, best_idx], inl[batch_idxs, best_idx], best_scores
+
+    def sprt_threshold(self, epsilon: Tensor, delta: Tensor) -> Tensor:
+        """Compute the log of the SPRT decision threshold :math:`A` :cite:`chum2008optimal`.
+
+        Args:
+            epsilon: probability of a correspondence being consistent with a good model :math:`(B,)`.
+            delta: probability of a correspondence being consistent with a bad model :math:`(B,)`.
+
+        Returns:
+            the log-threshold :math:`(B,)`, infinite where the test can not discriminate the models.
+
+        """
+        eps = 1e-9
+        C = (1.0 - delta) * torch.log((1.0 - delta) / (1.0 - epsilon).clamp(min=eps)) + delta * torch.log(
+            delta / epsilon.clamp(min=eps)
+        )
+        models_per_sample = 3.0 if self.model_type == "fundamental_7pt" else 1.0
+        K = self.sprt_model_cost * C / models_per_sample
+        A = K + 1.0
+        # fixed point of A = K + 1 + log(A), converges in a few iterations
+        for _ in range(10):
+            A = K + 1.0 + torch.log(A)
+        log_A = torch.log(A)
+        return torch.where(epsilon > delta, log_A, torch.full_like(log_A, math.inf))
+
+    def verify_sprt_batch(
+        self,
+        kp1: Tensor,
+        kp2: Tensor,
+        mask: Tensor,
+        models: Tensor,
+        models_ok: Tensor,
+        inl_th: float,
+        epsilon: Tensor,
+    ) -> Tuple[Tensor, Tensor, Tensor]:
+        """Score the hypotheses like :meth:`verify_batch`, rejecting the bad ones early with the SPRT.
+
+        The correspondences are visited in a random order, in stages of doubling size. After every stage the
+        hypotheses whose likelihood ratio of being bad exceeds the SPRT threshold are dropped, so only the few
+        promising ones are verified against all the correspondences. The number of surviving hypotheses is the only
+        value read back to the host, once per stage.
+
+        Args:
+            kp1: source keypoints :math:`(B, N, ...)`.
+            kp2: destination keypoints :math:`(B, N, ...)`.
+            mask: validity of the correspondences :math:`(B, N)`.
+            models: the hypotheses :math:`(B, M, 3, 3)`.
+            models_ok: validity of the hypotheses :math:`(B, M)`.
+            inl_th: inlier threshold.
+            epsilon: current estimate of the inlier ratio of each set :math:`(B,)`.
+
+        Returns:
+            - The best model per set, shape of :math:`(B, 3, 3)`.
+            - Its inlier mask, shape of :math:`(B, N)`.
+            - Its score, shape of :math:`(B,)`. Sets without any surviving hypothesis get a score of -1.
+
+        """
+        B, M = models.shape[:2]
+        N = mask.shape[1]
+        if N <= 2 * self.sprt_min_points:
+            return self.verify_batch(kp1, kp2, mask, models, models_ok, inl_th)
+        perm = torch.randperm(N, device=kp1.device)
+        kp1_perm, kp2_perm, mask_perm = kp1[:, perm], kp2[:, perm], mask[:, perm]
+        hyp_batch = torch.arange(B, device=kp1.device).repeat_interleave(M)
+        hyp_idx = torch.arange(B * M, device=kp1.device)
+        hyp_models = models.reshape(B * M, 3, 3)
+        num_inl = zeros(B * M, dtype=kp1.dtype, device=kp1.device)
+        num_seen = zeros(B * M, dtype=kp1.dtype, device=kp1.device)
+        log_A = log_inl = log_outl = torch.zeros(B, dtype=kp1.dtype, device=kp1.device)
+        alive = models_ok.flatten()
+        start, stop = 0, self.sprt_min_points
+        while start < N:
+            if start > 0:
+                # compact the surviving hypotheses
+                keep = alive.nonzero()[:, 0]
+                if len(keep) == 0:
+                    break
+                hyp_batch, hyp_idx, hyp_models = hyp_batch[keep], hyp_idx[keep], hyp_models[keep]
+                num_inl, num_seen = num_inl[keep], num_seen[keep]
+            kp1_chunk = kp1_perm[hyp_batch, start:stop]
+            kp2_chunk = kp2_perm[hyp_batch, start:stop]
+            mask_chunk = mask_perm[hyp_batch, start:stop]
+            errors = self.error_fn(kp1_chunk, kp2_chunk, hyp_models)
+            num_inl = num_inl + ((errors <= inl_th) & mask_chunk).to(kp1).sum(dim=1)
+            num_seen = num_seen + mask_chunk.to(kp1).sum(dim=1)
+            if start == 0:
+                # the bad models dominate the hypotheses: their median inlier ratio estimates delta
+                ratio = (num_inl / num_seen.clamp(min=1)).masked_fill(~models_ok.flatten(), math.nan)
+                delta = ratio.view(B, M).nanmedian(dim=1)[0].nan_to_num(0.05).clamp(min=1e-3, max=0.5)
+                epsilon = epsilon.clamp(min=self.sprt_min_inlier_ratio, max=1.0 - 1e-3)
+                log_A = self.sprt_threshold(epsilon, delta)
+                log_inl = torch.log(delta / epsilon)
+                log_outl = torch.log((1.0 - delta) / (1.0 - epsilon))
+            log_lambda = num_inl * log_inl[hyp_batch] + (num_seen - num_inl) * log_outl[hyp_batch]
+            alive = (log_lambda <= log_A[hyp_batch]) & models_ok.flatten()[hyp_idx]
+            start, stop = stop, min(2 * stop, N)
+        scores = torch.full((B * M,), -1.0, dtype=kp1.dtype, device=kp1.device)
+        if start >= N:
+            scores[hyp_idx] = torch.where(alive, num_inl, torch.full_like(num_inl, -1.0))
+        best_scores, best_idx = scores.view(B, M).max(dim=1)
+        batch_idxs = torch.arange(B, device=kp1.device)
+        model_best = models[batch_idxs, best_idx]
+        errors = self.error_fn(kp1, kp2, model_best)
+        inliers_best = (errors <= inl_th) & mask & (best_scores >= 0)[:, None]
+        return model_best, inliers_best, best_scores
+
+    def polish_model_batch(self, kp1: Tensor, kp2: Tensor, mask: Tensor, inliers: Tensor) -> Tensor:
+        """Re-estimate the models of a batch of correspondence sets from their inliers.
+
+        Args:
+            kp1: source keypoints :math:`(B, N, ...)`.
+            kp2: destination keypoints :math:`(B, N, ...)`.
+            mask: validity of the correspondences :math:`(B, N)`.
+            inliers: the inliers of the current models :math:`(B, N)`.
+
+        Returns:
+            the polished models, shape of :math:`(B, 3, 3)`.
+
+        """
+        # the padded entries are replaced by a valid correspondence and get a zero weight
+        first_valid = mask.to(torch.uint8).argmax(dim=1)
+        batch_idxs = torch.arange(mask.shape[0], device=mask.device)
+        shape = (-1, -1, *([1] * (kp1.dim() - 2)))
+        fill1, fill2 = kp1[batch_idxs, first_valid][:, None], kp2[batch_idxs, first_valid][:, None]
+        kp1 = torch.where(mask.view(*mask.shape, *shape[2:]), kp1, fill1)
+        kp2 = torch.where(mask.view(*mask.shape, *shape[2:]), kp2, fill2)
+        weights = (inliers & mask).to(kp1.dtype)
+        return self.polisher_solver(kp1, kp2, weights).reshape(-1, 3, 3)
+
+    def validate_inputs_batch(
+        self, kp1: Tensor, kp2: Tensor, mask: Optional[Tensor] = None, weights: Optional[Tensor] = None
+    ) -> None:
+        if self.model_type == "homography_from_linesegments":
+            KORNIA_CHECK_SHAPE(kp1, ["B", "N", "2", "2"])
+            KORNIA_CHECK_SHAPE(kp2, ["B", "N", "2", "2"])
+        else:
+            KORNIA_CHECK_SHAPE(kp1, ["B", "N", "2"])
+            KORNIA_CHECK_SHAPE(kp2, ["B", "N", "2"])
+        KORNIA_CHECK(kp1.shape == kp2.shape, f"kp1 and kp2 should have equal shape, got {kp1.shape}, {kp2.shape}")
+        if mask is not None:
+            KORNIA_CHECK(
+                mask.shape == kp1.shape[:2], f"mask should have shape {tuple(kp1.shape[:2])}, got {mask.shape}"
+            )
+        if weights is not None:
+            KORNIA_CHECK(
+                weights.shape == kp1.shape[:2],
+                f"weights should have shape {tuple(kp1.shape[:2])}, got {weights.shape}",
+            )
+
+    def forward_batch(
+        self, kp1: Tensor, kp2: Tensor, mask: Optional[Tensor] = None, weights: Optional[Tensor] = None
+    ) -> Tuple[Tensor, Tensor]:
+        r"""Execute RANSAC on a batch of padded correspondence sets at once.
+
+        Hypothesis generation, scoring and local optimization are vectorised over all the sets, and every set stops
+        sampling on its own once the confidence-based criterion is met. Each iteration evaluates
+        ``batch_size`` hypotheses against all ``N`` correspondences of every active set, so consider a smaller
+        ``batch_size`` when verifying many sets at once.
+
+        Args:
+            kp1: source image keypoints :math:`(B, N, 2)`, or line segments :math:`(B, N, 2, 2)`.
+            kp2: distance image keypoints :math:`(B, N, 2)`, or line segments :math:`(B, N, 2, 2)`.
+            mask: validity of the correspondences :math:`(B, N)`. Padded entries are ignored. Default: all valid.
+            weights: optional correspondences weights :math:`(B, N)`, higher is better. They guide the sampling,
+                see ``sampling``.
+
+        Returns:
+            - Estimated models, shape of :math:`(B, 3, 3)`. Sets in which no model was found get a zero model.
+            - The inlier/outlier masks, shape of :math:`(B, N)`.
+
+        """
+        self.validate_inputs_batch(kp1, kp2, mask, weights)
+        B, N = kp1.shape[:2]
+        if mask is None:
+            mask = torch.ones(B, N, dtype=torch.bool, device=kp1.device)
+        mask = mask.bool()
+        num_tc = mask.sum(dim=1).to(kp1.dtype)
+        best_score_total = torch.full((B,), float(self.minimal_sample_size), dtype=kp1.dtype, device=kp1.device)
+        best_model_total = zeros(B, 3, 3, dtype=kp1.dtype, device=kp1.device)
+        inliers_best_total = zeros(B, N, dtype=torch.bool, device=kp1.device)
+        active = num_tc >= self.minimal_sample_size
         for i in range(self.max_iter):
-            # Sample minimal samples in batch to estimate models
-            idxs = self.sample(self.minimal_sample_size, num_tc, self.batch_size, kp1.device)
-            kp1_sampled = kp1[idxs]
-            kp2_sampled = kp2[idxs]
-
-            kp1_sampled, kp2_sampled = self.remove_bad_samples(kp1_sampled, kp2_sampled)
-            if len(kp1_sampled) == 0:
-                continue
-            # Estimate models
-            models = self.estimate_model_from_minsample(kp1_sampled, kp2_sampled)
-            models = self.remove_bad_models(models)
-            if (models is None) or (len(models) == 0):
-                continue
-            # Score the models and select the best one
-            model, inliers, model_score = self.verify(kp1, kp2, models, self.inl_th)
-            # Store far-the-best model and (optionally) do a local optimization
-            if model_score > best_score_total:
-                # Local optimization
-                for _ in range(self.max_lo_iters):
-                    model_lo = self.polish_model(kp1, kp2, inliers)
-                    if (model_lo is None) or (len(model_lo) == 0):
-                        continue
-                    _, inliers_lo, score_lo = self.verify(kp1, kp2, model_lo, self.inl_th)
-                    # print (f"Orig score = {best_model_score}, LO score = {score_lo} TC={num_tc}")
-                    if score_lo > model_score:
-                        model = model_lo.clone()[0]
-                        inliers = inliers_lo.clone()
-                        model_score = score_lo
-                    else:
-                        break
-                # Now storing the best model
-                best_model_total = model.clone()
-                inliers_best_total = inliers.clone()
-                best_score_total = model_score
-
-                # Should we already stop?
-                new_max_iter = int(
-                    self.max_samples_by_conf(int(best_score_total), num_tc, self.minimal_sample_size, self.confidence)
+            # the only host sync of the iteration: which sets still need sampling
+            active_idxs = active.nonzero()[:, 0]
+            if len(active_idxs) == 0:
+                break
+            kp1_a, kp2_a, mask_a = kp1[active_idxs], kp2[active_idxs], mask[active_idxs]
+            weights_a = None if weights is None else weights[active_idxs]
+            idxs = self.sample_batch(mask_a, weights_a, i * self.batch_size)
+            models, models_ok = self.estimate_models_batch(kp1_a, kp2_a, mask_a, idxs)
+            if self.sprt:
+                epsilon = best_score_total[active_idxs] / num_tc[active_idxs]
+                model, inliers, model_score = self.verify_sprt_batch(
+                    kp1_a, kp2_a, mask_a, models, models_ok, self.inl_th, epsilon
                 )
-                # print (f"New max_iter = {new_max_iter}")
-                # Stop estimation, if the model is very good
-                if (i + 1) * self.batch_size >= new_max_iter:
+            else:
+                model, inliers, model_score = self.verify_batch(kp1_a, kp2_a, mask_a, models, models_ok, self.inl_th)
+            improved = model_score > best_score_total[active_idxs]
+            # Local optimization, the polished model is kept only if it has more inliers. The sets whose inliers did
+            # not change would be polished into the same model, so it stops once none of the sets improves.
+            improving = improved
+            for _ in range(self.max_lo_iters):
+                if not improving.any():
                     break
-        # local optimization with all inliers for better precision
+                model_lo = self.polish_model_batch(kp1_a, kp2_a, mask_a, inliers)
+                model_lo_ok = model_lo.isfinite().flatten(-2).all(-1)
+                _, inliers_lo, score_lo = self.verify_batch(
+                    kp1_a, kp2_a, mask_a, model_lo[:, None], model_lo_ok[:, None], self.inl_th
+                )
+                improving = improving & (score_lo > model_score)
+                model = torch.where(improving[:, None, None], model_lo, model)
+                inliers = torch.where(improving[:, None], inliers_lo, inliers)
+                model_score = torch.where(improving, score_lo, model_score)
+            # Now storing the best models
+            best_model_total[active_idxs] = torch.where(improved[:, None, None], model, best_model_total[active_idxs])
+            inliers_best_total[active_idxs] = torch.where(improved[:, None], inliers, inliers_best_total[active_idxs])
+            best_score_total[active_idxs] = torch.where(improved, model_score, best_score_total[active_idxs])
+            # Should we already stop?
+            new_max_iter = self.max_samples_by_conf_batch(
+                best_score_total[active_idxs], num_tc[active_idxs], self.minimal_sample_size, self.confidence
+            )
+            if weights_a is not None and self.sampling != "uniform":
+                new_max_iter = torch.minimum(
+                    new_max_iter,
+                    self.prosac_max_samples_batch(inliers_best_total[active_idxs], mask_a, weights_a),
+                )
+            active[active_idxs] = (i + 1) * self.batch_size < new_max_iter
         return best_model_total, inliers_best_total
@@ -22,8 +22,8 @@ from typing import Optional
 import torch
 import torch.nn.functional as F
 
-from kornia.core import Module, Tensor, concatenate, rand, stack, tensor, where, zeros, zeros_like
-from kornia.filters.sobel import spatial_gradient3d
+from kornia.core import Module, Tensor, concatenate, pad, rand, stack, tensor, where, zeros
+from kornia.core.capabilities import needs_host_fallback
 from kornia.geometry.conversions import normalize_pixel_coordinates, normalize_pixel_coordinates3d
 from kornia.utils import create_meshgrid, create_meshgrid3d
 from kornia.utils._compat import torch_version_ge
@@ -597,53 +597,63 @@ def conv_quad_interp3d(input: Tensor, strict_maxima_bonus: float = 10.0, eps: fl
     grid_global: Tensor = create_meshgrid3d(D, H, W, False, device=input.device).permute(0, 4, 1, 2, 3)
     grid_global = grid_global.to(input.dtype)
 
+    # The location is only refined at the extrema, so the derivatives are computed there only, from the
+    # neighbors of the extrema in the input padded as in spatial_gradient3d.
+    nms_mask: Tensor = nms3d(input, (3, 3, 3), True)
+    bc_idx, d_idx, h_idx, w_idx = where(nms_mask.view(B * CH, D, H, W))
+    x_flat: Tensor = pad(input, 6 * [1], "replicate").reshape(-1)
+    stride_d, stride_h = (H + 2) * (W + 2), W + 2
+    center_idx = ((bc_idx * (D + 2) + d_idx + 1) * (H + 2) + h_idx + 1) * (W + 2) + w_idx + 1
+
+    def _at(ds: int, dy: int, dx: int) -> Tensor:
+        return x_flat[center_idx + ds * stride_d + dy * stride_h + dx]
+
+    center = _at(0, 0, 0)
     # to determine the location we are solving system of linear equations Ax = b, where b is 1st order gradient
     # and A is Hessian matrix
-    b: Tensor = spatial_gradient3d(input, order=1, mode="diff")
-    b = b.permute(0, 1, 3, 4, 5, 2).reshape(-1, 3, 1)
-    A: Tensor = spatial_gradient3d(input, order=2, mode="diff")
-    A = A.permute(0, 1, 3, 4, 5, 2).reshape(-1, 6)
-    dxx = A[..., 0]
-    dyy = A[..., 1]
-    dss = A[..., 2]
-    dxy = 0.25 * A[..., 3]  # normalization to match OpenCV implementation
-    dys = 0.25 * A[..., 4]  # normalization to match OpenCV implementation
-    dxs = 0.25 * A[..., 5]  # normalization to match OpenCV implementation
+    b: Tensor = stack([_at(0, 0, 1) - _at(0, 0, -1), _at(0, 1, 0) - _at(0, -1, 0), _at(1, 0, 0) - _at(-1, 0, 0)], -1)
+    b = 0.5 * b.view(-1, 3, 1)
+    dxx = _at(0, 0, 1) - 2.0 * center + _at(0, 0, -1)
+    dyy = _at(0, 1, 0) - 2.0 * center + _at(0, -1, 0)
+    dss = _at(1, 0, 0) - 2.0 * center + _at(-1, 0, 0)
+    # normalization to match OpenCV implementation, and the signs of the kernels of spatial_gradient3d
+    dxy = 0.25 * (_at(0, -1, -1) - _at(0, -1, 1) - _at(0, 1, -1) + _at(0, 1, 1))
+    dys = 0.25 * (_at(1, -1, 0) - _at(1, 1, 0) - _at(-1, -1, 0) + _at(-1, 1, 0))
+    dxs = 0.25 * (_at(1, 0, -1) - _at(1, 0, 1) - _at(-1, 0, -1) + _at(-1, 0, 1))
 
     Hes = stack([dxx, dxy, dxs, dxy, dyy, dys, dxs, dys, dss], -1).view(-1, 3, 3)
     if not torch_version_ge(1, 10):
         # The following is needed to avoid singular cases
         Hes += rand(Hes[0].size(), device=Hes.device).abs()[None] * eps
 
-    nms_mask: Tensor = nms3d(input, (3, 3, 3), True)
-    x_solved: Tensor = zeros_like(b)
-    x_solved_masked, _, solved_correctly = safe_solve_with_mask(b[nms_mask.view(-1)], Hes[nms_mask.view(-1)])
+    x_solved, _, solved_correctly = safe_solve_with_mask(b, Hes)
 
     #  Kill those points, where we cannot solve
     new_nms_mask = nms_mask.masked_scatter(nms_mask, solved_correctly)
 
-    x_solved[where(new_nms_mask.view(-1, 1, 1))[0]] = x_solved_masked[solved_correctly]
-
-    dx: Tensor = -x_solved
+    dx: Tensor = -x_solved.masked_fill(~solved_correctly.view(-1, 1, 1), 0)
 
     # Ignore ones, which are far from window center
     mask1 = dx.abs().max(dim=1, keepdim=True)[0] > 0.7
-    dx.masked_fill_(mask1.expand_as(dx), 0)
-    # SDAA not support bmm fp64
-    if 'sdaa' in b.device.type and b.dtype == torch.float64:
+    dx = dx.masked_fill(mask1.expand_as(dx), 0)
+    if needs_host_fallback("matmul", b):
         device = b.device
         dy: Tensor = 0.5 * torch.bmm(b.permute(0, 2, 1).cpu(), dx.cpu()).to(device)
-    else:    
+    else:
         dy: Tensor = 0.5 * torch.bmm(b.permute(0, 2, 1), dx)
-    y_max = input + dy.view(B, CH, D, H, W)
+    spatial_idx = (d_idx * H + h_idx) * W + w_idx
+    y_max = input.reshape(B * CH, -1).index_put((bc_idx, spatial_idx), dy.view(-1), accumulate=True)
+    y_max = y_max.view(B, CH, D, H, W)
     if strict_maxima_bonus > 0:
         y_max += strict_maxima_bonus * new_nms_mask.to(input.dtype)
 
-    dx_res: Tensor = dx.flip(1).reshape(B, CH, D, H, W, 3).permute(0, 1, 5, 2, 3, 4)
-    dx_res[:, :, (1, 2)] = dx_res[:, :, (2, 1)]
-
-    coords_max: Tensor = grid_global.repeat(B, 1, 1, 1, 1).unsqueeze(1)
-    coords_max = coords_max + dx_res
+    # the offsets are in the (d, x, y) order of the coordinates grid
+    dx_res: Tensor = dx.view(-1, 3)[:, (2, 0, 1)]
+    coords_max: Tensor = grid_global.reshape(1, 1, 3, D * H * W).repeat(B, CH, 1, 1).view(B * CH, 3, D * H * W)
+    coords_max = coords_max.index_put(
+        (bc_idx[:, None], torch.arange(3, device=input.device)[None], spatial_idx[:, None]), dx_res, accumulate=True
+    )
+    coords_max = coords_max.view(B, CH, 3, D, H, W)
 
     return coords_max, y_max
 
@@ -22,6 +22,7 @@ import torch
 
 from kornia.core import ImageModule as Module
 from kornia.core import Tensor, ones, ones_like, zeros
+from kornia.core.capabilities import needs_host_fallback
 from kornia.filters import gaussian_blur2d
 from kornia.utils import _extract_device_dtype
 from kornia.utils.image import perform_keep_shape_image
@@ -628,7 +629,7 @@ def resize(
 
         input = gaussian_blur2d(input, ks, sigmas)
 
-    if 'sdaa' in input.device.type:
+    if needs_host_fallback("interpolate", input):
         device = input.device
         output = torch.nn.functional.interpolate(input.cpu(), size=size, mode=interpolation, align_corners=align_corners).to(device)
     else:
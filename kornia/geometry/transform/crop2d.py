@@ -359,6 +359,16 @@ def crop_by_indices(
     if size is None:
         h, w = infer_bbox_shape(src)
         size = h.unique(sorted=False), w.unique(sorted=False)
+    height, width = input_tensor.shape[-2:]
+    crop_h = y2.clamp(max=height) - y1
+    crop_w = x2.clamp(max=width) - x1
+    # the crops are gathered at once when they only need padding, i.e. unless some of them need resizing, are
+    # larger than ``size`` or wrap around like negative slices
+    fits = (crop_h == int(size[0])) & (crop_w == int(size[1]))
+    if shape_compensation != "resize":
+        fits = (crop_h <= int(size[0])) & (crop_w <= int(size[1]))
+    if bool((src >= 0).all()) and bool(fits.all()):
+        return _crop_by_indices_gather(input_tensor, x1, y1, x1 + crop_w, y1 + crop_h, (int(size[0]), int(size[1])))
     out = torch.empty(B, C, *size, device=input_tensor.device, dtype=input_tensor.dtype)
     # Find out the cropped shapes that need to be resized.
     for i, _ in enumerate(out):
@@ -378,3 +388,20 @@ def crop_by_indices(
         else:
             out[i] = _out
     return out
+
+
+def _crop_by_indices_gather(
+    input_tensor: Tensor, x1: Tensor, y1: Tensor, x2: Tensor, y2: Tensor, size: Tuple[int, int]
+) -> Tensor:
+    """Crop every image of the batch with a single gather.
+
+    The crops must fit in ``size``, the pixels of the output out of the crops, i.e. beyond ``x2`` and ``y2``, are
+    zero padded.
+    """
+    B, C, H, W = input_tensor.shape
+    rows = y1[:, None] + torch.arange(size[0], device=input_tensor.device)
+    cols = x1[:, None] + torch.arange(size[1], device=input_tensor.device)
+    valid = (rows < y2[:, None])[:, :, None] & (cols < x2[:, None])[:, None, :]
+    index = rows.clamp(max=H - 1)[:, :, None] * W + cols.clamp(max=W - 1)[:, None, :]
+    out = input_tensor.flatten(-2).gather(-1, index.flatten(1)[:, None].expand(-1, C, -1))
+    return out.view(B, C, *size).masked_fill(~valid[:, None], 0)
@@ -23,6 +23,7 @@ import torch
 import torch.nn.functional as F
 
 from kornia.core import Tensor, concatenate, ones, ones_like, stack, tan, tensor, zeros
+from kornia.core.capabilities import needs_host_fallback
 from kornia.core.check import KORNIA_CHECK, KORNIA_CHECK_SHAPE
 from kornia.geometry.conversions import (
     angle_to_rotation_matrix,
@@ -477,8 +478,7 @@ def get_rotation_matrix2d(center: Tensor, angle: Tensor, scale: Tensor) -> Tenso
     rotat_m = eye_like(3, center)
     rotat_m[:, :2, :2] = angle_to_rotation_matrix(angle)
 
-    # sdaa @ not support fp64
-    if 'sdaa' in shift_m.device.type and shift_m.dtype == torch.float64:
+    if needs_host_fallback("matmul", shift_m):
         device = shift_m.device
         affine_m = (shift_m.cpu() @ rotat_m.cpu() @ scale_m.cpu() @ shift_m_inv.cpu()).to(device)
     else:
@@ -693,8 +693,7 @@ def get_shear_matrix2d(center: Tensor, sx: Optional[Tensor] = None, sy: Optional
     x, y = torch.split(center, 1, dim=-1)
     x, y = x.view(-1), y.view(-1)
 
-    # SDAA tan not support fp64
-    if 'sdaa' in sx.device.type and sx.dtype == torch.float64:
+    if needs_host_fallback("tan", sx):
         device = sx.device
         sx_tan = tan(sx.cpu()).to(device)
         sy_tan = tan(sy.cpu()).to(device)
@@ -982,8 +981,7 @@ def get_projective_transform(center: Tensor, angles: Tensor, scales: Tensor) ->
     rmat: Tensor = axis_angle_to_rotation_matrix(axis_angle_rad)  # Bx3x3
     scaling_matrix: Tensor = eye_like(3, rmat)
     scaling_matrix = scaling_matrix * scales.unsqueeze(dim=1)
-    # SDAA @ not support fp64
-    if 'sdaa' in rmat.device.type and rmat.dtype == torch.float64:
+    if needs_host_fallback("matmul", rmat):
         device = rmat.device
         rmat = (rmat.cpu() @ scaling_matrix.to(rmat).cpu()).to(device)
     else:
@@ -1001,8 +999,7 @@ def get_projective_transform(center: Tensor, angles: Tensor, scales: Tensor) ->
 
     # chain 4x4 transforms
     proj_mat = convert_affinematrix_to_homography3d(proj_mat)  # Bx4x4
-    # SDAA @ not support fp64
-    if 'sdaa' in proj_mat.device.type and proj_mat.dtype == torch.float64:
+    if needs_host_fallback("matmul", proj_mat):
         device = proj_mat.device
         proj_mat = (from_origin_mat.cpu() @ proj_mat.cpu() @ to_origin_mat.cpu()).to(device)
     else:
@@ -22,13 +22,15 @@ import math
 import torch
 import torch.nn.functional as F
 
-from kornia.core import Module, Tensor, ones, pad, stack, tensor, zeros
+from kornia.core import Module, Tensor, pad, tensor, zeros
 from kornia.core.check import KORNIA_CHECK, KORNIA_CHECK_IS_TENSOR, KORNIA_CHECK_SHAPE
-from kornia.filters import filter2d, gaussian_blur2d
+from kornia.filters import filter2d, filter2d_separable, gaussian_blur2d, get_kernel_cache
+from kornia.filters.kernels import _cached_gaussian_kernel1d
 
 __all__ = [
     "PyrDown",
     "PyrUp",
+    "PyramidPlan",
     "ScalePyramid",
     "build_laplacian_pyramid",
     "build_pyramid",
@@ -56,6 +58,14 @@ def _get_pyramid_gaussian_kernel() -> Tensor:
     )
 
 
+@torch.jit.ignore
+def _cached_pyramid_gaussian_kernel(device: torch.device, dtype: torch.dtype) -> Tensor:
+    """Return the pre-computed gaussian kernel on a device, from the shared cache of the kernels."""
+    return get_kernel_cache().get(
+        ("pyramid", device, dtype), lambda: _get_pyramid_gaussian_kernel().to(device=device, dtype=dtype)
+    )
+
+
 class PyrDown(Module):
     r"""Blur a tensor and downsamples it.
 
@@ -160,6 +170,7 @@ class ScalePyramid(Module):
         self.border = min_size // 2 - 1
         self.sigma_step = 2 ** (1.0 / float(self.n_levels))
         self.double_image = double_image
+        self._octave_blurs: dict[float, tuple[list[float], list[tuple[float, int]]]] = {}
 
     def __repr__(self) -> str:
         return (
@@ -204,47 +215,62 @@ class ScalePyramid(Module):
             cur_level = x
         return cur_level, cur_sigma, pixel_distance
 
+    def get_octave_blurs(self, first_sigma: float) -> tuple[list[float], list[tuple[float, int]]]:
+        """Get the sigmas of the levels of an octave, and the blurs computing every level from the previous one.
+
+        Args:
+            first_sigma: the blur level of the first level of the octave.
+
+        Returns:
+            the sigmas of the levels, and the sigma and kernel size of the blur of each level after the first one.
+
+        """
+        if first_sigma not in self._octave_blurs:
+            cur_sigma = first_sigma
+            level_sigmas = [cur_sigma]
+            blurs = []
+            for _ in range(1, self.n_levels + self.extra_levels):
+                sigma = cur_sigma * math.sqrt(self.sigma_step**2 - 1.0)
+                blurs.append((sigma, self.get_kernel_size(sigma)))
+                cur_sigma *= self.sigma_step
+                level_sigmas.append(cur_sigma)
+            self._octave_blurs[first_sigma] = (level_sigmas, blurs)
+        return self._octave_blurs[first_sigma]
+
     def forward(self, x: Tensor) -> tuple[list[Tensor], list[Tensor], list[Tensor]]:
-        bs, _, _, _ = x.size()
+        bs, ch, _, _ = x.size()
+        num_levels = self.n_levels + self.extra_levels
         cur_level, cur_sigma, pixel_distance = self.get_first_level(x)
 
-        sigmas = [cur_sigma * ones(bs, self.n_levels + self.extra_levels).to(x.device).to(x.dtype)]
-        pixel_dists = [pixel_distance * ones(bs, self.n_levels + self.extra_levels).to(x.device).to(x.dtype)]
-        pyr = [[cur_level]]
-        oct_idx = 0
+        pyr: list[Tensor] = []
+        sigmas: list[Tensor] = []
+        pixel_dists: list[Tensor] = []
         while True:
-            cur_level = pyr[-1][0]
-            for level_idx in range(1, self.n_levels + self.extra_levels):
-                sigma = cur_sigma * math.sqrt(self.sigma_step**2 - 1.0)
-                ksize = self.get_kernel_size(sigma)
-
+            height, width = cur_level.shape[-2:]
+            level_sigmas, blurs = self.get_octave_blurs(cur_sigma)
+            # the levels are written in a single buffer per octave, each one blurring the previous one
+            octave = cur_level.new_empty(bs, ch, num_levels, height, width)
+            octave[:, :, 0] = cur_level
+            for level_idx, (sigma, ksize) in enumerate(blurs, 1):
                 # Hack, because PyTorch does not allow to pad more than original size.
                 # But for the huge sigmas, one needs huge kernel and padding...
-
-                ksize = min(ksize, cur_level.size(2), cur_level.size(3))
+                ksize = min(ksize, height, width)
                 if ksize % 2 == 0:
                     ksize += 1
-
-                cur_level = gaussian_blur2d(cur_level, (ksize, ksize), (sigma, sigma))
-                cur_sigma *= self.sigma_step
-                pyr[-1].append(cur_level)
-                sigmas[-1][:, level_idx] = cur_sigma
-                pixel_dists[-1][:, level_idx] = pixel_distance
-            _pyr = pyr[-1][-self.extra_levels]
-            nextOctaveFirstLevel = _pyr[:, :, ::2, ::2]
-
+                kernel = _cached_gaussian_kernel1d(ksize, sigma, x.device, x.dtype)
+                cur_level = filter2d_separable(cur_level, kernel, kernel, "reflect")
+                octave[:, :, level_idx] = cur_level
+            pyr.append(octave)
+            sigmas.append(tensor(level_sigmas, device=x.device, dtype=x.dtype).repeat(bs, 1))
+            pixel_dists.append(x.new_full((bs, num_levels), pixel_distance))
+
+            cur_level = octave[:, :, -self.extra_levels, ::2, ::2]
             pixel_distance *= 2.0
             cur_sigma = self.init_sigma
-            if min(nextOctaveFirstLevel.size(2), nextOctaveFirstLevel.size(3)) <= self.min_size:
+            if min(cur_level.size(2), cur_level.size(3)) <= self.min_size:
                 break
-            pyr.append([nextOctaveFirstLevel])
-            sigmas.append(cur_sigma * torch.ones(bs, self.n_levels + self.extra_levels).to(x.device))
-            pixel_dists.append(pixel_distance * torch.ones(bs, self.n_levels + self.extra_levels).to(x.device))
-            oct_idx += 1
 
-        output_pyr = [stack(i, 2) for i in pyr]
-
-        return output_pyr, sigmas, pixel_dists
+        return pyr, sigmas, pixel_dists
 
 
 def pyrdown(input: Tensor, border_type: str = "reflect", align_corners: bool = False, factor: float = 2.0) -> Tensor:
@@ -272,7 +298,7 @@ def pyrdown(input: Tensor, border_type: str = "reflect", align_corners: bool = F
     """
     KORNIA_CHECK_SHAPE(input, ["B", "C", "H", "W"])
 
-    kernel: Tensor = _get_pyramid_gaussian_kernel()
+    kernel: Tensor = _cached_pyramid_gaussian_kernel(input.device, input.dtype)
     _, _, height, width = input.shape
     # blur image
     x_blur: Tensor = filter2d(input, kernel, border_type)
@@ -313,7 +339,7 @@ def pyrup(input: Tensor, border_type: str = "reflect", align_corners: bool = Fal
     """
     KORNIA_CHECK_SHAPE(input, ["B", "C", "H", "W"])
 
-    kernel: Tensor = _get_pyramid_gaussian_kernel()
+    kernel: Tensor = _cached_pyramid_gaussian_kernel(input.device, input.dtype)
     # upsample tensor
     _, _, height, width = input.shape
     # TODO: use kornia.geometry.resize/rescale
@@ -432,6 +458,149 @@ def build_laplacian_pyramid(
     return laplacian_pyramid
 
 
+class PyramidPlan:
+    r"""Plan of the pyramids of images of a fixed shape, which reuses its buffers on every call.
+
+    The shapes of the levels, the padding and the kernel are computed once, and the levels are written into buffers
+    allocated once, so that building the pyramids of the frames of a video or a tracker does not allocate the
+    levels on every frame. The returned levels are the buffers of the plan, overwritten by the next call: they must
+    be cloned to be kept. The plan is meant for inference, the images must not require gradients.
+
+    Args:
+        shape: the shape :math:`(B, C, H, W)` of the images.
+        max_level: 0-based index of the last (the smallest) pyramid layer, as in :func:`build_pyramid`.
+        border_type: the padding mode to be applied before convolving.
+          The expected modes are: ``'constant'``, ``'reflect'``,
+          ``'replicate'`` or ``'circular'``.
+        align_corners: interpolation flag.
+        device: the device of the images.
+        dtype: the dtype of the images.
+
+    Example:
+        >>> plan = PyramidPlan((1, 3, 32, 32), max_level=3)
+        >>> for frame in torch.rand(4, 1, 3, 32, 32):
+        ...     pyramid = plan.build_pyramid(frame)
+        >>> [level.shape[-1] for level in pyramid]
+        [32, 16, 8]
+
+    """
+
+    def __init__(
+        self,
+        shape: tuple[int, int, int, int],
+        max_level: int,
+        border_type: str = "reflect",
+        align_corners: bool = False,
+        device: torch.device | None = None,
+        dtype: torch.dtype | None = None,
+    ) -> None:
+        KORNIA_CHECK(len(shape) == 4, f"Expected the shape (B, C, H, W) of the images. Got {shape}.")
+        KORNIA_CHECK(
+            isinstance(max_level, int) and max_level >= 0,
+            f"Invalid max_level, it must be a positive integer. Got: {max_level}",
+        )
+        self.shape = tuple(shape)
+        self.max_level = max_level
+        self.border_type = border_type
+        self.align_corners = align_corners
+        self.device = torch.device("cpu") if device is None else torch.device(device)
+        self.dtype = torch.get_default_dtype() if dtype is None else dtype
+        self.kernel = _get_pyramid_gaussian_kernel().to(device=self.device, dtype=self.dtype)
+
+        h, w = shape[2], shape[3]
+        # as in build_laplacian_pyramid, the images of arbitrary shapes are padded
+        if not (is_powerof_two(w) or is_powerof_two(h)):
+            self.laplacian_padding: tuple[int, int, int, int] | None = (
+                0,
+                find_next_powerof_two(w) - w,
+                0,
+                find_next_powerof_two(h) - h,
+            )
+        else:
+            self.laplacian_padding = None
+
+        self._gaussian = self._allocate_levels(h, w)
+        self._laplacian_input: Tensor | None = None
+        self._laplacian_gaussian = self._gaussian
+        if self.laplacian_padding is not None:
+            h, w = h + self.laplacian_padding[3], w + self.laplacian_padding[1]
+            self._laplacian_input = self._empty(h, w)
+            self._laplacian_gaussian = self._allocate_levels(h, w)
+        # every level but the last one, which is the last level of the gaussian pyramid
+        self._laplacian = [self._empty(h, w)] + [torch.empty_like(level) for level in self._laplacian_gaussian]
+        self._laplacian = self._laplacian[: max(self.max_level - 1, 0)]
+
+    def _empty(self, height: int, width: int) -> Tensor:
+        return torch.empty(self.shape[0], self.shape[1], height, width, device=self.device, dtype=self.dtype)
+
+    def _allocate_levels(self, height: int, width: int) -> list[Tensor]:
+        # the levels after the first one, with the sizes of pyrdown
+        levels: list[Tensor] = []
+        for _ in range(self.max_level - 1):
+            height, width = int(float(height) / 2.0), int(float(width) // 2.0)
+            levels.append(self._empty(height, width))
+        return levels
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(shape={self.shape}, max_level={self.max_level}, "
+            f"border_type={self.border_type}, align_corners={self.align_corners}, device={self.device}, "
+            f"dtype={self.dtype})"
+        )
+
+    def _check(self, input: Tensor) -> None:
+        KORNIA_CHECK(
+            tuple(input.shape) == self.shape and input.device == self.device and input.dtype == self.dtype,
+            f"Expected images of shape {self.shape} on {self.device} with {self.dtype}. "
+            f"Got {tuple(input.shape)} on {input.device} with {input.dtype}.",
+        )
+        KORNIA_CHECK(not input.requires_grad, "The images of a pyramid plan must not require gradients.")
+
+    def _fill(self, input: Tensor, levels: list[Tensor]) -> list[Tensor]:
+        cur_level = input
+        for level in levels:
+            x_blur = filter2d(cur_level, self.kernel, self.border_type)
+            level.copy_(F.interpolate(x_blur, size=level.shape[-2:], mode="bilinear", align_corners=self.align_corners))
+            cur_level = level
+        return [input, *levels]
+
+    def build_pyramid(self, input: Tensor) -> list[Tensor]:
+        r"""Construct the Gaussian pyramid of an image, as :func:`build_pyramid`.
+
+        Args:
+            input: the image of the shape, device and dtype of the plan.
+
+        Returns:
+            the levels :math:`[(B, C, H, W), (B, C, H/2, W/2), ...]`, the first one being the input.
+
+        """
+        self._check(input)
+        return self._fill(input, self._gaussian)
+
+    def build_laplacian_pyramid(self, input: Tensor) -> list[Tensor]:
+        r"""Construct the Laplacian pyramid of an image, as :func:`build_laplacian_pyramid`.
+
+        Args:
+            input: the image of the shape, device and dtype of the plan.
+
+        Returns:
+            the levels :math:`[(B, C, H, W), (B, C, H/2, W/2), ...]`.
+
+        """
+        self._check(input)
+        if self._laplacian_input is not None and self.laplacian_padding is not None:
+            self._laplacian_input.copy_(pad(input, list(self.laplacian_padding), "reflect"))
+            input = self._laplacian_input
+        gaussian_pyramid = self._fill(input, self._laplacian_gaussian)
+        for i, laplacian in enumerate(self._laplacian):
+            _, _, height, width = gaussian_pyramid[i + 1].shape
+            x_up = F.interpolate(
+                gaussian_pyramid[i + 1], size=(height * 2, width * 2), mode="bilinear", align_corners=self.align_corners
+            )
+            torch.sub(gaussian_pyramid[i], filter2d(x_up, self.kernel, self.border_type), out=laplacian)
+        return [*self._laplacian, gaussian_pyramid[-1]]
+
+
 def upscale_double(x: Tensor) -> Tensor:
     r"""Upscale image by the factor of 2, even indices maps to original indices.
 
@@ -21,6 +21,7 @@ import torch
 from torch import nn
 
 from kornia.core import ones, zeros
+from kornia.core.capabilities import needs_host_fallback
 from kornia.utils import create_meshgrid
 from kornia.utils.helpers import _torch_solve_cast
 
@@ -37,8 +38,7 @@ def _pair_square_euclidean(tensor1: torch.Tensor, tensor2: torch.Tensor) -> torc
     # ||t1-t2||^2 = (t1-t2)^T(t1-t2) = t1^T*t1 + t2^T*t2 - 2*t1^T*t2
     t1_sq: torch.Tensor = tensor1.mul(tensor1).sum(dim=-1, keepdim=True)
     t2_sq: torch.Tensor = tensor2.mul(tensor2).sum(dim=-1, keepdim=True).transpose(1, 2)
-    # SDAA matmul not support fp64
-    if 'sdaa' in tensor1.device.type and tensor1.dtype == torch.float64:
+    if needs_host_fallback("matmul", tensor1):
         device = tensor1.device
         t1_t2: torch.Tensor = tensor1.cpu().matmul(tensor2.transpose(1, 2).cpu()).to(device)
     else:
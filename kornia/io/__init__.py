@@ -15,6 +15,6 @@
 # limitations under the License.
 #
 
-from .io import ImageLoadType, load_image, write_image
+from .io import ImageLoadType, load_image, load_images, load_images_async, write_image
 
-__all__ = ["ImageLoadType", "load_image", "write_image"]
+__all__ = ["ImageLoadType", "load_image", "load_images", "load_images_async", "write_image"]
@@ -17,9 +17,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional, Sequence
 
 import kornia_rs
 import torch
@@ -41,6 +44,14 @@ class ImageLoadType(Enum):
     RGB32 = 5
 
 
+def _read_image(path_file: Path) -> Any:
+    """Read an image file and decode it as a numpy array with shape HxWxC using the Kornia Rust backend."""
+    # NOTE: the decoders release the GIL, so several images can be decoded at once from threads
+    if path_file.suffix.lower() in [".jpg", ".jpeg"]:
+        return kornia_rs.read_image_jpegturbo(str(path_file))
+    return kornia_rs.read_image_any(str(path_file))
+
+
 def _load_image_to_tensor(path_file: Path, device: Device) -> Tensor:
     """Read an image file and decode using the Kornia Rust backend.
 
@@ -55,10 +66,7 @@ def _load_image_to_tensor(path_file: Path, device: Device) -> Tensor:
 
     """
     # read image and return as `np.ndarray` with shape HxWxC
-    if path_file.suffix.lower() in [".jpg", ".jpeg"]:
-        img = kornia_rs.read_image_jpegturbo(str(path_file))
-    else:
-        img = kornia_rs.read_image_any(str(path_file))
+    img = _read_image(path_file)
 
     # convert the image to tensor with shape CxHxW
     img_t = image_to_tensor(img, keepdim=True)
@@ -72,7 +80,7 @@ def _load_image_to_tensor(path_file: Path, device: Device) -> Tensor:
 def _to_float32(image: Tensor) -> Tensor:
     """Convert an image tensor to float32."""
     KORNIA_CHECK(image.dtype == torch.uint8)
-    return image.float() / 255.0
+    return image.to(torch.float32).div_(255.0)
 
 
 def _to_uint8(image: Tensor) -> Tensor:
@@ -101,50 +109,173 @@ def load_image(
     # read the image using the kornia_rs package
     image: Tensor = _load_image_to_tensor(path_file, device)  # CxHxW
 
+    return _convert_image(image, desired_type)
+
+
+def _convert_image(image: Tensor, desired_type: ImageLoadType) -> Tensor:
+    """Convert a decoded image :math:`(*, C, H, W)` to the desired color space and dtype."""
     if desired_type == ImageLoadType.UNCHANGED:
         return image
     elif desired_type == ImageLoadType.GRAY8:
-        if image.shape[0] == 1 and image.dtype == torch.uint8:
+        if image.shape[-3] == 1 and image.dtype == torch.uint8:
             return image
-        elif image.shape[0] == 3 and image.dtype == torch.uint8:
+        elif image.shape[-3] == 3 and image.dtype == torch.uint8:
             gray8 = kornia.color.rgb_to_grayscale(image)
             return gray8
-        elif image.shape[0] == 4 and image.dtype == torch.uint8:
+        elif image.shape[-3] == 4 and image.dtype == torch.uint8:
             gray32 = kornia.color.rgb_to_grayscale(kornia.color.rgba_to_rgb(_to_float32(image)))
             return _to_uint8(gray32)
 
     elif desired_type == ImageLoadType.RGB8:
-        if image.shape[0] == 3 and image.dtype == torch.uint8:
+        if image.shape[-3] == 3 and image.dtype == torch.uint8:
             return image
-        elif image.shape[0] == 1 and image.dtype == torch.uint8:
+        elif image.shape[-3] == 1 and image.dtype == torch.uint8:
             rgb8 = kornia.color.grayscale_to_rgb(image)
             return rgb8
 
     elif desired_type == ImageLoadType.RGBA8:
-        if image.shape[0] == 3 and image.dtype == torch.uint8:
+        if image.shape[-3] == 3 and image.dtype == torch.uint8:
             rgba32 = kornia.color.rgb_to_rgba(_to_float32(image), 0.0)
             return _to_uint8(rgba32)
 
     elif desired_type == ImageLoadType.GRAY32:
-        if image.shape[0] == 1 and image.dtype == torch.uint8:
+        if image.shape[-3] == 1 and image.dtype == torch.uint8:
             return _to_float32(image)
-        elif image.shape[0] == 3 and image.dtype == torch.uint8:
+        elif image.shape[-3] == 3 and image.dtype == torch.uint8:
             gray32 = kornia.color.rgb_to_grayscale(_to_float32(image))
             return gray32
-        elif image.shape[0] == 4 and image.dtype == torch.uint8:
+        elif image.shape[-3] == 4 and image.dtype == torch.uint8:
             gray32 = kornia.color.rgb_to_grayscale(kornia.color.rgba_to_rgb(_to_float32(image)))
             return gray32
 
     elif desired_type == ImageLoadType.RGB32:
-        if image.shape[0] == 3 and image.dtype == torch.uint8:
+        if image.shape[-3] == 3 and image.dtype == torch.uint8:
             return _to_float32(image)
-        elif image.shape[0] == 1 and image.dtype == torch.uint8:
+        elif image.shape[-3] == 1 and image.dtype == torch.uint8:
             rgb32 = kornia.color.grayscale_to_rgb(_to_float32(image))
             return rgb32
 
     raise NotImplementedError(f"Unknown type: {desired_type}")
 
 
+def _decode_into(path_file: Path, out: Optional[Tensor], index: int) -> tuple[torch.Size, Optional[Tensor]]:
+    """Decode an image and copy it into ``out[index]`` if given, otherwise return it as a CxHxW tensor."""
+    image = image_to_tensor(_read_image(path_file), keepdim=True)
+    if out is None:
+        return image.shape, image
+    C, H, W = image.shape
+    KORNIA_CHECK(
+        C == out.shape[1] and H <= out.shape[2] and W <= out.shape[3],
+        f"The image {path_file} of shape {tuple(image.shape)} does not fit in the buffer of shape {tuple(out.shape)}.",
+    )
+    slot = out[index]
+    slot[:, :H, :W].copy_(image)
+    slot[:, H:].zero_()
+    slot[:, :H, W:].zero_()
+    return image.shape, None
+
+
+def _check_inputs(paths: Sequence[str | Path], out: Optional[Tensor]) -> None:
+    """Check the paths and the optional buffer of the batched loading."""
+    KORNIA_CHECK(len(paths) > 0, "At least one image path is required.")
+    if out is not None:
+        KORNIA_CHECK(out.dtype == torch.uint8 and out.dim() == 4, "The buffer must be a uint8 tensor (B, C, H, W).")
+        KORNIA_CHECK(len(out) >= len(paths), f"The buffer can hold {len(out)} images, got {len(paths)} paths.")
+
+
+def _collate_images(
+    decoded: Sequence[tuple[torch.Size, Optional[Tensor]]],
+    out: Optional[Tensor],
+    desired_type: ImageLoadType,
+    device: Device,
+) -> tuple[Tensor, Tensor]:
+    """Gather the decoded images in a zero padded batch, move it to the device and convert it."""
+    channels = {shape[0] for shape, _ in decoded}
+    KORNIA_CHECK(len(channels) == 1, f"All the images must decode to the same number of channels. Got: {channels}.")
+    sizes = torch.tensor([list(shape[1:]) for shape, _ in decoded], dtype=torch.long)
+    dev = device if isinstance(device, torch.device) or device is None else torch.device(device)
+    if out is not None:
+        batch = out[: len(decoded)]
+    else:
+        # stage in page-locked memory so that the copy to the accelerator can be asynchronous
+        pin_memory = dev is not None and dev.type == "cuda" and torch.cuda.is_available()
+        H, W = sizes.amax(0).tolist()
+        batch = torch.zeros(len(decoded), channels.pop(), H, W, dtype=torch.uint8, pin_memory=pin_memory)
+        for i, (shape, image) in enumerate(decoded):
+            # the images are returned by the decoding unless they were written into ``out``
+            if image is not None:
+                batch[i, :, : shape[1], : shape[2]].copy_(image)
+    # a reused ``out`` may be overwritten by the next call while an asynchronous copy still reads it, the freshly
+    # allocated batch is kept alive by the pinned memory allocator until its copy is done
+    batch = batch.to(device=dev, non_blocking=out is None)
+    return _convert_image(batch, desired_type), sizes.to(device=dev)
+
+
+def load_images(
+    paths: Sequence[str | Path],
+    desired_type: ImageLoadType = ImageLoadType.RGB8,
+    device: Device = "cpu",
+    num_workers: Optional[int] = None,
+    out: Optional[Tensor] = None,
+) -> tuple[Tensor, Tensor]:
+    r"""Read and decode a list of image files in parallel using the Kornia Rust backend.
+
+    The images are decoded on a thread pool and gathered in a single batch, zero padded to the largest height and
+    width. The batch is staged in pinned memory when it goes to a CUDA device and converted to ``desired_type`` on
+    the device.
+
+    Args:
+        paths: Paths to valid image files, all decoding to the same number of channels.
+        desired_type: the desired image type, defined by color space and dtype.
+        device: the device where you want to get your images placed.
+        num_workers: number of decoding threads. Default: the number of CPUs.
+        out: optional preallocated uint8 buffer :math:`(B', C, H', W')`, e.g. pinned and reused across calls, with
+          :math:`B' \geq B` and large enough to hold every image. The images are then copied into it as soon as they
+          are decoded and the returned batch has its height and width.
+
+    Return:
+        - The images with shape :math:`(B, C, H, W)`.
+        - The height and width of each image in the batch, with shape :math:`(B, 2)`.
+
+    """
+    _check_inputs(paths, out)
+    num_workers = num_workers or min(len(paths), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        decoded = list(executor.map(_decode_into, [Path(p) for p in paths], [out] * len(paths), range(len(paths))))
+    return _collate_images(decoded, out, desired_type, device)
+
+
+async def load_images_async(
+    paths: Sequence[str | Path],
+    desired_type: ImageLoadType = ImageLoadType.RGB8,
+    device: Device = "cpu",
+    executor: Optional[Executor] = None,
+    out: Optional[Tensor] = None,
+) -> tuple[Tensor, Tensor]:
+    """Asynchronous version of :func:`load_images`, for use with :mod:`asyncio`.
+
+    The images are decoded in ``executor`` (the default executor of the event loop if None), so that the event loop
+    keeps running, e.g. to run the inference of the previous batch while the next one is decoded.
+
+    Args:
+        paths: Paths to valid image files, all decoding to the same number of channels.
+        desired_type: the desired image type, defined by color space and dtype.
+        device: the device where you want to get your images placed.
+        executor: the executor decoding the images.
+        out: optional preallocated uint8 buffer, see :func:`load_images`.
+
+    Return:
+        The same as :func:`load_images`.
+
+    """
+    _check_inputs(paths, out)
+    loop = asyncio.get_running_loop()
+    decoded = await asyncio.gather(
+        *(loop.run_in_executor(executor, _decode_into, Path(p), out, i) for i, p in enumerate(paths))
+    )
+    return await loop.run_in_executor(executor, _collate_images, decoded, out, desired_type, device)
+
+
 def _write_uint8_image(path_file: Path, img_np: Any, quality: int) -> None:
     """Write uint8 image to file."""
     if path_file.suffix.lower() in [".jpg", ".jpeg"]:
@@ -23,13 +23,13 @@ import torch
 import torch.nn.functional as F
 
 from kornia.core import Tensor
+from kornia.core.capabilities import needs_host_fallback
 
 
 def _kl_div_2d(p: Tensor, q: Tensor) -> Tensor:
     # D_KL(P || Q)
     batch, chans, height, width = p.shape
-    # SDAA not support kl_div
-    if 'sdaa' in q.device.type:
+    if needs_host_fallback("kl_div", q):
         device = q.device
         unsummed_kl = F.kl_div(
             q.reshape(batch * chans, height * width).log().cpu(), p.reshape(batch * chans, height * width).cpu(), reduction="none"
@@ -17,8 +17,9 @@
 
 from typing import Any, ClassVar, List, Optional, Tuple, Union
 
-from kornia.core import Module, Tensor, rand, tensor
+from kornia.core import Module, Tensor, concatenate, rand, tensor
 from kornia.core.mixin.onnx import ONNXExportMixin
+from kornia.geometry.bbox import batched_nms
 
 __all__ = ["BoxFiltering"]
 
@@ -30,6 +31,8 @@ class BoxFiltering(Module, ONNXExportMixin):
         confidence_threshold: an 0-d scalar that represents the desired threshold.
         classes_to_keep: a 1-d list of classes to keep. If None, keep all classes.
         filter_as_zero: whether to filter boxes as zero.
+        iou_threshold: if set, the boxes passing the filters are also suppressed with a class-aware
+            :func:`~kornia.geometry.bbox.batched_nms` using this IoU threshold.
 
     """
 
@@ -42,9 +45,11 @@ class BoxFiltering(Module, ONNXExportMixin):
         confidence_threshold: Optional[Union[Tensor, float]] = None,
         classes_to_keep: Optional[Union[Tensor, List[int]]] = None,
         filter_as_zero: bool = False,
+        iou_threshold: Optional[float] = None,
     ) -> None:
         super().__init__()
         self.filter_as_zero = filter_as_zero
+        self.iou_threshold = iou_threshold
         self.classes_to_keep = None
         self.confidence_threshold = None
         if classes_to_keep is not None:
@@ -97,6 +102,14 @@ class BoxFiltering(Module, ONNXExportMixin):
         # Combine the confidence and class masks
         combined_mask = confidence_mask & class_mask  # [B, D]
 
+        # Apply non-maxima suppression, per image and per class
+        if self.iou_threshold is not None:
+            xy, wh = boxes[:, :, 2:4], boxes[:, :, 4:6]
+            boxes_xyxy = concatenate([xy, xy + wh], -1)
+            combined_mask = batched_nms(
+                boxes_xyxy, boxes[:, :, 1], self.iou_threshold, boxes[:, :, 0].long(), combined_mask
+            )
+
         if self.filter_as_zero:
             filtered_boxes = boxes * combined_mask[:, :, None]
             return filtered_boxes
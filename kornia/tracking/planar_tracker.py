@@ -38,6 +38,11 @@ class HomographyTracker(Module):
         ransac: homography estimation module. Default: :class:`~kornia.geometry.RANSAC`.
         minimum_inliers_num: threshold for number inliers for matching to be successful.
 
+    .. note::
+        When a matcher relies on a :class:`~kornia.feature.DescriptorMatcher` created with an ``index``, the index is
+        built on the target descriptors in :meth:`set_target`, so the frames are matched with approximate nearest
+        neighbor search against it.
+
     """
 
     def __init__(
@@ -86,6 +91,18 @@ class HomographyTracker(Module):
             self.target_initial_representation = self.initial_matcher.extract_features(target)
         if hasattr(self.fast_matcher, "extract_features") and isinstance(self.fast_matcher.extract_features, Module):
             self.target_fast_representation = self.fast_matcher.extract_features(target)
+        # the target descriptors are matched with every frame, index them once
+        for matcher, representation in (
+            (self.initial_matcher, self.target_initial_representation),
+            (self.fast_matcher, self.target_fast_representation),
+        ):
+            descriptor_matcher = getattr(matcher, "matcher", None)
+            if (
+                isinstance(descriptor_matcher, DescriptorMatcher)
+                and descriptor_matcher.index is not None
+                and "descriptors" in representation
+            ):
+                descriptor_matcher.build_index(representation["descriptors"][0])
 
     def reset_tracking(self) -> None:
         self.previous_homography = None
@@ -106,6 +123,7 @@ class HomographyTracker(Module):
         match_dict: Dict[str, Tensor] = self.initial_matcher(input_dict)
         keypoints0 = match_dict["keypoints0"][match_dict["batch_indexes"] == 0]
         keypoints1 = match_dict["keypoints1"][match_dict["batch_indexes"] == 0]
+        confidence = match_dict["confidence"][match_dict["batch_indexes"] == 0] if "confidence" in match_dict else None
 
         self.keypoints0_num = len(keypoints0)
         self.keypoints1_num = len(keypoints1)
@@ -113,7 +131,7 @@ class HomographyTracker(Module):
         if self.keypoints0_num < self.minimum_inliers_num:
             return self.no_match()
 
-        H, inliers = self.ransac(keypoints0, keypoints1)
+        H, inliers = self.ransac(keypoints0, keypoints1, confidence)
         self.inliers_num = inliers.sum().item()
 
         if self.inliers_num < self.minimum_inliers_num:
@@ -142,6 +160,7 @@ class HomographyTracker(Module):
         match_dict = self.fast_matcher(input_dict)
         keypoints0 = match_dict["keypoints0"][match_dict["batch_indexes"] == 0]
         keypoints1 = match_dict["keypoints1"][match_dict["batch_indexes"] == 0]
+        confidence = match_dict["confidence"][match_dict["batch_indexes"] == 0] if "confidence" in match_dict else None
         keypoints1 = transform_points(Hwarp, keypoints1)
 
         self.keypoints0_num = len(keypoints0)
@@ -151,7 +170,7 @@ class HomographyTracker(Module):
             self.reset_tracking()
             return self.no_match()
 
-        H, inliers = self.ransac(keypoints0, keypoints1)
+        H, inliers = self.ransac(keypoints0, keypoints1, confidence)
         self.inliers_num = inliers.sum().item()
 
         if self.inliers_num < self.minimum_inliers_num:
@@ -42,6 +42,7 @@ from .misc import (
     differentiable_polynomial_floor,
     differentiable_polynomial_rounding,
     eye_like,
+    pad_by_batch_indexes,
     vec_like,
 )
 from .one_hot import one_hot
@@ -75,6 +76,7 @@ __all__ = [
     "load_pointcloud_ply",
     "map_location_to_cpu",
     "one_hot",
+    "pad_by_batch_indexes",
     "print_image",
     "safe_inverse_with_mask",
     "safe_solve_with_mask",
@@ -20,6 +20,7 @@ from typing import List, Optional, Tuple, Union
 import torch
 from torch import Tensor
 
+from kornia.core.capabilities import needs_host_fallback
 from kornia.core.check import KORNIA_CHECK, KORNIA_CHECK_SHAPE
 
 # TODO: implement width of the line
@@ -129,8 +130,7 @@ def draw_line(image: torch.Tensor, p1: torch.Tensor, p2: torch.Tensor, color: to
     x2, y2 = p2[..., 0], p2[..., 1]
     dx = x2 - x1
     dy = y2 - y1
-    # SDAA bug
-    if 'sdaa' in dy.device.type:
+    if needs_host_fallback("sign_values", dy):
         device = dy.device
         dx_sign = torch.sign(dx.cpu()).to(device)
         dy_sign = torch.sign(dy.cpu()).to(device)
@@ -262,9 +262,9 @@ def draw_rectangle(
         color = color.expand(batch, num_rectangle, c)
 
     device = image.device
-    if 'sdaa' in device.type:
+    if needs_host_fallback("strided_copy", image):
         if device == color.device:
-            # SDAA tests bug in some tensor.stride
+            # the writes into some of the views are not supported
             image = image.cpu()
             color = color.cpu()
         else:
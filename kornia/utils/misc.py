@@ -20,6 +20,7 @@ from typing import Optional
 import torch
 
 from kornia.core import Tensor, eye, zeros
+from kornia.core.capabilities import needs_host_fallback
 
 
 def eye_like(n: int, input: Tensor, shared_memory: bool = False) -> Tensor:
@@ -88,8 +89,7 @@ def differentiable_polynomial_rounding(input: Tensor) -> Tensor:
 
     """
     # Perform differentiable rounding
-    # SDAA round not support fp64
-    if 'sdaa' in input.device.type and input.dtype == torch.float64:
+    if needs_host_fallback("round", input):
         device = input.device
         input_round = input.cpu().round().to(device)
     else:
@@ -140,3 +140,49 @@ def differentiable_clipping(
     if min_val is not None:
         output[output < min_val] = scale * (torch.exp(output[output < min_val] - min_val) - 1.0) + min_val
     return output
+
+
+def pad_by_batch_indexes(
+    input: Tensor, batch_indexes: Tensor, batch_size: Optional[int] = None, padding_value: float = 0.0
+) -> tuple[Tensor, Tensor]:
+    r"""Scatter a flat tensor of elements belonging to several samples into a padded batch.
+
+    Elements keep their relative order inside every sample.
+
+    Args:
+        input: the flat elements with shape :math:`(N, *)`.
+        batch_indexes: the sample each element belongs to, with shape :math:`(N,)`.
+        batch_size: number of samples :math:`B`. Default: ``batch_indexes.max() + 1``.
+        padding_value: value of the padded entries.
+
+    Returns:
+        - The padded batch with shape :math:`(B, L, *)`, where :math:`L` is the size of the largest sample.
+        - The validity mask of the entries with shape :math:`(B, L)`.
+
+    Example:
+        >>> x = torch.tensor([1.0, 2.0, 3.0])
+        >>> padded, mask = pad_by_batch_indexes(x, torch.tensor([1, 0, 1]))
+        >>> padded
+        tensor([[2., 0.],
+                [1., 3.]])
+        >>> mask
+        tensor([[ True, False],
+                [ True,  True]])
+
+    """
+    if len(batch_indexes.shape) != 1 or batch_indexes.shape[0] != input.shape[0]:
+        raise AssertionError(f"batch_indexes must have shape ({input.shape[0]},). Got {batch_indexes.shape}")
+    batch_indexes = batch_indexes.long()
+    if batch_size is None:
+        batch_size = int(batch_indexes.max().item()) + 1 if batch_indexes.numel() > 0 else 0
+    counts = torch.bincount(batch_indexes, minlength=batch_size)
+    max_len = int(counts.max().item()) if batch_size > 0 else 0
+    order = torch.sort(batch_indexes, stable=True)[1]
+    sorted_indexes = batch_indexes[order]
+    starts = counts.cumsum(0) - counts
+    positions = torch.arange(len(order), device=input.device) - starts[sorted_indexes]
+    out = torch.full((batch_size, max_len, *input.shape[1:]), padding_value, dtype=input.dtype, device=input.device)
+    mask = zeros(batch_size, max_len, dtype=torch.bool, device=input.device)
+    out[sorted_indexes, positions] = input[order]
+    mask[sorted_indexes, positions] = True
+    return out, mask
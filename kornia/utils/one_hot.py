@@ -18,6 +18,7 @@
 import torch
 
 from kornia.core import Tensor, zeros
+from kornia.core.capabilities import needs_host_fallback
 
 
 def one_hot(labels: Tensor, num_classes: int, device: torch.device, dtype: torch.dtype, eps: float = 1e-6) -> Tensor:
@@ -59,8 +60,7 @@ def one_hot(labels: Tensor, num_classes: int, device: torch.device, dtype: torch
     shape = labels.shape
     one_hot = zeros((shape[0], num_classes) + shape[1:], device=device, dtype=dtype)
 
-    # SDAA not support fp64 scatter
-    if 'sdaa' in one_hot.device.type and one_hot.dtype == torch.float64:
+    if needs_host_fallback("scatter", one_hot):
         device = one_hot.device
         return one_hot.cpu().scatter_(1, labels.unsqueeze(1).cpu(), 1.0).to(device) + eps
     else:
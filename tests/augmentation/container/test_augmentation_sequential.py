@@ -24,7 +24,7 @@ import torch
 import kornia
 import kornia.augmentation as K
 from kornia.augmentation.container.base import ParamItem
-from kornia.constants import BorderType
+from kornia.constants import BorderType, DataKey, Resample
 from kornia.geometry.bbox import bbox_to_mask
 
 from testing.augmentation.utils import reproducibility_test
@@ -536,3 +536,258 @@ class TestAugmentationSequential:
         assert outputs[1].dtype == dtype, "Output mask dtype should match the input dtype"
         assert outputs[2].dtype == dtype, "Output box dtype should match the input dtype"
         assert outputs[3].dtype == dtype, "Output keypoints dtype should match the input dtype"
+
+
+class TestFusedGeometric:
+    def _smooth_image(self, batch_size, height, width, device, dtype):
+        yy, xx = torch.meshgrid(
+            torch.linspace(0, 1, height, device=device, dtype=dtype),
+            torch.linspace(0, 1, width, device=device, dtype=dtype),
+            indexing="ij",
+        )
+        return torch.stack([xx, yy, xx * yy])[None].repeat(batch_size, 1, 1, 1)
+
+    def _augmentations(self):
+        return [
+            K.RandomAffine(20, translate=(0.1, 0.1), scale=(0.9, 1.1), p=1.0, align_corners=True),
+            K.RandomHorizontalFlip(p=0.5),
+            K.RandomRotation(15, p=1.0),
+            K.RandomPerspective(0.2, p=1.0, align_corners=True),
+            K.CenterCrop(24, cropping_mode="resample"),
+        ]
+
+    def test_runs(self, device, dtype):
+        aug = K.ImageSequential(
+            K.RandomAffine(10, p=1.0, align_corners=True),
+            K.RandomHorizontalFlip(p=1.0),
+            K.ColorJiggle(0.1, p=1.0),
+            K.RandomRotation(10, p=1.0),
+            K.CenterCrop(4),
+            K.RandomPerspective(0.2, p=1.0, align_corners=False),
+            K.RandomElasticTransform(p=1.0),
+            fuse_geometric=True,
+        )
+        params = aug.forward_parameters(torch.Size((2, 3, 8, 8)))
+        runs = aug.get_fused_sequence(params)
+        assert [len(run) for run in runs] == [2, 1, 2, 1, 1]
+        assert [p.name for p in runs[2]] == ["RandomRotation_3", "CenterCrop_4"]
+        aug.fuse_geometric = False
+        assert all(len(run) == 1 for run in aug.get_fused_sequence(params))
+
+    def test_same_as_unfused(self, device, dtype):
+        img = self._smooth_image(4, 32, 32, device, dtype)
+        mask = torch.zeros(4, 1, 32, 32, device=device, dtype=dtype)
+        mask[..., 8:24, 10:20] = 1.0
+        bbox = torch.tensor([[[8.0, 10.0, 20.0, 24.0]]], device=device, dtype=dtype).repeat(4, 1, 1)
+        points = torch.tensor([[[12.0, 15.0], [20.0, 9.0]]], device=device, dtype=dtype).repeat(4, 1, 1)
+        data_keys = ["input", "mask", "bbox_xyxy", "keypoints"]
+
+        aug = K.AugmentationSequential(*self._augmentations(), data_keys=data_keys)
+        fused = K.AugmentationSequential(*self._augmentations(), data_keys=data_keys, fuse_geometric=True)
+        expected = aug(img, mask, bbox, points)
+        actual = fused(img, mask, bbox, points, params=aug._params)
+
+        assert actual[0].shape == expected[0].shape == (4, 3, 24, 24)
+        assert actual[1].shape == expected[1].shape == (4, 1, 24, 24)
+        # the borders differ with the zeros padded by each intermediate warp
+        center = (slice(None), slice(None), slice(8, 16), slice(8, 16))
+        assert_close(actual[0][center], expected[0][center], atol=5e-2, rtol=5e-2)
+        assert (actual[1][center] != expected[1][center]).float().mean() < 0.05
+        assert_close(actual[2], expected[2], atol=1e-3, rtol=1e-3)
+        assert_close(actual[3], expected[3], atol=1e-3, rtol=1e-3)
+        assert_close(fused.transform_matrix, aug.transform_matrix)
+
+    @pytest.mark.parametrize("align_corners", [True, False])
+    def test_same_as_unfused_exact(self, align_corners, device, dtype):
+        # a single warp fused with flips and crops samples the same pixels as the unfused operations
+        img = torch.rand(2, 3, 32, 30, device=device, dtype=dtype)
+        runs = [
+            [
+                K.RandomAffine(20, translate=(0.1, 0.1), p=1.0, align_corners=align_corners),
+                K.RandomHorizontalFlip(p=1.0),
+                K.CenterCrop(20),
+            ],
+            [
+                K.RandomHorizontalFlip(p=1.0),
+                K.RandomResizedCrop((24, 20), p=1.0, align_corners=align_corners, cropping_mode="resample"),
+            ],
+            [K.RandomPerspective(0.3, p=1.0, align_corners=align_corners), K.RandomVerticalFlip(p=1.0)],
+        ]
+        for augmentations in runs:
+            fused = K.ImageSequential(*augmentations, fuse_geometric=True)
+            out = fused(img)
+            assert_close(out, K.ImageSequential(*augmentations)(img, params=fused._params), atol=1e-4, rtol=1e-4)
+
+    def test_keypoints_follow_image(self, device, dtype):
+        img = torch.zeros(2, 1, 32, 32, device=device, dtype=dtype)
+        img[..., 14:17, 10:13] = 1.0
+        points = torch.tensor([[[11.0, 15.0]]], device=device, dtype=dtype).repeat(2, 1, 1)
+        aug = K.AugmentationSequential(
+            K.RandomAffine(10, translate=(0.1, 0.1), p=1.0, align_corners=True),
+            K.RandomRotation(10, p=1.0),
+            K.CenterCrop(28, cropping_mode="resample"),
+            data_keys=["input", "keypoints"],
+            fuse_geometric=True,
+        )
+        out_img, out_points = aug(img, points)
+        for i in range(2):
+            idx = out_img[i, 0].flatten().argmax()
+            peak = torch.stack([idx % 28, idx // 28]).to(dtype)
+            assert (peak - out_points[i, 0]).norm() <= 2.0
+
+    def test_image_sequential(self, device, dtype):
+        img = self._smooth_image(2, 32, 32, device, dtype)
+        aug = K.ImageSequential(*self._augmentations(), fuse_geometric=True)
+        out = aug(img)
+        assert out.shape == (2, 3, 24, 24)
+        mat = aug.get_transformation_matrix(img, aug._params)
+        assert_close(aug.get_transformation_matrix(img, aug._params, recompute=True), mat)
+        # reproducible with the same parameters
+        assert_close(aug(img, params=aug._params), out)
+
+
+class TestRaggedBatch:
+    def _augmentations(self):
+        # deterministic operations, so that every image can be compared against a batch of its own
+        return [
+            K.RandomAffine((30.0, 30.0), p=1.0, align_corners=True),
+            K.RandomHorizontalFlip(p=1.0),
+            K.RandomGaussianBlur(3, (1.0, 1.0), p=1.0),
+            K.RandomInvert(p=1.0),
+            K.Normalize(mean=torch.tensor([0.5]), std=torch.tensor([0.25])),
+        ]
+
+    def _data(self, device, dtype):
+        sizes = [(8, 10), (12, 7), (8, 10)]
+        images = [torch.rand(3, h, w, device=device, dtype=dtype) for h, w in sizes]
+        masks = [(torch.rand(1, h, w, device=device) > 0.5).to(dtype) for h, w in sizes]
+        points = [torch.tensor([[2.0, 3.0], [5.0, 1.0]], device=device, dtype=dtype)[: i + 1] for i in range(3)]
+        return images, masks, points
+
+    def test_ragged_images(self, device, dtype):
+        images = kornia.augmentation.RaggedImages.from_list(
+            [torch.rand(3, 4, 5, device=device, dtype=dtype), torch.rand(3, 6, 2, device=device, dtype=dtype)]
+        )
+        assert images.data.shape == (2, 3, 6, 5)
+        assert [size for _, size in images.buckets()] == [(4, 5), (6, 2)]
+        assert (images.data[0, :, 4:] == 0).all() and (images.data[1, :, :, 2:] == 0).all()
+        assert [im.shape for im in images.to_list()] == [(3, 4, 5), (3, 6, 2)]
+
+    def test_same_as_dense(self, device, dtype):
+        images, masks, points = self._data(device, dtype)
+        data_keys = ["input", "mask", "keypoints"]
+        extra_args = {DataKey.MASK: {"resample": Resample.NEAREST, "align_corners": True}}
+        aug = K.AugmentationSequential(*self._augmentations(), data_keys=data_keys, extra_args=extra_args)
+        out_images, out_masks, out_points = aug(images, masks, points)
+
+        assert isinstance(out_images, list) and isinstance(out_masks, list) and isinstance(out_points, list)
+        for i in range(len(images)):
+            dense = K.AugmentationSequential(*self._augmentations(), data_keys=data_keys, extra_args=extra_args)
+            expected = dense(images[i][None], masks[i][None], points[i][None])
+            assert_close(out_images[i], expected[0][0], atol=1e-4, rtol=1e-4)
+            assert_close(out_masks[i], expected[1][0])
+            assert_close(out_points[i], expected[2][0], atol=1e-4, rtol=1e-4)
+
+    @pytest.mark.parametrize("align_corners", [True, False])
+    def test_geometric_same_as_dense(self, align_corners, device, dtype):
+        images, _, _ = self._data(device, dtype)
+        augmentations = [
+            K.RandomAffine((30.0, 30.0), p=1.0, align_corners=align_corners),
+            K.Resize((6, 6)),
+            K.RandomVerticalFlip(p=1.0),
+        ]
+        out = K.AugmentationSequential(*augmentations)(images)
+        for i in range(len(images)):
+            expected = K.AugmentationSequential(*augmentations)(images[i][None])
+            assert_close(out[i], expected[0], atol=1e-4, rtol=1e-4)
+
+    def test_random(self, device, dtype):
+        images, masks, _ = self._data(device, dtype)
+        boxes = [torch.tensor([[1.0, 1.0, 4.0, 5.0]], device=device, dtype=dtype) for _ in images]
+        aug = K.AugmentationSequential(
+            K.RandomAffine(20.0, translate=(0.1, 0.1), p=0.5, align_corners=True),
+            K.ColorJitter(0.1, 0.1, 0.1, 0.1, p=0.5),
+            K.RandomResizedCrop((5, 5), p=1.0),
+            data_keys=["input", "mask", "bbox_xyxy"],
+        )
+        out_images, out_masks, out_boxes = aug(images, masks, boxes)
+        assert [im.shape for im in out_images] == [(3, 5, 5)] * 3
+        assert [m.shape for m in out_masks] == [(1, 5, 5)] * 3
+        assert [b.shape for b in out_boxes] == [(1, 4)] * 3
+        assert aug.transform_matrix.shape == (3, 3, 3)
+
+    @pytest.mark.parametrize(
+        "augmentation",
+        [
+            K.RandomAffine(20.0, translate=(0.2, 0.1), scale=(0.8, 1.2), p=1.0, align_corners=True),
+            K.RandomTranslate(0.2, 0.1, p=1.0, align_corners=True),
+            K.RandomShear((10.0, 10.0), p=1.0, align_corners=True),
+            K.RandomPerspective(0.5, p=1.0, align_corners=True),
+            K.RandomAffine(20.0, translate=(0.2, 0.1), p=1.0, align_corners=False),
+            K.RandomPerspective(0.5, p=1.0, align_corners=False),
+            K.ColorJiggle(0.1, 0.1, 0.1, 0.1, p=1.0),
+            K.ColorJitter(0.1, 0.0, 0.1, 0.1, p=1.0),
+        ],
+    )
+    def test_params_sampled_once(self, augmentation, device, dtype):
+        images, _, _ = self._data(device, dtype)
+        aug = K.AugmentationSequential(augmentation)
+        with patch.object(augmentation, "forward_parameters", wraps=augmentation.forward_parameters) as sample:
+            out = aug(images)
+        assert sample.call_count == 1
+        # the parameters are fitted to the size of every image
+        params = aug._params[0].data
+        for i, image in enumerate(images):
+            image_params = {
+                k: v if v.dim() == 0 or k in ("order", "forward_input_shape") else v[i : i + 1]
+                for k, v in params.items()
+            }
+            image_params["forward_input_shape"] = torch.tensor((1, *image.shape))
+            expected = augmentation(image[None], params=image_params)
+            assert_close(out[i], expected[0], atol=1e-4, rtol=1e-4)
+
+    def test_contrast_same_as_dense(self, device, dtype):
+        images, _, _ = self._data(device, dtype)
+        augmentation = K.ColorJitter(0.1, 0.3, 0.1, 0.1, p=1.0)
+        aug = K.AugmentationSequential(augmentation)
+        out = aug(images)
+        # the mean of the contrast adjustment is taken over every image alone, without the padding
+        params = aug._params[0].data
+        for i, image in enumerate(images):
+            image_params = {k: v if k == "order" else v[i : i + 1] for k, v in params.items()}
+            image_params["forward_input_shape"] = torch.tensor((1, *image.shape))
+            expected = augmentation(image[None], params=image_params)
+            assert_close(out[i], expected[0], atol=1e-4, rtol=1e-4)
+
+    def test_params_fitted(self, device, dtype):
+        images, _, _ = self._data(device, dtype)
+        sizes = torch.tensor([image.shape[-1:-3:-1] for image in images], device=device, dtype=dtype)
+        aug = K.AugmentationSequential(
+            K.RandomAffine(0.0, translate=(0.2, 0.1), p=1.0), K.RandomPerspective(0.5, p=1.0)
+        )
+        aug(images)
+        affine, perspective = ({k: v.to(sizes) for k, v in param.data.items()} for param in aug._params)
+        assert_close(affine["center"], sizes / 2 - 0.5)
+        assert (affine["translations"].abs() <= sizes * torch.tensor([0.2, 0.1], device=device, dtype=dtype)).all()
+        corners = torch.tensor([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]], device=device, dtype=dtype)
+        assert_close(perspective["start_points"], corners * (sizes[:, None] - 1))
+        offsets = perspective["end_points"] - perspective["start_points"]
+        assert (offsets.abs() <= 0.5 * sizes[:, None] / 2).all()
+
+    def test_ragged_images_in_and_out(self, device, dtype):
+        images, _, _ = self._data(device, dtype)
+        ragged = kornia.augmentation.RaggedImages.from_list(images)
+        aug = K.AugmentationSequential(K.RandomAffine((30.0, 30.0), p=1.0, align_corners=True))
+        out = aug(ragged)
+        assert isinstance(out, kornia.augmentation.RaggedImages)
+        for actual, expected in zip(out.to_list(), aug(images)):
+            assert_close(actual, expected)
+
+    def test_exception(self, device, dtype):
+        images, _, _ = self._data(device, dtype)
+        aug = K.AugmentationSequential(K.RandomAffine(10.0, p=1.0))
+        aug(images)
+        with pytest.raises(Exception):
+            aug(images, params=aug._params)
+        with pytest.raises(Exception):
+            aug([images[0], images[1][:1]])
@@ -0,0 +1,87 @@
+# LICENSE HEADER MANAGED BY add-license-header
+#
+# Copyright 2018 Kornia Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+import torch
+
+import kornia.augmentation as K
+
+from testing.base import assert_close
+
+
+class TestParamBank:
+    def _augmentation(self):
+        return K.AugmentationSequential(
+            K.RandomAffine(30.0, p=0.5, align_corners=True),
+            K.RandomResizedCrop((6, 7), p=1.0),
+            K.RandomGaussianBlur(3, (0.1, 2.0), p=0.5),
+            data_keys=["input", "mask"],
+        )
+
+    def test_replay(self, device, dtype, tmp_path):
+        aug = self._augmentation()
+        state = torch.get_rng_state()
+        bank = K.ParamBank.sample(aug, (3, 3, 8, 9), num_batches=6, seed=1)
+        assert_close(torch.get_rng_state(), state)
+        assert len(bank) == 6
+        # a single draw for all the batches
+        assert bank.columns["RandomAffine_0/batch_prob"].shape == (18,)
+
+        bank.save(tmp_path / "bank.pt")
+        loaded = K.ParamBank.load(tmp_path / "bank.pt")
+        same = K.ParamBank.sample(aug, (3, 3, 8, 9), num_batches=6, seed=1)
+        images = torch.rand(3, 3, 8, 9, device=device, dtype=dtype)
+        masks = torch.rand(3, 1, 8, 9, device=device, dtype=dtype)
+        for index in range(len(bank)):
+            expected = aug(images, masks, params=bank.get(index, device=device))
+            assert expected[0].shape == (3, 3, 6, 7)
+            assert_close(aug(images, masks, params=loaded.get(index, device=device))[0], expected[0])
+            assert_close(aug(images, masks, params=same.get(index, device=device))[1], expected[1])
+
+    def test_rows(self, device, dtype):
+        aug = K.RandomAffine(30.0, p=0.5, align_corners=True)
+        bank = K.ParamBank.sample(aug, (4, 1, 5, 5), num_batches=8)
+        images = torch.rand(4, 1, 5, 5, device=device, dtype=dtype)
+        for params in bank:
+            to_apply = params["batch_prob"] > 0.5
+            # only the parameters of the applied samples are stored
+            assert len(params["angle"]) == int(to_apply.sum())
+            assert params["forward_input_shape"].tolist() == [4, 1, 5, 5]
+            out = aug(images, params={k: v.to(device) for k, v in params.items()})
+            assert_close(out[~to_apply.to(device)], images[~to_apply.to(device)])
+
+    def test_batch_level(self, device, dtype):
+        aug = K.AugmentationSequential(
+            K.ColorJitter(0.1, 0.1, 0.1, 0.1, p=0.5),
+            K.RandomCrop((4, 4), p=0.5),
+        )
+        bank = K.ParamBank.sample(aug, (2, 3, 6, 6), num_batches=20, seed=0)
+        # the order of the jitter is drawn per batch
+        assert bank.columns["ColorJitter_0/order"].shape == (20, 4)
+        images = torch.rand(2, 3, 6, 6, device=device, dtype=dtype)
+        shapes = {aug(images, params=bank.get(index, device=device)).shape[-1] for index in range(len(bank))}
+        assert shapes == {4, 6}
+
+    def test_exception(self):
+        aug = K.AugmentationSequential(K.RandomAffine(3.0), K.RandomHorizontalFlip(), random_apply=1)
+        with pytest.raises(Exception):
+            K.ParamBank.sample(aug, (2, 3, 8, 8), num_batches=20, seed=0)
+        aug.set_static_mode()
+        bank = K.ParamBank.sample(aug, (2, 3, 8, 8), num_batches=20, seed=0)
+        assert bank.columns["RandomAffine_0/batch_prob"].shape == (40,)
+        with pytest.raises(Exception):
+            bank[20]
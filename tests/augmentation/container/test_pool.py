@@ -0,0 +1,71 @@
+# LICENSE HEADER MANAGED BY add-license-header
+#
+# Copyright 2018 Kornia Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import sys
+
+import pytest
+import torch
+
+import kornia.augmentation as K
+
+from testing.base import assert_close
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="the workers are forked")
+class TestAugmentationPool:
+    def _augmentation(self):
+        return K.AugmentationSequential(
+            K.RandomAffine(30.0, translate=(0.1, 0.1), p=1.0, align_corners=True),
+            K.ColorJitter(0.1, 0.1, 0.1, p=0.5),
+            data_keys=["input", "mask"],
+        )
+
+    def test_same_as_main_process(self, device, dtype):
+        if device.type != "cpu":
+            pytest.skip("the pool augments CPU tensors")
+        aug = self._augmentation()
+        batches = [(torch.rand(3, 3, 8, 9, dtype=dtype), torch.rand(3, 1, 8, 9, dtype=dtype)) for _ in range(7)]
+        with K.AugmentationPool(aug, num_workers=2, prefetch=3, multiprocessing_context="fork") as pool:
+            outputs = [([o.clone() for o in out], params) for out, params in pool.imap(batches, return_params=True)]
+        assert len(outputs) == len(batches)
+        for (images, masks), ((out_images, out_masks), params) in zip(batches, outputs):
+            expected = aug(images, masks, params=params)
+            assert_close(out_images, expected[0])
+            assert_close(out_masks, expected[1])
+
+    def test_reuse(self):
+        batches = [torch.rand(2, 3, 6, 6) for _ in range(5)]
+        with K.AugmentationPool(K.RandomHorizontalFlip(p=1.0), 1, prefetch=2, multiprocessing_context="fork") as pool:
+            # the batches in flight are drained when the stream is left early
+            for i, _ in enumerate(pool.imap(batches)):
+                if i == 1:
+                    break
+            outputs = [out.clone() for out in pool.imap(batches)]
+            # the slots are reallocated when the shapes change
+            outputs_small = [out.clone() for out in pool.imap([b[:, :, :4] for b in batches])]
+        for batch, out, out_small in zip(batches, outputs, outputs_small):
+            assert_close(out, batch.flip(-1))
+            assert_close(out_small, batch[:, :, :4].flip(-1))
+
+    def test_exception(self):
+        with pytest.raises(Exception):
+            K.AugmentationPool(K.RandomHorizontalFlip(), num_workers=2, prefetch=1)
+        with K.AugmentationPool(K.RandomGrayscale(p=1.0), 1, prefetch=1, multiprocessing_context="fork") as pool:
+            with pytest.raises(RuntimeError, match="augmentation worker"):
+                list(pool.imap([torch.rand(1, 3, 4, 4), torch.rand(1, 5, 4, 4)]))
+            # the pool is still usable
+            assert len(list(pool.imap([torch.rand(1, 3, 4, 4)]))) == 1
@@ -68,3 +68,31 @@ class TestSequential:
         assert out.shape == inp.shape
         aug.inverse(inp)
         reproducibility_test(inp, aug)
+
+    @pytest.mark.parametrize("random_apply", [1, (1, 2), (2,), True])
+    def test_static_random_apply(self, random_apply, device, dtype):
+        inp = torch.rand(8, 3, 30, 30, device=device, dtype=dtype)
+        aug = K.ImageSequential(
+            K.ColorJiggle(0.1, 0.1, 0.1, 0.1, p=1.0),
+            K.ImageSequential(K.RandomAffine(360, p=1.0)),
+            K.RandomHorizontalFlip(p=1.0),
+            random_apply=random_apply,
+            random_apply_weights=[1.0, 1.0, 0.0],
+        )
+        aug.set_static_mode()
+        out = aug(inp)
+        assert out.shape == inp.shape
+        # all the operations are run, masked by a per-sample selection
+        assert len(aug._params) == len(aug)
+        applied = torch.stack([aug._params[0].data["batch_prob"], aug._params[1].data[0].data["batch_prob"]], dim=1)
+        low, high = aug.random_apply
+        assert ((applied.sum(dim=1) >= min(low, 2)) & (applied.sum(dim=1) < high)).all()
+        assert (aug._params[2].data["batch_prob"] == 0).all()
+        reproducibility_test(inp, aug)
+
+    def test_static_random_apply_unsupported(self, device, dtype):
+        inp = torch.rand(2, 3, 30, 30, device=device, dtype=dtype)
+        aug = K.ImageSequential(K.RandomAffine(360, p=1.0), kornia.filters.MedianBlur((3, 3)), random_apply=1)
+        aug.set_static_mode()
+        with pytest.raises(NotImplementedError):
+            aug(inp)
@@ -4233,6 +4233,16 @@ class TestRandomLinearIllumination(BaseTester):
         output_tensor = transform(input_tensor)
         self.assert_close(output_tensor[0], output_tensor[1])
 
+    def test_batch(self, device, dtype):
+        input_tensor = torch.zeros(16, 2, 5, 4, device=device, dtype=dtype)
+        gradient = RandomLinearIllumination(gain=0.25, sign=1.0, p=1.0)(input_tensor)
+        ramp_y = torch.linspace(0, 0.25, 5, device=device, dtype=dtype)[:, None].expand(5, 4)
+        ramp_x = torch.linspace(0, 0.25, 4, device=device, dtype=dtype)[None].expand(5, 4)
+        ramps = (ramp_y, ramp_y.flip(0), ramp_x, ramp_x.flip(1))
+        # every image has its own direction
+        for image in gradient:
+            assert any(torch.allclose(image, ramp.expand_as(image), atol=1e-4) for ramp in ramps)
+
 
 class TestRandomLinearCornerIllumination(BaseTester):
     def _get_expected(self, device, dtype):
@@ -5172,6 +5182,32 @@ class TestRandomRain(BaseTester):
         aug = RandomRain(p=0.0, drop_height=(2, 3), drop_width=(2, 3), number_of_drops=(1, 3))
         aug(input_data)
 
+    def test_drops(self, device, dtype):
+        input_data = torch.zeros(2, 1, 6, 6, device=device, dtype=dtype)
+        params = {
+            "number_of_drops_factor": torch.tensor([1, 2]),
+            "coordinates_factor": torch.tensor([[[0.0, 0.0], [0.5, 0.5]], [[0.0, 0.0], [1.0, 1.0]]]),
+            "drop_height_factor": torch.tensor([3, 2]),
+            "drop_width_factor": torch.tensor([0, -2]),
+        }
+        output_data = RandomRain(p=1.0).apply_transform(input_data, params, {})
+        expected = torch.zeros_like(input_data)
+        # the vertical drop at the top left corner, the second drop of the first image is not drawn
+        expected[0, 0, [0, 1, 3], 0] = 200 / 255
+        # the diagonal drops, leaning to the left
+        expected[1, 0, [0, 2], [2, 0]] = 200 / 255
+        expected[1, 0, [3, 5], [5, 3]] = 200 / 255
+        self.assert_close(output_data, expected)
+
+    def test_batch(self, device, dtype):
+        input_data = torch.rand(4, 3, 12, 15, device=device, dtype=dtype)
+        aug = RandomRain(p=1.0, drop_height=(2, 6), drop_width=(-4, 4), number_of_drops=(1, 20))
+        output_data = aug(input_data)
+        for i in range(4):
+            params = {k: v[i : i + 1] for k, v in aug._params.items()}
+            params["coordinates_factor"] = params["coordinates_factor"][:, : int(params["number_of_drops_factor"])]
+            self.assert_close(output_data[i : i + 1], aug.apply_transform(input_data[i : i + 1], params, {}))
+
 
 class TestMultiprocessing:
     torch.manual_seed(0)  # for random reproductibility
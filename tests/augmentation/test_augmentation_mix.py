@@ -346,6 +346,21 @@ class TestRandomMosaic(BaseTester):
         self.assert_close(out_image, expected, rtol=1e-4, atol=1e-4)
         self.assert_close(out_box, expected_box, rtol=1e-4, atol=1e-4)
 
+    def test_tiles(self, device, dtype):
+        f = RandomMosaic(output_size=(8, 8), start_ratio_range=(0.25, 0.25), p=1.0, data_keys=["input", "bbox_xyxy"])
+        input = torch.arange(1, 5, device=device, dtype=dtype).view(4, 1, 1, 1).repeat(1, 2, 8, 8)
+        boxes = torch.tensor([[[3.0, 4.0, 6.0, 7.0]]], device=device, dtype=dtype).repeat(4, 1, 1)
+        out_image, out_box = f(input, boxes)
+
+        # the crop starts at (2, 2) of the 16x16 super-image, the tile (i, j) is at the i-th column and j-th row
+        permutation = f._params["permutation"].to(device)
+        self.assert_close(out_image[:, :, :6, :6], input[permutation[:, 0], :, :6, :6])
+        self.assert_close(out_image[:, :, 6:, :6], input[permutation[:, 1], :, :2, :6])
+        self.assert_close(out_image[:, :, :6, 6:], input[permutation[:, 2], :, :6, :2])
+        self.assert_close(out_image[:, :, 6:, 6:], input[permutation[:, 3], :, :2, :2])
+        assert out_box.shape == (4, 4, 4)
+        self.assert_close(out_box[:, 0], boxes[:, 0] - 2)
+
     @pytest.mark.parametrize("p", [0.0, 0.5, 1.0])
     def test_p(self, p, device, dtype):
         torch.manual_seed(76)
@@ -115,6 +115,17 @@ class TestAutoAugment(BaseTester):
     def test_sequential(augment_method, device, dtype):
         _test_sequential(AutoAugment(), device=device, dtype=dtype)
 
+    def test_static_mode(self, device, dtype):
+        aug = AutoAugment()
+        aug.set_static_mode()
+        in_tensor = torch.rand(10, 3, 50, 50, device=device, dtype=dtype)
+        out_tensor = aug(in_tensor)
+        # every policy is sampled, each sample is augmented by at most one of them
+        assert len(aug._params) == len(aug)
+        applied = torch.stack([param.data[0].data["batch_prob"] > 0.5 for param in aug._params], dim=1)
+        assert (applied.sum(dim=1) <= 1).all()
+        self.assert_close(aug(in_tensor, params=aug._params), out_tensor)
+
 
 class TestRandAugment(BaseTester):
     @pytest.mark.parametrize("policy", [None, [[("translate_y", -0.5, 0.5)]]])
@@ -144,6 +155,20 @@ class TestRandAugment(BaseTester):
     def test_sequential(augment_method, device, dtype):
         _test_sequential(RandAugment(n=3, m=15), device=device, dtype=dtype)
 
+    def test_static_mode(self, device, dtype):
+        aug = RandAugment(n=2, m=15)
+        aug.set_static_mode()
+        in_tensor = torch.rand(10, 3, 50, 50, device=device, dtype=dtype)
+        out_tensor = aug(in_tensor)
+        # every policy is sampled, each sample is augmented by at most n of them
+        assert len(aug._params) == len(aug)
+        applied = torch.stack([param.data[0].data["batch_prob"] > 0.5 for param in aug._params], dim=1)
+        assert (applied.sum(dim=1) <= 2).all()
+        self.assert_close(aug(in_tensor, params=aug._params), out_tensor)
+        trans = aug.get_transformation_matrix(in_tensor, params=aug._params)
+        self.assert_close(trans, aug.transform_matrix)
+        _test_sequential(aug, device=device, dtype=dtype)
+
 
 class TestTrivialAugment(BaseTester):
     @pytest.mark.parametrize("policy", [None, [[("translate_y", -0.5, 0.5)]]])
@@ -169,3 +194,13 @@ class TestTrivialAugment(BaseTester):
 
     def test_sequential(augment_method, device, dtype):
         _test_sequential(TrivialAugment(), device=device, dtype=dtype)
+
+    def test_static_mode(self, device, dtype):
+        aug = TrivialAugment()
+        aug.set_static_mode()
+        in_tensor = torch.rand(10, 3, 50, 50, device=device, dtype=dtype)
+        aug(in_tensor)
+        applied = torch.stack([param.data[0].data["batch_prob"] > 0.5 for param in aug._params], dim=1)
+        assert (applied.sum(dim=1) <= 1).all()
+        trans = aug.get_transformation_matrix(in_tensor, params=aug._params)
+        self.assert_close(trans, aug.transform_matrix)
@@ -19,13 +19,19 @@ from unittest.mock import patch
 
 import pytest
 import torch
+from torch.distributions import Bernoulli, Beta, Categorical, Normal, RelaxedBernoulli, Uniform
 
+import kornia.augmentation as K
 from kornia.augmentation._2d.base import AugmentationBase2D
 from kornia.augmentation._2d.geometric.affine import RandomAffine
 from kornia.augmentation._2d.intensity.gaussian_blur import RandomGaussianBlur
 from kornia.augmentation._3d.geometric.affine import RandomAffine3D
 from kornia.augmentation._3d.intensity.motion_blur import RandomMotionBlur3D
 from kornia.augmentation.base import _BasicAugmentationBase
+from kornia.augmentation.utils import _adapted_rsampling, _adapted_sampling
+from kornia.core.profiling import track_sync_points
+from kornia.geometry.boxes import Boxes
+from kornia.geometry.keypoints import Keypoints
 
 from testing.base import BaseTester
 
@@ -238,3 +244,275 @@ class TestGeometricAugmentationBase3D:
             res = aug(x, params)
 
         assert res.dtype == dtype, "The output dtype should match the input dtype"
+
+
+class TestRngGenerator(BaseTester):
+    def _generator(self, device, seed=0):
+        if device.type not in ("cpu", "cuda"):
+            pytest.skip(f"No generator on {device.type}.")
+        return torch.Generator(device=device).manual_seed(seed)
+
+    def test_reproducible(self, device, dtype):
+        x = torch.rand(8, 3, 9, 9, device=device, dtype=dtype)
+        aug = RandomAffine(30.0, p=0.5)
+        aug.set_rng_generator(self._generator(device))
+        out1 = aug(x)
+        torch.manual_seed(1)  # the global random stream does not matter
+        aug.set_rng_generator(self._generator(device))
+        out2 = aug(x)
+        self.assert_close(out1, out2)
+
+    def test_full_batch_params(self, device, dtype):
+        aug = RandomGaussianBlur((3, 3), (0.1, 2.0), p=0.5)
+        aug.set_rng_generator(self._generator(device))
+        assert aug.full_batch_params
+        params = aug.forward_parameters((8, 3, 9, 9))
+        assert params["sigma"].shape == (8,)
+        assert params["batch_prob"].device == device
+        aug.set_rng_generator(None)
+        assert not aug.full_batch_params
+
+    @pytest.mark.parametrize("aug", [RandomAffine(30.0, p=0.5), RandomGaussianBlur((3, 3), (0.1, 2.0), p=0.5)])
+    def test_masked_samples(self, aug, device, dtype):
+        x = torch.rand(8, 3, 9, 9, device=device, dtype=dtype)
+        aug.set_rng_generator(self._generator(device, seed=3))
+        out = aug(x)
+        to_apply = aug._params["batch_prob"] > 0.5
+        assert 0 < to_apply.sum() < 8
+        self.assert_close(out[~to_apply], x[~to_apply])
+        # same as sampling the parameters of the applied samples only
+        aug.set_rng_generator(None)
+        params = {k: v[to_apply] if k != "forward_input_shape" else v for k, v in aug._params.items()}
+        self.assert_close(out[to_apply], aug(x[to_apply], params=params))
+
+    @pytest.mark.parametrize(
+        "aug",
+        [
+            RandomAffine(30.0, p=0.5),
+            RandomGaussianBlur((3, 3), (0.1, 2.0), p=0.5),
+            K.RandomResizedCrop((5, 5), p=0.5),
+            K.RandomMixUpV2(p=0.5),
+            K.ColorJitter(0.1, 0.1, 0.1, 0.1, p=0.5),
+        ],
+    )
+    def test_global_stream_untouched(self, aug, device, dtype):
+        aug.set_rng_generator(self._generator(device))
+        state = torch.get_rng_state()
+        cuda_state = torch.cuda.get_rng_state(device) if device.type == "cuda" else None
+        aug.forward_parameters((8, 3, 9, 9))
+        assert torch.equal(torch.get_rng_state(), state)
+        if cuda_state is not None:
+            assert torch.equal(torch.cuda.get_rng_state(device), cuda_state)
+
+    @pytest.mark.parametrize("same_on_batch", [True, False])
+    @pytest.mark.parametrize(
+        "dist_name", ["uniform", "normal", "bernoulli", "relaxed_bernoulli", "beta", "categorical"]
+    )
+    def test_sample_from_generator(self, dist_name, same_on_batch, device, dtype):
+        one = torch.tensor(1.0, device=device, dtype=dtype)
+        dist = {
+            "uniform": Uniform(-one, one),
+            "normal": Normal(0.0 * one, one),
+            "bernoulli": Bernoulli(0.5 * one),
+            "relaxed_bernoulli": RelaxedBernoulli(0.5 * one, probs=0.5 * one),
+            "beta": Beta(2.0 * one, 3.0 * one),
+            "categorical": Categorical(torch.ones(4, device=device, dtype=dtype)),
+        }[dist_name]
+        sample = _adapted_sampling if dist_name in ("bernoulli", "categorical") else _adapted_rsampling
+        out1 = sample((16,), dist, same_on_batch, self._generator(device))
+        out2 = sample((16,), dist, same_on_batch, self._generator(device))
+        assert out1.shape == (16,)
+        assert out1.device == device
+        self.assert_close(out1, out2)
+        if same_on_batch:
+            self.assert_close(out1, out1[:1].expand(16))
+
+    def test_no_sync_points(self, device, dtype):
+        aug = RandomAffine(30.0, p=0.5)
+        aug.set_rng_generator(self._generator(device))
+        with track_sync_points(strict=True):
+            aug.forward_parameters((8, 3, 9, 9))
+
+    def test_boxes_keypoints_classes(self, device, dtype):
+        x = torch.rand(8, 3, 9, 9, device=device, dtype=dtype)
+        boxes = Boxes.from_tensor(torch.tensor([[[1.0, 2.0, 5.0, 6.0]]], device=device, dtype=dtype).repeat(8, 1, 1))
+        keypoints = Keypoints(torch.rand(8, 3, 2, device=device, dtype=dtype) * 8)
+        classes = torch.arange(8, device=device)
+        aug = RandomAffine(30.0, p=0.5)
+        aug.set_rng_generator(self._generator(device, seed=3))
+        aug(x)
+        params, transform = aug._params, aug.transform_matrix
+        with track_sync_points(strict=True):
+            out_boxes = aug.transform_boxes(boxes, params, aug.flags, transform=transform)
+            out_keypoints = aug.transform_keypoints(keypoints, params, aug.flags, transform=transform)
+            out_classes = aug.transform_classes(classes, params, aug.flags, transform=transform)
+
+        to_apply = params["batch_prob"] > 0.5
+        assert 0 < to_apply.sum() < 8
+        self.assert_close(out_boxes.data[~to_apply], boxes.data[~to_apply])
+        self.assert_close(out_keypoints.data[~to_apply], keypoints.data[~to_apply])
+        self.assert_close(out_classes, classes)
+        # same as transforming the applied samples only
+        aug.set_rng_generator(None)
+        params = {k: v[to_apply] if k != "forward_input_shape" else v for k, v in params.items()}
+        params["batch_prob"] = to_apply.to(dtype)
+        expected = aug.transform_boxes(boxes, params, aug.flags, transform=transform)
+        self.assert_close(out_boxes.data, expected.data)
+        expected = aug.transform_keypoints(keypoints, params, aug.flags, transform=transform)
+        self.assert_close(out_keypoints.data, expected.data)
+
+    @pytest.mark.parametrize(
+        "aug",
+        [
+            K.Resize((5, 6)),
+            K.CenterCrop((5, 5)),
+            K.RandomCrop((5, 5)),
+            K.RandomResizedCrop((5, 5)),
+            K.PadTo((12, 12)),
+            K.SmallestMaxSize(6),
+        ],
+    )
+    def test_output_size_changes(self, aug, device, dtype):
+        x = torch.rand(2, 3, 9, 9, device=device, dtype=dtype)
+        mask = torch.rand(2, 1, 9, 9, device=device, dtype=dtype)
+        boxes = torch.tensor([[[1.0, 2.0, 5.0, 6.0]]], device=device, dtype=dtype).repeat(2, 1, 1)
+        keypoints = torch.rand(2, 3, 2, device=device, dtype=dtype) * 8
+        seq = K.AugmentationSequential(aug, data_keys=["input", "mask", "bbox_xyxy", "keypoints"])
+        seq.set_rng_generator(self._generator(device))
+        out = seq(x, mask, boxes, keypoints)
+        # every sample is transformed, the parameters are the same as without a generator
+        seq.set_rng_generator(None)
+        expected = seq(x, mask, boxes, keypoints, params=seq._params)
+        assert out[0].shape[-2:] == out[1].shape[-2:] != x.shape[-2:]
+        for actual, reference in zip(out, expected):
+            self.assert_close(actual, reference)
+
+    def test_sequential(self, device, dtype):
+        x = torch.rand(4, 3, 9, 9, device=device, dtype=dtype)
+        aug = K.AugmentationSequential(RandomAffine(30.0, p=0.5), K.ColorJitter(0.1, 0.1, p=0.5))
+        aug.set_rng_generator(self._generator(device))
+        out1 = aug(x)
+        aug.set_rng_generator(self._generator(device))
+        self.assert_close(aug(x), out1)
+
+
+class TestStaticMode(BaseTester):
+    @pytest.mark.parametrize("aug", [RandomAffine(30.0, p=0.5), RandomGaussianBlur((3, 3), (0.1, 2.0), p=0.5)])
+    def test_masked_samples(self, aug, device, dtype):
+        torch.manual_seed(0)
+        x = torch.rand(8, 3, 9, 9, device=device, dtype=dtype)
+        aug.set_static_mode()
+        out = aug(x)
+        params = aug._params
+        assert params["batch_prob"].shape == (8,)
+        to_apply = params["batch_prob"] > 0.5
+        self.assert_close(out[~to_apply], x[~to_apply])
+        self.assert_close(aug(x, params=params), out)
+        # same as applying the operation to the selected samples only
+        aug.set_static_mode(False)
+        params = {k: v[to_apply] if k != "forward_input_shape" else v for k, v in params.items()}
+        self.assert_close(aug(x[to_apply], params=params), out[to_apply])
+
+    @pytest.mark.parametrize("crop", [K.RandomResizedCrop((5, 5)), K.CenterCrop((5, 5)), K.Resize((5, 6))])
+    def test_output_size_changes(self, crop, device, dtype):
+        torch.manual_seed(0)
+        x = torch.rand(8, 3, 9, 9, device=device, dtype=dtype)
+        mask = torch.rand(8, 1, 9, 9, device=device, dtype=dtype)
+        boxes = torch.tensor([[[1.0, 2.0, 5.0, 6.0]]], device=device, dtype=dtype).repeat(8, 1, 1)
+        keypoints = torch.rand(8, 3, 2, device=device, dtype=dtype) * 8
+        seq = K.AugmentationSequential(
+            RandomAffine(30.0, p=0.5), crop, data_keys=["input", "mask", "bbox_xyxy", "keypoints"]
+        )
+        seq.set_static_mode()
+        out = seq(x, mask, boxes, keypoints)
+        assert out[0].shape[-2:] == out[1].shape[-2:] == crop.flags["size"]
+        assert out[2].shape == boxes.shape
+        assert out[3].shape == keypoints.shape
+        for actual, replayed in zip(out, seq(x, mask, boxes, keypoints, params=seq._params)):
+            self.assert_close(actual, replayed)
+
+    def test_single_graph(self, device, dtype):
+        dynamo = pytest.importorskip("torch._dynamo")
+        x = torch.rand(4, 3, 9, 9, device=device, dtype=dtype)
+        aug = RandomAffine(30.0, p=0.5)
+        aug.set_static_mode()
+        explanation = dynamo.explain(aug)(x)
+        assert explanation.graph_count == 1
+        assert explanation.graph_break_count == 0
+
+    @pytest.mark.parametrize("aug", [K.ColorJiggle(0.3, 0.3, 0.3, 0.1), K.ColorJitter(0.3, 0.3, 0.3, 0.1)])
+    def test_follows_order(self, aug, device, dtype):
+        torch.manual_seed(0)
+        x = torch.rand(4, 3, 9, 9, device=device, dtype=dtype)
+        for order in ([3, 1, 0, 2], [0, 1, 2, 3], [2, 3, 1, 0]):
+            aug.set_static_mode(False)
+            aug(x)
+            params = {**aug._params, "order": torch.tensor(order)}
+            out = aug(x, params=params)
+            aug.set_static_mode()
+            self.assert_close(aug(x, params=params), out)
+
+
+class TestUint8(BaseTester):
+    _LUT_AUGMENTATIONS = [
+        K.RandomBrightness((0.8, 1.2), p=0.5),
+        K.RandomContrast((0.7, 1.3), p=0.5),
+        K.RandomGamma((0.5, 1.5), p=0.5),
+        K.RandomPosterize(3, p=0.5),
+        K.RandomSolarize(0.1, 0.1, p=0.5),
+        K.RandomEqualize(p=0.5),
+        K.RandomInvert(p=0.5),
+    ]
+
+    @pytest.mark.parametrize("aug", _LUT_AUGMENTATIONS)
+    def test_lut_same_as_float(self, aug, device):
+        torch.manual_seed(0)
+        x = torch.randint(0, 256, (4, 3, 9, 9), dtype=torch.uint8, device=device)
+        with patch.object(aug, "apply_transform", wraps=aug.apply_transform) as apply_transform:
+            out = aug(x)
+            # the augmentation is computed on the lookup tables only
+            for call in apply_transform.call_args_list:
+                assert call.args[0].shape[-2:] == (1, 256)
+        assert out.dtype == torch.uint8
+        expected = (aug(x.float() / 255, params=aug._params) * 255).round()
+        self.assert_close(out.float(), expected)
+
+    @pytest.mark.parametrize("aug", [K.RandomAffine(30.0, p=0.5), K.RandomHorizontalFlip(p=0.5)])
+    def test_geometric(self, aug, device):
+        torch.manual_seed(0)
+        x = torch.randint(0, 256, (4, 3, 9, 9), dtype=torch.uint8, device=device)
+        mask = torch.randint(0, 3, (4, 1, 9, 9), dtype=torch.uint8, device=device)
+        out = aug(x)
+        assert out.dtype == torch.uint8
+        assert aug.transform_matrix.is_floating_point()
+        expected = (aug(x.float() / 255, params=aug._params) * 255).round()
+        self.assert_close(out.float(), expected)
+        out_mask = aug.transform_masks(mask, aug._params, aug.flags, aug.transform_matrix)
+        assert out_mask.dtype == torch.uint8
+        assert set(out_mask.unique().tolist()) <= {0, 1, 2}
+
+    @pytest.mark.parametrize("fuse_geometric", [False, True])
+    def test_sequential_single_lut(self, fuse_geometric, device):
+        torch.manual_seed(0)
+        x = torch.randint(0, 256, (4, 3, 9, 9), dtype=torch.uint8, device=device)
+        mask = torch.randint(0, 3, (4, 1, 9, 9), dtype=torch.uint8, device=device)
+        aug = K.AugmentationSequential(
+            K.RandomBrightness((0.8, 1.2), p=0.5),
+            K.RandomContrast((0.7, 1.3), p=0.5),
+            K.RandomGamma((0.5, 1.5), p=0.5),
+            K.RandomAffine(30.0, p=0.5),
+            K.RandomHorizontalFlip(p=0.5),
+            K.RandomInvert(p=0.5),
+            data_keys=["input", "mask"],
+            fuse_geometric=fuse_geometric,
+        )
+        with patch("kornia.augmentation.container.fusion.apply_lut", wraps=K.container.fusion.apply_lut) as apply_lut:
+            out, out_mask = aug(x, mask)
+        # the first three operations are fused into one table
+        assert apply_lut.call_count == 1
+        assert out.dtype == torch.uint8
+        assert out_mask.dtype == torch.uint8
+        assert aug.transform_matrix.is_floating_point()
+        # only the rounding of the intermediate images differs from the float path
+        expected, _ = aug(x.float() / 255, mask.float(), params=aug._params)
+        self.assert_close(out.float(), expected * 255, rtol=0, atol=1.0)
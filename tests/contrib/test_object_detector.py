@@ -50,6 +50,30 @@ class TestObjectDetector(BaseTester):
             assert torch.all(dets[:, 0].int() == dets[:, 0])
             assert torch.all(dets[:, 1] >= 0.3)
 
+    def test_post_processor_nms(self, device, dtype):
+        # the boxes 0 and 1 of the same class overlap, the box 1 has a low confidence
+        logits = torch.tensor([[[4.0, -9.0], [-1.0, -9.0], [-9.0, 3.0]]], device=device, dtype=dtype)
+        boxes = torch.tensor(
+            [[[0.2, 0.2, 0.2, 0.2], [0.21, 0.2, 0.2, 0.2], [0.8, 0.8, 0.1, 0.1]]], device=device, dtype=dtype
+        )
+        sizes = torch.tensor([[100, 100]], device=device)
+
+        # only the suppression: the output stays a tensor, with the low confidence box kept
+        post_processor = DETRPostProcessor(0.5, 2, 3, confidence_filtering=False, iou_threshold=0.5)
+        out = post_processor(logits, boxes, sizes)
+        assert isinstance(out, torch.Tensor)
+        assert out.shape == (1, 3, 6)
+        assert (out[0, :, 1] > 0).sum() == 2
+
+        # only the confidence filtering
+        out = DETRPostProcessor(0.5, 2, 3)(logits, boxes, sizes)
+        assert out[0].shape == (2, 6)
+
+        # both
+        post_processor = DETRPostProcessor(0.05, 2, 3, iou_threshold=0.5)
+        assert post_processor(logits, boxes, sizes)[0].shape == (2, 6)
+        assert DETRPostProcessor(0.05, 2, 3)(logits, boxes, sizes)[0].shape == (3, 6)
+
     @pytest.mark.slow
     @pytest.mark.skipif(torch_version_lt(2, 0, 0), reason="Unsupported ONNX opset version: 16")
     @pytest.mark.parametrize("variant", ("resnet50d", "hgnetv2_l"))
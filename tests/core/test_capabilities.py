@@ -0,0 +1,141 @@
+# LICENSE HEADER MANAGED BY add-license-header
+#
+# Copyright 2018 Kornia Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+import torch
+
+import kornia
+from kornia.core.capabilities import (
+    DeviceProfile,
+    device_profile,
+    dispatch_op,
+    get_device_profile,
+    is_op_supported,
+    needs_host_fallback,
+    register_device_profile,
+)
+
+from testing.base import BaseTester
+
+
+class TestDeviceProfile:
+    def test_supports(self):
+        profile = DeviceProfile("fake", {"matmul": frozenset({torch.float64}), "conv2d": None})
+        assert profile.supports("matmul", torch.float32)
+        assert not profile.supports("matmul", torch.float64)
+        assert not profile.supports("conv2d", torch.float32)
+        assert profile.supports("tan", torch.float64)
+
+    def test_unregistered_device_supports_everything(self):
+        profile = get_device_profile("fake_device_type")
+        assert profile.device_type == "fake_device_type"
+        assert profile.supports("matmul", torch.float64)
+
+    def test_default_sdaa_profile(self):
+        assert not is_op_supported("matmul", "sdaa", torch.float64)
+        assert is_op_supported("matmul", "sdaa", torch.float32)
+        # only the float64 `sign` goes through the host, its results are wrong on some inputs in any dtype
+        assert not is_op_supported("sign", "sdaa", torch.float64)
+        assert is_op_supported("sign", "sdaa", torch.float32)
+        assert not is_op_supported("sign_values", "sdaa", torch.float32)
+
+    def test_context_restores(self):
+        before = get_device_profile("cpu")
+        with device_profile(DeviceProfile("cpu", {"matmul": None})):
+            assert not is_op_supported("matmul", "cpu", torch.float32)
+        assert get_device_profile("cpu") == before
+        assert is_op_supported("matmul", "cpu", torch.float32)
+
+    def test_register(self):
+        register_device_profile(DeviceProfile("fake_registered", {"tan": None}))
+        assert not is_op_supported("tan", "fake_registered")
+
+
+class TestDispatchOp(BaseTester):
+    def test_native(self, device, dtype):
+        a = torch.rand(2, 3, 3, device=device, dtype=dtype)
+        seen = []
+
+        def fn(x, y):
+            seen.append(x)
+            return x @ y
+
+        out = dispatch_op("matmul", fn, a, a)
+        assert seen[0] is a
+        self.assert_close(out, a @ a)
+
+    def test_fallback(self, device, dtype):
+        a = torch.rand(2, 3, 3, device=device, dtype=dtype)
+        seen = []
+
+        def fn(x, y=None):
+            seen.append(x.device)
+            return torch.linalg.qr(x @ y)
+
+        with device_profile(DeviceProfile(a.device.type, {"matmul": None})):
+            assert needs_host_fallback("matmul", a)
+            q, r = dispatch_op("matmul", fn, a, y=a)
+        assert seen[0] == torch.device("cpu")
+        assert q.device == a.device
+        assert r.device == a.device
+        self.assert_close(q @ r, a @ a)
+
+    def test_filter2d_fallback(self, device, dtype):
+        img = torch.rand(1, 2, 5, 5, device=device, dtype=dtype)
+        kernel = torch.rand(1, 3, 3, device=device, dtype=dtype)
+        expected = kornia.filters.filter2d(img, kernel)
+        with device_profile(DeviceProfile(img.device.type, {"conv2d": None})):
+            actual = kornia.filters.filter2d(img, kernel)
+        assert actual.device == img.device
+        self.assert_close(actual, expected)
+
+    def test_geometry_fallback(self, device, dtype):
+        trans = torch.rand(2, 4, 4, device=device, dtype=dtype)
+        points = torch.rand(2, 6, 3, device=device, dtype=dtype)
+        expected = kornia.geometry.transform_points(trans, points)
+        with device_profile(DeviceProfile(points.device.type, {"matmul": None})):
+            actual = kornia.geometry.transform_points(trans, points)
+        self.assert_close(actual, expected)
+
+    @pytest.mark.parametrize(
+        "op, fn",
+        [
+            ("interpolate", lambda x: kornia.geometry.transform.rescale(x, 2.0)),
+            ("kl_div", lambda x: kornia.losses.kl_div_loss_2d(x.softmax(-1), x.flip(-1).softmax(-1))),
+            (
+                "matmul",
+                lambda x: kornia.geometry.epipolar.sampson_epipolar_distance(
+                    x[:, 0, :, :2], x[:, 1, :, :2], x[:, 0, :3, :3]
+                ),
+            ),
+            ("round", kornia.utils.differentiable_polynomial_rounding),
+            (
+                "sign_values",
+                lambda x: kornia.utils.draw_line(
+                    x[0].clone(), torch.tensor([1, 1]), torch.tensor([4, 3]), torch.tensor([1.0, 1.0])
+                ),
+            ),
+        ],
+    )
+    def test_call_sites_fallback(self, op, fn, device, dtype):
+        x = torch.rand(1, 2, 5, 5, device=device, dtype=dtype)
+        expected = fn(x)
+        with device_profile(DeviceProfile(x.device.type, {op: None})):
+            assert needs_host_fallback(op, x)
+            actual = fn(x)
+        assert actual.device == x.device
+        self.assert_close(actual, expected)
@@ -0,0 +1,71 @@
+# LICENSE HEADER MANAGED BY add-license-header
+#
+# Copyright 2018 Kornia Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+import torch
+
+import kornia
+from kornia.core.profiling import SyncPointError, track_sync_points
+
+
+class TestTrackSyncPoints:
+    def test_ransac_item(self, device, dtype):
+        points1 = torch.rand(1, 20, 2, device=device, dtype=dtype)
+        points2 = points1 + 0.01
+        ransac = kornia.geometry.RANSAC("homography", max_iter=3)
+        with track_sync_points() as report:
+            ransac(points1[0], points2[0])
+        summary = report.summary()
+        assert "kornia.geometry.ransac.RANSAC.forward_batch" in summary
+        # at most a single host sync per iteration
+        assert 1 <= summary["kornia.geometry.ransac.RANSAC.forward_batch"]["kinds"]["data_dependent"] <= 3
+        assert report.count("data_dependent") >= 1
+        assert "RANSAC.forward_batch" in repr(report)
+
+    def test_ignores_user_code(self, device, dtype):
+        x = torch.rand(4, device=device, dtype=dtype)
+        with track_sync_points(strict=True) as report:
+            x.sum().item()
+            _ = x[x > 0.5]
+        assert len(report) == 0
+
+    def test_sync_free_op(self, device, dtype):
+        img = torch.rand(1, 1, 7, 7, device=device, dtype=dtype)
+        with track_sync_points(strict=True) as report:
+            kornia.filters.gaussian_blur2d(img, (3, 3), (1.5, 1.5))
+        assert len(report) == 0
+
+    def test_strict(self, device, dtype):
+        boxes = torch.tensor([[0.0, 0.0, 2.0, 2.0], [0.5, 0.5, 2.0, 2.0]], device=device, dtype=dtype)
+        scores = torch.tensor([0.9, 0.8], device=device, dtype=dtype)
+        with pytest.raises(SyncPointError):
+            with track_sync_points(strict=True):
+                kornia.geometry.bbox.nms(boxes, scores, 0.5)
+
+    def test_budget(self, device, dtype):
+        boxes = torch.tensor([[0.0, 0.0, 2.0, 2.0], [0.5, 0.5, 2.0, 2.0]], device=device, dtype=dtype)
+        scores = torch.tensor([0.9, 0.8], device=device, dtype=dtype)
+        with track_sync_points() as report:
+            kornia.geometry.bbox.nms(boxes, scores, 0.5)
+        num_events = len(report)
+        assert num_events > 0
+        with track_sync_points(budget=num_events) as report:
+            kornia.geometry.bbox.nms(boxes, scores, 0.5)
+        assert len(report) == num_events
+        with pytest.raises(SyncPointError):
+            with track_sync_points(budget=num_events - 1):
+                kornia.geometry.bbox.nms(boxes, scores, 0.5)
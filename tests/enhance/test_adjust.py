@@ -849,6 +849,40 @@ class TestEqualize(BaseTester):
 
         self.assert_close(f(inputs), expected, low_tolerance=True)
 
+    @staticmethod
+    def _equalize_channel(channel):
+        # reference: a histogram per channel, its counts rounded to the dtype of the image
+        im = channel * 255.0
+        histo = torch.histc(im.float(), bins=256, min=0, max=255).to(channel.dtype)
+        nonzero_histo = histo[histo != 0]
+        step = torch.div(nonzero_histo.sum() - nonzero_histo[-1], 255, rounding_mode="trunc")
+        if step == 0:
+            return im / 255.0
+        lut = torch.div(torch.cumsum(histo, 0) + torch.div(step, 2, rounding_mode="trunc"), step, rounding_mode="trunc")
+        lut = torch.cat([torch.zeros_like(lut[:1]), lut[:-1]]).clamp(0, 255)
+        return lut.gather(0, im.flatten().long()).view_as(im) / 255.0
+
+    def test_equalize_same_as_per_channel(self, device, dtype):
+        # the channels have more pixels than float16 counts exactly
+        inputs = torch.rand(2, 3, 64, 64, device=device, dtype=dtype)
+        inputs[0, 0] = 0.5
+        inputs[1, 1] = inputs[1, 1] * 0.1 + 0.3
+        expected = torch.stack([self._equalize_channel(channel) for channel in inputs.flatten(0, 1)])
+        self.assert_close(kornia.enhance.equalize(inputs), expected.view_as(inputs), rtol=0.0, atol=0.0)
+
+    @pytest.mark.parametrize("block_size", [None, 50])
+    def test_equalize_batch_independent(self, block_size, device, dtype, monkeypatch):
+        if block_size is not None:
+            monkeypatch.setattr(kornia.enhance.adjust, "_EQUALIZE_BLOCK_SIZE_CPU", block_size)
+        inputs = torch.rand(4, 3, 5, 7, device=device, dtype=dtype)
+        inputs[1] = inputs[1] * 0.25 + 0.5
+        inputs[2, 0] = 0.5
+
+        out = kornia.enhance.equalize(inputs)
+        expected = torch.cat([kornia.enhance.equalize(image[None, None]) for image in inputs.flatten(0, 1)])
+        self.assert_close(out, expected.view_as(inputs))
+        self.assert_close(out[2, 0], inputs[2, 0])
+
     def test_gradcheck(self, device):
         bs, channels, height, width = 1, 2, 3, 3
         inputs = torch.ones(bs, channels, height, width, device=device, dtype=torch.float64)
@@ -0,0 +1,59 @@
+# LICENSE HEADER MANAGED BY add-license-header
+#
+# Copyright 2018 Kornia Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+import torch
+
+import kornia
+from kornia.enhance.adjust import _equalize_lut, _level_histogram
+
+from testing.base import BaseTester
+
+
+class TestApplyLut(BaseTester):
+    def test_identity(self, device):
+        img = torch.randint(0, 256, (2, 3, 5, 4), dtype=torch.uint8, device=device)
+        lut = kornia.enhance.lut_to_uint8(kornia.enhance.identity_lut(img))
+        assert lut.shape == (2, 3, 256)
+        self.assert_close(kornia.enhance.apply_lut(img, lut), img)
+
+    def test_per_channel(self, device, dtype):
+        img = torch.randint(0, 256, (2, 3, 5, 4), dtype=torch.uint8, device=device)
+        lut = torch.rand(2, 3, 256, device=device, dtype=dtype)
+        out = kornia.enhance.apply_lut(img, lut)
+        assert out.dtype == dtype
+        expected = torch.stack([torch.stack([lut[b, c][img[b, c].long()] for c in range(3)]) for b in range(2)])
+        self.assert_close(out, expected)
+
+    def test_broadcast(self, device):
+        img = torch.randint(0, 256, (2, 3, 5, 4), dtype=torch.uint8, device=device)
+        lut = torch.arange(255, -1, -1, dtype=torch.uint8, device=device)
+        self.assert_close(kornia.enhance.apply_lut(img, lut), 255 - img)
+
+    def test_exception(self, device, dtype):
+        with pytest.raises(Exception):
+            kornia.enhance.apply_lut(torch.rand(1, 3, 4, 4, device=device, dtype=dtype), torch.rand(256))
+        with pytest.raises(Exception):
+            kornia.enhance.apply_lut(torch.zeros(1, 3, 4, 4, dtype=torch.uint8, device=device), torch.rand(255))
+
+    def test_equalize(self, device, dtype):
+        img = torch.randint(0, 256, (2, 3, 7, 9), dtype=torch.uint8, device=device)
+        img[0] = img[0] // 4 + 30
+        img[1, 0] = 7
+        histo = _level_histogram(img.flatten(-2), dtype=dtype)
+        out = kornia.enhance.apply_lut(img, _equalize_lut(histo) / 255)
+        self.assert_close(out, kornia.enhance.equalize(img.to(dtype) / 255))
@@ -0,0 +1,100 @@
+# LICENSE HEADER MANAGED BY add-license-header
+#
+# Copyright 2018 Kornia Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+import torch
+
+from kornia.feature import FeatureCache
+
+from testing.base import BaseTester
+
+
+class TestFeatureCache(BaseTester):
+    def _compute(self, calls):
+        def compute(images):
+            calls.append(len(images))
+            return {"mean": images.mean((1, 2, 3)), "max": images.flatten(1).max(1)[0]}
+
+        return compute
+
+    def test_get_batch(self, device, dtype):
+        images = torch.rand(3, 1, 4, 5, device=device, dtype=dtype)
+        cache = FeatureCache()
+        calls = []
+        out = cache.get_batch("test", images[[0, 1, 0, 2]], self._compute(calls), keys=torch.tensor([0, 1, 0, 2]))
+        self.assert_close(out["mean"], images[[0, 1, 0, 2]].mean((1, 2, 3)))
+        # the missing images are computed at once, and only once each
+        assert calls == [3]
+        out = cache.get_batch("test", images[[2, 1]], self._compute(calls), keys=[2, 1])
+        self.assert_close(out["max"], images[[2, 1]].flatten(1).max(1)[0])
+        assert calls == [3]
+        assert (cache.hits, cache.misses) == (2, 3)
+        # the content of the images is hashed without keys
+        cache.get_batch("test", images, self._compute(calls))
+        cache.get_batch("other", images[:2], self._compute(calls))
+        cache.get_batch("test", images[:1].clone(), self._compute(calls))
+        assert calls == [3, 3, 2]
+        assert len(cache) == 8
+
+    def test_get_batch_owns_storage(self, device, dtype):
+        images = torch.rand(4, 1, 4, 5, device=device, dtype=dtype)
+        cache = FeatureCache()
+        cache.get_batch("test", images, lambda x: {"flat": x.flatten(1)}, keys=[0, 1, 2, 3])
+        # every entry holds its own storage, so that the budget bounds the memory
+        for key in range(4):
+            flat = cache.get(("test", key))["flat"]
+            assert flat.untyped_storage().nbytes() == flat.numel() * flat.element_size()
+        assert cache.nbytes == images.numel() * images.element_size()
+
+    def test_image_key(self, device, dtype):
+        image = torch.rand(1, 4, 5, device=device, dtype=dtype)
+        key = FeatureCache.image_key(image)
+        assert FeatureCache.image_key(image.clone()) == key
+        assert FeatureCache.image_key(image.cpu()) == key
+        # the values, their order, the shape and the type are hashed
+        changed = image.clone()
+        changed[0, 0, 0] += 1
+        assert FeatureCache.image_key(changed) != key
+        assert FeatureCache.image_key(image.flip(-1)) != key
+        assert FeatureCache.image_key(image.view(1, 5, 4)) != key
+        assert FeatureCache.image_key(image.to(torch.int64)) != FeatureCache.image_key(image.to(torch.int32))
+
+    @pytest.mark.parametrize("spill_dir", [None, True])
+    def test_eviction(self, device, dtype, spill_dir):
+        images = torch.rand(4, 1, 4, 5, device=device, dtype=dtype)
+        cache = FeatureCache(max_bytes=2 * 2 * images.element_size(), spill_dir=spill_dir)
+        calls = []
+        for idx in range(4):
+            cache.get_batch("test", images[idx : idx + 1], self._compute(calls), keys=[idx])
+        assert cache.nbytes <= cache.max_bytes
+        assert (("test", 0) in cache) == bool(spill_dir)
+        assert len(cache) == (4 if spill_dir else 2)
+        # the least recently used features are evicted
+        cache.get_batch("test", images[2:], self._compute(calls), keys=[2, 3])
+        assert calls == [1, 1, 1, 1]
+        out = cache.get_batch("test", images[:2], self._compute(calls), keys=[0, 1])
+        self.assert_close(out["mean"], images[:2].mean((1, 2, 3)))
+        assert out["mean"].device == images.device
+        assert calls == ([1, 1, 1, 1] if spill_dir else [1, 1, 1, 1, 2])
+        cache.clear()
+        assert len(cache) == 0 and cache.nbytes == 0
+
+    def test_exception(self):
+        with pytest.raises(Exception):
+            FeatureCache(max_bytes=-1)
+        with pytest.raises(Exception):
+            FeatureCache().get_batch("test", torch.rand(2, 1, 3, 3), lambda x: {"x": x}, keys=[0])
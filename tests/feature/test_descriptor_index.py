@@ -0,0 +1,114 @@
+# LICENSE HEADER MANAGED BY add-license-header
+#
+# Copyright 2018 Kornia Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+import torch
+
+from kornia.feature import DescriptorIndex, DescriptorMatcher
+
+from testing.base import BaseTester
+
+
+class TestDescriptorIndex(BaseTester):
+    @pytest.mark.parametrize("num_ref, num_query, k", [(50, 20, 2), (3, 5, 4), (1, 1, 1)])
+    def test_search_exact(self, num_ref, num_query, k, device, dtype):
+        torch.random.manual_seed(0)
+        ref = torch.rand(num_ref, 8, device=device, dtype=dtype)
+        query = torch.rand(num_query, 8, device=device, dtype=dtype)
+        # probing all the lists is the brute-force search
+        index = DescriptorIndex(num_lists=4, num_probes=4).build(ref)
+        dists, idxs = index.search(query, k)
+        assert dists.shape == (num_query, k)
+        assert idxs.shape == (num_query, k)
+        kk = min(k, num_ref)
+        expected_dists, expected_idxs = torch.cdist(query, ref).topk(kk, dim=1, largest=False)
+        self.assert_close(dists[:, :kk], expected_dists, rtol=1e-4, atol=1e-4)
+        assert (idxs[:, :kk] == expected_idxs).all()
+        assert torch.isinf(dists[:, kk:]).all()
+
+    def test_search_approximate(self, device, dtype):
+        torch.random.manual_seed(0)
+        centers = 10.0 * torch.rand(16, 8, device=device, dtype=dtype)
+        ref = (centers[:, None] + torch.rand(16, 20, 8, device=device, dtype=dtype)).flatten(0, 1)
+        query = ref + 0.01 * torch.rand_like(ref)
+        index = DescriptorIndex(num_lists=16, num_probes=2).build(ref)
+        dists, idxs = index.search(query, 1)
+        assert (idxs[:, 0] == torch.arange(len(ref), device=device)).float().mean() > 0.95
+        self.assert_close(dists[:, 0], (query - ref[idxs[:, 0]]).norm(dim=1), rtol=1e-2, atol=1e-2)
+
+    def test_is_built_on(self, device, dtype):
+        ref = torch.rand(2, 10, 8, device=device, dtype=dtype)
+        index = DescriptorIndex(num_lists=2)
+        assert not index.is_built
+        index.build(ref[0])
+        assert index.is_built
+        assert index.is_built_on(ref[0])
+        assert not index.is_built_on(ref[1])
+        assert not index.is_built_on(ref[0].clone())
+        ref[0, 0] += 1.0
+        assert not index.is_built_on(ref[0])
+
+    def test_exception(self, device, dtype):
+        index = DescriptorIndex()
+        with pytest.raises(Exception):
+            index.search(torch.rand(3, 8, device=device, dtype=dtype))
+        index.build(torch.rand(10, 8, device=device, dtype=dtype))
+        with pytest.raises(Exception):
+            index.search(torch.rand(3, 4, device=device, dtype=dtype))
+
+
+class TestDescriptorMatcherIndex(BaseTester):
+    @pytest.mark.parametrize("match_type", ["nn", "snn", "mnn", "smnn"])
+    @pytest.mark.parametrize("num_desc1, num_desc2", [(30, 20), (20, 30), (1, 5), (5, 1), (2, 2)])
+    def test_same_as_full(self, match_type, num_desc1, num_desc2, device, dtype):
+        torch.random.manual_seed(0)
+        desc1 = torch.rand(num_desc1, 8, device=device, dtype=dtype)
+        desc2 = torch.rand(num_desc2, 8, device=device, dtype=dtype)
+        num_close = min(num_desc1, num_desc2) // 2
+        desc2[:num_close] = desc1[:num_close] + 0.01 * torch.rand_like(desc1[:num_close])
+        dists, idxs = DescriptorMatcher(match_type, 0.9)(desc1, desc2)
+        index = DescriptorIndex(num_lists=3, num_probes=3)
+        dists_index, idxs_index = DescriptorMatcher(match_type, 0.9, index=index)(desc1, desc2)
+        assert (idxs == idxs_index).all()
+        self.assert_close(dists, dists_index, rtol=1e-4, atol=1e-4)
+
+    @pytest.mark.parametrize("reference", [0, 1])
+    def test_build_index(self, reference, device, dtype):
+        torch.random.manual_seed(0)
+        descs = torch.rand(2, 40, 8, device=device, dtype=dtype)
+        matcher = DescriptorMatcher("smnn", 0.95, index=DescriptorIndex(num_lists=4, num_probes=4))
+        matcher.build_index(descs[reference])
+        centroids = matcher.index.centroids
+        dists, idxs = matcher(descs[0], descs[1])
+        # the prebuilt index is reused
+        assert matcher.index.centroids is centroids
+        expected_dists, expected_idxs = DescriptorMatcher("smnn", 0.95)(descs[0], descs[1])
+        assert (idxs == expected_idxs).all()
+        self.assert_close(dists, expected_dists, rtol=1e-4, atol=1e-4)
+
+    def test_build_index_exception(self, device, dtype):
+        with pytest.raises(RuntimeError):
+            DescriptorMatcher("snn", 0.9).build_index(torch.rand(10, 8, device=device, dtype=dtype))
+
+    @pytest.mark.parametrize("match_type", ["nn", "snn", "mnn", "smnn"])
+    def test_empty_nocrash(self, match_type, device, dtype):
+        desc = torch.rand(10, 8, device=device, dtype=dtype)
+        matcher = DescriptorMatcher(match_type, 0.8, index=DescriptorIndex(num_lists=2))
+        for desc1, desc2 in [(desc[:0], desc), (desc, desc[:0])]:
+            dists, idxs = matcher(desc1, desc2)
+            assert dists.shape == (0, 1)
+            assert idxs.shape == (0, 2)
@@ -24,6 +24,8 @@ from torch import nn
 import kornia
 from kornia.feature import (
     DescriptorMatcher,
+    FeatureCache,
+    GeometryAwareDescriptorMatcher,
     GFTTAffNetHardNet,
     KeyNetHardNet,
     LAFDescriptor,
@@ -67,6 +69,23 @@ class TestGetLAFDescriptors(BaseTester):
         self.assert_close(descs_test_from_rgb, descs_reference)
         self.assert_close(descs_test_from_gray, descs_reference)
 
+    def test_chunk_size_pyramid(self, device, dtype):
+        B, C, H, W = 2, 3, 64, 64
+        PS = 16
+        img = torch.rand(B, C, H, W, device=device, dtype=dtype)
+        centers = torch.tensor([[H / 3.0, W / 3.0], [2.0 * H / 3.0, W / 2.0], [H / 2.0, W / 2.0]], device=device)
+        scales = torch.tensor([(H + W) / 4.0, (H + W) / 8.0, 8.0], device=device).view(1, 3, 1, 1)
+        ori = torch.tensor([0.0, 30.0, 60.0], device=device).view(1, 3, 1)
+        lafs = kornia.feature.laf_from_center_scale_ori(centers[None], scales, ori).repeat(B, 1, 1, 1).to(dtype)
+        pyramid = [img]
+        for _ in range(3):
+            pyramid.append(kornia.geometry.transform.pyrdown(pyramid[-1]))
+        sift = SIFTDescriptor(PS).to(device, dtype)
+        expected = get_laf_descriptors(img, lafs, sift, PS, True)
+        self.assert_close(get_laf_descriptors(img, lafs, sift, PS, True, chunk_size=1), expected)
+        self.assert_close(get_laf_descriptors(img, lafs, sift, PS, True, pyramid=pyramid), expected)
+        self.assert_close(LAFDescriptor(sift, PS, chunk_size=2)(img, lafs), expected)
+
     def test_gradcheck(self, device):
         dtype = torch.float64
         B, C, H, W = 1, 1, 32, 32
@@ -235,6 +254,47 @@ class TestLocalFeatureMatcher(BaseTester):
         matcher = LocalFeatureMatcher(SIFTFeature(5), DescriptorMatcher("snn", 0.8)).to(device)
         assert matcher is not None
 
+    @pytest.mark.parametrize("matcher", [DescriptorMatcher("snn", 0.9), GeometryAwareDescriptorMatcher("fginn")])
+    def test_cache(self, device, dtype, matcher):
+        images = torch.rand(3, 1, 48, 48, device=device, dtype=dtype)
+        cache = FeatureCache()
+        cached = LocalFeatureMatcher(SIFTFeature(30), matcher, cache=cache).to(device, dtype)
+        reference = LocalFeatureMatcher(SIFTFeature(30), matcher).to(device, dtype)
+        with torch.no_grad():
+            for idx0, idx1 in [(0, 1), (0, 2), (1, 2)]:
+                inputs = {"image0": images[idx0 : idx0 + 1], "image1": images[idx1 : idx1 + 1]}
+                out = cached({**inputs, "keys0": [idx0], "keys1": [idx1]})
+                expected = reference(inputs)
+                for k, v in expected.items():
+                    self.assert_close(out[k], v)
+        # the features of every image are extracted once
+        assert (len(cache), cache.hits, cache.misses) == (3, 3, 3)
+
+    @pytest.mark.parametrize("match_type", ["nn", "snn", "mnn", "smnn"])
+    def test_batch(self, device, dtype, match_type):
+        torch.random.manual_seed(0)
+        lafs = torch.rand(4, 2, 20, 2, 3, device=device, dtype=dtype)
+        descs = torch.rand(4, 2, 20, 8, device=device, dtype=dtype)
+        descs[:, 1, :10] = descs[:, 0, :10] + 0.01
+        data = {
+            "image0": torch.rand(4, 1, 16, 16, device=device, dtype=dtype),
+            "image1": torch.rand(4, 1, 16, 16, device=device, dtype=dtype),
+            "lafs0": lafs[:, 0],
+            "lafs1": lafs[:, 1],
+            "descriptors0": descs[:, 0],
+            "descriptors1": descs[:, 1],
+        }
+        matcher = LocalFeatureMatcher(SIFTFeature(5), DescriptorMatcher(match_type, 0.9)).to(device, dtype)
+        out = matcher(data)
+        # the reference matches the pairs one by one
+        expected = matcher({k: v[:1] for k, v in data.items()})
+        for idx in range(1, 4):
+            out_pair = matcher({k: v[idx : idx + 1] for k, v in data.items()})
+            for k, v in out_pair.items():
+                expected[k] = torch.cat([expected[k], v + idx if k == "batch_indexes" else v], 1 if "lafs" in k else 0)
+        for k, v in expected.items():
+            self.assert_close(out[k], v)
+
     @pytest.mark.slow
     @pytest.mark.parametrize("data", ["loftr_homo"], indirect=True)
     def test_nomatch(self, device, dtype, data):
@@ -428,6 +428,18 @@ class TestExtractPatchesSimple(BaseTester):
         PS = 11
         self.gradcheck(kornia.feature.extract_patches_simple, (img, nlaf, PS, False), fast_mode=False)
 
+    def test_batch_chunk(self, device, dtype):
+        torch.random.manual_seed(0)
+        img = torch.rand(3, 2, 40, 50, device=device, dtype=dtype)
+        center = 40.0 * torch.rand(3, 7, 2, device=device, dtype=dtype)
+        scale = 1.0 + 10.0 * torch.rand(3, 7, 1, 1, device=device, dtype=dtype)
+        laf = kornia.feature.laf_from_center_scale_ori(center, scale)
+        patches = kornia.feature.extract_patches_simple(img, laf, 8)
+        for i in range(3):
+            expected = kornia.feature.extract_patches_simple(img[i : i + 1], laf[i : i + 1], 8)
+            self.assert_close(patches[i : i + 1], expected)
+        self.assert_close(patches, kornia.feature.extract_patches_simple(img, laf, 8, chunk_size=6))
+
 
 class TestExtractPatchesPyr(BaseTester):
     def test_shape(self, device):
@@ -472,6 +484,32 @@ class TestExtractPatchesPyr(BaseTester):
             nondet_tol=1e-8,
         )
 
+    def test_batch_chunk(self, device, dtype):
+        torch.random.manual_seed(0)
+        img = torch.rand(3, 2, 80, 100, device=device, dtype=dtype)
+        center = 80.0 * torch.rand(3, 9, 2, device=device, dtype=dtype)
+        scale = 1.0 + 40.0 * torch.rand(3, 9, 1, 1, device=device, dtype=dtype)
+        laf = kornia.feature.laf_from_center_scale_ori(center, scale)
+        patches = kornia.feature.extract_patches_from_pyramid(img, laf, 8)
+        for i in range(3):
+            self.assert_close(
+                patches[i : i + 1], kornia.feature.extract_patches_from_pyramid(img[i : i + 1], laf[i : i + 1], 8)
+            )
+        self.assert_close(patches, kornia.feature.extract_patches_from_pyramid(img, laf, 8, chunk_size=6))
+
+    def test_pyramid(self, device, dtype):
+        torch.random.manual_seed(0)
+        img = torch.rand(2, 1, 80, 100, device=device, dtype=dtype)
+        center = 80.0 * torch.rand(2, 9, 2, device=device, dtype=dtype)
+        scale = 1.0 + 40.0 * torch.rand(2, 9, 1, 1, device=device, dtype=dtype)
+        laf = kornia.feature.laf_from_center_scale_ori(center, scale)
+        pyramid = kornia.geometry.transform.build_pyramid(img, 4)
+        expected = kornia.feature.extract_patches_from_pyramid(img, laf, 8)
+        self.assert_close(kornia.feature.extract_patches_from_pyramid(img, laf, 8, pyramid=pyramid), expected)
+        # the scale of the coarsest levels is clamped to the available ones
+        patches = kornia.feature.extract_patches_from_pyramid(img, laf, 8, pyramid=pyramid[:1])
+        self.assert_close(patches, kornia.feature.extract_patches_simple(img, laf, 8))
+
 
 class TestLAFIsTouchingBoundary(BaseTester):
     def test_shape(self, device):
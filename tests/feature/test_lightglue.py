@@ -0,0 +1,70 @@
+# LICENSE HEADER MANAGED BY add-license-header
+#
+# Copyright 2018 Kornia Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+import torch
+
+from kornia.feature import LightGlue
+
+from testing.base import BaseTester
+
+
+class TestLightGlue(BaseTester):
+    def _model(self, device, dtype, **conf):
+        model = LightGlue(None, input_dim=32, descriptor_dim=32, n_layers=4, num_heads=2, filter_threshold=0.0, **conf)
+        # spread the confidences, so that the pairs stop at different layers
+        for token in model.token_confidence:
+            token.token[0].weight.data *= 20.0
+            token.token[0].bias.data += 1.0
+        return model.to(device, dtype).eval()
+
+    def _image(self, num, device, dtype):
+        return {
+            "keypoints": torch.rand(1, num, 2, device=device, dtype=dtype) * 40,
+            "descriptors": torch.randn(1, num, 32, device=device, dtype=dtype),
+            "image_size": torch.tensor([[64, 48]], device=device),
+        }
+
+    @pytest.mark.parametrize("batched", [True, None])
+    @pytest.mark.parametrize("depth_confidence, width_confidence", [(-1, -1), (0.5, -1), (0.6, 0.5)])
+    def test_shortlist_same_as_pairs(self, depth_confidence, width_confidence, batched, device, dtype):
+        if dtype in (torch.float16, torch.bfloat16):
+            pytest.skip("the padding changes the rounding, and the matches, in half-precision")
+        torch.manual_seed(0)
+        model = self._model(device, dtype, depth_confidence=depth_confidence, width_confidence=width_confidence)
+        query = self._image(20, device, dtype)
+        candidates = [self._image(num, device, dtype) for num in (15, 30, 3, 22)]
+        with torch.no_grad():
+            out = model.match_shortlist(query, candidates, batched=batched)
+            assert out["stop"].shape == (4,)
+            for k, candidate in enumerate(candidates):
+                expected = model({"image0": query, "image1": candidate})
+                in_pair = out["pair_idxs"] == k
+                self.assert_close(out["matches"][in_pair], expected["matches"][0])
+                self.assert_close(out["scores"][in_pair], expected["scores"][0])
+                assert out["stop"][k] == expected["stop"]
+        # the pairs are in order
+        assert (out["pair_idxs"].diff() >= 0).all()
+
+    def test_exception(self, device, dtype):
+        model = self._model(device, dtype)
+        with pytest.raises(Exception):
+            model.match_shortlist(self._image(5, device, dtype), [])
+        candidate = self._image(5, device, dtype)
+        candidate["descriptors"] = candidate["descriptors"][..., :16]
+        with pytest.raises(Exception):
+            model.match_shortlist(self._image(5, device, dtype), [candidate])
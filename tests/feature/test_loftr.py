@@ -20,7 +20,7 @@ import sys
 import pytest
 import torch
 
-from kornia.feature import LoFTR
+from kornia.feature import FeatureCache, LoFTR
 from kornia.geometry import resize
 from kornia.utils._compat import torch_version_ge
 
@@ -73,6 +73,25 @@ class TestLoFTR(BaseTester):
             out = loftr(sample)
         assert out is not None
 
+    @pytest.mark.parametrize("width1", [40, 32])
+    def test_cache(self, device, dtype, width1):
+        images = torch.rand(3, 1, 32, 40, device=device, dtype=dtype)
+        cache = FeatureCache()
+        loftr = LoFTR(None, cache=cache).to(device, dtype)
+        reference = LoFTR(None).to(device, dtype)
+        reference.load_state_dict(loftr.state_dict())
+        idx0, idx1 = torch.tensor([0, 0, 1]), torch.tensor([1, 2, 2])
+        inputs = {"image0": images[idx0], "image1": images[idx1][..., :width1]}
+        with torch.no_grad():
+            out = loftr({**inputs, "keys0": idx0, "keys1": idx1 + 3})
+            expected = reference(inputs)
+            # the features are only read from the cache for the same keys
+            out2 = loftr({**inputs, "keys0": idx0, "keys1": idx1 + 3})
+        assert (len(cache), cache.misses) == (4, 4)
+        for k, v in expected.items():
+            self.assert_close(out[k], v)
+            self.assert_close(out2[k], v)
+
     @pytest.mark.slow
     def test_gradcheck(self, device):
         patches = torch.rand(1, 1, 32, 32, device=device, dtype=torch.float64)
@@ -246,6 +246,79 @@ class TestMatchSMNN(BaseTester):
         self.assert_close(matcher(desc1, desc2)[1], matcher_jit(desc1, desc2)[1])
 
 
+class TestDescriptorMatcherTiled(BaseTester):
+    @pytest.mark.parametrize("match_type", ["nn", "snn", "mnn", "smnn"])
+    @pytest.mark.parametrize("num_desc1, num_desc2", [(30, 20), (20, 30), (1, 5), (5, 1), (2, 2)])
+    @pytest.mark.parametrize("max_memory", [256, 2**30])
+    def test_same_as_full(self, match_type, num_desc1, num_desc2, max_memory, device, dtype):
+        torch.random.manual_seed(0)
+        desc1 = torch.rand(num_desc1, 8, device=device, dtype=dtype)
+        desc2 = torch.rand(num_desc2, 8, device=device, dtype=dtype)
+        num_close = min(num_desc1, num_desc2) // 2
+        desc2[:num_close] = desc1[:num_close] + 0.01 * torch.rand_like(desc1[:num_close])
+        dists, idxs = DescriptorMatcher(match_type, 0.9)(desc1, desc2)
+        dists_tiled, idxs_tiled = DescriptorMatcher(match_type, 0.9, max_memory=max_memory)(desc1, desc2)
+        assert (idxs == idxs_tiled).all()
+        self.assert_close(dists, dists_tiled, rtol=1e-4, atol=1e-4)
+
+    @pytest.mark.parametrize("match_type", ["nn", "snn", "mnn", "smnn"])
+    def test_empty_nocrash(self, match_type, device, dtype):
+        desc = torch.rand(10, 8, device=device, dtype=dtype)
+        matcher = DescriptorMatcher(match_type, 0.8, max_memory=256)
+        for desc1, desc2 in [(desc[:0], desc), (desc, desc[:0])]:
+            dists, idxs = matcher(desc1, desc2)
+            assert dists.shape == (0, 1)
+            assert idxs.shape == (0, 2)
+
+    @pytest.mark.jit()
+    @pytest.mark.parametrize("match_type", ["nn", "snn", "mnn", "smnn"])
+    def test_jit(self, match_type, device, dtype):
+        desc1 = torch.rand(5, 8, device=device, dtype=dtype)
+        desc2 = torch.rand(7, 8, device=device, dtype=dtype)
+        matcher = DescriptorMatcher(match_type, 0.8, max_memory=128).to(device)
+        matcher_jit = torch.jit.script(DescriptorMatcher(match_type, 0.8, max_memory=128).to(device))
+        self.assert_close(matcher(desc1, desc2)[0], matcher_jit(desc1, desc2)[0])
+        self.assert_close(matcher(desc1, desc2)[1], matcher_jit(desc1, desc2)[1])
+
+
+class TestDescriptorMatcherBatch(BaseTester):
+    @pytest.mark.parametrize("match_type", ["nn", "snn", "mnn", "smnn"])
+    @pytest.mark.parametrize("num_desc1, num_desc2", [(30, 20), (20, 30), (1, 5), (5, 1), (2, 2)])
+    @pytest.mark.parametrize("masked", [False, True])
+    def test_same_as_pairs(self, match_type, num_desc1, num_desc2, masked, device, dtype):
+        torch.random.manual_seed(0)
+        desc1 = torch.rand(4, num_desc1, 8, device=device, dtype=dtype)
+        desc2 = torch.rand(4, num_desc2, 8, device=device, dtype=dtype)
+        num_close = min(num_desc1, num_desc2) // 2
+        desc2[:, :num_close] = desc1[:, :num_close] + 0.01 * torch.rand_like(desc1[:, :num_close])
+        mask1 = torch.rand(4, num_desc1, device=device) > 0.3 if masked else None
+        mask2 = torch.rand(4, num_desc2, device=device) > 0.3 if masked else None
+        matcher = DescriptorMatcher(match_type, 0.9)
+        dists, idxs, batch_idxs = matcher.match_batch(desc1, desc2, mask1, mask2)
+
+        expected_dists, expected_idxs, expected_batch_idxs = [], [], []
+        for b in range(4):
+            valid1 = torch.arange(num_desc1, device=device) if mask1 is None else torch.where(mask1[b])[0]
+            valid2 = torch.arange(num_desc2, device=device) if mask2 is None else torch.where(mask2[b])[0]
+            pair_dists, pair_idxs = matcher(desc1[b, valid1], desc2[b, valid2])
+            expected_dists.append(pair_dists)
+            expected_idxs.append(torch.stack([valid1[pair_idxs[:, 0]], valid2[pair_idxs[:, 1]]], 1))
+            expected_batch_idxs.append(torch.full((len(pair_idxs),), b, device=device, dtype=torch.long))
+        assert (idxs == torch.cat(expected_idxs)).all()
+        assert (batch_idxs == torch.cat(expected_batch_idxs)).all()
+        self.assert_close(dists, torch.cat(expected_dists), rtol=1e-4, atol=1e-4)
+
+    @pytest.mark.parametrize("match_type", ["nn", "snn", "mnn", "smnn"])
+    def test_empty_nocrash(self, match_type, device, dtype):
+        desc = torch.rand(2, 10, 8, device=device, dtype=dtype)
+        matcher = DescriptorMatcher(match_type, 0.8)
+        for desc1, desc2 in [(desc[:, :0], desc), (desc, desc[:, :0])]:
+            dists, idxs, batch_idxs = matcher.match_batch(desc1, desc2)
+            assert dists.shape == (0, 1)
+            assert idxs.shape == (0, 2)
+            assert batch_idxs.shape == (0,)
+
+
 class TestMatchFGINN(BaseTester):
     @pytest.mark.parametrize("num_desc1, num_desc2, dim", [(2, 4, 4), (2, 5, 128), (6, 2, 32)])
     def test_shape_one_way(self, num_desc1, num_desc2, dim, device):
@@ -519,6 +592,34 @@ class TestLightGlueDISK(BaseTester):
             )
 
 
+class TestLightGlueMatcherShortlist(BaseTester):
+    def test_same_as_pairs(self, device, dtype, monkeypatch):
+        # random weights, the test does not need the trained ones
+        monkeypatch.setattr(torch.hub, "load_state_dict_from_url", lambda *args, **kwargs: {})
+        torch.manual_seed(0)
+        config = {"descriptor_dim": 32, "n_layers": 3, "num_heads": 2, "filter_threshold": 0.0}
+        lg = LightGlueMatcher("disk", config).to(device, dtype).eval()
+
+        def features(num):
+            center = torch.rand(1, num, 2, device=device, dtype=dtype) * 50
+            scale = torch.rand(1, num, 1, 1, device=device, dtype=dtype) * 5 + 1
+            ori = torch.rand(1, num, 1, device=device, dtype=dtype) * 360
+            return torch.randn(num, 128, device=device, dtype=dtype), laf_from_center_scale_ori(center, scale, ori)
+
+        desc1, lafs1 = features(12)
+        descs2, lafs2 = zip(*[features(num) for num in (9, 1, 20, 14)])
+        with torch.no_grad():
+            dists, idxs, pair_idxs = lg.match_shortlist(desc1, descs2, lafs1, lafs2, (60, 64), [(60, 64)] * 4)
+            for k in range(len(descs2)):
+                expected_dists, expected_idxs = lg(desc1, descs2[k], lafs1, lafs2[k], (60, 64), (60, 64))
+                self.assert_close(idxs[pair_idxs == k], expected_idxs)
+                self.assert_close(dists[pair_idxs == k], expected_dists)
+            # the images with less than two descriptors have no match
+            assert (pair_idxs != 1).all()
+            dists, idxs, pair_idxs = lg.match_shortlist(desc1[:1], descs2, lafs1[:, :1], lafs2)
+            assert dists.shape == (0, 1) and idxs.shape == (0, 2) and pair_idxs.shape == (0,)
+
+
 class TestLightGlueHardNet(BaseTester):
     @pytest.mark.skip(reason="download weight from github")
     def test_smoke(self):
@@ -66,6 +66,27 @@ class TestScaleSpaceDetector(BaseTester):
         self.assert_close(lafs, expected_laf, rtol=0.001, atol=1e-03)
         self.assert_close(resps, expected_resp, rtol=0.001, atol=1e-03)
 
+    def test_same_on_batch(self, device, dtype):
+        torch.manual_seed(0)
+        inp = kornia.filters.box_blur(torch.rand(3, 1, 64, 80, device=device, dtype=dtype), (5, 5))
+        det = ScaleSpaceDetector(
+            20,
+            resp_module=kornia.feature.BlobDoG(),
+            nms_module=kornia.geometry.ConvQuadInterp3d(10),
+            scale_pyr_module=kornia.geometry.ScalePyramid(3, 1.6, 10, double_image=True),
+            scale_space_response=True,
+            minima_are_also_good=True,
+        ).to(device, dtype)
+        lafs, resps = det(inp)
+        for idx in range(3):
+            lafs_idx, resps_idx = det(inp[idx : idx + 1])
+            self.assert_close(lafs[idx : idx + 1], lafs_idx)
+            self.assert_close(resps[idx : idx + 1], resps_idx)
+        # the lafs are inside the image
+        pts = kornia.feature.laf_to_boundary_points(lafs[resps > 0][None], 12)
+        assert (pts[..., 0] >= 0).all() and (pts[..., 0] <= 80).all()
+        assert (pts[..., 1] >= 0).all() and (pts[..., 1] <= 64).all()
+
     def test_gradcheck(self, device):
         batch_size, channels, height, width = 1, 1, 7, 7
         patches = torch.rand(batch_size, channels, height, width, device=device, dtype=torch.float64)
@@ -20,6 +20,7 @@ import torch
 
 from kornia.filters import (
     GaussianBlur2d,
+    KernelCache,
     gaussian,
     gaussian_blur2d,
     get_gaussian_discrete_kernel1d,
@@ -27,7 +28,9 @@ from kornia.filters import (
     get_gaussian_kernel1d,
     get_gaussian_kernel2d,
     get_gaussian_kernel3d,
+    get_kernel_cache,
 )
+from kornia.geometry.transform import pyrdown
 
 from testing.base import BaseTester, assert_close
 
@@ -96,6 +99,18 @@ def test_get_gaussian_kernel2d_float(ksize_x, ksize_y, sigma, device, dtype):
     assert_close(actual.sum(), expected.sum())
 
 
+def test_kernel_cache_inference_mode(device, dtype):
+    get_kernel_cache().clear()
+    sample = torch.rand(1, 1, 16, 16, device=device, dtype=dtype)
+    # the kernels are cached by the first calls, in inference mode
+    with torch.inference_mode():
+        gaussian_blur2d(sample, (5, 5), (1.5, 1.5))
+        pyrdown(sample)
+    sample.requires_grad_(True)
+    (gaussian_blur2d(sample, (5, 5), (1.5, 1.5)).sum() + pyrdown(sample).sum()).backward()
+    assert sample.grad is not None
+
+
 @pytest.mark.parametrize("ksize_x", [5, 11])
 @pytest.mark.parametrize("ksize_y", [3, 7])
 @pytest.mark.parametrize("sigma", ([[1.5, 2.1], [1.5, 2.1], [5.0, 2.7]], [[1.5, 2.1], [3.5, 2.1]]))
@@ -197,6 +212,36 @@ def test_gaussian_blur2d_float(ksize_x, ksize_y, sigma, device, dtype):
     assert_close(actual, actual_sep)
 
 
+@pytest.mark.parametrize("separable", [True, False])
+def test_gaussian_blur2d_cached(separable, device, dtype):
+    sample = torch.rand(2, 3, 16, 16, device=device, dtype=dtype)
+    sigma = (1.3, 2.1)
+    expected = gaussian_blur2d(sample, (5, 7), torch.tensor([sigma], device=device, dtype=dtype), separable=separable)
+    cache = get_kernel_cache()
+    actual = gaussian_blur2d(sample, (5, 7), sigma, separable=separable)
+    hits = cache.hits
+    # the kernels are computed once
+    actual_again = gaussian_blur2d(sample, (5, 7), sigma, separable=separable)
+    assert cache.hits == hits + (2 if separable else 1)
+    assert_close(actual, expected)
+    assert_close(actual_again, expected)
+
+
+def test_kernel_cache():
+    cache = KernelCache(max_size=2)
+    for key in [0, 1, 0, 2]:
+        cache.get(key, lambda key=key: torch.full((1, 3), float(key)))
+    # the least recently used kernel is evicted
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert_close(cache.get(0, lambda: torch.zeros(1, 1)), torch.zeros(1, 3))
+    assert cache.get(1, lambda: torch.ones(1, 1)).shape == (1, 1)
+    cache.clear()
+    assert len(cache) == 0
+    with pytest.raises(Exception):
+        KernelCache(max_size=-1)
+
+
 @pytest.mark.parametrize("ksize_x", [5, 11])
 @pytest.mark.parametrize("ksize_y", [3, 7])
 @pytest.mark.parametrize("sigma", ([[1.5, 2.1], [1.5, 2.1], [5.0, 2.7]], [[1.5, 2.1], [3.5, 2.1]]))
@@ -471,6 +471,21 @@ class TestConvQuadInterp3d(BaseTester):
         sample[0, 0, 1, 2, 2] += 20.0
         self.gradcheck(kornia.geometry.ConvQuadInterp3d(strict_maxima_bonus=0), (sample), atol=1e-3, rtol=1e-3)
 
+    def test_quadratic(self, device, dtype):
+        grid = kornia.utils.create_meshgrid3d(5, 9, 11, False, device=device, dtype=dtype)
+        d, x, y = grid[..., 0], grid[..., 1], grid[..., 2]
+        sample = -((x - 5.3) ** 2) - 2.0 * (y - 4.2) ** 2 - 0.5 * (d - 2.1) ** 2
+        coords, vals = kornia.geometry.ConvQuadInterp3d(0)(sample[None])
+        # the extremum is exactly located from the discrete derivatives of a quadratic
+        expected_coord = torch.tensor([2.1, 5.3, 4.2], device=device, dtype=dtype)
+        self.assert_close(coords[0, 0, :, 2, 4, 5], expected_coord, atol=1e-4, rtol=1e-4)
+        self.assert_close(vals[0, 0, 2, 4, 5], torch.zeros_like(vals[0, 0, 2, 4, 5]), atol=1e-4, rtol=1e-4)
+        # the other locations are not moved
+        not_max = torch.ones_like(vals, dtype=torch.bool)
+        not_max[0, 0, 2, 4, 5] = False
+        self.assert_close(vals[not_max], sample[None][not_max])
+        self.assert_close(coords.permute(0, 1, 3, 4, 5, 2)[not_max], grid.expand(1, 5, 9, 11, 3)[not_max[:, 0]])
+
     def test_diag(self, device, dtype):
         sample = torch.tensor(
             [
@@ -15,13 +15,17 @@
 # limitations under the License.
 #
 
+import math
+
 import torch
 import pytest
 import kornia
 from kornia.geometry.bbox import (
+    batched_nms,
     infer_bbox_shape,
     infer_bbox_shape3d,
     nms,
+    soft_nms,
     transform_bbox,
     validate_bbox,
     validate_bbox3d,
@@ -289,3 +293,103 @@ class TestNMS(BaseTester):
         expected = torch.tensor([0, 3, 1], device=device, dtype=torch.long)
         actual = nms(boxes, scores, iou_threshold=0.8)
         self.assert_close(actual, expected)
+
+
+def _greedy_nms(boxes, scores, iou_threshold):
+    # reference greedy NMS, one kept box at a time
+    x1, y1, x2, y2 = boxes.unbind(-1)
+    areas = (x2 - x1) * (y2 - y1)
+    order = scores.argsort(descending=True, stable=True)
+    keep = []
+    while len(order) > 0:
+        i, order = order[0], order[1:]
+        keep.append(i.item())
+        w = (torch.min(x2[i], x2[order]) - torch.max(x1[i], x1[order])).clamp(min=0.0)
+        h = (torch.min(y2[i], y2[order]) - torch.max(y1[i], y1[order])).clamp(min=0.0)
+        inter = w * h
+        order = order[inter / (areas[i] + areas[order] - inter) <= iou_threshold]
+    return keep
+
+
+def _random_boxes(shape, device, dtype):
+    xy = 100.0 * torch.rand(*shape, 2, device=device, dtype=dtype)
+    wh = 1.0 + 30.0 * torch.rand(*shape, 2, device=device, dtype=dtype)
+    return torch.cat([xy, xy + wh], -1)
+
+
+class TestBatchedNMS(BaseTester):
+    @pytest.mark.parametrize("chunk_size", [7, 1024])
+    def test_same_as_greedy(self, chunk_size, device, dtype):
+        torch.random.manual_seed(0)
+        boxes = _random_boxes((3, 100), device, dtype)
+        scores = torch.rand(3, 100, device=device, dtype=dtype)
+        keep = batched_nms(boxes, scores, 0.5, chunk_size=chunk_size)
+        assert keep.shape == (3, 100)
+        for b in range(3):
+            expected = _greedy_nms(boxes[b], scores[b], 0.5)
+            assert sorted(keep[b].nonzero()[:, 0].tolist()) == sorted(expected)
+            self.assert_close(nms(boxes[b], scores[b], 0.5), torch.tensor(expected, device=device))
+
+    def test_class_aware_and_mask(self, device, dtype):
+        boxes = torch.tensor(
+            [[10.0, 10.0, 20.0, 20.0], [11.0, 11.0, 21.0, 21.0], [11.0, 11.0, 21.0, 21.0], [10.0, 10.0, 20.0, 20.0]],
+            device=device,
+            dtype=dtype,
+        )
+        scores = torch.tensor([0.9, 0.8, 0.7, 0.95], device=device, dtype=dtype)
+        class_ids = torch.tensor([0, 0, 1, 0], device=device)
+        mask = torch.tensor([True, True, True, False], device=device)
+        keep = batched_nms(boxes, scores, 0.5, class_ids=class_ids, mask=mask)
+        assert keep.tolist() == [True, False, True, False]
+
+    def test_diou(self, device, dtype):
+        # overlapping enough for NMS, but with centers far apart for DIoU-NMS
+        boxes = torch.tensor([[0.0, 0.0, 10.0, 10.0], [3.0, 0.0, 13.0, 10.0]], device=device, dtype=dtype)
+        scores = torch.tensor([0.9, 0.8], device=device, dtype=dtype)
+        assert batched_nms(boxes, scores, 0.52).tolist() == [True, False]
+        assert batched_nms(boxes, scores, 0.52, method="diou").tolist() == [True, True]
+
+    def test_exception(self, device, dtype):
+        boxes = torch.rand(2, 5, 4, device=device, dtype=dtype)
+        with pytest.raises(ValueError):
+            batched_nms(boxes, torch.rand(2, 4, device=device, dtype=dtype), 0.5)
+        with pytest.raises(ValueError):
+            batched_nms(boxes, torch.rand(2, 5, device=device, dtype=dtype), 0.5, method="giou")
+
+
+class TestSoftNMS(BaseTester):
+    def test_smoke(self, device, dtype):
+        boxes = torch.tensor(
+            [[10.0, 10.0, 20.0, 20.0], [11.0, 11.0, 21.0, 21.0], [100.0, 100.0, 200.0, 200.0]],
+            device=device,
+            dtype=dtype,
+        )
+        scores = torch.tensor([0.9, 0.8, 0.7], device=device, dtype=dtype)
+        iou = 81.0 / 119.0
+        expected = torch.tensor([0.9, 0.8 * math.exp(-(iou**2) / 0.5), 0.7], device=device, dtype=dtype)
+        self.assert_close(soft_nms(boxes, scores, sigma=0.5), expected, rtol=1e-4, atol=1e-4)
+        expected_linear = torch.tensor([0.9, 0.8 * (1.0 - iou), 0.7], device=device, dtype=dtype)
+        self.assert_close(soft_nms(boxes, scores, kernel="linear"), expected_linear, rtol=1e-4, atol=1e-4)
+
+    def test_compensation(self, device, dtype):
+        # the third box is only decayed by the second one, which is already suppressed by the first one
+        boxes = torch.tensor(
+            [[0.0, 0.0, 10.0, 10.0], [0.0, 0.0, 10.0, 10.0], [0.0, 0.0, 10.0, 10.0]], device=device, dtype=dtype
+        )
+        scores = torch.tensor([0.9, 0.8, 0.7], device=device, dtype=dtype)
+        out = soft_nms(boxes, scores, sigma=0.5)
+        self.assert_close(out[1], out[2] * 0.8 / 0.7)
+
+    @pytest.mark.parametrize("chunk_size", [3, 1024])
+    def test_batch_chunk(self, chunk_size, device, dtype):
+        torch.random.manual_seed(0)
+        boxes = _random_boxes((2, 20), device, dtype)
+        scores = torch.rand(2, 20, device=device, dtype=dtype)
+        class_ids = torch.randint(0, 2, (2, 20), device=device)
+        mask = torch.rand(2, 20, device=device) > 0.2
+        out = soft_nms(boxes, scores, class_ids=class_ids, mask=mask, chunk_size=chunk_size)
+        assert out.shape == (2, 20)
+        assert (out[~mask] == 0).all()
+        assert (out <= scores).all()
+        for b in range(2):
+            self.assert_close(out[b], soft_nms(boxes[b], scores[b], class_ids=class_ids[b], mask=mask[b]))
@@ -16,6 +16,7 @@
 #
 
 import math
+from unittest.mock import patch
 
 import pytest
 import torch
@@ -274,3 +275,216 @@ class TestRansacMethods:
         x = RANSAC.max_samples_by_conf(n_inl=999999999, num_tc=1000000000, sample_size=1, conf=conf)
         assert x > 0.0
         assert x == math.log(1.0 - conf) / math.log(eps)
+
+
+class TestRANSACBatch(BaseTester):
+    @pytest.mark.parametrize("model_type", ["homography", "fundamental", "fundamental_7pt"])
+    def test_smoke(self, device, dtype, model_type):
+        torch.random.manual_seed(0)
+        points1 = torch.rand(3, 10, 2, device=device, dtype=dtype)
+        points2 = torch.rand(3, 10, 2, device=device, dtype=dtype)
+        ransac = RANSAC(model_type, batch_size=16, max_iter=2).to(device=device, dtype=dtype)
+        models, inliers = ransac.forward_batch(points1, points2)
+        assert models.shape == (3, 3, 3)
+        assert inliers.shape == (3, 10)
+
+    def test_smoke_linesegments(self, device, dtype):
+        torch.random.manual_seed(0)
+        ls1 = torch.rand(2, 6, 2, 2, device=device, dtype=dtype)
+        ls2 = torch.rand(2, 6, 2, 2, device=device, dtype=dtype)
+        ransac = RANSAC("homography_from_linesegments", batch_size=16, max_iter=2).to(device=device, dtype=dtype)
+        models, inliers = ransac.forward_batch(ls1, ls2)
+        assert models.shape == (2, 3, 3)
+        assert inliers.shape == (2, 6)
+
+    def test_padded_pairs(self, device, dtype):
+        torch.random.manual_seed(0)
+        B, N = 3, 30
+        H = torch.eye(3, dtype=dtype, device=device).repeat(B, 1, 1)
+        H[:, :2] = H[:, :2] + 0.1 * torch.rand_like(H[:, :2])
+        points_src = 100.0 * torch.rand(B, N, 2, device=device, dtype=dtype)
+        points_dst = transform_points(H, points_src)
+        # outliers in every pair, the second pair is padded and the last one is too small
+        points_dst[:, :5] += 50.0
+        mask = torch.ones(B, N, dtype=torch.bool, device=device)
+        mask[1, 20:] = False
+        mask[2, 3:] = False
+        points_src[1, 20:] = 0.0
+        points_dst[1, 20:] = 0.0
+
+        ransac = RANSAC("homography", inl_th=0.5, batch_size=64).to(device=device, dtype=dtype)
+        models, inliers = ransac.forward_batch(points_src, points_dst, mask)
+
+        assert not (inliers & ~mask).any()
+        assert inliers[0, 5:].all()
+        assert not inliers[0, :5].any()
+        assert inliers[1, 5:20].all()
+        assert not inliers[2].any()
+        self.assert_close(models[2], torch.zeros(3, 3, device=device, dtype=dtype))
+        self.assert_close(
+            transform_points(models[:2], points_src[:2, 5:20]), points_dst[:2, 5:20], rtol=1e-3, atol=1e-2
+        )
+
+    def test_local_optimization_converges(self, device, dtype):
+        torch.random.manual_seed(0)
+        H = torch.eye(3, dtype=dtype, device=device)[None]
+        H[:, :2] = H[:, :2] + 0.1 * torch.rand_like(H[:, :2])
+        points_src = 100.0 * torch.rand(2, 30, 2, device=device, dtype=dtype)
+        points_dst = transform_points(H, points_src)
+        ransac = RANSAC("homography", inl_th=0.5, batch_size=64, max_iter=1, max_lo_iters=5)
+        ransac = ransac.to(device=device, dtype=dtype)
+        with patch.object(ransac, "polish_model_batch", wraps=ransac.polish_model_batch) as polish:
+            _, inliers = ransac.forward_batch(points_src, points_dst)
+        assert inliers.all()
+        # all the points are inliers of the first model, the polished one cannot have more
+        assert polish.call_count == 1
+
+    def test_exception(self, device, dtype):
+        ransac = RANSAC("homography")
+        points = torch.rand(2, 10, 2, device=device, dtype=dtype)
+        with pytest.raises(Exception):
+            ransac.forward_batch(points, points[:, :5])
+        with pytest.raises(Exception):
+            ransac.forward_batch(points, points, torch.ones(2, 5, dtype=torch.bool, device=device))
+
+
+class TestRANSACSPRT(BaseTester):
+    def _data(self, num_points, device, dtype):
+        torch.random.manual_seed(0)
+        H = torch.eye(3, dtype=dtype, device=device)[None]
+        H[:, :2] = H[:, :2] + 0.1 * torch.rand_like(H[:, :2])
+        points_src = 100.0 * torch.rand(1, num_points, 2, device=device, dtype=dtype)
+        points_dst = transform_points(H, points_src)
+        points_dst[:, : num_points // 2] = 100.0 * torch.rand_like(points_dst[:, : num_points // 2])
+        return H, points_src, points_dst
+
+    def test_verify_keeps_good_model(self, device, dtype):
+        H, points_src, points_dst = self._data(1000, device, dtype)
+        mask = torch.ones(1, 1000, dtype=torch.bool, device=device)
+        # first candidate is random, the second one is the ground truth
+        models = torch.stack([torch.eye(3, device=device, dtype=dtype)[None] + torch.rand_like(H), H], dim=1)
+        models_ok = torch.ones(1, 2, dtype=torch.bool, device=device)
+        epsilon = torch.zeros(1, device=device, dtype=dtype)
+        ransac = RANSAC("homography", inl_th=0.5).to(device=device, dtype=dtype)
+
+        model, inliers, score = ransac.verify_sprt_batch(points_src, points_dst, mask, models, models_ok, 0.5, epsilon)
+        model_full, inliers_full, score_full = ransac.verify_batch(points_src, points_dst, mask, models, models_ok, 0.5)
+
+        self.assert_close(model, H)
+        self.assert_close(model, model_full)
+        assert (inliers == inliers_full).all()
+        self.assert_close(score, score_full)
+
+    def test_threshold(self, device, dtype):
+        ransac = RANSAC("homography")
+        epsilon = torch.tensor([0.5, 0.1, 0.01], device=device, dtype=dtype)
+        delta = torch.tensor([0.01, 0.01, 0.01], device=device, dtype=dtype)
+        log_a = ransac.sprt_threshold(epsilon, delta)
+        assert torch.isfinite(log_a[:2]).all()
+        assert (log_a[:2] > 0).all()
+        assert log_a[2] == float("inf")
+
+    @pytest.mark.parametrize("sprt", [False, True])
+    def test_forward(self, device, dtype, sprt):
+        _, points_src, points_dst = self._data(1000, device, dtype)
+        ransac = RANSAC("homography", inl_th=0.5, batch_size=256, sprt=sprt).to(device=device, dtype=dtype)
+        model, inliers = ransac(points_src[0], points_dst[0])
+        assert inliers[500:].all()
+        self.assert_close(transform_points(model[None], points_src[:, 500:]), points_dst[:, 500:], rtol=1e-3, atol=5e-2)
+
+
+class TestRANSACSampling(BaseTester):
+    def _data(self, device, dtype):
+        torch.random.manual_seed(0)
+        N, num_outliers = 500, 400
+        H = torch.eye(3, dtype=dtype, device=device)[None]
+        H[:, :2] = H[:, :2] + 0.1 * torch.rand_like(H[:, :2])
+        points_src = 100.0 * torch.rand(1, N, 2, device=device, dtype=dtype)
+        points_dst = transform_points(H, points_src)
+        points_dst[:, :num_outliers] = 100.0 * torch.rand_like(points_dst[:, :num_outliers])
+        # noisy confidences, higher for the inliers
+        weights = torch.rand(1, N, device=device, dtype=dtype)
+        weights[:, num_outliers:] += 0.5
+        return points_src, points_dst, weights, num_outliers
+
+    def test_sample(self, device, dtype):
+        ransac = RANSAC("homography")
+        idxs = ransac.sample(4, 10, 100, device=device)
+        assert idxs.shape == (100, 4)
+        assert ((idxs >= 0) & (idxs < 10)).all()
+        assert (idxs.sort(dim=1)[0].diff(dim=1) > 0).all()
+        weights = torch.zeros(10, device=device, dtype=dtype)
+        weights[:5] = 1.0
+        idxs = ransac.sample(4, 10, 100, device=device, weights=weights)
+        assert (idxs < 5).all()
+        assert (idxs.sort(dim=1)[0].diff(dim=1) > 0).all()
+
+    @pytest.mark.parametrize("sampling", ["uniform", "prosac", "weighted"])
+    def test_sample_batch(self, device, dtype, sampling):
+        torch.random.manual_seed(0)
+        mask = torch.ones(2, 30, dtype=torch.bool, device=device)
+        mask[1, 10:] = False
+        weights = torch.rand(2, 30, device=device, dtype=dtype)
+        ransac = RANSAC("homography", batch_size=50, sampling=sampling)
+        for w in [None, weights]:
+            idxs = ransac.sample_batch(mask, w)
+            assert idxs.shape == (2, 50, 4)
+            assert (idxs[1] < 10).all()
+            assert (idxs.sort(dim=2)[0].diff(dim=2) > 0).all()
+
+    def test_uniform_ignores_weights(self, device, dtype):
+        mask = torch.ones(2, 30, dtype=torch.bool, device=device)
+        weights = torch.rand(2, 30, device=device, dtype=dtype)
+        ransac = RANSAC("homography", batch_size=50)
+        assert ransac.sampling == "uniform"
+        torch.random.manual_seed(0)
+        expected = ransac.sample_batch(mask)
+        torch.random.manual_seed(0)
+        assert (ransac.sample_batch(mask, weights) == expected).all()
+
+    def test_prosac_growth(self, device, dtype):
+        mask = torch.ones(1, 100, dtype=torch.bool, device=device)
+        weights = torch.arange(100, 0, -1, device=device, dtype=dtype)[None]
+        ransac = RANSAC("homography", batch_size=10, sampling="prosac")
+        sizes = ransac.prosac_sizes(mask, 0)
+        assert sizes[0, 0] == 4
+        assert (sizes.diff(dim=1) >= 0).all()
+        # the first samples are drawn among the best ranked correspondences, including the last one of the pool
+        idxs = ransac.sample_batch(mask, weights, 0)
+        assert (idxs[0, 0].sort()[0] == torch.arange(4, device=device)).all()
+        assert (idxs[0].max(dim=1)[0] == sizes[0] - 1).all()
+        # the pool covers all the correspondences in the end
+        assert (ransac.prosac_sizes(mask, 2 * ransac.prosac_max_samples) > 100).all()
+
+    def test_prosac_early_stop(self, device, dtype):
+        points_src, points_dst, weights, num_outliers = self._data(device, dtype)
+        ransac = RANSAC("homography", inl_th=0.5, batch_size=64, max_iter=20, sampling="prosac")
+        ransac = ransac.to(device=device, dtype=dtype)
+        calls = []
+        sample_batch = ransac.sample_batch
+
+        def counting_sample_batch(*args):
+            calls.append(1)
+            return sample_batch(*args)
+
+        ransac.sample_batch = counting_sample_batch
+        _, inliers = ransac(points_src[0], points_dst[0], weights[0])
+        assert len(calls) < 20
+        assert inliers[num_outliers:].all()
+        assert not inliers[:num_outliers].any()
+
+    @pytest.mark.parametrize("sampling", ["prosac", "weighted"])
+    def test_forward_batch(self, device, dtype, sampling):
+        points_src, points_dst, weights, num_outliers = self._data(device, dtype)
+        points_src, points_dst, weights = points_src.repeat(2, 1, 1), points_dst.repeat(2, 1, 1), weights.repeat(2, 1)
+        mask = torch.ones(2, points_src.shape[1], dtype=torch.bool, device=device)
+        ransac = RANSAC("homography", inl_th=0.5, batch_size=64, sampling=sampling).to(device=device, dtype=dtype)
+        _, inliers = ransac.forward_batch(points_src, points_dst, mask, weights)
+        assert inliers[:, num_outliers:].all()
+
+    def test_exception(self, device, dtype):
+        with pytest.raises(NotImplementedError):
+            RANSAC("homography", sampling="foo")
+        points = torch.rand(2, 10, 2, device=device, dtype=dtype)
+        with pytest.raises(Exception):
+            RANSAC("homography").forward_batch(points, points, weights=torch.rand(2, 5, device=device, dtype=dtype))
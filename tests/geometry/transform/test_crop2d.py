@@ -289,6 +289,38 @@ class TestCropByIndices(BaseTester):
 
         self.assert_close(kornia.geometry.transform.crop_by_indices(inp, indices), expected)
 
+    @pytest.mark.parametrize("shape_compensation", ["pad", "resize"])
+    def test_crop_by_indices_batch(self, shape_compensation, device, dtype):
+        inp = torch.rand(3, 2, 6, 5, device=device, dtype=dtype)
+        indices = torch.tensor(
+            [
+                [[0, 0], [1, 0], [1, 2], [0, 2]],
+                [[3, 1], [4, 1], [4, 3], [3, 3]],
+                [[2, 4], [3, 4], [3, 6], [2, 6]],
+            ],
+            device=device,
+            dtype=torch.int64,
+        )
+        out = kornia.geometry.transform.crop_by_indices(inp, indices, (3, 2), shape_compensation=shape_compensation)
+        self.assert_close(out[0], inp[0, :, 0:3, 0:2])
+        self.assert_close(out[1], inp[1, :, 1:4, 3:5])
+        if shape_compensation == "pad":
+            # the last crop is out of the image
+            self.assert_close(out[2, :, :2], inp[2, :, 4:6, 2:4])
+            self.assert_close(out[2, :, 2:], torch.zeros_like(out[2, :, 2:]))
+
+    def test_crop_by_indices_larger_than_size(self, device, dtype):
+        inp = torch.rand(2, 2, 6, 5, device=device, dtype=dtype)
+        # the second crop is larger than the output size
+        indices = torch.tensor(
+            [[[0, 0], [0, 0], [0, 1], [0, 1]], [[1, 1], [4, 1], [4, 5], [1, 5]]], device=device, dtype=torch.int64
+        )
+        out = kornia.geometry.transform.crop_by_indices(inp, indices, (3, 2), shape_compensation="pad")
+        self.assert_close(out[0, :, :2, :1], inp[0, :, 0:2, 0:1])
+        self.assert_close(out[0, :, 2:], torch.zeros_like(out[0, :, 2:]))
+        self.assert_close(out[0, :, :, 1:], torch.zeros_like(out[0, :, :, 1:]))
+        self.assert_close(out[1], inp[1, :, 1:4, 1:3])
+
     @pytest.mark.skip(reason="SDAA not support backend='inductor'")
     def test_dynamo(self, device, dtype, torch_optimizer):
         # Define script
@@ -118,6 +118,23 @@ class TestScalePyramid(BaseTester):
                 self.assert_close(img, img.flip(1))
                 self.assert_close(img, img.flip(2))
 
+    def test_sigmas(self, device, dtype):
+        inp = torch.rand(2, 1, 64, 48, device=device, dtype=dtype)
+        SP = kornia.geometry.ScalePyramid(n_levels=3, init_sigma=1.6, min_size=10)
+        sp, sigmas, pixel_dists = SP(inp)
+        assert len(sp) == len(sigmas) == len(pixel_dists) == 3
+        expected_sigmas = 1.6 * 2.0 ** (torch.arange(6, device=device, dtype=dtype) / 3.0)
+        for oct_idx, (octave_sigmas, octave_dists) in enumerate(zip(sigmas, pixel_dists)):
+            self.assert_close(octave_sigmas, expected_sigmas.expand(2, 6))
+            self.assert_close(octave_dists, torch.full_like(octave_sigmas, 2.0**oct_idx))
+        # the kernels are computed once per configuration
+        cache = kornia.filters.get_kernel_cache()
+        misses = cache.misses
+        sp2, _, _ = SP(inp)
+        assert cache.misses == misses
+        for octave, octave2 in zip(sp, sp2):
+            self.assert_close(octave, octave2)
+
     def test_gradcheck(self, device):
         img = torch.rand(1, 2, 7, 9, device=device, dtype=torch.float64)
         from kornia.geometry import ScalePyramid as SP
@@ -185,6 +202,43 @@ class TestBuildLaplacianPyramid(BaseTester):
         self.gradcheck(kornia.geometry.transform.build_laplacian_pyramid, (img, max_level), nondet_tol=1e-8)
 
 
+class TestPyramidPlan(BaseTester):
+    @pytest.mark.parametrize("shape", [(2, 3, 32, 32), (1, 1, 30, 45), (1, 2, 64, 48)])
+    @pytest.mark.parametrize("max_level", [1, 3, 4])
+    def test_same_as_functions(self, shape, max_level, device, dtype):
+        plan = kornia.geometry.transform.PyramidPlan(shape, max_level, device=device, dtype=dtype)
+        for _ in range(2):
+            sample = torch.rand(shape, device=device, dtype=dtype)
+            pyramid = plan.build_pyramid(sample)
+            expected = kornia.geometry.transform.build_pyramid(sample, max_level)
+            assert len(pyramid) == len(expected)
+            for level, expected_level in zip(pyramid, expected):
+                self.assert_close(level, expected_level)
+
+            pyramid = plan.build_laplacian_pyramid(sample)
+            expected = kornia.geometry.transform.build_laplacian_pyramid(sample, max_level)
+            assert len(pyramid) == len(expected)
+            for level, expected_level in zip(pyramid, expected):
+                self.assert_close(level, expected_level)
+
+    def test_buffers(self, device, dtype):
+        plan = kornia.geometry.transform.PyramidPlan((1, 1, 16, 16), 3, device=device, dtype=dtype)
+        pyramid = plan.build_pyramid(torch.rand(1, 1, 16, 16, device=device, dtype=dtype))
+        pointers = [level.data_ptr() for level in pyramid[1:]]
+        pyramid = plan.build_pyramid(torch.rand(1, 1, 16, 16, device=device, dtype=dtype))
+        # the levels are written into the same buffers
+        assert [level.data_ptr() for level in pyramid[1:]] == pointers
+
+    def test_exception(self, device, dtype):
+        plan = kornia.geometry.transform.PyramidPlan((1, 1, 16, 16), 3, device=device, dtype=dtype)
+        with pytest.raises(Exception):
+            plan.build_pyramid(torch.rand(1, 1, 16, 17, device=device, dtype=dtype))
+        with pytest.raises(Exception):
+            plan.build_pyramid(torch.rand(1, 1, 16, 16, device=device, dtype=dtype, requires_grad=True))
+        with pytest.raises(Exception):
+            kornia.geometry.transform.PyramidPlan((1, 16, 16), 3)
+
+
 class TestUpscaleDouble(BaseTester):
     @pytest.mark.parametrize("shape", ((5, 5), (2, 5, 5), (1, 2, 5, 5)))
     def test_smoke(self, shape, device, dtype):
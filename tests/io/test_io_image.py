@@ -15,6 +15,7 @@
 # limitations under the License.
 #
 
+import asyncio
 import io
 import sys
 from pathlib import Path
@@ -25,7 +26,7 @@ import requests
 import torch
 
 from kornia.core import Tensor
-from kornia.io import ImageLoadType, load_image, write_image
+from kornia.io import ImageLoadType, load_image, load_images, load_images_async, write_image
 from kornia.utils._compat import torch_version_ge
 
 try:
@@ -144,3 +145,55 @@ class TestIoImage:
         write_image(file_path, img_th)
 
         assert file_path.is_file()
+
+
+@pytest.mark.skipif(not available_package(), reason="kornia_rs only supports python >=3.7 and pt >= 1.10.0")
+class TestLoadImages:
+    @pytest.fixture
+    def image_files(self, tmp_path):
+        images = [create_random_img8_torch(h, w, 3) for h, w in [(4, 5), (6, 3), (4, 5)]]
+        paths = []
+        for i, img in enumerate(images):
+            paths.append(tmp_path / f"image{i}.png")
+            write_image(paths[-1], img)
+        return images, paths
+
+    def test_padded_batch(self, image_files):
+        images, paths = image_files
+        batch, sizes = load_images(paths, ImageLoadType.UNCHANGED, num_workers=2)
+        assert batch.shape == (3, 3, 6, 5)
+        assert batch.dtype == torch.uint8
+        assert sizes.tolist() == [[4, 5], [6, 3], [4, 5]]
+        for img, out, (h, w) in zip(images, batch, sizes.tolist()):
+            assert (out[:, :h, :w] == img).all()
+            assert (out[:, h:] == 0).all() and (out[:, :, w:] == 0).all()
+
+    def test_desired_type(self, image_files):
+        _, paths = image_files
+        batch, _ = load_images(paths[::2], ImageLoadType.RGB32)
+        assert batch.shape == (2, 3, 4, 5)
+        assert batch.dtype == torch.float32
+        torch.testing.assert_close(batch[0], load_image(paths[0], ImageLoadType.RGB32))
+
+    def test_out(self, image_files):
+        images, paths = image_files
+        out = torch.full((4, 3, 8, 8), 255, dtype=torch.uint8)
+        batch, _ = load_images(paths, ImageLoadType.UNCHANGED, out=out)
+        assert batch.shape == (3, 3, 8, 8)
+        assert batch.data_ptr() == out.data_ptr()
+        assert (batch[1, :, :6, :3] == images[1]).all()
+        assert (batch[1, :, 6:] == 0).all()
+        with pytest.raises(Exception):
+            load_images(paths, out=torch.zeros(3, 3, 4, 4, dtype=torch.uint8))
+
+    def test_async(self, image_files):
+        _, paths = image_files
+        batch, sizes = asyncio.run(load_images_async(paths, ImageLoadType.UNCHANGED))
+        expected, expected_sizes = load_images(paths, ImageLoadType.UNCHANGED)
+        assert (batch == expected).all()
+        assert (sizes == expected_sizes).all()
+        # the buffer is checked before the decoding starts
+        with pytest.raises(Exception, match="can hold 2 images"):
+            asyncio.run(load_images_async(paths, out=torch.zeros(2, 3, 8, 8, dtype=torch.uint8)))
+        with pytest.raises(Exception, match="uint8 tensor"):
+            asyncio.run(load_images_async(paths, out=torch.zeros(3, 3, 8, 8)))
@@ -115,3 +115,16 @@ class TestBoxFiltering:
         assert len(filtered_boxes[0]) == 4  # All boxes in the first batch should be kept
         assert len(filtered_boxes[1]) == 4  # All boxes in the second batch should be kept
         assert len(filtered_boxes[2]) == 4  # All boxes in the third batch should be kept
+
+    def test_nms(self, sample_boxes):
+        """Test the class-aware suppression of the overlapping boxes."""
+        boxes = sample_boxes.clone()
+        boxes[0, 2, 0] = 2  # same class and same box as the previous one, with the same confidence
+        boxes[1, 1, 2:] = boxes[1, 0, 2:]  # overlaps the box of class 1, but is of class 2
+        filter = BoxFiltering(iou_threshold=0.5)
+        filtered_boxes = filter(boxes)
+
+        assert len(filtered_boxes[0]) == 3
+        assert filtered_boxes[0][:, 0].tolist() == [1, 2, 4]
+        assert len(filtered_boxes[1]) == 4
+        assert len(filtered_boxes[2]) == 4
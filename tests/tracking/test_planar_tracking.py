@@ -18,8 +18,8 @@
 import pytest
 import torch
 
-from kornia.feature import DescriptorMatcher, GFTTAffNetHardNet, LocalFeatureMatcher, SIFTFeature
-from kornia.geometry import rescale, transform_points
+from kornia.feature import DescriptorIndex, DescriptorMatcher, GFTTAffNetHardNet, LocalFeatureMatcher, SIFTFeature
+from kornia.geometry import rescale, transform_points, translate
 from kornia.tracking import HomographyTracker
 from kornia.utils._compat import torch_version_le
 
@@ -38,6 +38,38 @@ class TestHomographyTracker:
         tracker = HomographyTracker().to(device)
         assert tracker is not None
 
+    def test_index_same_matches(self, device):
+        torch.manual_seed(0)
+        target = torch.rand(1, 1, 24, 24, device=device)
+        target = torch.nn.functional.interpolate(target, size=(128, 128), mode="bicubic", align_corners=False)
+        target = target.clamp(0.0, 1.0)
+        shifts = torch.tensor([[[2.0, 1.0]], [[4.0, 2.0]], [[6.0, 3.0]]], device=device)
+        frames = [translate(target, shift) for shift in shifts]
+
+        def track(index):
+            descriptor_matcher = DescriptorMatcher("smnn", 0.95, index=index)
+            matches = []
+            descriptor_matcher.register_forward_hook(lambda module, inputs, outputs: matches.append(outputs[1]))
+            matcher = LocalFeatureMatcher(SIFTFeature(200), descriptor_matcher).to(device)
+            tracker = HomographyTracker(matcher, matcher, minimum_inliers_num=10)
+            outputs = []
+            with torch.no_grad():
+                tracker.set_target(target)
+                for frame in frames:
+                    torch.manual_seed(0)
+                    outputs.append(tracker(frame))
+            return matches, outputs
+
+        # probing all the lists gives the exact neighbors, the tracker follows the same matches as without an index
+        expected_matches, expected = track(None)
+        matches, actual = track(DescriptorIndex(num_lists=4, num_probes=4))
+        assert len(matches) == len(expected_matches) == len(frames)
+        for idxs, expected_idxs in zip(matches, expected_matches):
+            assert torch.equal(idxs, expected_idxs)
+        for (homography, success), (expected_homography, expected_success) in zip(actual, expected):
+            assert success and expected_success
+            assert_close(homography, expected_homography)
+
     @pytest.mark.slow
     def test_nomatch(self, device, dtype, data_url):
         data = torch.hub.load_state_dict_from_url(data_url)
@@ -15,11 +15,14 @@
 # limitations under the License.
 #
 
+import torch
+
 from kornia.core import tensor
 from kornia.utils.misc import (
     differentiable_clipping,
     differentiable_polynomial_floor,
     differentiable_polynomial_rounding,
+    pad_by_batch_indexes,
 )
 
 from testing.base import BaseTester
@@ -62,3 +65,23 @@ class TestDifferentiablePolynomialFloor(BaseTester):
     def test_gradcheck(self, device):
         x = tensor([1.5, 3.1, 5.9, 6.6], device=device)
         self.gradcheck(differentiable_polynomial_floor, (x))
+
+
+class TestPadByBatchIndexes(BaseTester):
+    def test_smoke(self, device, dtype):
+        x = torch.rand(5, 2, device=device, dtype=dtype)
+        idx = torch.tensor([2, 0, 2, 2, 0], device=device)
+        padded, mask = pad_by_batch_indexes(x, idx)
+        assert padded.shape == (3, 3, 2)
+        assert mask.shape == (3, 3)
+        self.assert_close(padded[0, :2], x[[1, 4]])
+        self.assert_close(padded[2], x[[0, 2, 3]])
+        assert mask.sum(1).tolist() == [2, 0, 3]
+        self.assert_close(padded[~mask], torch.zeros(4, 2, device=device, dtype=dtype))
+
+    def test_batch_size(self, device, dtype):
+        x = torch.rand(2, device=device, dtype=dtype)
+        padded, mask = pad_by_batch_indexes(x, torch.zeros(2, device=device), batch_size=3, padding_value=-1.0)
+        assert padded.shape == (3, 2)
+        assert not mask[1:].any()
+        self.assert_close(padded[1:], torch.full((2, 2), -1.0, device=device, dtype=dtype))